@@ -1,14 +1,18 @@
 import tkinter as tk
-from tkinter import ttk
+from tkinter import ttk, messagebox, filedialog
 from typing import Dict, Type
 
+from app.core.workload import TraceRecorder
 from app.theme.retro import apply_retro_style
 
 
+TITLE = "Ciencias de la Computación II - Búsquedas"
+
+
 class RetroApp:
 	def __init__(self) -> None:
 		self.root = tk.Tk()
-		self.root.title("Ciencias de la Computación II - Búsquedas")
+		self.root.title(TITLE)
 		self.root.geometry("1000x700")
 		self.root.resizable(True, True)
 
@@ -17,9 +21,40 @@ class RetroApp:
 		self.container = ttk.Frame(self.root, padding=10)
 		self.container.pack(fill=tk.BOTH, expand=True)
 
+		# Las vistas registran aquí cada operación por clave (ver app/core/workload.py)
+		self.traza = TraceRecorder()
+		self._build_menu()
+
 		self.views: Dict[str, tk.Frame] = {}
 		self._init_views()
 
+	def _build_menu(self) -> None:
+		menubar = tk.Menu(self.root)
+		menu_traza = tk.Menu(menubar, tearoff=0)
+		menu_traza.add_command(label="Iniciar grabación", command=self._on_trace_start)
+		menu_traza.add_command(label="Detener y guardar…", command=self._on_trace_save)
+		menubar.add_cascade(label="Traza", menu=menu_traza)
+		self.root.config(menu=menubar)
+
+	def _on_trace_start(self) -> None:
+		self.traza.iniciar()
+		self.root.title(f"{TITLE} [grabando traza]")
+
+	def _on_trace_save(self) -> None:
+		self.traza.detener()
+		self.root.title(TITLE)
+		if not self.traza.eventos:
+			messagebox.showinfo("Traza", "No se grabó ninguna operación.")
+			return
+		path = filedialog.asksaveasfilename(
+			title="Guardar traza",
+			defaultextension=".csv",
+			filetypes=[("Traza CSV", "*.csv"), ("Todos los archivos", "*.*")],
+		)
+		if path:
+			self.traza.guardar(path)
+			messagebox.showinfo("Traza", f"{len(self.traza.eventos)} operaciones guardadas en:\n{path}")
+
 	def _init_views(self) -> None:
 		from app.views.home import HomeView
 		from app.views.busquedas import BusquedasView
@@ -0,0 +1,331 @@
+"""
+Archivo binario de bloques con registros de ancho fijo (memoria secundaria real
+para las búsquedas externas).
+
+- Cabecera de 32 bytes: MAGIA, n, B y registros por bloque.
+- Bloque i (a partir del byte 32): cuenta de registros (int64) seguida de
+  block_size registros int64; las posiciones libres valen VACIO, así que
+  ese valor (-2^63) no puede ser una clave: escribirlo da ValueError.
+- B = ⌈√n⌉ y block_size = ⌈n/B⌉, como en el _read_params de las vistas.
+- Cada acceso a un bloque es una lectura posicionada (os.pread, o seek + read
+  donde no existe) de exactamente un bloque; ContadorIO cuenta lecturas y
+  escrituras y `ultimas_lecturas` guarda las de la última búsqueda.
+- BloquesEnArchivo presenta los bloques como secuencia de solo lectura con
+  una caché LRU pequeña: una vista puede recorrer y dibujar un archivo
+  grande sin tenerlo entero en memoria (esas lecturas no se cuentan).
+
+Uso:
+    python -m app.core.block_file crear datos.blq -n 1000000 -d 7
+    python -m app.core.block_file buscar datos.blq --consultas 1000 --binaria
+"""
+
+import argparse
+import math
+import os
+import random
+import struct
+import time
+from array import array
+from collections import OrderedDict
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from app.core.bucket_storage import VACIO, clave_valida
+from app.core.paged_storage import ContadorIO
+
+
+MAGIA = b"BLQ1"
+_CABECERA = struct.Struct("<4sqqq")
+
+BLOQUES_EN_CACHE = 32
+
+
+def dimensiones(n: int) -> Tuple[int, int]:
+	"""(B, registros por bloque) para n registros."""
+	n = max(1, n)
+	b = math.ceil(math.sqrt(n))
+	return b, math.ceil(n / b)
+
+
+class BlockFile:
+	"""Bloques de registros int64 en disco, leídos de a un bloque por acceso."""
+
+	def __init__(self, ruta: str, io: Optional[ContadorIO] = None) -> None:
+		self.ruta = ruta
+		self.io = io if io is not None else ContadorIO()
+		self.ultimas_lecturas = 0
+		self._f = open(ruta, "r+b")
+		magia, self.n, self.b, self.block_size = _CABECERA.unpack(self._f.read(_CABECERA.size))
+		if magia != MAGIA:
+			self._f.close()
+			raise ValueError(f"{ruta} no es un archivo de bloques")
+		self.tam_bloque = 8 * (1 + self.block_size)
+
+	def __enter__(self) -> "BlockFile":
+		return self
+
+	def __exit__(self, *exc) -> None:
+		self.cerrar()
+
+	def cerrar(self) -> None:
+		if not self._f.closed:
+			self._f.close()
+
+	@property
+	def cerrado(self) -> bool:
+		return self._f.closed
+
+	# ------------------------------------------------------------
+	# Creación
+	# ------------------------------------------------------------
+	@classmethod
+	def crear(cls, ruta: str, n: int, bloques: Iterable[Sequence[Optional[int]]], b: Optional[int] = None, block_size: Optional[int] = None) -> "BlockFile":
+		"""Escribe los bloques dados (None = posición libre) y abre el archivo."""
+		if b is None or block_size is None:
+			b, block_size = dimensiones(n)
+		vacio = array("q", [0] + [VACIO] * block_size)
+		with open(ruta, "wb") as f:
+			f.write(_CABECERA.pack(MAGIA, n, b, block_size))
+			escritos = 0
+			for registros in bloques:
+				if escritos == b:
+					raise ValueError("hay más bloques que B")
+				f.write(_bloque(registros, block_size).tobytes())
+				escritos += 1
+			for _ in range(escritos, b):
+				f.write(vacio.tobytes())
+		return cls(ruta)
+
+	@classmethod
+	def desde_claves(cls, ruta: str, n: int, claves: Iterable[int]) -> "BlockFile":
+		"""Empaqueta claves ya ordenadas en bloques llenos, sin cargarlas todas en memoria."""
+		_, block_size = dimensiones(n)
+
+		def trozos() -> Iterator[List[int]]:
+			trozo: List[int] = []
+			for k in claves:
+				trozo.append(k)
+				if len(trozo) == block_size:
+					yield trozo
+					trozo = []
+			if trozo:
+				yield trozo
+
+		return cls.crear(ruta, n, trozos())
+
+	# ------------------------------------------------------------
+	# Acceso a bloques
+	# ------------------------------------------------------------
+	def _leer(self, i: int, contar: bool = True) -> array:
+		offset = _CABECERA.size + i * self.tam_bloque
+		if hasattr(os, "pread"):
+			datos = os.pread(self._f.fileno(), self.tam_bloque, offset)
+		else:
+			self._f.seek(offset)
+			datos = self._f.read(self.tam_bloque)
+		bloque = array("q")
+		bloque.frombytes(datos)
+		if contar:
+			self.io.lecturas += 1
+			self.ultimas_lecturas += 1
+		return bloque
+
+	def leer_bloque(self, i: int) -> List[int]:
+		"""Registros del bloque i (una lectura)."""
+		return [v for v in self._leer(i)[1:] if v != VACIO]
+
+	def ver_bloque(self, i: int) -> List[int]:
+		"""Registros del bloque i sin contar la lectura (para recorrer o dibujar, no para buscar)."""
+		return [v for v in self._leer(i, contar=False)[1:] if v != VACIO]
+
+	def leer_posiciones(self, i: int) -> List[Optional[int]]:
+		"""Las block_size posiciones del bloque i, con None en las libres (una lectura)."""
+		return [None if v == VACIO else v for v in self._leer(i)[1:]]
+
+	def escribir_bloque(self, i: int, registros: Sequence[Optional[int]]) -> None:
+		if len(registros) > self.block_size:
+			raise ValueError("el bloque excede su tamaño")
+		datos = _bloque(registros, self.block_size).tobytes()
+		offset = _CABECERA.size + i * self.tam_bloque
+		if hasattr(os, "pwrite"):
+			os.pwrite(self._f.fileno(), datos, offset)
+		else:
+			self._f.seek(offset)
+			self._f.write(datos)
+		self.io.escrituras += 1
+
+	def bloques(self) -> Iterator[List[int]]:
+		"""Todos los bloques en orden (B lecturas)."""
+		for i in range(self.b):
+			yield self.leer_bloque(i)
+
+	# ------------------------------------------------------------
+	# Búsquedas (cuentan lecturas de bloque)
+	# ------------------------------------------------------------
+	def buscar(self, key: int, binaria: bool = False) -> Optional[Tuple[int, int]]:
+		"""(bloque, posición) de key en un archivo ordenado, o None."""
+		self.ultimas_lecturas = 0
+		if binaria:
+			return self._buscar_binaria(key)
+		for i in range(self.b):
+			bloque = self.leer_bloque(i)
+			if not bloque:
+				break
+			if key <= bloque[-1]:
+				return _posicion(bloque, i, key)
+		return None
+
+	def _buscar_binaria(self, key: int) -> Optional[Tuple[int, int]]:
+		left, right = 0, self.b - 1
+		candidato: Optional[Tuple[int, List[int]]] = None
+		while left <= right:
+			mid = (left + right) // 2
+			bloque = self.leer_bloque(mid)
+			if not bloque or key <= bloque[-1]:
+				# Los bloques vacíos están al final: la clave va antes
+				if bloque:
+					candidato = (mid, bloque)
+				right = mid - 1
+			else:
+				left = mid + 1
+		if candidato is None:
+			return None
+		return _posicion(candidato[1], candidato[0], key)
+
+	def buscar_direcciones(self, key: int, direcciones: Iterable[int]) -> int:
+		"""
+		Recorre las direcciones de sondeo de una tabla hash guardada en bloques
+		(dirección i en el bloque i // block_size); solo se lee un bloque nuevo
+		cuando la dirección cae fuera del que ya se tiene. Devuelve la dirección
+		de key o -1 (se detiene en la primera posición libre).
+		"""
+		self.ultimas_lecturas = 0
+		actual, posiciones = -1, []
+		for d in direcciones:
+			i = d // self.block_size
+			if i != actual:
+				actual, posiciones = i, self.leer_posiciones(i)
+			v = posiciones[d % self.block_size]
+			if v is None:
+				return -1
+			if v == key:
+				return d
+		return -1
+
+
+class BloquesEnArchivo(Sequence[List[int]]):
+	"""Los bloques de un BlockFile como secuencia de solo lectura, leídos al pedirlos."""
+
+	def __init__(self, archivo: BlockFile, cache: int = BLOQUES_EN_CACHE) -> None:
+		self.archivo = archivo
+		self.cache = max(1, cache)
+		self._bloques: "OrderedDict[int, List[int]]" = OrderedDict()
+
+	def __len__(self) -> int:
+		return self.archivo.b
+
+	def __getitem__(self, i):
+		if isinstance(i, slice):
+			return [self[j] for j in range(*i.indices(len(self)))]
+		if i < 0:
+			i += len(self)
+		if not 0 <= i < len(self):
+			raise IndexError(i)
+		bloque = self._bloques.get(i)
+		if bloque is None:
+			bloque = self.archivo.ver_bloque(i)
+			self._bloques[i] = bloque
+			if len(self._bloques) > self.cache:
+				self._bloques.popitem(last=False)
+		else:
+			self._bloques.move_to_end(i)
+		return bloque
+
+	def reabrir(self) -> None:
+		"""Vuelve a abrir el archivo si se cerró (al volver a esta estructura con deshacer/rehacer)."""
+		if self.archivo.cerrado:
+			self.archivo = BlockFile(self.archivo.ruta)
+			self._bloques.clear()
+
+
+def validar_clave(clave: int) -> int:
+	"""La clave si cabe en un registro; VACIO (-2^63) marca las posiciones libres."""
+	if not clave_valida(clave):
+		raise ValueError(f"la clave {clave} no cabe en un registro int64 (-2^63 marca las posiciones libres)")
+	return clave
+
+
+def _bloque(registros: Sequence[Optional[int]], block_size: int) -> array:
+	valores = [VACIO if v is None else validar_clave(v) for v in registros]
+	ocupados = len(valores) - valores.count(VACIO)
+	return array("q", [ocupados] + valores + [VACIO] * (block_size - len(valores)))
+
+
+def _posicion(bloque: List[int], i: int, key: int) -> Optional[Tuple[int, int]]:
+	for pos, v in enumerate(bloque):
+		if v == key:
+			return i, pos
+		if v > key:
+			break
+	return None
+
+
+# ------------------------------------------------------------------
+# CLI
+# ------------------------------------------------------------------
+
+def main(argv: Optional[List[str]] = None) -> None:
+	parser = argparse.ArgumentParser(description="Archivo binario de bloques: creación y búsquedas con conteo de lecturas")
+	sub = parser.add_subparsers(dest="orden", required=True)
+
+	crear = sub.add_parser("crear", help="genera n claves aleatorias ordenadas en un archivo de bloques")
+	crear.add_argument("archivo")
+	crear.add_argument("-n", type=int, default=100000)
+	crear.add_argument("-d", "--digitos", type=int, default=7)
+	crear.add_argument("--semilla", type=int, default=None)
+
+	buscar = sub.add_parser("buscar", help="búsquedas aleatorias (o las claves dadas) sobre el archivo")
+	buscar.add_argument("archivo")
+	buscar.add_argument("claves", nargs="*", type=int)
+	buscar.add_argument("--consultas", type=int, default=1000)
+	buscar.add_argument("--binaria", action="store_true", help="búsqueda binaria entre bloques")
+	buscar.add_argument("--semilla", type=int, default=None)
+
+	args = parser.parse_args(argv)
+	rng = random.Random(args.semilla)
+
+	if args.orden == "crear":
+		minimo = 10 ** (args.digitos - 1) if args.digitos > 1 else 0
+		disponibles = 10 ** args.digitos - minimo
+		if args.n > disponibles:
+			parser.error(f"solo hay {disponibles} claves de {args.digitos} dígitos")
+		claves = rng.sample(range(minimo, minimo + disponibles), args.n)
+		claves.sort()
+		with BlockFile.desde_claves(args.archivo, args.n, claves) as archivo:
+			print(f"{args.archivo}: n={archivo.n}, B={archivo.b}, registros por bloque={archivo.block_size}")
+		return
+
+	with BlockFile(args.archivo) as archivo:
+		claves = args.claves
+		if not claves:
+			# Claves presentes tomadas de bloques al azar, más algunas ausentes
+			claves = []
+			for _ in range(args.consultas):
+				bloque = archivo.leer_bloque(rng.randrange(archivo.b))
+				claves.append(rng.choice(bloque) if bloque and rng.random() < 0.8 else rng.randrange(10 ** 9))
+		lecturas: List[int] = []
+		encontradas = 0
+		inicio = time.perf_counter()
+		for k in claves:
+			if archivo.buscar(k, args.binaria) is not None:
+				encontradas += 1
+			lecturas.append(archivo.ultimas_lecturas)
+		segundos = time.perf_counter() - inicio
+
+	modo = "binaria" if args.binaria else "secuencial"
+	print(f"Búsqueda {modo}: {len(claves)} consultas, {encontradas} encontradas")
+	print(f"Lecturas de bloque por búsqueda: media={sum(lecturas) / max(1, len(lecturas)):.2f} máx={max(lecturas, default=0)}")
+	print(f"Tiempo: {segundos * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,550 @@
+"""
+Búsqueda por bloques sin interfaz gráfica (misma estructura que BloquesView
+y BloquesBinariaView).
+
+- n registros ordenados en B = ⌈√n⌉ bloques de ⌈n/B⌉ registros.
+- Para ubicar el bloque se compara la clave con el último registro de cada
+  bloque: en orden (secuencial) o por bisección (binaria).
+- Cada bloque examinado cuenta como una lectura de bloque.
+- FenceIndex guarda en memoria el máximo de cada bloque (fence keys): ubicar
+  el bloque de una clave es un bisect O(log B) y luego se lee un solo bloque.
+- BloomFilters (opcional, dentro de FenceIndex) guarda un filtro de Bloom por
+  bloque: una búsqueda que falla se responde sin leer el bloque casi siempre.
+- buscar_bloque ubica el bloque sobre las fence keys con búsqueda binaria,
+  por interpolación (con paso binario si la distribución está sesgada) o
+  exponencial; cada sondeo es la lectura de un bloque.
+- SplitMergeBlocks reemplaza el corrimiento en cascada: un bloque lleno se
+  divide y uno con pocos registros se fusiona o redistribuye con un vecino,
+  así cada operación reescribe a lo sumo dos bloques.
+"""
+
+import math
+from bisect import bisect_left
+from typing import List, Optional, Sequence, Tuple
+
+from app.core.paged_storage import ContadorIO
+
+
+FACTOR_LLENADO = 0.5
+
+ESTRATEGIAS = ("binaria", "interpolacion", "exponencial")
+
+BITS_POR_CLAVE = 10
+
+_MASCARA = (1 << 64) - 1
+
+
+def _mezclar(x: int) -> int:
+	"""splitmix64: dispersa bien claves consecutivas."""
+	x = (x + 0x9E3779B97F4A7C15) & _MASCARA
+	x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASCARA
+	x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASCARA
+	return x ^ (x >> 31)
+
+
+class BloomFilters:
+	"""Un filtro de Bloom por bloque, reconstruido cada vez que el bloque se reescribe."""
+
+	def __init__(self, bits_por_clave: int = BITS_POR_CLAVE) -> None:
+		self.bits_por_clave = max(1, bits_por_clave)
+		self.num_hashes = max(1, round(self.bits_por_clave * math.log(2)))
+		# (bits del filtro, mapa de bits) por bloque
+		self.filtros: List[Tuple[int, int]] = []
+		self.consultas = 0
+		self.lecturas_evitadas = 0
+		self.falsos_positivos = 0
+
+	def _posiciones(self, key: int, m: int):
+		# Doble hashing: h1 + i·h2 con h2 impar
+		h1 = _mezclar(key)
+		h2 = _mezclar(h1) | 1
+		for i in range(self.num_hashes):
+			yield (h1 + i * h2) % m
+
+	def _filtro(self, block: Sequence[int]) -> Tuple[int, int]:
+		m = self.bits_por_clave * max(1, len(block))
+		bits = 0
+		for key in block:
+			for p in self._posiciones(key, m):
+				bits |= 1 << p
+		return m, bits
+
+	def reconstruir(self, blocks: Sequence[List[int]]) -> None:
+		self.filtros = [self._filtro(block) for block in blocks]
+
+	def actualizar(self, blocks: Sequence[List[int]], idx: int) -> None:
+		if len(self.filtros) != len(blocks):
+			self.reconstruir(blocks)
+		else:
+			self.filtros[idx] = self._filtro(blocks[idx])
+
+	def puede_contener(self, idx: int, key: int) -> bool:
+		m, bits = self.filtros[idx]
+		return all(bits >> p & 1 for p in self._posiciones(key, m))
+
+	def consultar(self, blocks: Sequence[List[int]], idx: int, key: int) -> bool:
+		"""¿Hay que leer el bloque idx para buscar key? Lleva las estadísticas."""
+		self.consultas += 1
+		if not self.puede_contener(idx, key):
+			self.lecturas_evitadas += 1
+			return False
+		if key not in blocks[idx]:
+			# Se leerá el bloque para nada
+			self.falsos_positivos += 1
+		return True
+
+	@property
+	def tasa_falsos_positivos(self) -> float:
+		"""Falsos positivos sobre las consultas de claves ausentes."""
+		negativas = self.lecturas_evitadas + self.falsos_positivos
+		return self.falsos_positivos / negativas if negativas else 0.0
+
+	@property
+	def tasa_teorica(self) -> float:
+		k, b = self.num_hashes, self.bits_por_clave
+		return (1 - math.exp(-k / b)) ** k
+
+
+class FenceIndex:
+	"""Fence keys: último registro (máximo) de cada bloque no vacío, en orden de bloque."""
+
+	def __init__(self, blocks: Sequence[List[int]] = ()) -> None:
+		# Filtros de Bloom por bloque (opcionales), mantenidos junto con las fence keys
+		self.filtros: Optional[BloomFilters] = None
+		self.reconstruir(blocks)
+
+	def reconstruir(self, blocks: Sequence[List[int]]) -> None:
+		self.maximos: List[int] = [block[-1] for block in blocks if block]
+		self.bloques: List[int] = [i for i, block in enumerate(blocks) if block]
+		if self.filtros is not None:
+			self.filtros.reconstruir(blocks)
+
+	def actualizar(self, blocks: Sequence[List[int]], idx: int) -> None:
+		"""El bloque idx cambió: se ajusta solo su fence key (y su filtro)."""
+		if self.filtros is not None:
+			self.filtros.actualizar(blocks, idx)
+		j = bisect_left(self.bloques, idx)
+		presente = j < len(self.bloques) and self.bloques[j] == idx
+		if blocks[idx]:
+			if presente:
+				self.maximos[j] = blocks[idx][-1]
+			else:
+				self.bloques.insert(j, idx)
+				self.maximos.insert(j, blocks[idx][-1])
+		elif presente:
+			del self.bloques[j]
+			del self.maximos[j]
+
+	def bloque_de(self, key: int) -> int:
+		"""Primer bloque cuyo máximo es ≥ key, o -1 si key es mayor que todos."""
+		i = bisect_left(self.maximos, key)
+		return self.bloques[i] if i < len(self.bloques) else -1
+
+	def ubicar(self, blocks: Sequence[List[int]], key: int) -> Tuple[int, int]:
+		"""(bloque, posición) donde está o iría key; (-1, 0) si va después del último registro."""
+		idx = self.bloque_de(key)
+		if idx < 0:
+			return -1, 0
+		return idx, bisect_left(blocks[idx], key)
+
+	def contiene(self, blocks: Sequence[List[int]], key: int) -> bool:
+		idx, pos = self.ubicar(blocks, key)
+		return idx >= 0 and blocks[idx][pos] == key
+
+
+def buscar_bloque(
+	maximos: Sequence[int], key: int, estrategia: str = "binaria", dominio: Optional[Tuple[int, int]] = None
+) -> Tuple[int, List[Tuple[int, str]]]:
+	"""
+	Primer i con maximos[i] ≥ key (o -1) y los sondeos hechos como (i, tipo).
+
+	`dominio` = (mínima, máxima) clave posible, para interpolar; por defecto el
+	primer y el último máximo (datos de cabecera, no cuentan como lectura).
+	"""
+	sondeos: List[Tuple[int, str]] = []
+	if not maximos:
+		return -1, sondeos
+	if estrategia == "interpolacion":
+		lo, hi = _interpolacion(maximos, key, dominio or (maximos[0], maximos[-1]), sondeos)
+	elif estrategia == "exponencial":
+		lo, hi = _exponencial(maximos, key, sondeos)
+	else:
+		lo, hi = 0, len(maximos) - 1
+	# Binaria sobre lo que queda (todo el arreglo si la estrategia es binaria)
+	while lo <= hi:
+		mid = (lo + hi) // 2
+		sondeos.append((mid, "binaria"))
+		if maximos[mid] >= key:
+			hi = mid - 1
+		else:
+			lo = mid + 1
+	return (lo if lo < len(maximos) else -1), sondeos
+
+
+def _interpolacion(maximos: Sequence[int], key: int, dominio: Tuple[int, int], sondeos: List[Tuple[int, str]]) -> Tuple[int, int]:
+	"""Acota por interpolación; si un sondeo no reduce el rango a la mitad, el siguiente es binario."""
+	lo, hi = 0, len(maximos) - 1
+	# Cotas de valor: todo lo anterior a lo es < key; hi + 1 (si existe) es ≥ key
+	v_lo, v_hi = dominio[0] - 1, max(dominio[1], key)
+	while lo <= hi:
+		tam = hi - lo + 1
+		if v_hi > v_lo:
+			pos = lo + -(-(key - v_lo) * (tam + 1) // (v_hi - v_lo)) - 1
+		else:
+			pos = lo
+		pos = min(hi, max(lo, pos))
+		sondeos.append((pos, "interpolacion"))
+		if maximos[pos] >= key:
+			hi, v_hi = pos - 1, maximos[pos]
+		else:
+			lo, v_lo = pos + 1, maximos[pos]
+		if hi - lo + 1 > tam // 2:
+			# Distribución sesgada: un paso binario garantiza O(log B)
+			if lo > hi:
+				break
+			mid = (lo + hi) // 2
+			sondeos.append((mid, "binaria"))
+			if maximos[mid] >= key:
+				hi, v_hi = mid - 1, maximos[mid]
+			else:
+				lo, v_lo = mid + 1, maximos[mid]
+	return lo, hi
+
+
+def _exponencial(maximos: Sequence[int], key: int, sondeos: List[Tuple[int, str]]) -> Tuple[int, int]:
+	"""Sondea 0, 1, 3, 7, … hasta pasar key; deja el rango para la binaria."""
+	lo, i = 0, 0
+	while i < len(maximos):
+		sondeos.append((i, "exponencial"))
+		if maximos[i] >= key:
+			return lo, i - 1
+		lo = i + 1
+		i = 2 * i + 1
+	return lo, len(maximos) - 1
+
+
+class SplitMergeBlocks:
+	"""
+	Inserción por división y borrado por fusión/redistribución sobre una lista
+	de bloques (se modifica en su lugar). Los bloques con datos quedan al
+	principio y los vacíos, de reserva, al final.
+	"""
+
+	def __init__(self, block_size: int, factor_llenado: float = FACTOR_LLENADO, bloques_minimos: int = 0, io: Optional[ContadorIO] = None) -> None:
+		self.block_size = max(1, block_size)
+		self.factor_llenado = min(1.0, max(0.0, factor_llenado))
+		# Se conservan al menos estos bloques (vacíos al final si sobran)
+		self.bloques_minimos = bloques_minimos
+		# Debajo de este tamaño un bloque se fusiona o pide registros al vecino
+		self.minimo = max(1, self.block_size // 2)
+		# Bloques leídos / escritos por las operaciones
+		self.io = io if io is not None else ContadorIO()
+		self.registros_movidos = 0
+		# Descripción de la última operación, suficiente para revertirla (ver revertir)
+		self.cambio: Optional[Tuple] = None
+
+	def _corte(self) -> int:
+		"""Registros que conserva el bloque dividido, según el factor de llenado."""
+		return min(self.block_size, max(1, round(self.factor_llenado * (self.block_size + 1))))
+
+	def insertar(self, blocks: List[List[int]], fences: FenceIndex, key: int) -> int:
+		"""Inserta key (que no debe existir) y devuelve el bloque donde quedó."""
+		if not blocks:
+			blocks.append([])
+		idx, pos = fences.ubicar(blocks, key)
+		if idx < 0:
+			idx = fences.bloques[-1] if fences.bloques else 0
+			pos = len(blocks[idx])
+		block = blocks[idx]
+		self.io.lecturas += 1
+		block.insert(pos, key)
+		self.io.escrituras += 1
+		if len(block) <= self.block_size:
+			self.cambio = ("insertar", idx, pos, key, None)
+			fences.actualizar(blocks, idx)
+			return idx
+
+		# División: la parte alta pasa a un bloque nuevo justo después
+		corte = self._corte()
+		blocks.insert(idx + 1, block[corte:])
+		self.registros_movidos += len(block) - corte
+		del block[corte:]
+		self.io.escrituras += 1
+		reserva = len(blocks) > self.bloques_minimos and not blocks[-1]
+		if reserva:
+			# El bloque nuevo ocupa uno vacío de reserva
+			blocks.pop()
+		self.cambio = ("insertar", idx, pos, key, ("dividir", reserva))
+		fences.reconstruir(blocks)
+		return idx if pos < corte else idx + 1
+
+	def eliminar(self, blocks: List[List[int]], fences: FenceIndex, idx: int, pos: int) -> None:
+		"""Quita blocks[idx][pos]; si el bloque queda corto, fusiona o redistribuye."""
+		block = blocks[idx]
+		self.io.lecturas += 1
+		key = block.pop(pos)
+		self.io.escrituras += 1
+		self.cambio = ("eliminar", idx, pos, key, None)
+		if len(block) >= self.minimo:
+			fences.actualizar(blocks, idx)
+			return
+
+		if idx + 1 < len(blocks) and blocks[idx + 1]:
+			izq = idx
+		elif idx > 0:
+			izq = idx - 1
+		else:
+			# Único bloque con datos: puede quedar corto (o vacío)
+			fences.actualizar(blocks, idx)
+			return
+		der = izq + 1
+		vecino = blocks[der] if izq == idx else blocks[izq]
+		self.io.lecturas += 1
+		juntos = blocks[izq] + blocks[der]
+		corte = len(blocks[izq])
+
+		if len(vecino) > self.minimo:
+			# Redistribución: ambos bloques quedan con la mitad
+			mitad = (len(juntos) + 1) // 2
+			self.registros_movidos += abs(len(blocks[izq]) - mitad)
+			blocks[izq][:] = juntos[:mitad]
+			blocks[der][:] = juntos[mitad:]
+			self.io.escrituras += 1
+			self.cambio = ("eliminar", idx, pos, key, ("redistribuir", izq, corte))
+			fences.actualizar(blocks, izq)
+			fences.actualizar(blocks, der)
+			return
+
+		# Fusión: el bloque izquierdo absorbe al derecho, que se libera
+		# (sigue siendo una sola escritura: la del bloque que sobrevive)
+		self.registros_movidos += len(blocks[der])
+		blocks[izq][:] = juntos
+		del blocks[der]
+		reserva = len(blocks) < self.bloques_minimos
+		if reserva:
+			blocks.append([])
+		self.cambio = ("eliminar", idx, pos, key, ("fusionar", izq, corte, reserva))
+		fences.reconstruir(blocks)
+
+	@staticmethod
+	def revertir(blocks: List[List[int]], fences: FenceIndex, cambio: Tuple) -> None:
+		"""
+		Deshace la operación descrita por `cambio` (el atributo del mismo nombre
+		tras insertar/eliminar): una división se deshace fusionando y una fusión
+		dividiendo por el mismo corte. Toca los mismos bloques que la operación.
+		"""
+		_, idx, pos, key, ajuste = cambio
+		tocados = [idx]
+		if cambio[0] == "insertar":
+			if ajuste is not None:
+				_, reserva = ajuste
+				blocks[idx].extend(blocks.pop(idx + 1))
+				if reserva:
+					blocks.append([])
+			blocks[idx].pop(pos)
+		else:
+			if ajuste is not None and ajuste[0] == "redistribuir":
+				_, izq, corte = ajuste
+				juntos = blocks[izq] + blocks[izq + 1]
+				blocks[izq][:] = juntos[:corte]
+				blocks[izq + 1][:] = juntos[corte:]
+				tocados = [izq, izq + 1]
+			elif ajuste is not None:
+				_, izq, corte, reserva = ajuste
+				if reserva:
+					blocks.pop()
+				juntos = blocks[izq]
+				blocks.insert(izq + 1, juntos[corte:])
+				del juntos[corte:]
+			blocks[idx].insert(pos, key)
+		if ajuste is not None and ajuste[0] != "redistribuir":
+			# Cambió la cantidad de bloques: se corren los índices de los siguientes
+			fences.reconstruir(blocks)
+		else:
+			for i in tocados:
+				fences.actualizar(blocks, i)
+
+	def repetir(self, blocks: List[List[int]], fences: FenceIndex, cambio: Tuple) -> None:
+		"""Vuelve a aplicar la operación descrita por `cambio` (rehacer tras revertir)."""
+		_, idx, pos, key, _ = cambio
+		if cambio[0] == "insertar":
+			self.insertar(blocks, fences, key)
+		else:
+			self.eliminar(blocks, fences, idx, pos)
+
+
+class BlockTable:
+	"""Registros ordenados en bloques de tamaño fijo, con contadores de acceso."""
+
+	def __init__(self, n: int, binaria: bool = False, factor_llenado: Optional[float] = None) -> None:
+		self.n = max(1, n)
+		self.b = math.ceil(math.sqrt(self.n))
+		self.block_size = math.ceil(self.n / self.b)
+		self.binaria = binaria
+		self.blocks: List[List[int]] = [[] for _ in range(self.b)]
+		self.fences = FenceIndex(self.blocks)
+		self.total = 0
+
+		self.bloques_leidos = 0
+		self.comparaciones = 0
+		self.registros_desplazados = 0
+		# Lecturas de bloque de la última búsqueda
+		self.ultimas_lecturas = 0
+
+		# Con factor de llenado se divide/fusiona en lugar de desplazar en cascada
+		self.division: Optional[SplitMergeBlocks] = None
+		if factor_llenado is not None:
+			self.division = SplitMergeBlocks(self.block_size, factor_llenado, self.b)
+
+	def __len__(self) -> int:
+		return self.total
+
+	def __contains__(self, key: int) -> bool:
+		return self.buscar(key) is not None
+
+	@property
+	def llena(self) -> bool:
+		return self.total >= self.n
+
+	# ------------------------------------------------------------
+	# Búsqueda
+	# ------------------------------------------------------------
+	def bloque_de(self, key: int) -> int:
+		"""Primer bloque no vacío cuyo último registro es ≥ key, o -1."""
+		if self.binaria:
+			return self._bloque_binario(key)
+		return self._bloque_secuencial(key)
+
+	def _bloque_secuencial(self, key: int) -> int:
+		for idx, block in enumerate(self.blocks):
+			if not block:
+				continue
+			self.ultimas_lecturas += 1
+			self.comparaciones += 1
+			if key <= block[-1]:
+				return idx
+		return -1
+
+	def _bloque_binario(self, key: int) -> int:
+		left, right = 0, len(self.blocks) - 1
+		target = -1
+		while left <= right:
+			mid = (left + right) // 2
+			self.ultimas_lecturas += 1
+			if not self.blocks[mid]:
+				right = mid - 1
+				continue
+			self.comparaciones += 1
+			if key <= self.blocks[mid][-1]:
+				target = mid
+				right = mid - 1
+			else:
+				left = mid + 1
+		return target
+
+	def _posicion_en_bloque(self, block: List[int], key: int) -> int:
+		"""Posición de key dentro del bloque (lineal o binaria), o -1."""
+		if not self.binaria:
+			for pos, value in enumerate(block):
+				self.comparaciones += 1
+				if value == key:
+					return pos
+				if value > key:
+					break
+			return -1
+		left, right = 0, len(block) - 1
+		while left <= right:
+			mid = (left + right) // 2
+			self.comparaciones += 1
+			if block[mid] == key:
+				return mid
+			if block[mid] < key:
+				left = mid + 1
+			else:
+				right = mid - 1
+		return -1
+
+	def buscar(self, key: int) -> Optional[Tuple[int, int]]:
+		"""(bloque, posición) de key, o None."""
+		self.ultimas_lecturas = 0
+		idx = self.bloque_de(key)
+		pos = self._posicion_en_bloque(self.blocks[idx], key) if idx >= 0 else -1
+		self.bloques_leidos += self.ultimas_lecturas
+		return (idx, pos) if pos >= 0 else None
+
+	# ------------------------------------------------------------
+	# Inserción y borrado
+	# ------------------------------------------------------------
+	def insertar(self, key: int) -> Optional[int]:
+		"""Inserta en orden; devuelve el bloque, o None si es duplicada o la estructura está llena."""
+		if self.llena:
+			return None
+		# Las fence keys ubican el bloque sin leerlo; solo se lee el bloque destino
+		idx, pos = self.fences.ubicar(self.blocks, key)
+		self.bloques_leidos += 1
+		if idx >= 0 and self.blocks[idx][pos] == key:
+			return None
+		if self.division is not None:
+			movidos = self.division.registros_movidos
+			idx = self.division.insertar(self.blocks, self.fences, key)
+			self.registros_desplazados += self.division.registros_movidos - movidos
+			self.total += 1
+			return idx
+		if idx < 0:
+			# Va al final: último bloque con datos (o el primero si todo está vacío)
+			idx = self.fences.bloques[-1] if self.fences.bloques else 0
+			pos = len(self.blocks[idx])
+		block = self.blocks[idx]
+		block.insert(pos, key)
+		self.total += 1
+		if len(block) > self.block_size:
+			self._desbordar(idx)
+		else:
+			self.fences.actualizar(self.blocks, idx)
+		return idx
+
+	def _desbordar(self, idx: int) -> None:
+		"""Desplaza registros a los bloques vecinos hasta que idx vuelve a caber."""
+		blocks = self.blocks
+		if any(len(blocks[j]) < self.block_size for j in range(idx + 1, len(blocks))):
+			# Corrimiento hacia adelante: el último de cada bloque lleno pasa al siguiente
+			while len(blocks[idx]) > self.block_size:
+				blocks[idx + 1].insert(0, blocks[idx].pop())
+				self.registros_desplazados += 1
+				self.bloques_leidos += 1
+				self.fences.actualizar(blocks, idx)
+				idx += 1
+		else:
+			# Sin espacio adelante: el primero de cada bloque pasa al anterior
+			while len(blocks[idx]) > self.block_size:
+				blocks[idx - 1].append(blocks[idx].pop(0))
+				self.registros_desplazados += 1
+				self.bloques_leidos += 1
+				self.fences.actualizar(blocks, idx)
+				idx -= 1
+		self.fences.actualizar(blocks, idx)
+
+	def eliminar(self, key: int) -> bool:
+		"""Borra key y reorganiza los bloques de izquierda a derecha (como las vistas)."""
+		found = self.buscar(key)
+		if found is None:
+			return False
+		idx, pos = found
+		self.total -= 1
+		if self.division is not None:
+			movidos = self.division.registros_movidos
+			self.division.eliminar(self.blocks, self.fences, idx, pos)
+			self.registros_desplazados += self.division.registros_movidos - movidos
+			return True
+		self.blocks[idx].pop(pos)
+
+		registros = [(j, v) for j, block in enumerate(self.blocks) for v in block]
+		nuevos: List[List[int]] = [[] for _ in range(self.b)]
+		for i, (anterior, v) in enumerate(registros):
+			j = min(i // self.block_size, self.b - 1)
+			nuevos[j].append(v)
+			if j != anterior:
+				self.registros_desplazados += 1
+		self.blocks = nuevos
+		self.fences.reconstruir(nuevos)
+		return True
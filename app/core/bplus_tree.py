@@ -0,0 +1,358 @@
+"""
+Árbol B+ con nodos del tamaño de un bloque, dimensionado con los parámetros
+de IndicesView.
+
+- Cada nodo es una página de B bytes con entradas de Ri = v + p bytes, así
+  que la capacidad (fanout) es bfri = ⌊B/Ri⌋, la misma fórmula del índice:
+  un nodo interno tiene hasta bfri hijos y una hoja hasta bfri claves.
+- Los nodos, salvo la raíz, tienen al menos ⌊(bfri + 1)/2⌋ hijos o claves:
+  al insertar se dividen y al eliminar piden prestado a un hermano o se
+  fusionan con él, así todas las hojas quedan siempre a la misma altura.
+- Las hojas guardan las claves (con su valor, p. ej. el bloque de datos) y
+  están encadenadas en orden para los recorridos por rango.
+- Las páginas se identifican por número; cada nodo visitado cuenta como una
+  lectura y cada nodo modificado como una escritura (ContadorIO).
+
+Uso:
+	python -m app.core.bplus_tree -r 30000 -B 1024 -R 100 -v 9 -p 6
+	python -m app.core.bplus_tree -r 30000 -B 512 --eliminar 0.5 --rango 100
+"""
+
+import argparse
+import random
+import time
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from app.core.isam_index import CONSULTAS, costos
+from app.core.paged_storage import ContadorIO
+
+
+_SIN_PAGINA = -1
+
+
+class _Nodo:
+	__slots__ = ("hoja", "claves", "hijos", "valores", "siguiente")
+
+	def __init__(self, hoja: bool) -> None:
+		self.hoja = hoja
+		self.claves: List[int] = []
+		# Internos: números de página de los hijos; hojas: valores de cada clave
+		self.hijos: List[int] = []
+		self.valores: List[Any] = []
+		self.siguiente = _SIN_PAGINA
+
+
+class BPlusTree:
+	"""Árbol B+ de claves enteras con capacidad por nodo bfri y contadores de lecturas de nodo."""
+
+	def __init__(self, B: int, v: int, p: int, io: Optional[ContadorIO] = None) -> None:
+		Ri = v + p
+		if B <= 0 or v <= 0 or p <= 0:
+			raise ValueError("B, v y p deben ser positivos")
+		self.capacidad = int(B // Ri)
+		if self.capacidad < 3:
+			raise ValueError(f"Con bfri = ⌊B/Ri⌋ = {self.capacidad} no se puede armar un árbol B+ (hacen falta al menos 3 entradas por nodo)")
+		self.minimo = (self.capacidad + 1) // 2
+		self.io = io if io is not None else ContadorIO()
+		self.ultimas_lecturas = 0
+		self._paginas: Dict[int, _Nodo] = {}
+		self._libres: List[int] = []
+		self._total_paginas = 0
+		self._n = 0
+		self.raiz = self._nueva(_Nodo(hoja=True))
+
+	def __len__(self) -> int:
+		return self._n
+
+	def __contains__(self, clave: int) -> bool:
+		return self.buscar(clave) is not None
+
+	# ------------------------------------------------------------
+	# Páginas
+	# ------------------------------------------------------------
+	def _nueva(self, nodo: _Nodo) -> int:
+		if self._libres:
+			pagina = self._libres.pop()
+		else:
+			pagina = self._total_paginas
+			self._total_paginas += 1
+		self._paginas[pagina] = nodo
+		self.io.escrituras += 1
+		return pagina
+
+	def _liberar(self, pagina: int) -> None:
+		del self._paginas[pagina]
+		self._libres.append(pagina)
+
+	def _leer(self, pagina: int) -> _Nodo:
+		self.io.lecturas += 1
+		self.ultimas_lecturas += 1
+		return self._paginas[pagina]
+
+	def _escribir(self, *nodos: _Nodo) -> None:
+		self.io.escrituras += len(nodos)
+
+	def _camino(self, clave: int) -> List[Tuple[int, _Nodo, int]]:
+		"""(página, nodo, hijo elegido) desde la raíz hasta la hoja de clave (una lectura por nivel)."""
+		camino = []
+		pagina = self.raiz
+		while True:
+			nodo = self._leer(pagina)
+			if nodo.hoja:
+				camino.append((pagina, nodo, -1))
+				return camino
+			i = bisect_right(nodo.claves, clave)
+			camino.append((pagina, nodo, i))
+			pagina = nodo.hijos[i]
+
+	# ------------------------------------------------------------
+	# Consultas
+	# ------------------------------------------------------------
+	def buscar(self, clave: int) -> Optional[Any]:
+		"""Valor de clave (True si se insertó sin valor), o None; cuenta los nodos leídos."""
+		self.ultimas_lecturas = 0
+		hoja = self._camino(clave)[-1][1]
+		i = bisect_left(hoja.claves, clave)
+		if i < len(hoja.claves) and hoja.claves[i] == clave:
+			return hoja.valores[i]
+		return None
+
+	def rango(self, desde: int, hasta: int) -> Iterator[Tuple[int, Any]]:
+		"""(clave, valor) con desde ≤ clave ≤ hasta, recorriendo la cadena de hojas."""
+		self.ultimas_lecturas = 0
+		hoja = self._camino(desde)[-1][1]
+		i = bisect_left(hoja.claves, desde)
+		while True:
+			while i < len(hoja.claves):
+				if hoja.claves[i] > hasta:
+					return
+				yield hoja.claves[i], hoja.valores[i]
+				i += 1
+			if hoja.siguiente == _SIN_PAGINA:
+				return
+			hoja, i = self._leer(hoja.siguiente), 0
+
+	def altura(self) -> int:
+		"""Niveles del árbol (1 = solo la raíz hoja); no cuenta lecturas."""
+		niveles, nodo = 1, self._paginas[self.raiz]
+		while not nodo.hoja:
+			niveles += 1
+			nodo = self._paginas[nodo.hijos[0]]
+		return niveles
+
+	def nodos_por_nivel(self) -> List[int]:
+		"""Nodos de cada nivel, de las hojas a la raíz (como multilevel_blocks del índice estático)."""
+		niveles, nivel = [], [self.raiz]
+		while True:
+			niveles.append(len(nivel))
+			primero = self._paginas[nivel[0]]
+			if primero.hoja:
+				break
+			nivel = [h for pagina in nivel for h in self._paginas[pagina].hijos]
+		return niveles[::-1]
+
+	# ------------------------------------------------------------
+	# Inserción
+	# ------------------------------------------------------------
+	def insertar(self, clave: int, valor: Any = True) -> bool:
+		"""Inserta clave; False si ya estaba (no se modifica)."""
+		self.ultimas_lecturas = 0
+		camino = self._camino(clave)
+		_, hoja, _ = camino[-1]
+		i = bisect_left(hoja.claves, clave)
+		if i < len(hoja.claves) and hoja.claves[i] == clave:
+			return False
+		hoja.claves.insert(i, clave)
+		hoja.valores.insert(i, valor)
+		self._escribir(hoja)
+		self._n += 1
+
+		# Las divisiones suben mientras el nodo exceda la capacidad
+		for nivel in range(len(camino) - 1, -1, -1):
+			pagina, nodo, _ = camino[nivel]
+			if len(nodo.hijos if not nodo.hoja else nodo.claves) <= self.capacidad:
+				break
+			separador, nueva = self._dividir(nodo)
+			if nivel == 0:
+				raiz = _Nodo(hoja=False)
+				raiz.claves = [separador]
+				raiz.hijos = [pagina, nueva]
+				self.raiz = self._nueva(raiz)
+			else:
+				padre, j = camino[nivel - 1][1], camino[nivel - 1][2]
+				padre.claves.insert(j, separador)
+				padre.hijos.insert(j + 1, nueva)
+				self._escribir(padre)
+		return True
+
+	def _dividir(self, nodo: _Nodo) -> Tuple[int, int]:
+		"""Pasa la mitad derecha de nodo a una página nueva; devuelve (separador, página nueva)."""
+		derecho = _Nodo(nodo.hoja)
+		if nodo.hoja:
+			corte = (len(nodo.claves) + 1) // 2
+			derecho.claves, nodo.claves = nodo.claves[corte:], nodo.claves[:corte]
+			derecho.valores, nodo.valores = nodo.valores[corte:], nodo.valores[:corte]
+			derecho.siguiente = nodo.siguiente
+			separador = derecho.claves[0]
+			pagina = self._nueva(derecho)
+			nodo.siguiente = pagina
+		else:
+			corte = (len(nodo.hijos) + 1) // 2
+			# La clave entre las dos mitades sube al padre
+			separador = nodo.claves[corte - 1]
+			derecho.claves, nodo.claves = nodo.claves[corte:], nodo.claves[:corte - 1]
+			derecho.hijos, nodo.hijos = nodo.hijos[corte:], nodo.hijos[:corte]
+			pagina = self._nueva(derecho)
+		self._escribir(nodo)
+		return separador, pagina
+
+	# ------------------------------------------------------------
+	# Eliminación
+	# ------------------------------------------------------------
+	def eliminar(self, clave: int) -> bool:
+		"""Elimina clave; False si no estaba."""
+		self.ultimas_lecturas = 0
+		camino = self._camino(clave)
+		_, hoja, _ = camino[-1]
+		i = bisect_left(hoja.claves, clave)
+		if i >= len(hoja.claves) or hoja.claves[i] != clave:
+			return False
+		del hoja.claves[i]
+		del hoja.valores[i]
+		self._escribir(hoja)
+		self._n -= 1
+
+		for nivel in range(len(camino) - 1, 0, -1):
+			_, nodo, _ = camino[nivel]
+			if len(nodo.claves if nodo.hoja else nodo.hijos) >= self.minimo:
+				break
+			padre, j = camino[nivel - 1][1], camino[nivel - 1][2]
+			self._reequilibrar(padre, j, nodo)
+
+		# Una raíz interna con un solo hijo sobra: el árbol baja un nivel
+		pagina, raiz, _ = camino[0]
+		if not raiz.hoja and len(raiz.hijos) == 1:
+			self.raiz = raiz.hijos[0]
+			self._liberar(pagina)
+		return True
+
+	def _reequilibrar(self, padre: _Nodo, j: int, nodo: _Nodo) -> None:
+		"""nodo (hijo j de padre) quedó por debajo del mínimo: préstamo de un hermano o fusión."""
+		tam = (lambda n: len(n.claves)) if nodo.hoja else (lambda n: len(n.hijos))
+		izquierdo = self._leer(padre.hijos[j - 1]) if j > 0 else None
+		if izquierdo is not None and tam(izquierdo) > self.minimo:
+			if nodo.hoja:
+				nodo.claves.insert(0, izquierdo.claves.pop())
+				nodo.valores.insert(0, izquierdo.valores.pop())
+				padre.claves[j - 1] = nodo.claves[0]
+			else:
+				nodo.claves.insert(0, padre.claves[j - 1])
+				nodo.hijos.insert(0, izquierdo.hijos.pop())
+				padre.claves[j - 1] = izquierdo.claves.pop()
+			self._escribir(izquierdo, nodo, padre)
+			return
+		derecho = self._leer(padre.hijos[j + 1]) if j + 1 < len(padre.hijos) else None
+		if derecho is not None and tam(derecho) > self.minimo:
+			if nodo.hoja:
+				nodo.claves.append(derecho.claves.pop(0))
+				nodo.valores.append(derecho.valores.pop(0))
+				padre.claves[j] = derecho.claves[0]
+			else:
+				nodo.claves.append(padre.claves[j])
+				nodo.hijos.append(derecho.hijos.pop(0))
+				padre.claves[j] = derecho.claves.pop(0)
+			self._escribir(derecho, nodo, padre)
+			return
+		# Ningún hermano puede prestar: se fusiona con uno (queda a lo sumo la capacidad)
+		if izquierdo is not None:
+			self._fusionar(padre, j - 1, izquierdo, nodo)
+		else:
+			self._fusionar(padre, j, nodo, derecho)
+
+	def _fusionar(self, padre: _Nodo, j: int, izquierdo: _Nodo, derecho: _Nodo) -> None:
+		"""Une el hijo j + 1 de padre con el hijo j y libera su página."""
+		if izquierdo.hoja:
+			izquierdo.claves += derecho.claves
+			izquierdo.valores += derecho.valores
+			izquierdo.siguiente = derecho.siguiente
+		else:
+			izquierdo.claves += [padre.claves[j]] + derecho.claves
+			izquierdo.hijos += derecho.hijos
+		self._liberar(padre.hijos[j + 1])
+		del padre.claves[j]
+		del padre.hijos[j + 1]
+		self._escribir(izquierdo, padre)
+
+
+def comparar(r: int, B: int, R: int, v: int, p: int, consultas: int = CONSULTAS, semilla: Optional[int] = None) -> Dict[str, Any]:
+	"""
+	Inserta r claves al azar en un árbol B+ y mide los nodos leídos por
+	búsqueda (más el acceso al bloque de datos) frente a los accesos del
+	índice multinivel estático con los mismos parámetros.
+	"""
+	rng = random.Random(semilla)
+	arbol = BPlusTree(B, v, p)
+	claves = rng.sample(range(1, max(10 * r, 1000) + 1), r)
+	inicio = time.perf_counter()
+	for k in claves:
+		arbol.insertar(k)
+	segundos = time.perf_counter() - inicio
+	lecturas = []
+	for _ in range(max(1, consultas)):
+		arbol.buscar(rng.choice(claves))
+		lecturas.append(arbol.ultimas_lecturas + 1)
+	return {
+		"capacidad": arbol.capacidad,
+		"altura": arbol.altura(),
+		"nodos_por_nivel": arbol.nodos_por_nivel(),
+		"media": sum(lecturas) / len(lecturas),
+		"maximo": max(lecturas),
+		"escrituras": arbol.io.escrituras,
+		"segundos": segundos,
+		# Las hojas del B+ tienen una entrada por registro: se compara con el índice denso
+		"estatico_denso": costos(r, B, R, v, p, "secondary", True),
+		"estatico_primario": costos(r, B, R, v, p, "primary", True),
+		"arbol": arbol,
+	}
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+	parser = argparse.ArgumentParser(description="Árbol B+ con fanout bfri = ⌊B/(v+p)⌋ frente al índice multinivel estático")
+	parser.add_argument("-r", type=int, default=30000, help="número de registros")
+	parser.add_argument("-B", type=int, default=1024, help="bytes por bloque (nodo)")
+	parser.add_argument("-R", type=int, default=100, help="bytes por registro (para el índice estático)")
+	parser.add_argument("-v", type=int, default=9, help="bytes de la clave")
+	parser.add_argument("-p", type=int, default=6, help="bytes del puntero")
+	parser.add_argument("--consultas", type=int, default=CONSULTAS)
+	parser.add_argument("--eliminar", type=float, default=0.0, help="fracción de claves a eliminar después de insertar")
+	parser.add_argument("--rango", type=int, default=0, help="ancho de una consulta por rango de ejemplo")
+	parser.add_argument("--semilla", type=int, default=None)
+	args = parser.parse_args(argv)
+
+	try:
+		resultado = comparar(args.r, args.B, args.R, args.v, args.p, args.consultas, args.semilla)
+	except ValueError as e:
+		parser.error(str(e))
+	arbol: BPlusTree = resultado["arbol"]
+	denso, primario = resultado["estatico_denso"], resultado["estatico_primario"]
+	print(f"Árbol B+: capacidad bfri={resultado['capacidad']}, altura {resultado['altura']}, nodos por nivel {resultado['nodos_por_nivel']}")
+	print(f"  {args.r} inserciones en {resultado['segundos']:.2f} s, {resultado['escrituras']} escrituras de nodo")
+	print(f"  accesos por búsqueda (nodos + bloque de datos): media={resultado['media']:.2f} máx={resultado['maximo']}")
+	print(f"Índice multinivel estático denso: bloques por nivel {denso['multilevel_blocks']}, accesos {denso['accesos']}")
+	print(f"Índice multinivel estático primario: bloques por nivel {primario['multilevel_blocks']}, accesos {primario['accesos']}")
+
+	rng = random.Random(args.semilla)
+	if args.eliminar > 0:
+		claves = [k for k, _ in arbol.rango(0, 10 ** 18)]
+		for k in rng.sample(claves, int(len(claves) * min(1.0, args.eliminar))):
+			arbol.eliminar(k)
+		print(f"Tras eliminar {args.r - len(arbol)} claves: altura {arbol.altura()}, nodos por nivel {arbol.nodos_por_nivel()}")
+	if args.rango > 0 and len(arbol):
+		desde = rng.randrange(1, 10 * args.r)
+		encontradas = sum(1 for _ in arbol.rango(desde, desde + args.rango))
+		print(f"Rango [{desde}, {desde + args.rango}]: {encontradas} claves, {arbol.ultimas_lecturas} nodos leídos")
+
+
+if __name__ == "__main__":
+	main()
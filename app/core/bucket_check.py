@@ -0,0 +1,206 @@
+"""
+Comprobación de las tablas de cubetas de app/core/bucket_hashing.py.
+
+Compara el modo de una vez con la lógica de listas de las tablas originales
+de las vistas y los modos incremental y en disco con el de una vez, sobre
+cargas aleatorias con inserciones y eliminaciones (a mitad de cada carga
+las tablas en disco se guardan y se reabren desde su archivo). Con `--memoria N` mide
+en cambio la memoria de una tabla de N claves.
+
+Uso:
+	python -m app.core.bucket_check --cargas 200 --operaciones 300
+	python -m app.core.bucket_check --memoria 200000
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import tracemalloc
+from typing import List, Optional, Tuple
+
+from app.core.bucket_hashing import BucketHashTable, HashTableParciales, HashTableTotales
+from app.core.bucket_storage import EN_OVERFLOW
+
+
+class _CubetasListas:
+	"""
+	Cubetas como listas de listas, con la misma lógica que las tablas
+	originales de las vistas: se inserta en la primera posición libre o al
+	final del overflow, eliminar deja None y reubicar reinserta las claves
+	en orden de inserción (una lista, como el insertion_order original). (Las parciales originales perdían al reubicar
+	las claves que no cabían en el área principal; aquí van al overflow,
+	como en las totales.)
+	"""
+
+	def __init__(self, num_cubetas: int, tam_cubeta: int) -> None:
+		self.tam_cubeta = tam_cubeta
+		self.orden: List[int] = []
+		self.reconstruir([], [], num_cubetas)
+
+	def colocar(self, clave: int, b: int, rango: int = 0) -> Optional[int]:
+		self.orden.append(clave)
+		bucket = self.buckets[b]
+		for i in range(self.tam_cubeta):
+			if bucket[i] is None:
+				bucket[i] = clave
+				return i
+		self.overflow[b].append(clave)
+		return None
+
+	def quitar(self, clave: int, b: int) -> Optional[int]:
+		if clave in self.orden:
+			self.orden.remove(clave)
+		bucket = self.buckets[b]
+		for i, val in enumerate(bucket):
+			if val == clave:
+				bucket[i] = None
+				return i
+		if clave in self.overflow[b]:
+			self.overflow[b].remove(clave)
+			return EN_OVERFLOW
+		return None
+
+	def pares(self, b: int) -> List[Tuple[int, int]]:
+		return [(self.orden.index(v), v) for v in self.buckets[b] + self.overflow[b] if v is not None]
+
+	def posicion(self, clave: int, b: int) -> Optional[int]:
+		if clave in self.buckets[b]:
+			return self.buckets[b].index(clave)
+		return EN_OVERFLOW if clave in self.overflow[b] else None
+
+	def reconstruir(self, claves, rangos, num_cubetas: int) -> None:
+		self.num_cubetas = num_cubetas
+		self.buckets = [[None] * self.tam_cubeta for _ in range(num_cubetas)]
+		self.overflow = [[] for _ in range(num_cubetas)]
+		self.orden = []
+		for clave in claves:
+			self.colocar(clave, clave % num_cubetas)
+
+	def reubicar(self, num_cubetas: int) -> int:
+		claves = list(self.orden)
+		self.reconstruir(claves, [], num_cubetas)
+		return len(claves)
+
+	def sincronizar(self) -> None:
+		pass
+
+	def cerrar(self) -> None:
+		pass
+
+
+def _estado_comparable(tabla: BucketHashTable) -> dict:
+	data = tabla.to_dict()
+	for campo in ("incremental", "archivo", "registros_movidos", "paginas"):
+		data.pop(campo, None)
+	# En disco to_dict no copia las claves: se leen de las páginas
+	data["buckets"] = list(tabla.buckets)
+	data["overflow"] = list(tabla.overflow)
+	data["insertion_order"] = tabla.insertion_order
+	data["buckets"] = [list(fila) for fila in data["buckets"]]
+	data["overflow"] = [list(fila) for fila in data["overflow"]]
+	return data
+
+
+def comprobar(
+	cls, num_cubetas: int, tam_cubeta: int, densidad: float, operaciones: int, rango_claves: int, rng: random.Random, carpeta: str
+) -> Optional[str]:
+	"""
+	Una carga aleatoria de inserciones, eliminaciones y búsquedas. Devuelve
+	None si todos los modos coinciden o la descripción de la primera
+	diferencia.
+	"""
+	referencia = cls(num_cubetas, tam_cubeta, densidad)
+	referencia._almacen = _CubetasListas(referencia.num_cubetas, referencia.tam_cubeta)
+	ruta = os.path.join(carpeta, "cubetas.dat")
+	variantes = {
+		"una vez": cls(num_cubetas, tam_cubeta, densidad),
+		"incremental": cls(num_cubetas, tam_cubeta, densidad, incremental=True),
+		"disco": cls(num_cubetas, tam_cubeta, densidad, archivo=ruta),
+		"disco incremental": cls(num_cubetas, tam_cubeta, densidad, incremental=True, archivo=ruta + "2"),
+	}
+	try:
+		for i in range(operaciones):
+			if i == operaciones // 2:
+				# Guardar y reabrir: to_dict solo anota el archivo de páginas
+				for nombre in ("disco", "disco incremental"):
+					data = variantes[nombre].to_dict()
+					variantes[nombre].cerrar()
+					variantes[nombre] = cls.from_dict(json.loads(json.dumps(data)))
+			clave = rng.randrange(rango_claves)
+			op = rng.choices(("insertar", "eliminar", "buscar"), (6, 3, 1))[0]
+			esperado = getattr(referencia, op)(clave)
+			for nombre, tabla in variantes.items():
+				msg = getattr(tabla, op)(clave)
+				if nombre == "una vez" and msg != esperado:
+					return f"operación {i} ({op} {clave}), modo {nombre}: {msg!r} en lugar de {esperado!r}"
+
+		esperado = _estado_comparable(referencia)
+		for nombre, tabla in variantes.items():
+			if _estado_comparable(tabla) != esperado:
+				return f"estado final distinto en modo {nombre} tras {operaciones} operaciones"
+		return None
+	finally:
+		for tabla in variantes.values():
+			tabla.cerrar()
+
+
+def memoria(cls, claves: List[int], num_cubetas: int, tam_cubeta: int, densidad: float) -> Tuple[int, int]:
+	"""
+	Bytes que reserva una tabla al insertar `claves` y borrar una de cada
+	cuatro: (lo que queda reservado al final, pico durante la carga). Las
+	claves ya existen antes de medir, así que no cuentan.
+	"""
+	tracemalloc.start()
+	try:
+		tabla = cls(num_cubetas, tam_cubeta, densidad)
+		for clave in claves:
+			tabla.insertar(clave)
+		for clave in claves[::4]:
+			tabla.eliminar(clave)
+		return tracemalloc.get_traced_memory()
+	finally:
+		tracemalloc.stop()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+	parser = argparse.ArgumentParser(description="Compara las tablas de cubetas con la lógica de listas original en todos los modos")
+	parser.add_argument("--cargas", type=int, default=200, help="cargas aleatorias por tipo de tabla")
+	parser.add_argument("--operaciones", type=int, default=300, help="operaciones por carga")
+	parser.add_argument("--semilla", type=int, default=None)
+	parser.add_argument("--memoria", type=int, default=None, metavar="N", help="en lugar de comparar, mide la memoria con N claves")
+	args = parser.parse_args(argv)
+
+	rng = random.Random(args.semilla)
+	if args.memoria is not None:
+		claves = rng.sample(range(10 ** 12), max(1, args.memoria))
+		for cls in (HashTableTotales, HashTableParciales):
+			actual, pico = memoria(cls, claves, 1024, 4, 0.75)
+			vivas = len(claves) - len(claves[::4])
+			print(
+				f"{cls.__name__}: {actual / 2 ** 20:.1f} MB con {vivas} claves "
+				f"({actual / vivas:.1f} bytes por clave), pico {pico / 2 ** 20:.1f} MB"
+			)
+		return
+	fallas = 0
+	for cls in (HashTableTotales, HashTableParciales):
+		for n in range(args.cargas):
+			num_cubetas = rng.randint(1, 5)
+			tam_cubeta = rng.randint(1, 4)
+			densidad = rng.choice((0.5, 0.75, 0.9))
+			rango_claves = rng.choice((20, 60, 200))
+			with tempfile.TemporaryDirectory() as carpeta:
+				falla = comprobar(cls, num_cubetas, tam_cubeta, densidad, args.operaciones, rango_claves, rng, carpeta)
+			if falla:
+				fallas += 1
+				print(f"{cls.__name__} carga {n} (cubetas={num_cubetas}, tam={tam_cubeta}, densidad={densidad}): {falla}")
+	total = 2 * args.cargas
+	print(f"{total - fallas}/{total} cargas coinciden con la lógica de listas original")
+	if fallas:
+		sys.exit(1)
+
+
+if __name__ == "__main__":
+	main()
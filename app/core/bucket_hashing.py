@@ -0,0 +1,694 @@
+"""
+Tablas de cubetas con expansiones TOTALES y PARCIALES (sin interfaz; las usan
+DinamicasTotalesView / DinamicasParcialesView y app/core/workload.py).
+
+Ambas tablas guardan las cubetas en un BucketStorage (o PagedBucketStorage si
+se da `archivo`), ubican cada clave con clave % num_cubetas y, al cambiar el
+número de cubetas, reubican todos los registros de una vez o, en modo
+incremental, unas pocas cubetas antiguas por operación (IncrementalStorage).
+Las subclases solo deciden cuándo y a cuántas cubetas se expande o reduce.
+
+La tabla no guarda nada por clave fuera del almacén: la pertenencia se
+resuelve leyendo la cubeta y el orden de inserción es el rango guardado
+junto a cada clave. En disco las reubicaciones van cubeta por cubeta;
+`cerrar` libera el archivo cuando la tabla se reemplaza. Al guardar una
+tabla en disco, to_dict no copia las claves: anota el archivo de páginas,
+que from_dict reabre tal como quedó (el JSON vale con ese archivo sin tocar).
+
+La comprobación contra las tablas de listas originales y la medición de
+memoria están en app/core/bucket_check.py.
+"""
+
+from typing import List, Optional, Tuple
+
+from app.core.bucket_storage import EN_OVERFLOW, BucketStorage, IncrementalStorage, RegistroMigracion, clave_valida
+from app.core.paged_storage import ContadorIO, PagedBucketStorage
+
+
+class BucketHashTable:
+	"""Cubetas de tamaño fijo con overflow por cubeta y reubicación de una vez o incremental."""
+
+	def __init__(
+		self,
+		num_cubetas: int,
+		tam_cubeta: int,
+		densidad_objetivo: float,
+		incremental: bool = False,
+		archivo: Optional[str] = None,
+	) -> None:
+		self.num_cubetas_inicial = max(1, num_cubetas)
+		self.num_cubetas = max(1, num_cubetas)
+		self.tam_cubeta = max(1, tam_cubeta)
+		self.densidad_objetivo = densidad_objetivo  # ej: 0.75
+
+		# Área principal y overflow en arreglos compactos (ver app/core/bucket_storage.py)
+		# o, si se da `archivo`, en páginas en disco con buffer pool (app/core/paged_storage.py)
+		self.archivo = archivo
+		if archivo:
+			self._almacen = PagedBucketStorage(archivo, self.num_cubetas, self.tam_cubeta)
+		else:
+			self._almacen = BucketStorage(self.num_cubetas, self.tam_cubeta)
+
+		# Modo incremental: las expansiones/reducciones no reubican todo de una
+		# vez; se migran unas pocas cubetas antiguas en cada operación.
+		self.incremental = incremental
+		self._migracion: Optional[IncrementalStorage] = None
+
+		self.total_registros: int = 0  # cuenta principal + overflow
+		# Número de la próxima inserción: el almacén lo guarda junto a la clave
+		# (su rango) y al reubicar se reinserta en ese orden. Una clave borrada
+		# y vuelta a insertar queda al final, igual que en una lista.
+		self._secuencia: int = 0
+		# Registros reubicados por expansiones/reducciones (costo de crecer)
+		self.registros_movidos: int = 0
+
+	# ------------------------------------------------------------
+	# Propiedades
+	# ------------------------------------------------------------
+	@property
+	def insertion_order(self) -> List[int]:
+		# Se recorren todas las cubetas (solo al guardar)
+		pares = []
+		for almacen in self._almacenes():
+			for b in range(almacen.num_cubetas):
+				pares.extend(almacen.pares(b))
+		return [clave for _, clave in sorted(pares)]
+
+	@property
+	def io_paginas(self) -> Optional[ContadorIO]:
+		"""Lecturas/escrituras de página si las cubetas están en disco; si no, None."""
+		return getattr(self._almacen, "io", None)
+
+	@property
+	def buckets(self):
+		"""buckets[b]: lista del área principal de la cubeta b (None = libre)."""
+		return self._almacen_actual.buckets
+
+	@property
+	def overflow(self):
+		"""overflow[b]: registros desbordados de la cubeta b."""
+		return self._almacen_actual.overflow
+
+	@property
+	def _almacen_actual(self) -> BucketStorage:
+		# Durante una migración las cubetas visibles son las nuevas
+		return self._migracion.nuevo if self._migracion else self._almacen
+
+	@property
+	def migrando(self) -> bool:
+		return self._migracion is not None
+
+	def cubetas_pendientes(self) -> List[Tuple[int, List[Optional[int]], List[int]]]:
+		"""Cubetas antiguas que aún no se migraron: (índice, área principal, overflow)."""
+		if not self._migracion:
+			return []
+		anterior = self._migracion.anterior
+		return [
+			(j, anterior.buckets[j], anterior.overflow[j])
+			for j in range(self._migracion.migradas, anterior.num_cubetas)
+		]
+
+	@property
+	def capacidad_total(self) -> int:
+		# Capacidad del área principal (sin contar overflow)
+		return self.num_cubetas * self.tam_cubeta
+
+	@property
+	def densidad_actual(self) -> float:
+		if self.capacidad_total == 0:
+			return 0.0
+		# Todos los registros (incluyendo overflow) sobre la capacidad principal
+		return self.total_registros / self.capacidad_total
+
+	# ------------------------------------------------------------
+	# Operaciones básicas
+	# ------------------------------------------------------------
+	def _existe_clave(self, clave: int) -> bool:
+		"""Retorna True si la clave ya está en la tabla (cubeta u overflow)."""
+		almacen, bucket_idx = self._ubicar(clave)
+		return almacen.posicion(clave, bucket_idx) is not None
+
+	def __contains__(self, clave: int) -> bool:
+		return self._existe_clave(clave)
+
+	def __len__(self) -> int:
+		return self.total_registros
+
+	def eliminar(self, clave: int) -> str:
+		self._avanzar_migracion()
+
+		# Buscar en área principal y luego en overflow
+		bucket_idx, pos = self._quitar(clave)
+		if pos is None:
+			return f"Registro {clave} no encontrado en la cubeta {bucket_idx}."
+
+		self.total_registros -= 1
+		if pos == EN_OVERFLOW:
+			msg = (
+				f"Registro {clave} eliminado del overflow de la cubeta {bucket_idx}. "
+				f"Densidad actual: {self.densidad_actual:.2f}"
+			)
+		else:
+			msg = (
+				f"Registro {clave} eliminado de la cubeta {bucket_idx}, posición {pos}. "
+				f"Densidad actual: {self.densidad_actual:.2f}"
+			)
+		return self._post_delete_maybe_reduce(msg)
+
+	def _post_delete_maybe_reduce(self, base_msg: str) -> str:
+		"""Reducción tras una eliminación exitosa (la define cada subclase)."""
+		return base_msg
+
+	def localizar(self, clave: int) -> Optional[Tuple[int, int]]:
+		"""(cubeta, posición o EN_OVERFLOW) de la clave, o None si no está."""
+		self._avanzar_migracion()
+		almacen, bucket_idx = self._ubicar(clave)
+		pos = almacen.posicion(clave, bucket_idx)
+		return None if pos is None else (bucket_idx, pos)
+
+	def buscar(self, clave: int) -> str:
+		"""Busca la clave en su cubeta (área principal y overflow)."""
+		encontrada = self.localizar(clave)
+		if encontrada is None:
+			return f"Registro {clave} no encontrado en la cubeta {self._ubicar(clave)[1]}."
+		bucket_idx, pos = encontrada
+		if pos == EN_OVERFLOW:
+			return f"Registro {clave} encontrado en el overflow de la cubeta {bucket_idx}."
+		return (
+			f"Registro {clave} encontrado en la cubeta {bucket_idx}, "
+			f"posición {pos} ({self._formula(clave)})."
+		)
+
+	def _registrar_insercion(self, clave: int) -> Tuple[str, int, Optional[int]]:
+		"""Coloca la clave con el próximo número de inserción; devuelve (fórmula, cubeta, posición)."""
+		formula = self._formula(clave)
+		bucket_idx, pos = self._colocar(clave, self._secuencia)
+		self.total_registros += 1
+		self._secuencia += 1
+		return formula, bucket_idx, pos
+
+	# ------------------------------------------------------------
+	# Serialización para guardar/cargar
+	# ------------------------------------------------------------
+	def _estado(self, tipo: str) -> dict:
+		"""
+		Campos comunes de to_dict (completa antes una migración en curso). En
+		disco no se leen las páginas: basta con la ruta del archivo ya
+		sincronizado y lo necesario para reabrirlo.
+		"""
+		self._completar_migracion()
+		self._almacen.sincronizar()
+		data = {
+			"tipo": tipo,
+			"num_cubetas_inicial": self.num_cubetas_inicial,
+			"num_cubetas": self.num_cubetas,
+			"tam_cubeta": self.tam_cubeta,
+			"densidad_objetivo": self.densidad_objetivo,
+			"incremental": self.incremental,
+			"archivo": self.archivo,
+			"registros_movidos": self.registros_movidos,
+		}
+		if isinstance(self._almacen, PagedBucketStorage):
+			data["paginas"] = dict(
+				self._almacen.estado(),
+				ruta=self._almacen.ruta,
+				registros=self.total_registros,
+				secuencia=self._secuencia,
+			)
+		else:
+			data["buckets"] = list(self.buckets)
+			data["overflow"] = list(self.overflow)
+			data["insertion_order"] = self.insertion_order
+		return data
+
+	@classmethod
+	def _desde_estado(cls, data: dict):
+		"""Tabla a partir de los campos comunes de to_dict."""
+		num_cubetas = data["num_cubetas"]
+		paginas = data.get("paginas")
+		obj = cls(
+			num_cubetas=num_cubetas,
+			tam_cubeta=data["tam_cubeta"],
+			densidad_objetivo=data["densidad_objetivo"],
+			# Un archivo de páginas guardado se reabre abajo; crearlo aquí lo vaciaría
+			archivo=None if paginas else data.get("archivo"),
+		)
+		obj.num_cubetas_inicial = data.get("num_cubetas_inicial", num_cubetas)
+		obj.incremental = data.get("incremental", False)
+		obj.registros_movidos = data.get("registros_movidos", 0)
+		if paginas:
+			obj.archivo = data.get("archivo")
+			obj._almacen = PagedBucketStorage(paginas["ruta"], num_cubetas, obj.tam_cubeta, estado=paginas)
+			obj.total_registros = paginas["registros"]
+			obj._secuencia = paginas["secuencia"]
+			return obj
+		orden = data.get("insertion_order")
+		if orden is None:
+			# Archivos sin orden guardado: se toma el orden de las cubetas
+			orden = [
+				v
+				for fila, desborde in zip(data["buckets"], data["overflow"])
+				for v in list(fila) + list(desborde)
+				if v is not None
+			]
+		rangos = {clave: i for i, clave in enumerate(orden)}
+		obj.total_registros = obj._almacen.cargar(data["buckets"], data["overflow"], rangos)
+		obj._secuencia = len(orden)
+		return obj
+
+	# ------------------------------------------------------------
+	# Reubicación (de una vez o incremental)
+	# ------------------------------------------------------------
+	def _ubicar(self, clave: int) -> Tuple[BucketStorage, int]:
+		if self._migracion:
+			return self._migracion.ubicar(clave)
+		return self._almacen, clave % self.num_cubetas
+
+	def _colocar(self, clave: int, rango: int) -> Tuple[int, Optional[int]]:
+		if self._migracion:
+			return self._migracion.colocar(clave, rango)
+		bucket_idx = clave % self.num_cubetas
+		return bucket_idx, self._almacen.colocar(clave, bucket_idx, rango)
+
+	def _quitar(self, clave: int) -> Tuple[int, Optional[int]]:
+		if self._migracion:
+			return self._migracion.quitar(clave)
+		bucket_idx = clave % self.num_cubetas
+		return bucket_idx, self._almacen.quitar(clave, bucket_idx)
+
+	def _formula(self, clave: int) -> str:
+		almacen, bucket_idx = self._ubicar(clave)
+		if self._migracion and almacen is self._migracion.anterior:
+			return f"clave % {almacen.num_cubetas} = {bucket_idx}, cubeta antigua aún sin migrar"
+		return f"clave % {almacen.num_cubetas} = {bucket_idx}"
+
+	def _reubicar(self, nuevas_cubetas: int) -> None:
+		"""
+		Pasa a `nuevas_cubetas` cubetas. Sin modo incremental reubica todos
+		los registros ya; en modo incremental deja ambos almacenes y migra
+		unas pocas cubetas antiguas por operación (ver IncrementalStorage),
+		empezando en la operación siguiente.
+
+		Si ya hay una migración en curso, el cambio se encadena: la densidad
+		y los umbrales usan ya `nuevas_cubetas`, las operaciones se anotan
+		desde ahora para el cambio nuevo y al terminar la migración actual
+		empieza otra hacia ese tamaño. Cada migración rehace las cubetas con
+		las operaciones anotadas desde que se pidió (ver RegistroMigracion),
+		así que el resultado es el mismo que reubicar todo en cada cambio, y
+		ninguna operación migra más de `por_paso` cubetas antiguas.
+
+		En disco, la reubicación de una vez es una migración completa cubeta
+		por cubeta hacia un archivo nuevo, así que nunca junta todas las
+		claves en memoria.
+		"""
+		self.num_cubetas = nuevas_cubetas
+		if self.incremental:
+			if self._migracion:
+				anteriores = self._migracion.nuevo.num_cubetas
+				self._migracion.siguiente = RegistroMigracion(self._secuencia, anteriores, nuevas_cubetas)
+			else:
+				registro = RegistroMigracion(self._secuencia, self._almacen.num_cubetas, nuevas_cubetas)
+				self._migracion = IncrementalStorage(self._almacen, registro)
+		elif self.archivo:
+			self._completar_migracion()
+			registro = RegistroMigracion(self._secuencia, self._almacen.num_cubetas, nuevas_cubetas)
+			self._migracion = IncrementalStorage(self._almacen, registro)
+			self._completar_migracion()
+		else:
+			# Los registros se reinsertan en el orden EXACTO en que fueron
+			# insertados (por rango), así los módulos se recalculan en ese orden
+			self._completar_migracion()
+			self.registros_movidos += self._almacen.reubicar(nuevas_cubetas)
+
+	def _avanzar_migracion(self) -> None:
+		if not self._migracion:
+			return
+		self.registros_movidos += self._migracion.paso()
+		if self._migracion.terminada:
+			self._terminar_migracion()
+
+	def _completar_migracion(self) -> None:
+		# Incluye las migraciones encadenadas (solo al guardar)
+		while self._migracion:
+			self.registros_movidos += self._migracion.completar()
+			self._terminar_migracion()
+
+	def _terminar_migracion(self) -> None:
+		# El almacén anterior ya no se usa (en disco: se borra su archivo)
+		self._migracion.anterior.descartar()
+		self._almacen = self._migracion.nuevo
+		siguiente = self._migracion.siguiente
+		self._migracion = None
+		if siguiente is not None:
+			# La siguiente migración empieza en la próxima operación. Aunque
+			# vuelva al mismo número de cubetas hay que hacerla: reubicar deja
+			# las cubetas sin los huecos que dejaron las eliminaciones.
+			self._migracion = IncrementalStorage(self._almacen, siguiente)
+
+	def _almacenes(self) -> List[BucketStorage]:
+		if self._migracion:
+			return [self._migracion.anterior, self._migracion.nuevo]
+		return [self._almacen]
+
+	def cerrar(self) -> None:
+		"""Libera el archivo de páginas (si lo hay); la tabla ya no se usa después."""
+		for almacen in self._almacenes():
+			almacen.cerrar()
+
+
+class HashTableTotales(BucketHashTable):
+	"""
+	Tabla hash basada en cubetas, con expansiones y reducciones TOTALES.
+
+	- #cubetas iniciales
+	- tamaño de cubeta
+	- densidad de ocupación objetivo (ej: 0.75)
+
+	Manejo de colisiones:
+		- Si la cubeta está llena, el nuevo registro va a una lista de
+		  *desbordamiento (overflow)* asociada a esa cubeta.
+
+	Expansión total:
+		- Se dispara cuando densidad_actual >= densidad_objetivo
+		- Duplica el número de cubetas (N -> 2N) y reubica todos los registros
+		(cubetas + overflow).
+
+	Reducción total:
+		- Forzada manualmente (botón)
+		- Reduce a la mitad el número de cubetas (N -> N/2), hasta un mínimo
+		de num_cubetas_inicial, reubicando todos los registros.
+
+	El almacenamiento, la búsqueda, la eliminación y la reubicación (de una
+	vez o incremental) vienen de BucketHashTable.
+	"""
+
+	# ------------------------------------------------------------
+	# Operaciones básicas
+	# ------------------------------------------------------------
+	def insertar(self, clave: int) -> str:
+		"""
+		Inserta una clave en la tabla.
+
+		- Calcula bucket_index = clave % num_cubetas.
+		- Si hay espacio en la cubeta principal, se inserta allí.
+		- Si la cubeta está llena, se inserta en la lista de overflow de esa cubeta.
+		- Después de insertar, si densidad >= objetivo, realiza expansión total.
+		"""
+		self._avanzar_migracion()
+		if self._existe_clave(clave):
+			return f"La clave {clave} ya se encuentra almacenada. No se permiten duplicados."
+		if not clave_valida(clave):
+			return f"La clave {clave} no cabe en un entero de 64 bits."
+		msg = self._insertar_en_cubeta_o_overflow(clave)
+
+		# Verificar densidad para posible expansión total
+		if self.densidad_actual >= self.densidad_objetivo:
+			msg += (
+				f" | Densidad actual {self.densidad_actual:.2f} ≥ objetivo "
+				f"{self.densidad_objetivo:.2f}, se realiza expansión TOTAL (duplicar cubetas)."
+			)
+			self._expansion_total()
+		else:
+			msg += f" | Densidad actual {self.densidad_actual:.2f}, no se requiere expansión."
+
+		return msg
+
+	def _post_delete_maybe_reduce(self, base_msg: str) -> str:
+		"""
+		Tras una eliminación exitosa, verifica si la densidad
+		cayó por debajo del umbral de reducción.
+
+		Umbral de reducción: 1 - densidad_objetivo.
+		Ejemplo: objetivo = 0.75 -> umbral_baja = 0.25.
+		"""
+		# Si no hay capacidad (caso extremo), no reducimos más.
+		if self.capacidad_total == 0:
+			return base_msg
+
+		umbral_baja = 1.0 - self.densidad_objetivo
+
+		if self.densidad_actual <= umbral_baja:
+			# Intentar reducción total (la función ya respeta el mínimo de cubetas)
+			reduccion_msg = self.reduccion_total()
+			return (
+				base_msg
+				+ f" | Densidad actual ≤ {umbral_baja:.2f}, se intenta REDUCCIÓN TOTAL. "
+				+ reduccion_msg
+			)
+
+		return base_msg
+
+	# ------------------------------------------------------------
+	# Serialización para guardar/cargar
+	# ------------------------------------------------------------
+	def to_dict(self) -> dict:
+		"""
+		Devuelve un diccionario JSON-serializable con el estado de la tabla.
+		Si hay una migración incremental en curso, primero se completa.
+		"""
+		return self._estado("totales")
+
+	@classmethod
+	def from_dict(cls, data: dict) -> "HashTableTotales":
+		"""
+		Crea una tabla a partir de un diccionario generado por to_dict().
+		"""
+		return cls._desde_estado(data)
+
+	# ------------------------------------------------------------
+	# Internos: inserción con overflow
+	# ------------------------------------------------------------
+	def _insertar_en_cubeta_o_overflow(self, clave: int) -> str:
+		# Área principal si hay posición libre; si no, overflow de la cubeta
+		formula, bucket_idx, pos = self._registrar_insercion(clave)
+
+		if pos is not None:
+			return (
+				f"Registro {clave} insertado en cubeta {bucket_idx}, posición {pos} "
+				f"({formula})."
+			)
+		return (
+			f"Cubeta {bucket_idx} llena, registro {clave} insertado en OVERFLOW "
+			f"de la cubeta {bucket_idx}."
+		)
+
+
+	# ------------------------------------------------------------
+	# Expansión y reducción TOTALES
+	# ------------------------------------------------------------
+	def _expansion_total(self) -> None:
+		"""
+		Expansión TOTAL:
+		- Duplica el número de cubetas: N -> 2N
+		- Reubica todos los registros (principal + overflow) recalculando el módulo.
+		"""
+		nuevas_cubetas = self.num_cubetas * 2
+		if nuevas_cubetas == self.num_cubetas:
+			return
+
+		self._reubicar(nuevas_cubetas)
+
+	def reduccion_total(self) -> str:
+		"""
+		Reducción TOTAL (forzada):
+		- num_cubetas: N -> N/2, sin bajar del número inicial.
+		- Reubica todos los registros.
+		"""
+		if self.num_cubetas <= self.num_cubetas_inicial:
+			return "No se puede reducir más, ya se alcanzó el número mínimo de cubetas."
+
+		nuevas_cubetas = max(self.num_cubetas_inicial, self.num_cubetas // 2)
+		if nuevas_cubetas == self.num_cubetas:
+			return "El número de cubetas ya es el mínimo permitido."
+
+		self._reubicar(nuevas_cubetas)
+
+		return (
+			f"Reducción TOTAL realizada: ahora hay {self.num_cubetas} cubetas. "
+			f"Densidad actual: {self.densidad_actual:.2f}"
+		)
+
+
+class HashTableParciales(BucketHashTable):
+	"""
+	Tabla hash basada en cubetas, con expansiones y reducciones PARCIALES.
+
+	Expansión parcial:
+		- Se dispara cuando densidad_actual >= densidad_objetivo
+		- Aumenta el número de cubetas en 1: N -> N + 1
+		- Reubica todos los registros recalculando el módulo.
+
+	Reducción parcial:
+		- Forzada por botón
+		- Disminuye el número de cubetas en 1: N -> N - 1
+		- Nunca baja del número inicial de cubetas.
+
+	El almacenamiento, la búsqueda, la eliminación y la reubicación (de una
+	vez o incremental) vienen de BucketHashTable.
+	"""
+
+	def __init__(
+		self,
+		num_cubetas: int,
+		tam_cubeta: int,
+		densidad_objetivo: float,
+		incremental: bool = False,
+		archivo: Optional[str] = None,
+	) -> None:
+		super().__init__(num_cubetas, tam_cubeta, densidad_objetivo, incremental, archivo)
+
+		# 🔹 Estado para el ciclo de expansiones parciales
+		self._partial_cycle_base: Optional[int] = self.num_cubetas
+		self._partial_cycle_steps: int = 0
+
+	# ------------------------------------------------------------
+	# Operaciones
+	# ------------------------------------------------------------
+	def insertar(self, clave: int) -> str:
+		self._avanzar_migracion()
+		# verificar duplicados
+		if self._existe_clave(clave):
+			return f"La clave {clave} ya se encuentra almacenada. No se permiten duplicados."
+		if not clave_valida(clave):
+			return f"La clave {clave} no cabe en un entero de 64 bits."
+
+		ok, msg = self._insertar_en_cubeta_o_expandir_parcial(clave)
+
+		if not ok:
+			return msg  # caso extremo
+
+		if self.densidad_actual >= self.densidad_objetivo:
+			msg += (
+				f" | Densidad actual {self.densidad_actual:.2f} ≥ objetivo "
+				f"{self.densidad_objetivo:.2f}, se realiza expansión PARCIAL."
+			)
+			self._expansion_parcial()
+		else:
+			msg += f" | Densidad actual {self.densidad_actual:.2f}, no se requiere expansión."
+
+		return msg
+
+	# ------------------------------------------------------------
+	# Serialización para guardar/cargar
+	# ------------------------------------------------------------
+	def to_dict(self) -> dict:
+		# Si hay una migración incremental en curso, primero se completa
+		data = self._estado("parciales")
+		# si usas ciclo parcial:
+		data["_partial_cycle_base"] = getattr(self, "_partial_cycle_base", None)
+		data["_partial_cycle_steps"] = getattr(self, "_partial_cycle_steps", 0)
+		return data
+
+	@classmethod
+	def from_dict(cls, data: dict) -> "HashTableParciales":
+		obj = cls._desde_estado(data)
+
+		obj._partial_cycle_base = data.get("_partial_cycle_base", obj.num_cubetas)
+		obj._partial_cycle_steps = data.get("_partial_cycle_steps", 0)
+
+		return obj
+
+	def _post_delete_maybe_reduce(self, base_msg: str) -> str:
+		"""
+		Tras una eliminación exitosa, verifica si la densidad
+		cayó por debajo del umbral de reducción.
+
+		Umbral de reducción: 1 - densidad_objetivo.
+		"""
+		if self.capacidad_total == 0:
+			return base_msg
+
+		umbral_baja = 1.0 - self.densidad_objetivo
+
+		if self.densidad_actual <= umbral_baja:
+			reduccion_msg = self.reduccion_parcial()
+			return (
+				base_msg
+				+ f" | Densidad actual ≤ {umbral_baja:.2f}, se intenta REDUCCIÓN PARCIAL. "
+				+ reduccion_msg
+			)
+
+		return base_msg
+
+
+	# ------------------------------------------------------------
+	# Internos
+	# ------------------------------------------------------------
+	def _insertar_en_cubeta_o_expandir_parcial(self, clave: int) -> Tuple[bool, str]:
+		"""
+		Intenta insertar la clave en la cubeta correspondiente.
+		Si la cubeta está llena, la clave se coloca en el OVERFLOW de esa cubeta.
+		Aquí **no** se realizan expansiones; eso se hace en `insertar` según la densidad.
+
+		Devuelve (ok, mensaje).
+		"""
+		# 1) Área principal de la cubeta; 2) si está llena, su overflow
+		formula, bucket_idx, pos = self._registrar_insercion(clave)
+
+		if pos is not None:
+			return True, (
+				f"Registro {clave} insertado en cubeta {bucket_idx}, posición {pos} "
+				f"({formula})."
+			)
+
+		msg = (
+			f"Cubeta {bucket_idx} llena al insertar {clave}, "
+			f"registro colocado en OVERFLOW de la cubeta {bucket_idx}."
+		)
+		return True, msg
+
+
+	def _expansion_parcial(self) -> None:
+		"""
+		Expansión PARCIAL con la regla:
+		- Dos expansiones parciales equivalen a una expansión total.
+
+		Si N es el número de cubetas al inicio del ciclo:
+		1ª parcial: num_cubetas = N + N//2
+		2ª parcial: num_cubetas = 2 * N
+
+		En cada expansión parcial se rehashean TODOS los registros
+		usando el nuevo número de cubetas. Por eso, después de la
+		segunda parcial, el estado es equivalente a haber hecho
+		directamente una expansión total desde N a 2N.
+		"""
+		# N al inicio del ciclo de parciales
+		if self._partial_cycle_base is None:
+			self._partial_cycle_base = self.num_cubetas
+
+		base = self._partial_cycle_base
+
+		if self._partial_cycle_steps == 0:
+			# Primera expansión parcial del ciclo: N -> N + N//2
+			incremento = max(1, base // 2)
+			nuevas_cubetas = base + incremento
+			self._partial_cycle_steps = 1
+		else:
+			# Segunda expansión parcial del ciclo: -> 2 * N
+			nuevas_cubetas = max(self.num_cubetas, base * 2)
+			# Ciclo completo, reseteamos
+			self._partial_cycle_steps = 0
+			self._partial_cycle_base = nuevas_cubetas  # nuevo N base para próximos ciclos
+
+		# Reconstituir tabla con el nuevo número de cubetas
+		self._reubicar(nuevas_cubetas)
+
+
+	def reduccion_parcial(self) -> str:
+		if self.num_cubetas <= self.num_cubetas_inicial:
+			return "No se puede reducir más, ya se alcanzó el número mínimo de cubetas."
+
+		nuevas_cubetas = max(self.num_cubetas_inicial, self.num_cubetas - 1)
+		if nuevas_cubetas == self.num_cubetas:
+			return "El número de cubetas ya es el mínimo permitido."
+
+		self._reubicar(nuevas_cubetas)
+
+		# 🔹 Reiniciamos ciclo parcial
+		self._partial_cycle_base = self.num_cubetas
+		self._partial_cycle_steps = 0
+
+		return (
+			f"Reducción PARCIAL realizada: ahora hay {self.num_cubetas} cubetas. "
+			f"Densidad actual: {self.densidad_actual:.2f}"
+		)
@@ -0,0 +1,538 @@
+"""
+Almacenamiento compacto de cubetas para las tablas de hash dinámico.
+
+- Área principal: un solo array('q') de num_cubetas × tam_cubeta enteros con
+  VACIO como marca de posición libre (8 bytes por posición, sin listas por
+  cubeta ni un int de Python por clave), y otro igual con el rango (número de
+  inserción) de cada clave.
+- Overflow: un área común de nodos encadenados por cubeta (clave, rango,
+  siguiente), con una lista de nodos libres que reutilizan los borrados.
+- El rango es todo el orden de inserción que guarda la tabla (no hay un
+  índice aparte por clave): `reubicar` ordena por rango los registros y los
+  reubica en una sola pasada sobre clave % num_cubetas, vectorizada con
+  NumPy si está disponible.
+- Al borrar, la posición del área principal queda libre y la ocupa la
+  próxima inserción en esa cubeta; el overflow no se mueve.
+- `IncrementalStorage` hace la misma reubicación por pasos: conserva el
+  almacén anterior y el nuevo, y migra unas pocas cubetas por operación.
+"""
+
+import heapq
+from array import array
+from collections.abc import Sequence
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+try:
+	import numpy as np
+except ImportError:
+	np = None
+
+
+# Marca de posición libre; las claves deben caber en un entero de 64 bits
+VACIO = -(2 ** 63)
+CLAVE_MIN = VACIO + 1
+CLAVE_MAX = 2 ** 63 - 1
+
+# `quitar` devuelve EN_OVERFLOW si la clave estaba en el área de overflow
+EN_OVERFLOW = -1
+
+_FIN = -1
+
+# Cubetas antiguas que migra cada operación durante una migración incremental
+CUBETAS_POR_PASO = 2
+
+
+def clave_valida(clave: int) -> bool:
+	return CLAVE_MIN <= clave <= CLAVE_MAX
+
+
+class _Filas(Sequence):
+	"""Vista de solo lectura por cubeta: filas[b] arma la lista de la cubeta b."""
+
+	def __init__(self, fila: Callable[[int], list], cantidad: int) -> None:
+		self._fila = fila
+		self._cantidad = cantidad
+
+	def __len__(self) -> int:
+		return self._cantidad
+
+	def __getitem__(self, b):
+		if isinstance(b, slice):
+			return [self._fila(i) for i in range(*b.indices(self._cantidad))]
+		if b < 0:
+			b += self._cantidad
+		if not 0 <= b < self._cantidad:
+			raise IndexError(b)
+		return self._fila(b)
+
+
+class BucketStorage:
+	"""
+	Cubetas de tamaño fijo más overflow encadenado, en arreglos planos.
+
+	Junto a cada clave se guarda su rango (número de inserción), que ordena
+	las claves de cada cubeta al reubicarlas (ver IncrementalStorage).
+	"""
+
+	def __init__(self, num_cubetas: int, tam_cubeta: int) -> None:
+		self.tam_cubeta = tam_cubeta
+		self._vaciar(num_cubetas)
+
+	def _vaciar(self, num_cubetas: int) -> None:
+		self.num_cubetas = num_cubetas
+		self.slots = array("q", [VACIO]) * (num_cubetas * self.tam_cubeta)
+		self.rangos = array("q", [0]) * (num_cubetas * self.tam_cubeta)
+		self._cabeza = array("q", [_FIN]) * num_cubetas
+		self._cola = array("q", [_FIN]) * num_cubetas
+		self._pool_clave = array("q")
+		self._pool_rango = array("q")
+		self._pool_sig = array("q")
+		self._libres: List[int] = []
+		self.en_overflow = 0
+
+	# ------------------------------------------------------------
+	# Lectura
+	# ------------------------------------------------------------
+	def cubeta(self, b: int) -> List[Optional[int]]:
+		"""Área principal de la cubeta b, con None en las posiciones libres."""
+		t = self.tam_cubeta
+		return [None if v == VACIO else v for v in self.slots[b * t:(b + 1) * t]]
+
+	def desborde(self, b: int) -> List[int]:
+		"""Overflow de la cubeta b en orden de llegada."""
+		claves = []
+		n = self._cabeza[b]
+		while n != _FIN:
+			claves.append(self._pool_clave[n])
+			n = self._pool_sig[n]
+		return claves
+
+	@property
+	def buckets(self) -> _Filas:
+		return _Filas(self.cubeta, self.num_cubetas)
+
+	@property
+	def overflow(self) -> _Filas:
+		return _Filas(self.desborde, self.num_cubetas)
+
+	def claves(self, b: int) -> List[int]:
+		"""Registros de la cubeta b: área principal y luego overflow."""
+		t = self.tam_cubeta
+		principal = [v for v in self.slots[b * t:(b + 1) * t] if v != VACIO]
+		return principal + self.desborde(b)
+
+	def pares(self, b: int) -> List[Tuple[int, int]]:
+		"""(rango, clave) de los registros de la cubeta b, en el orden de `claves`."""
+		t = self.tam_cubeta
+		pares = [
+			(self.rangos[i], self.slots[i])
+			for i in range(b * t, (b + 1) * t)
+			if self.slots[i] != VACIO
+		]
+		n = self._cabeza[b]
+		while n != _FIN:
+			pares.append((self._pool_rango[n], self._pool_clave[n]))
+			n = self._pool_sig[n]
+		return pares
+
+	def posicion(self, clave: int, b: int) -> Optional[int]:
+		"""Posición de la clave en el área principal de b, EN_OVERFLOW o None si no está."""
+		t = self.tam_cubeta
+		for i in range(b * t, (b + 1) * t):
+			if self.slots[i] == clave:
+				return i - b * t
+		n = self._cabeza[b]
+		while n != _FIN:
+			if self._pool_clave[n] == clave:
+				return EN_OVERFLOW
+			n = self._pool_sig[n]
+		return None
+
+	# ------------------------------------------------------------
+	# Escritura
+	# ------------------------------------------------------------
+	def colocar(self, clave: int, b: int, rango: int = 0) -> Optional[int]:
+		"""Ubica la clave en la cubeta b; devuelve la posición o None si fue a overflow."""
+		slots = self.slots
+		inicio = b * self.tam_cubeta
+		for i in range(inicio, inicio + self.tam_cubeta):
+			if slots[i] == VACIO:
+				slots[i] = clave
+				self.rangos[i] = rango
+				return i - inicio
+		self._encadenar(clave, b, rango)
+		return None
+
+	def _encadenar(self, clave: int, b: int, rango: int = 0) -> None:
+		if self._libres:
+			n = self._libres.pop()
+			self._pool_clave[n] = clave
+			self._pool_rango[n] = rango
+			self._pool_sig[n] = _FIN
+		else:
+			n = len(self._pool_clave)
+			self._pool_clave.append(clave)
+			self._pool_rango.append(rango)
+			self._pool_sig.append(_FIN)
+		if self._cabeza[b] == _FIN:
+			self._cabeza[b] = n
+		else:
+			self._pool_sig[self._cola[b]] = n
+		self._cola[b] = n
+		self.en_overflow += 1
+
+	def extraer(self, clave: int, b: int) -> Optional[Tuple[int, int]]:
+		"""
+		Borra la clave de la cubeta b; devuelve (posición o EN_OVERFLOW, rango)
+		o None si no está. En el área principal la posición queda libre (la
+		ocupa la próxima inserción) y el overflow no se mueve.
+		"""
+		slots = self.slots
+		inicio = b * self.tam_cubeta
+		for i in range(inicio, inicio + self.tam_cubeta):
+			if slots[i] == clave:
+				slots[i] = VACIO
+				return i - inicio, self.rangos[i]
+
+		anterior = _FIN
+		n = self._cabeza[b]
+		while n != _FIN:
+			if self._pool_clave[n] == clave:
+				rango = self._pool_rango[n]
+				self._desenlazar(b, anterior, n)
+				return EN_OVERFLOW, rango
+			anterior = n
+			n = self._pool_sig[n]
+		return None
+
+	def quitar(self, clave: int, b: int) -> Optional[int]:
+		"""
+		Borra la clave de la cubeta b. Devuelve su posición en el área
+		principal, EN_OVERFLOW si estaba en overflow o None si no está.
+		"""
+		hallada = self.extraer(clave, b)
+		return None if hallada is None else hallada[0]
+
+	def _desenlazar(self, b: int, anterior: int, n: int) -> None:
+		"""Quita el nodo n (que sigue a `anterior`) del overflow de b."""
+		siguiente = self._pool_sig[n]
+		if anterior == _FIN:
+			self._cabeza[b] = siguiente
+		else:
+			self._pool_sig[anterior] = siguiente
+		if self._cola[b] == n:
+			self._cola[b] = anterior
+		self._liberar(n)
+
+	def _liberar(self, n: int) -> None:
+		# Los nodos libres quedan con VACIO: `reubicar` recorre el pool completo
+		self._pool_clave[n] = VACIO
+		self._libres.append(n)
+		self.en_overflow -= 1
+
+	def reescribir(
+		self,
+		b: int,
+		principal: Sequence[Optional[Tuple[int, int]]],
+		desborde: Sequence[Tuple[int, int]],
+	) -> None:
+		"""Deja en la cubeta b el área principal `principal` ((rango, clave) o None si libre) y el overflow `desborde`."""
+		t = self.tam_cubeta
+		inicio = b * t
+		n = self._cabeza[b]
+		while n != _FIN:
+			self._liberar(n)
+			n = self._pool_sig[n]
+		self._cabeza[b] = _FIN
+		self._cola[b] = _FIN
+		for i in range(t):
+			par = principal[i] if i < len(principal) else None
+			if par is None:
+				self.slots[inicio + i] = VACIO
+			else:
+				self.rangos[inicio + i], self.slots[inicio + i] = par
+		for rango, clave in desborde:
+			self._encadenar(clave, b, rango)
+
+	def reconstruir(self, claves: Sequence, rangos: Sequence, num_cubetas: int) -> None:
+		"""
+		Reubica `claves` (en ese orden, con sus `rangos`) en `num_cubetas`
+		cubetas vacías: las primeras tam_cubeta claves de cada cubeta van al
+		área principal y el resto a su overflow, igual que insertarlas una
+		por una.
+		"""
+		self._vaciar(num_cubetas)
+		t = self.tam_cubeta
+		if len(claves) == 0:
+			return
+
+		if np is not None:
+			k = np.asarray(claves, dtype=np.int64)
+			r = np.asarray(rangos, dtype=np.int64)
+			cubetas = k % num_cubetas
+			# Orden estable: dentro de cada cubeta se conserva el orden de `claves`
+			orden = np.argsort(cubetas, kind="stable")
+			k = k[orden]
+			r = r[orden]
+			cubetas = cubetas[orden]
+			# Puesto de cada clave dentro de su cubeta
+			puesto = np.arange(len(k)) - np.searchsorted(cubetas, cubetas, side="left")
+			principal = puesto < t
+
+			# Se escribe en los arreglos que dejó _vaciar, sin copias intermedias
+			destino = cubetas[principal] * t + puesto[principal]
+			np.frombuffer(self.slots, dtype=np.int64)[destino] = k[principal]
+			np.frombuffer(self.rangos, dtype=np.int64)[destino] = r[principal]
+
+			# Overflow: los restantes ya vienen agrupados por cubeta; cada nodo
+			# apunta al siguiente de su misma cubeta
+			resto = ~principal
+			claves_o = k[resto]
+			cubetas_o = cubetas[resto]
+			m = len(claves_o)
+			if m:
+				sig = np.arange(1, m + 1, dtype=np.int64)
+				ultimo = np.ones(m, dtype=bool)
+				ultimo[:-1] = cubetas_o[1:] != cubetas_o[:-1]
+				sig[ultimo] = _FIN
+				primero = np.ones(m, dtype=bool)
+				primero[1:] = ultimo[:-1]
+				cabeza = np.full(num_cubetas, _FIN, dtype=np.int64)
+				cola = np.full(num_cubetas, _FIN, dtype=np.int64)
+				posiciones = np.arange(m, dtype=np.int64)
+				cabeza[cubetas_o[primero]] = posiciones[primero]
+				cola[cubetas_o[ultimo]] = posiciones[ultimo]
+				self._pool_clave.frombytes(claves_o.tobytes())
+				self._pool_rango.frombytes(r[resto].tobytes())
+				self._pool_sig.frombytes(sig.tobytes())
+				self._cabeza = array("q")
+				self._cabeza.frombytes(cabeza.tobytes())
+				self._cola = array("q")
+				self._cola.frombytes(cola.tobytes())
+				self.en_overflow = m
+			return
+
+		slots = self.slots
+		llenas = array("q", [0]) * num_cubetas
+		for clave, r in zip(claves, rangos):
+			b = clave % num_cubetas
+			i = llenas[b]
+			if i < t:
+				slots[b * t + i] = clave
+				self.rangos[b * t + i] = r
+				llenas[b] = i + 1
+			else:
+				self._encadenar(clave, b, r)
+
+	def reubicar(self, num_cubetas: int) -> int:
+		"""
+		Reubica sus registros en `num_cubetas` cubetas en orden de inserción
+		(de rango), igual que reinsertarlos uno por uno; devuelve cuántos son.
+		"""
+		if np is not None:
+			k = np.concatenate((np.frombuffer(self.slots, dtype=np.int64), np.frombuffer(self._pool_clave, dtype=np.int64)))
+			r = np.concatenate((np.frombuffer(self.rangos, dtype=np.int64), np.frombuffer(self._pool_rango, dtype=np.int64)))
+			vivas = k != VACIO
+			k, r = k[vivas], r[vivas]
+			orden = np.argsort(r, kind="stable")
+			claves, rangos = k[orden], r[orden]
+		else:
+			pares = sorted(
+				[(r, v) for r, v in zip(self.rangos, self.slots) if v != VACIO]
+				+ [(r, v) for r, v in zip(self._pool_rango, self._pool_clave) if v != VACIO]
+			)
+			claves = [v for _, v in pares]
+			rangos = [r for r, _ in pares]
+		self.reconstruir(claves, rangos, num_cubetas)
+		return len(claves)
+
+	def cargar(self, buckets: Sequence, overflow: Sequence, rangos: Dict[int, int]) -> int:
+		"""Carga listas de listas (formato de to_dict) con el rango de cada clave; devuelve cuántas claves hay."""
+		self._vaciar(len(buckets))
+		t = self.tam_cubeta
+		total = 0
+		for b, fila in enumerate(buckets):
+			for i, v in enumerate(fila[:t]):
+				if v is not None:
+					self.slots[b * t + i] = v
+					self.rangos[b * t + i] = rangos.get(v, 0)
+					total += 1
+			for v in overflow[b]:
+				self._encadenar(v, b, rangos.get(v, 0))
+				total += 1
+		return total
+
+	def nuevo_almacen(self, num_cubetas: int) -> "BucketStorage":
+		"""Almacén vacío del mismo tipo (destino de una migración incremental)."""
+		return BucketStorage(num_cubetas, self.tam_cubeta)
+
+	def sincronizar(self) -> None:
+		"""Nada que escribir: todo está en memoria (ver PagedBucketStorage)."""
+
+	def descartar(self) -> None:
+		"""Almacén reemplazado tras una migración; no guarda recursos propios."""
+
+	def cerrar(self) -> None:
+		"""Nada que cerrar (ver PagedBucketStorage)."""
+
+
+class RegistroMigracion:
+	"""
+	Operaciones hechas desde que se pidió un cambio de tamaño, por cubeta nueva.
+
+	Reubicar de una vez deja cada cubeta con las claves que había en ese
+	momento, en orden de inserción; después cada inserción ocupa la primera
+	posición libre (o va al overflow) y cada eliminación deja un hueco. Las
+	claves de una cubeta nueva pueden llegar desde varias cubetas antiguas
+	en pasos distintos, así que la migración incremental no puede ubicarlas
+	a medida que llegan: con este registro rehace la cubeta como si todo se
+	hubiera reubicado al pedir el cambio. Solo guarda las operaciones que
+	ocurren durante la migración, no las claves de la tabla.
+	"""
+
+	def __init__(self, rango_inicio: int, cubetas_anteriores: int, cubetas_nuevas: int) -> None:
+		# Las claves con rango menor ya estaban en la tabla al pedir el cambio
+		self.rango_inicio = rango_inicio
+		self.cubetas_anteriores = cubetas_anteriores
+		self.cubetas_nuevas = cubetas_nuevas
+		# Cubeta nueva -> [(borrada, clave, rango)] en el orden en que ocurrieron
+		self._ops: Dict[int, List[Tuple[bool, int, int]]] = {}
+		# Cubeta antigua -> cubetas nuevas con operaciones sobre sus claves
+		self._afectadas: Dict[int, Set[int]] = {}
+
+	def anotar(self, borrada: bool, clave: int, rango: int) -> None:
+		b = clave % self.cubetas_nuevas
+		self._ops.setdefault(b, []).append((borrada, clave, rango))
+		self._afectadas.setdefault(clave % self.cubetas_anteriores, set()).add(b)
+
+	def afectadas(self, j: int) -> Set[int]:
+		"""Cubetas nuevas con operaciones sobre claves de la cubeta antigua j."""
+		return self._afectadas.get(j, set())
+
+	def rehacer(
+		self, b: int, presentes: Sequence[Tuple[int, int]], tam_cubeta: int
+	) -> Tuple[List[Optional[Tuple[int, int]]], List[Tuple[int, int]]]:
+		"""
+		(área principal, overflow) de la cubeta nueva b como si se hubiera
+		reubicado todo al pedir el cambio y luego aplicado las operaciones
+		anotadas. `presentes` son los (rango, clave) que ya están en b o
+		llegan en este paso; las claves que aún esperan en una cubeta antigua
+		sin migrar quedan fuera hasta que llegue su turno.
+		"""
+		ops = self._ops.get(b, [])
+		vivas = {clave for _, clave in presentes}
+		# Claves que había al pedir el cambio, incluidas las borradas después
+		iniciales = sorted(
+			[par for par in presentes if par[0] < self.rango_inicio]
+			+ [(rango, clave) for borrada, clave, rango in ops if borrada and rango < self.rango_inicio]
+		)
+		principal: List[Optional[Tuple[int, int]]] = list(iniciales[:tam_cubeta])
+		# Posiciones libres del área principal (la inserción toma la menor)
+		libres = list(range(len(principal), tam_cubeta))
+		principal += [None] * (tam_cubeta - len(principal))
+		lugar = {par: i for i, par in enumerate(principal) if par is not None}
+		# Dict ordenado: agrega al final y quita cualquier par sin recorrer el overflow
+		desborde = dict.fromkeys(iniciales[tam_cubeta:])
+
+		# Una pasada: cada operación cuesta O(log tam_cubeta)
+		for borrada, clave, rango in ops:
+			par = (rango, clave)
+			if not borrada:
+				if libres:
+					i = heapq.heappop(libres)
+					principal[i] = par
+					lugar[par] = i
+				else:
+					desborde[par] = None
+			elif par in lugar:
+				i = lugar.pop(par)
+				principal[i] = None
+				heapq.heappush(libres, i)
+			else:
+				desborde.pop(par, None)
+
+		principal = [par if par is not None and par[1] in vivas else None for par in principal]
+		return principal, [par for par in desborde if par[1] in vivas]
+
+
+class IncrementalStorage:
+	"""
+	Reubicación por pasos de un almacén a otro del mismo tipo.
+
+	Las cubetas antiguas se migran en orden; una clave cuya cubeta antigua
+	(clave % cubetas anteriores) ya se migró está en el almacén nuevo, si no
+	en el anterior. Las operaciones se anotan en `registro` y cada cubeta
+	nueva que recibe claves (o que tuvo operaciones sobre claves de la
+	cubeta migrada) se rehace con él, así que al terminar el almacén nuevo
+	queda igual que reubicar todo de una vez al pedir el cambio y aplicar
+	después las mismas operaciones. Cada paso lee solo las cubetas que toca;
+	no hace falta tener todas las claves en memoria.
+
+	`siguiente` es el registro de un cambio de tamaño pedido con esta
+	migración en curso: anota las mismas operaciones y la tabla empieza
+	con él la próxima migración.
+	"""
+
+	def __init__(self, anterior: BucketStorage, registro: RegistroMigracion, por_paso: int = CUBETAS_POR_PASO) -> None:
+		self.anterior = anterior
+		self.registro = registro
+		self.siguiente: Optional[RegistroMigracion] = None
+		self.nuevo = anterior.nuevo_almacen(registro.cubetas_nuevas)
+		self.por_paso = max(1, por_paso)
+		self.migradas = 0
+
+	@property
+	def terminada(self) -> bool:
+		return self.migradas >= self.anterior.num_cubetas
+
+	def ubicar(self, clave: int) -> Tuple[BucketStorage, int]:
+		"""(almacén, cubeta) donde está o debe ir la clave."""
+		j = clave % self.anterior.num_cubetas
+		if j >= self.migradas:
+			return self.anterior, j
+		return self.nuevo, clave % self.nuevo.num_cubetas
+
+	def _anotar(self, borrada: bool, clave: int, rango: int) -> None:
+		self.registro.anotar(borrada, clave, rango)
+		if self.siguiente is not None:
+			self.siguiente.anotar(borrada, clave, rango)
+
+	def colocar(self, clave: int, rango: int) -> Tuple[int, Optional[int]]:
+		"""Inserta la clave; devuelve (cubeta, posición o None si fue a overflow)."""
+		almacen, b = self.ubicar(clave)
+		self._anotar(False, clave, rango)
+		return b, almacen.colocar(clave, b, rango)
+
+	def quitar(self, clave: int) -> Tuple[int, Optional[int]]:
+		"""Borra la clave; devuelve (cubeta, posición / EN_OVERFLOW / None)."""
+		almacen, b = self.ubicar(clave)
+		hallada = almacen.extraer(clave, b)
+		if hallada is None:
+			return b, None
+		pos, rango = hallada
+		self._anotar(True, clave, rango)
+		return b, pos
+
+	def paso(self) -> int:
+		"""Migra hasta `por_paso` cubetas antiguas; devuelve cuántos registros movió."""
+		movidos = 0
+		n = self.nuevo.num_cubetas
+		t = self.nuevo.tam_cubeta
+		for _ in range(self.por_paso):
+			if self.terminada:
+				break
+			grupos: Dict[int, List[Tuple[int, int]]] = {b: [] for b in self.registro.afectadas(self.migradas)}
+			for rango, clave in self.anterior.pares(self.migradas):
+				grupos.setdefault(clave % n, []).append((rango, clave))
+				movidos += 1
+			for b, pares in grupos.items():
+				principal, desborde = self.registro.rehacer(b, self.nuevo.pares(b) + pares, t)
+				self.nuevo.reescribir(b, principal, desborde)
+			self.migradas += 1
+		return movidos
+
+	def completar(self) -> int:
+		movidos = 0
+		while not self.terminada:
+			movidos += self.paso()
+		return movidos
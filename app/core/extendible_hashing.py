@@ -0,0 +1,353 @@
+"""
+Hash extensible: directorio de 2^g punteros a cubetas con profundidad local.
+
+La dirección de una clave son sus g bits menos significativos (k mod 2^g).
+Varias entradas del directorio pueden apuntar a la misma cubeta; una cubeta de
+profundidad local d' agrupa las claves que coinciden en sus d' bits bajos.
+Cuando una cubeta se llena se divide solo esa cubeta (d' -> d' + 1) y, si
+d' ya era igual a g, antes se duplica el directorio. Ninguna otra cubeta se
+toca, a diferencia de las expansiones totales y parciales.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from app.core.bucket_storage import EN_OVERFLOW
+
+
+# Límite del directorio (2^16 entradas); con más claves que comparten esos
+# bits bajos la cubeta usa overflow en lugar de seguir duplicando.
+PROFUNDIDAD_MAXIMA = 16
+
+
+class HashTableExtendible:
+	"""
+	Misma interfaz que HashTableTotales (`insertar`, `eliminar`, `localizar`,
+	`to_dict`, `from_dict`, `buckets`, `overflow`) para dibujarla y compararla
+	con las expansiones totales y parciales.
+
+	`num_cubetas` se redondea a potencia de dos para fijar la profundidad
+	global inicial. `densidad_objetivo` solo se informa: aquí la división la
+	dispara el desborde de una cubeta, no la densidad global.
+	"""
+
+	def __init__(self, num_cubetas: int, tam_cubeta: int, densidad_objetivo: float) -> None:
+		self.tam_cubeta = max(1, tam_cubeta)
+		self.densidad_objetivo = densidad_objetivo
+
+		self.profundidad_global = (max(1, num_cubetas) - 1).bit_length()
+		self.num_cubetas_inicial = 1 << self.profundidad_global
+
+		n = self.num_cubetas_inicial
+		self.directorio: List[int] = list(range(n))
+		self.profundidades: List[int] = [self.profundidad_global] * n
+		# Bits bajos que comparten las claves de cada cubeta (k mod 2^d'): es
+		# también el índice de la primera entrada del directorio que apunta a ella
+		self.patrones: List[int] = list(range(n))
+		self.buckets: List[List[Optional[int]]] = [[None] * self.tam_cubeta for _ in range(n)]
+		self.overflow: List[List[int]] = [[] for _ in range(n)]
+		self.total_registros = 0
+
+		# Claves en orden de inserción (dict: pertenencia y borrado en O(1))
+		self._orden: Dict[int, None] = {}
+
+		self.divisiones = 0
+		self.fusiones = 0
+		self.duplicaciones = 0
+		self.registros_movidos = 0
+
+	# ------------------------------------------------------------
+	# Propiedades
+	# ------------------------------------------------------------
+	@property
+	def num_cubetas(self) -> int:
+		return len(self.buckets)
+
+	@property
+	def profundidad_inicial(self) -> int:
+		return self.num_cubetas_inicial.bit_length() - 1
+
+	@property
+	def capacidad_total(self) -> int:
+		return self.num_cubetas * self.tam_cubeta
+
+	@property
+	def densidad_actual(self) -> float:
+		if self.capacidad_total == 0:
+			return 0.0
+		return self.total_registros / self.capacidad_total
+
+	@property
+	def insertion_order(self) -> List[int]:
+		return list(self._orden)
+
+	def __contains__(self, clave: int) -> bool:
+		return clave in self._orden
+
+	def __len__(self) -> int:
+		return self.total_registros
+
+	def indice_directorio(self, clave: int) -> int:
+		return clave % (1 << self.profundidad_global)
+
+	def direccion(self, clave: int) -> int:
+		"""Cubeta a la que apunta la entrada del directorio de la clave."""
+		return self.directorio[self.indice_directorio(clave)]
+
+	def patron(self, b: int) -> str:
+		"""Bits bajos que comparten las claves de la cubeta b (ej: '01')."""
+		d = self.profundidades[b]
+		if d == 0:
+			return "*"
+		return format(self.patrones[b], f"0{d}b")
+
+	# ------------------------------------------------------------
+	# Operaciones básicas
+	# ------------------------------------------------------------
+	def insertar(self, clave: int) -> str:
+		if clave in self._orden:
+			return f"La clave {clave} ya se encuentra almacenada. No se permiten duplicados."
+
+		eventos = []
+		while True:
+			b = self.direccion(clave)
+			if None in self.buckets[b] or not self._separable(b, clave):
+				break
+			if self.profundidades[b] == self.profundidad_global:
+				self._duplicar_directorio()
+				eventos.append(f"directorio duplicado a {len(self.directorio)} entradas (g={self.profundidad_global})")
+			eventos.append(self._dividir(b))
+
+		pos = self._colocar(clave, b)
+		self._orden[clave] = None
+		self.total_registros += 1
+
+		idx = self.indice_directorio(clave)
+		formula = f"{clave} % 2^{self.profundidad_global} = {idx}"
+		if pos is None:
+			msg = f"Cubeta {b} llena, registro {clave} insertado en OVERFLOW de la cubeta {b} ({formula})."
+		else:
+			msg = f"Registro {clave} insertado en cubeta {b}, posición {pos} ({formula})."
+		if eventos:
+			msg += " | " + "; ".join(eventos) + "."
+		return msg
+
+	def eliminar(self, clave: int) -> str:
+		b = self.direccion(clave)
+		if clave not in self._orden:
+			return f"Registro {clave} no encontrado en la cubeta {b}."
+
+		bucket = self.buckets[b]
+		if clave in bucket:
+			pos = bucket.index(clave)
+			bucket[pos] = None
+			msg = f"Registro {clave} eliminado de la cubeta {b}, posición {pos}."
+		else:
+			self.overflow[b].remove(clave)
+			msg = f"Registro {clave} eliminado del overflow de la cubeta {b}."
+		del self._orden[clave]
+		self.total_registros -= 1
+
+		eventos = []
+		while True:
+			fusion = self._fusionar(self.direccion(clave))
+			if fusion is None:
+				break
+			eventos.append(fusion)
+		if self._reducir_directorio():
+			eventos.append(f"directorio reducido a {len(self.directorio)} entradas (g={self.profundidad_global})")
+		if eventos:
+			msg += " | " + "; ".join(eventos) + "."
+		return msg
+
+	def localizar(self, clave: int) -> Optional[Tuple[int, int]]:
+		"""(cubeta, posición o EN_OVERFLOW) de la clave, o None si no está."""
+		if clave not in self._orden:
+			return None
+		b = self.direccion(clave)
+		if clave in self.buckets[b]:
+			return b, self.buckets[b].index(clave)
+		return b, EN_OVERFLOW
+
+	def buscar(self, clave: int) -> str:
+		encontrada = self.localizar(clave)
+		if encontrada is None:
+			return f"Registro {clave} no encontrado en la cubeta {self.direccion(clave)}."
+		b, pos = encontrada
+		formula = f"{clave} % 2^{self.profundidad_global} = {self.indice_directorio(clave)}"
+		if pos != EN_OVERFLOW:
+			return f"Registro {clave} encontrado en la cubeta {b}, posición {pos} ({formula})."
+		return f"Registro {clave} encontrado en el overflow de la cubeta {b} ({formula})."
+
+	def expansion_extendible(self) -> str:
+		"""Duplica el directorio sin dividir cubetas (expansión forzada)."""
+		if self.profundidad_global >= PROFUNDIDAD_MAXIMA:
+			return f"El directorio ya alcanzó la profundidad máxima ({PROFUNDIDAD_MAXIMA})."
+		self._duplicar_directorio()
+		return f"Directorio duplicado: {len(self.directorio)} entradas (g={self.profundidad_global})."
+
+	def reduccion_extendible(self) -> str:
+		"""Fusiona todas las cubetas compañeras que quepan juntas y reduce el directorio."""
+		antes = self.num_cubetas
+		b = 0
+		while b < self.num_cubetas:
+			if self._fusionar(b) is None:
+				b += 1
+		reducido = self._reducir_directorio()
+		if antes == self.num_cubetas and not reducido:
+			return "No hay cubetas compañeras que se puedan fusionar."
+		return (
+			f"Reducción realizada: {antes} -> {self.num_cubetas} cubetas, "
+			f"directorio de {len(self.directorio)} entradas (g={self.profundidad_global})."
+		)
+
+	# ------------------------------------------------------------
+	# Serialización para guardar/cargar
+	# ------------------------------------------------------------
+	def to_dict(self) -> dict:
+		return {
+			"tipo": "extendible",
+			"num_cubetas_inicial": self.num_cubetas_inicial,
+			"num_cubetas": self.num_cubetas,
+			"tam_cubeta": self.tam_cubeta,
+			"densidad_objetivo": self.densidad_objetivo,
+			"profundidad_global": self.profundidad_global,
+			"directorio": self.directorio,
+			"profundidades": self.profundidades,
+			"buckets": self.buckets,
+			"overflow": self.overflow,
+			"insertion_order": self.insertion_order,
+			"divisiones": self.divisiones,
+			"fusiones": self.fusiones,
+			"duplicaciones": self.duplicaciones,
+			"registros_movidos": self.registros_movidos,
+		}
+
+	@classmethod
+	def from_dict(cls, data: dict) -> "HashTableExtendible":
+		obj = cls(data.get("num_cubetas_inicial", 1), data["tam_cubeta"], data["densidad_objetivo"])
+		obj.profundidad_global = data["profundidad_global"]
+		obj.directorio = data["directorio"]
+		obj.profundidades = data["profundidades"]
+		obj.patrones = [0] * len(obj.profundidades)
+		vistas = set()
+		for i, b in enumerate(obj.directorio):
+			if b not in vistas:
+				vistas.add(b)
+				obj.patrones[b] = i % (1 << obj.profundidades[b])
+		obj.buckets = data["buckets"]
+		obj.overflow = data["overflow"]
+		obj.divisiones = data.get("divisiones", 0)
+		obj.fusiones = data.get("fusiones", 0)
+		obj.duplicaciones = data.get("duplicaciones", 0)
+		obj.registros_movidos = data.get("registros_movidos", 0)
+
+		orden = data.get("insertion_order")
+		if orden is None:
+			orden = [v for b in range(obj.num_cubetas) for v in obj.buckets[b] + obj.overflow[b] if v is not None]
+		obj._orden = dict.fromkeys(orden)
+		obj.total_registros = len(obj._orden)
+		return obj
+
+	# ------------------------------------------------------------
+	# Internos
+	# ------------------------------------------------------------
+	def _colocar(self, clave: int, b: int) -> Optional[int]:
+		"""Ubica la clave en la cubeta b; devuelve la posición o None si fue a overflow."""
+		bucket = self.buckets[b]
+		for i in range(self.tam_cubeta):
+			if bucket[i] is None:
+				bucket[i] = clave
+				return i
+		self.overflow[b].append(clave)
+		return None
+
+	def _vaciar(self, b: int) -> List[int]:
+		registros = [v for v in self.buckets[b] if v is not None] + self.overflow[b]
+		self.buckets[b] = [None] * self.tam_cubeta
+		self.overflow[b] = []
+		return registros
+
+	def _separable(self, b: int, clave: int) -> bool:
+		"""¿Alguna división de b (hasta PROFUNDIDAD_MAXIMA) separaría sus claves de `clave`?"""
+		mascara = (1 << PROFUNDIDAD_MAXIMA) - 1
+		patron = clave & mascara
+		return any(v & mascara != patron for v in self.buckets[b] + self.overflow[b] if v is not None)
+
+	def _duplicar_directorio(self) -> None:
+		# La entrada i + 2^g apunta a la misma cubeta que la entrada i
+		self.directorio = self.directorio + self.directorio
+		self.profundidad_global += 1
+		self.duplicaciones += 1
+
+	def _dividir(self, b: int) -> str:
+		"""Divide la cubeta b según el bit d' de las claves; solo cambia b y la nueva cubeta."""
+		d = self.profundidades[b]
+		bit = 1 << d
+		nueva = len(self.buckets)
+		self.buckets.append([None] * self.tam_cubeta)
+		self.overflow.append([])
+		self.profundidades[b] = d + 1
+		self.profundidades.append(d + 1)
+		self.patrones.append(self.patrones[b] | bit)
+
+		# Solo las entradas con el patrón de b y el bit d' en 1
+		for i in range(self.patrones[b] | bit, len(self.directorio), bit << 1):
+			self.directorio[i] = nueva
+
+		movidos = 0
+		for v in self._vaciar(b):
+			if v & bit:
+				self._colocar(v, nueva)
+				movidos += 1
+			else:
+				self._colocar(v, b)
+
+		self.divisiones += 1
+		self.registros_movidos += movidos
+		return f"cubeta {b} dividida en {b} y {nueva} (d'={d + 1}), {movidos} registro(s) movido(s)"
+
+	def _fusionar(self, b: int) -> Optional[str]:
+		"""
+		Une b con su compañera si tienen la misma profundidad local y caben en
+		una cubeta, sin bajar de la profundidad inicial.
+		"""
+		d = self.profundidades[b]
+		if d <= self.profundidad_inicial:
+			return None
+		companera = self.directorio[self.patrones[b] ^ (1 << (d - 1))]
+		if companera == b or self.profundidades[companera] != d:
+			return None
+		ocupados = [v for v in self.buckets[b] + self.buckets[companera] if v is not None]
+		if self.overflow[b] or self.overflow[companera] or len(ocupados) > self.tam_cubeta:
+			return None
+
+		# Se conserva la de índice menor y se elimina la otra
+		queda, sale = min(b, companera), max(b, companera)
+		movidos = self._vaciar(sale)
+		for v in movidos:
+			self._colocar(v, queda)
+		self.profundidades[queda] = d - 1
+		self.patrones[queda] %= 1 << (d - 1)
+
+		del self.buckets[sale]
+		del self.overflow[sale]
+		del self.profundidades[sale]
+		del self.patrones[sale]
+		for j, destino in enumerate(self.directorio):
+			if destino == sale:
+				self.directorio[j] = queda
+			elif destino > sale:
+				self.directorio[j] = destino - 1
+
+		self.fusiones += 1
+		self.registros_movidos += len(movidos)
+		return f"cubeta {sale} fusionada con {queda} (d'={d - 1})"
+
+	def _reducir_directorio(self) -> bool:
+		"""Reduce el directorio a la mitad mientras ninguna cubeta use la profundidad global."""
+		reducido = False
+		while self.profundidad_global > self.profundidad_inicial and max(self.profundidades) < self.profundidad_global:
+			self.directorio = self.directorio[: len(self.directorio) // 2]
+			self.profundidad_global -= 1
+			reducido = True
+		return reducido
@@ -0,0 +1,214 @@
+"""
+Ordenamiento externo por mezcla para la carga masiva de archivos de bloques.
+
+1. Corridas: se leen trozos de a lo sumo `memoria` claves, se ordenan en
+   memoria y cada trozo se escribe como corrida binaria (int64) temporal.
+2. Mezcla: las corridas se mezclan de a `fan_in` (heapq.merge) leyendo cada
+   una con un búfer propio, en tantas pasadas como haga falta; la última
+   mezcla no se escribe, se entrega como flujo.
+3. Carga: una primera lectura de las corridas finales cuenta las claves
+   distintas (la capacidad por defecto y el control de la dada); la segunda
+   empaqueta el flujo ordenado (sin duplicados) directamente en bloques
+   llenos con BlockFile.desde_claves.
+
+Nunca hay más de `memoria` claves en memoria, así que el archivo de entrada
+puede ser arbitrariamente grande.
+
+Uso:
+    python -m app.core.external_sort claves.txt datos.blq --memoria 100000
+"""
+
+import argparse
+import heapq
+import os
+import re
+import tempfile
+import time
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from app.core.block_file import BlockFile, validar_clave
+
+
+REGISTROS_EN_MEMORIA = 100_000
+FAN_IN = 16
+
+_SEPARADORES = re.compile(r"[\s,;]+")
+
+
+def leer_claves(ruta: str) -> Iterator[int]:
+	"""Claves enteras de un archivo de texto (separadas por líneas, espacios o comas), línea a línea."""
+	with open(ruta, "r", encoding="utf-8") as f:
+		for linea in f:
+			for campo in _SEPARADORES.split(linea.strip()):
+				if campo:
+					yield int(campo)
+
+
+def _leer_corrida(ruta: str, tam_bufer: int) -> Iterator[int]:
+	with open(ruta, "rb") as f:
+		while True:
+			bufer = array("q")
+			bufer.frombytes(f.read(8 * tam_bufer))
+			if not bufer:
+				return
+			yield from bufer
+
+
+class ExternalSorter:
+	"""Ordenamiento externo con presupuesto de memoria (en claves) y estadísticas."""
+
+	def __init__(self, memoria: int = REGISTROS_EN_MEMORIA, fan_in: int = FAN_IN, directorio: Optional[str] = None) -> None:
+		self.memoria = max(2, memoria)
+		self.fan_in = max(2, fan_in)
+		self.directorio = directorio
+		self.registros = 0
+		self.corridas = 0
+		self.pasadas = 0
+		self.duplicados = 0
+		self._temporales: List[str] = []
+
+	def _nueva_corrida(self) -> str:
+		fd, ruta = tempfile.mkstemp(suffix=".run", dir=self.directorio)
+		os.close(fd)
+		self._temporales.append(ruta)
+		return ruta
+
+	def _escribir_corrida(self, claves: Iterable[int]) -> str:
+		ruta = self._nueva_corrida()
+		tam_bufer = max(1, self.memoria // (self.fan_in + 1))
+		with open(ruta, "wb") as f:
+			bufer = array("q")
+			for k in claves:
+				bufer.append(k)
+				if len(bufer) >= tam_bufer:
+					bufer.tofile(f)
+					bufer = array("q")
+			bufer.tofile(f)
+		return ruta
+
+	def _corridas_iniciales(self, claves: Iterable[int]) -> List[str]:
+		corridas: List[str] = []
+		trozo = array("q")
+		for k in claves:
+			# Antes de escribir corridas: -2^63 se perdería al empaquetar en bloques
+			trozo.append(validar_clave(k))
+			self.registros += 1
+			if len(trozo) >= self.memoria:
+				corridas.append(self._escribir_corrida(sorted(trozo)))
+				trozo = array("q")
+		if trozo:
+			corridas.append(self._escribir_corrida(sorted(trozo)))
+		self.corridas = len(corridas)
+		return corridas
+
+	def _mezcla(self, corridas: List[str]) -> Iterator[int]:
+		# El presupuesto se reparte entre los búferes de lectura (y el de salida)
+		tam_bufer = max(1, self.memoria // (len(corridas) + 1))
+		return heapq.merge(*(_leer_corrida(r, tam_bufer) for r in corridas))
+
+	def corridas_finales(self, claves: Iterable[int]) -> List[str]:
+		"""Genera las corridas y las mezcla hasta que quedan a lo sumo `fan_in` (las borra limpiar)."""
+		corridas = self._corridas_iniciales(claves)
+		self.pasadas = 1
+		while len(corridas) > self.fan_in:
+			siguientes = []
+			for i in range(0, len(corridas), self.fan_in):
+				grupo = corridas[i:i + self.fan_in]
+				if len(grupo) == 1:
+					siguientes.append(grupo[0])
+					continue
+				siguientes.append(self._escribir_corrida(self._mezcla(grupo)))
+				for ruta in grupo:
+					self._borrar(ruta)
+			corridas = siguientes
+			self.pasadas += 1
+		return corridas
+
+	def mezclar(self, corridas: List[str], unicas: bool = True) -> Iterator[int]:
+		"""Mezcla final de las corridas como flujo; puede repetirse (cada vez las vuelve a leer)."""
+		self.duplicados = 0
+		anterior = None
+		for k in self._mezcla(corridas):
+			if unicas and k == anterior:
+				self.duplicados += 1
+				continue
+			anterior = k
+			yield k
+
+	def ordenar(self, claves: Iterable[int], unicas: bool = True) -> Iterator[int]:
+		"""Flujo ordenado de las claves (sin repetidas si `unicas`)."""
+		try:
+			yield from self.mezclar(self.corridas_finales(claves), unicas)
+		finally:
+			self.limpiar()
+
+	def _borrar(self, ruta: str) -> None:
+		try:
+			os.remove(ruta)
+		except OSError:
+			pass
+		if ruta in self._temporales:
+			self._temporales.remove(ruta)
+
+	def limpiar(self) -> None:
+		"""Borra las corridas temporales que queden."""
+		for ruta in list(self._temporales):
+			self._borrar(ruta)
+
+	def estadisticas(self) -> Dict[str, int]:
+		return {
+			"registros": self.registros,
+			"corridas": self.corridas,
+			"pasadas": self.pasadas,
+			"duplicados": self.duplicados,
+			"memoria": self.memoria,
+		}
+
+
+def cargar_bloques(entrada: str, destino: str, memoria: int = REGISTROS_EN_MEMORIA, n: Optional[int] = None, fan_in: int = FAN_IN) -> Dict[str, int]:
+	"""
+	Ordena externamente las claves de `entrada` y las escribe como archivo de
+	bloques en `destino`. Sin `n`, la capacidad es el número de claves
+	distintas; contarlas cuesta una lectura más de las corridas finales.
+	"""
+	sorter = ExternalSorter(memoria, fan_in, os.path.dirname(os.path.abspath(destino)))
+	try:
+		corridas = sorter.corridas_finales(leer_claves(entrada))
+		unicas = sum(1 for _ in sorter.mezclar(corridas))
+		capacidad = n if n is not None else max(1, unicas)
+		if unicas > capacidad:
+			raise ValueError(f"hay {unicas} claves distintas y la capacidad es {capacidad}")
+		with BlockFile.desde_claves(destino, capacidad, sorter.mezclar(corridas)) as archivo:
+			resultado = sorter.estadisticas()
+			resultado.update(n=archivo.n, bloques=archivo.b, block_size=archivo.block_size)
+	finally:
+		sorter.limpiar()
+	return resultado
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+	parser = argparse.ArgumentParser(description="Carga masiva: ordenamiento externo de un archivo de claves a un archivo de bloques")
+	parser.add_argument("entrada", help="archivo de texto con claves (una por línea o separadas por comas)")
+	parser.add_argument("destino", help="archivo de bloques (.blq)")
+	parser.add_argument("--memoria", type=int, default=REGISTROS_EN_MEMORIA, help="claves en memoria a la vez")
+	parser.add_argument("--fan-in", type=int, default=FAN_IN, help="corridas mezcladas por pasada")
+	parser.add_argument("-n", type=int, default=None, help="capacidad del archivo (por defecto, las claves distintas)")
+	args = parser.parse_args(argv)
+
+	inicio = time.perf_counter()
+	try:
+		resultado = cargar_bloques(args.entrada, args.destino, args.memoria, args.n, args.fan_in)
+	except ValueError as e:
+		parser.error(str(e))
+	segundos = time.perf_counter() - inicio
+	print(
+		f"{resultado['registros']} claves ({resultado['duplicados']} repetidas descartadas), "
+		f"{resultado['corridas']} corridas, {resultado['pasadas']} pasadas de mezcla"
+	)
+	print(f"{args.destino}: n={resultado['n']}, B={resultado['bloques']}, registros por bloque={resultado['block_size']}")
+	print(f"Tiempo: {segundos:.2f} s")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,198 @@
+"""
+Comparación de rendimiento de todas las combinaciones función hash ×
+resolución de colisiones, sin interfaz gráfica.
+
+Uso:
+	python -m app.core.hash_benchmark -N 10000 -d 6 --cargas 0.5,0.75,0.9 --csv resultados.csv
+	python -m app.core.hash_benchmark --archivo claves.txt -d 4
+"""
+
+import argparse
+import csv
+import math
+import random
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Type
+
+from app.core.hash_stats import ProbeStats, cluster_report
+from app.core.hash_table import HashTable, TransformTable
+
+
+FAMILIES: Dict[str, Type[HashTable]] = {
+	"hash": HashTable,
+	"transformacion": TransformTable,
+}
+
+COLUMNS = (
+	"familia", "hash", "resolucion", "n", "claves", "factor_carga", "insertadas",
+	"insert_ops_s", "busqueda_ops_s", "fallida_ops_s", "borrado_ops_s",
+	"sondeos_insert_prom", "exitosa_prom", "exitosa_p95", "exitosa_max",
+	"fallida_prom", "cluster_primario_max", "cluster_secundario_max",
+)
+
+
+def read_keys(path: str) -> List[int]:
+	"""Lee claves numéricas separadas por espacios, comas o saltos de línea."""
+	with open(path, "r", encoding="utf-8") as f:
+		content = f.read().replace(",", " ")
+	seen = set()
+	keys = []
+	for tok in content.split():
+		if tok.isdigit():
+			k = int(tok)
+			if k not in seen:
+				seen.add(k)
+				keys.append(k)
+	return keys
+
+
+def random_keys(count: int, d: int, rng: random.Random) -> List[int]:
+	"""Claves distintas de exactamente d dígitos."""
+	low = 10 ** (d - 1) if d > 1 else 0
+	high = 10 ** d
+	return rng.sample(range(low, high), min(count, high - low))
+
+
+def _absent_keys(keys: Sequence[int], d: int, count: int, rng: random.Random) -> List[int]:
+	low = 10 ** (d - 1) if d > 1 else 0
+	high = 10 ** d
+	present = set(keys)
+	absent: List[int] = []
+	for _ in range(count * 20):
+		if len(absent) >= count:
+			break
+		k = rng.randrange(low, high)
+		if k not in present:
+			absent.append(k)
+	return absent
+
+
+def _ops_per_second(count: int, seconds: float) -> float:
+	return count / seconds if seconds > 0 else float("inf")
+
+
+def _percentile(sorted_values: Sequence[int], q: float) -> int:
+	if not sorted_values:
+		return 0
+	return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+def measure(table_cls: Type[HashTable], keys: List[int], misses: List[int], n: int, d: int, hash_mode: str, probe_mode: str, **kwargs) -> dict:
+	"""
+	Mide una combinación: rendimiento sin instrumentar y distribución de sondeos.
+
+	Búsquedas exitosas, fallidas y borrados recorren la secuencia de prueba
+	de cada clave sobre la tabla, así que su rendimiento depende de la
+	resolución de colisiones igual que los sondeos promedio.
+	"""
+	table = table_cls(n, d, hash_mode, probe_mode, **kwargs)
+
+	t0 = time.perf_counter()
+	inserted = table.insert_many(keys)
+	t1 = time.perf_counter()
+	table.search_many(keys)
+	t2 = time.perf_counter()
+	table.search_many(misses)
+	t3 = time.perf_counter()
+
+	report = cluster_report(table)
+	hit_costs = sorted(table.search_cost(k) for k in table.keys())
+
+	removed = keys[: len(keys) // 2]
+	t4 = time.perf_counter()
+	table.delete_many(removed)
+	t5 = time.perf_counter()
+
+	# Sondeos de inserción: segunda construcción instrumentada
+	stats = ProbeStats()
+	probe_table = table_cls(n, d, hash_mode, probe_mode, **kwargs)
+	probe_table.stats = stats
+	probe_table.insert_many(keys)
+	insert_probes = stats.summary()["insert"]["sondeos_promedio"]
+
+	return {
+		"hash": table.hash_mode,
+		"resolucion": table.probe_mode,
+		"n": n,
+		"claves": len(keys),
+		"factor_carga": round(len(keys) / n, 4),
+		"insertadas": inserted,
+		"insert_ops_s": round(_ops_per_second(len(keys), t1 - t0)),
+		"busqueda_ops_s": round(_ops_per_second(len(keys), t2 - t1)),
+		"fallida_ops_s": round(_ops_per_second(len(misses), t3 - t2)),
+		"borrado_ops_s": round(_ops_per_second(len(removed), t5 - t4)),
+		"sondeos_insert_prom": round(insert_probes, 4),
+		"exitosa_prom": round(report["busqueda_exitosa_promedio"], 4),
+		"exitosa_p95": _percentile(hit_costs, 0.95),
+		"exitosa_max": report["cadena_mas_larga"],
+		"fallida_prom": round(report["busqueda_fallida_promedio"], 4),
+		"cluster_primario_max": report.get("cluster_primario", {}).get("max", ""),
+		"cluster_secundario_max": report["cluster_secundario"]["max"],
+	}
+
+
+def run_benchmark(keys: List[int], d: int, load_factors: Iterable[float], families: Iterable[str] = tuple(FAMILIES), base: int = 7, seed: Optional[int] = None) -> List[dict]:
+	"""Evalúa cada familia × carga × función hash × resolución."""
+	rng = random.Random(seed)
+	misses = _absent_keys(keys, d, len(keys), rng)
+	rows = []
+	for load in load_factors:
+		n = max(1, math.ceil(len(keys) / load))
+		for family in families:
+			table_cls = FAMILIES[family]
+			kwargs = {"base": base} if table_cls is TransformTable else {}
+			for hash_mode in table_cls.hash_modes:
+				for probe_mode in table_cls.probe_modes:
+					row = {"familia": family}
+					row.update(measure(table_cls, keys, misses, n, d, hash_mode, probe_mode, **kwargs))
+					rows.append(row)
+	return rows
+
+
+def format_table(rows: List[dict]) -> str:
+	"""Tabla de texto alineada con las columnas principales."""
+	shown = ("familia", "hash", "resolucion", "factor_carga", "insertadas", "insert_ops_s",
+		"busqueda_ops_s", "fallida_ops_s", "borrado_ops_s", "sondeos_insert_prom", "exitosa_prom",
+		"exitosa_max", "fallida_prom")
+	cells = [[str(r[c]) for c in shown] for r in rows]
+	widths = [max([len(c)] + [len(row[i]) for row in cells]) for i, c in enumerate(shown)]
+	lines = ["  ".join(c.ljust(w) for c, w in zip(shown, widths))]
+	lines.append("  ".join("-" * w for w in widths))
+	for row in cells:
+		lines.append("  ".join(v.ljust(w) for v, w in zip(row, widths)))
+	return "\n".join(lines)
+
+
+def write_csv(rows: List[dict], path: str) -> None:
+	with open(path, "w", encoding="utf-8", newline="") as f:
+		writer = csv.DictWriter(f, fieldnames=COLUMNS)
+		writer.writeheader()
+		writer.writerows(rows)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+	parser = argparse.ArgumentParser(description="Benchmark de funciones hash × resolución de colisiones")
+	parser.add_argument("-N", type=int, default=10000, help="cantidad de claves aleatorias")
+	parser.add_argument("-d", "--digitos", type=int, default=6, help="dígitos por clave")
+	parser.add_argument("--archivo", help="archivo de claves (en lugar de claves aleatorias)")
+	parser.add_argument("--cargas", default="0.5,0.75,0.9", help="factores de carga separados por coma")
+	parser.add_argument("--familias", default=",".join(FAMILIES), help="hash,transformacion")
+	parser.add_argument("--base", type=int, default=7, help="base para conversion_bases")
+	parser.add_argument("--semilla", type=int, default=None)
+	parser.add_argument("--csv", help="ruta del CSV de resultados")
+	args = parser.parse_args(argv)
+
+	rng = random.Random(args.semilla)
+	keys = read_keys(args.archivo) if args.archivo else random_keys(args.N, args.digitos, rng)
+	loads = [float(x) for x in args.cargas.split(",") if x.strip()]
+	families = [f.strip() for f in args.familias.split(",") if f.strip() in FAMILIES]
+
+	rows = run_benchmark(keys, args.digitos, loads, families, args.base, args.semilla)
+	print(format_table(rows))
+	if args.csv:
+		write_csv(rows, args.csv)
+		print(f"\nResultados guardados en {args.csv}")
+
+
+if __name__ == "__main__":
+	main()
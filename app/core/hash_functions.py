@@ -0,0 +1,276 @@
+"""
+Funciones hash compartidas por las vistas de búsqueda interna y externa.
+
+Los dígitos se extraen con división entera (sin formatear cadenas), de modo
+que cada función tiene una versión por lotes: con NumPy instalado se evalúa
+sobre arreglos completos; sin él se aplica la versión escalar clave por clave.
+"""
+
+from array import array
+from bisect import bisect_right
+from typing import Callable, Dict, Iterable, Sequence
+
+try:
+	import numpy as np
+except ImportError:  # NumPy es opcional
+	np = None
+
+
+HashFn = Callable[[int, int, int], int]
+TransformFn = Callable[[int, int, int, int], int]
+
+_POW10 = [10 ** i for i in range(1, 64)]
+
+# Con claves < 10^9, K² cabe en int64 (< 10^18)
+_NP_MAX_KEY = 10 ** 9
+
+
+def num_digits(x: int) -> int:
+	"""Cantidad de dígitos decimales de x >= 0 (0 tiene 1 dígito)."""
+	if x < _POW10[-1]:
+		return bisect_right(_POW10, x) + 1
+	return len(str(x))
+
+
+def _part_size(table_size: int) -> int:
+	"""Cantidad de dígitos por parte según los dígitos de n (n=10→1, n=100→2...)."""
+	return max(1, num_digits(table_size) - 1)
+
+
+def _center_square(k: int, d: int) -> int:
+	"""Los d dígitos centrales de K² (completado con ceros a 2d dígitos)."""
+	k2 = k * k
+	length = max(2 * d, num_digits(k2))
+	start = (length - d) // 2
+	return (k2 // 10 ** (length - start - d)) % 10 ** d
+
+
+# ----------------------------------------------------------------------
+# Funciones de HashView: devuelven la dirección en [0, n-1]
+# ----------------------------------------------------------------------
+
+def hash_modulo(k: int, table_size: int, d: int) -> int:
+	return k % table_size
+
+
+def hash_cuadrado(k: int, table_size: int, d: int) -> int:
+	"""Cuadrado: toma los d dígitos centrales de K²."""
+	return _center_square(k, d) % table_size
+
+
+def hash_plegamiento(k: int, table_size: int, d: int) -> int:
+	"""Plegamiento: multiplica partes de la clave y toma los primeros dígitos + 1."""
+	part_size = _part_size(table_size)
+	m = num_digits(k)
+
+	if m <= part_size:
+		result = k
+	else:
+		# La última parte (por la derecha) puede ser más corta
+		last_len = m % part_size or part_size
+		result = k % 10 ** last_len
+		rest = k // 10 ** last_len
+		part_mod = 10 ** part_size
+		for _ in range((m - last_len) // part_size):
+			result *= rest % part_mod
+			rest //= part_mod
+
+	result_len = num_digits(result)
+	direccion = result // 10 ** (result_len - part_size) if result_len >= part_size else result
+	return (direccion + 1) % table_size
+
+
+def hash_truncamiento(k: int, table_size: int, d: int) -> int:
+	"""Truncamiento: elige los primeros dígitos de la clave + 1."""
+	length = max(d, num_digits(k))
+	direccion = k // 10 ** max(0, length - _part_size(table_size))
+	return (direccion + 1) % table_size
+
+
+HASH_FUNCTIONS: Dict[str, HashFn] = {
+	"modulo": hash_modulo,
+	"cuadrado": hash_cuadrado,
+	"plegamiento": hash_plegamiento,
+	"truncamiento": hash_truncamiento,
+}
+
+
+def get_hash_function(mode: str) -> HashFn:
+	"""Devuelve la función hash del modo indicado (módulo por defecto)."""
+	return HASH_FUNCTIONS.get(mode, hash_modulo)
+
+
+# ----------------------------------------------------------------------
+# Funciones de TransformacionClavesView: valor "conceptual" (puede ser > n)
+# ----------------------------------------------------------------------
+
+def transform_modulo(k: int, n: int, d: int, base: int) -> int:
+	return k % n + 1
+
+
+def transform_cuadrado(k: int, n: int, d: int, base: int) -> int:
+	return _center_square(k, d) % n + 1
+
+
+def transform_plegamiento(k: int, n: int, d: int, base: int) -> int:
+	"""Suma parejas de 2 dígitos (último dígito suelto si sobra) + 1."""
+	suma = 0
+	if num_digits(k) % 2 == 1:
+		suma = k % 10
+		k //= 10
+	while k:
+		suma += k % 100
+		k //= 100
+	return suma + 1
+
+
+def transform_truncamiento(k: int, n: int, d: int, base: int) -> int:
+	"""Usa los dígitos 1 y 3 (posición 0 y 2) + 1."""
+	length = max(d, num_digits(k))
+	d1 = k // 10 ** (length - 1)
+	d3 = (k // 10 ** (length - 3)) % 10 if length > 2 else 0
+	return d1 * 10 + d3 + 1
+
+
+def transform_conversion_bases(k: int, n: int, d: int, base: int) -> int:
+	"""Suma de dígitos en la base indicada, luego % n y +1."""
+	suma = 0
+	while k > 0:
+		suma += k % base
+		k //= base
+	return suma % n + 1
+
+
+TRANSFORM_FUNCTIONS: Dict[str, TransformFn] = {
+	"modulo": transform_modulo,
+	"cuadrado": transform_cuadrado,
+	"plegamiento": transform_plegamiento,
+	"truncamiento": transform_truncamiento,
+	"conversion_bases": transform_conversion_bases,
+}
+
+
+def get_transform_function(mode: str) -> TransformFn:
+	"""Devuelve la transformación del modo indicado (módulo por defecto)."""
+	return TRANSFORM_FUNCTIONS.get(mode, transform_modulo)
+
+
+# ----------------------------------------------------------------------
+# Versiones por lotes
+# ----------------------------------------------------------------------
+
+if np is not None:
+	_NP_POW10 = 10 ** np.arange(1, 19, dtype=np.int64)
+	_NP_P10 = 10 ** np.arange(0, 19, dtype=np.int64)
+
+	def _np_digits(x):
+		return np.searchsorted(_NP_POW10, x, side="right") + 1
+
+	def _np_center_square(k, d):
+		k2 = k * k
+		length = np.maximum(2 * d, _np_digits(k2))
+		start = (length - d) // 2
+		return (k2 // _NP_P10[length - start - d]) % 10 ** d
+
+	def _np_hash_plegamiento(k, table_size, d):
+		part_size = _part_size(table_size)
+		m = _np_digits(k)
+		last_len = m % part_size
+		last_len[last_len == 0] = part_size
+		result = k % _NP_P10[last_len]
+		rest = k // _NP_P10[last_len]
+		groups = (m - last_len) // part_size
+		part_mod = 10 ** part_size
+		for g in range(int(groups.max(initial=0))):
+			result = np.where(groups > g, result * (rest % part_mod), result)
+			rest //= part_mod
+		result_len = _np_digits(result)
+		shift = np.maximum(result_len - part_size, 0)
+		direccion = np.where(result_len >= part_size, result // _NP_P10[shift], result)
+		return (direccion + 1) % table_size
+
+	def _np_hash_truncamiento(k, table_size, d):
+		length = np.maximum(d, _np_digits(k))
+		direccion = k // _NP_P10[np.maximum(0, length - _part_size(table_size))]
+		return (direccion + 1) % table_size
+
+	def _np_transform_plegamiento(k, n, d, base):
+		odd = _np_digits(k) % 2 == 1
+		suma = np.where(odd, k % 10, 0)
+		rest = np.where(odd, k // 10, k)
+		while rest.any():
+			suma += rest % 100
+			rest //= 100
+		return suma + 1
+
+	def _np_transform_truncamiento(k, n, d, base):
+		length = np.maximum(d, _np_digits(k))
+		d1 = k // _NP_P10[length - 1]
+		d3 = np.where(length > 2, (k // _NP_P10[np.maximum(length - 3, 0)]) % 10, 0)
+		return d1 * 10 + d3 + 1
+
+	def _np_transform_conversion_bases(k, n, d, base):
+		suma = np.zeros_like(k)
+		rest = k.copy()
+		while rest.any():
+			suma += rest % base
+			rest //= base
+		return suma % n + 1
+
+	_NP_HASH = {
+		"modulo": lambda k, n, d: k % n,
+		"cuadrado": lambda k, n, d: _np_center_square(k, d) % n,
+		"plegamiento": _np_hash_plegamiento,
+		"truncamiento": _np_hash_truncamiento,
+	}
+
+	_NP_TRANSFORM = {
+		"modulo": lambda k, n, d, base: k % n + 1,
+		"cuadrado": lambda k, n, d, base: _np_center_square(k, d) % n + 1,
+		"plegamiento": _np_transform_plegamiento,
+		"truncamiento": _np_transform_truncamiento,
+		"conversion_bases": _np_transform_conversion_bases,
+	}
+
+
+def _as_np_keys(keys, d: int):
+	"""Convierte a int64 si NumPy está disponible y no hay desbordamiento; si no, None."""
+	if np is None or d > 9:
+		return None
+	arr = np.asarray(keys)
+	if arr.dtype.kind not in "iu" or arr.ndim != 1:
+		return None
+	arr = arr.astype(np.int64, copy=False)
+	if arr.size and (arr.min() < 0 or arr.max() >= _NP_MAX_KEY):
+		return None
+	return arr
+
+
+def hash_batch(mode: str, keys: Iterable[int], table_size: int, d: int):
+	"""
+	Direcciones de HashView para un lote de claves.
+	Devuelve un arreglo NumPy (si está instalado) o un array('q').
+	"""
+	if not isinstance(keys, Sequence) and (np is None or not isinstance(keys, np.ndarray)):
+		keys = list(keys)
+	arr = _as_np_keys(keys, d)
+	if arr is not None:
+		fn = _NP_HASH.get(mode, _NP_HASH["modulo"])
+		return fn(arr, table_size, d).astype(np.int64, copy=False)
+	fn = get_hash_function(mode)
+	return array("q", [fn(k, table_size, d) for k in keys])
+
+
+def transform_batch(mode: str, keys: Iterable[int], n: int, d: int, base: int = 7):
+	"""
+	Valores hash conceptuales de TransformacionClavesView para un lote de claves.
+	Devuelve un arreglo NumPy (si está instalado) o un array('q').
+	"""
+	if not isinstance(keys, Sequence) and (np is None or not isinstance(keys, np.ndarray)):
+		keys = list(keys)
+	arr = _as_np_keys(keys, d)
+	if arr is not None:
+		fn = _NP_TRANSFORM.get(mode, _NP_TRANSFORM["modulo"])
+		return fn(arr, n, d, base).astype(np.int64, copy=False)
+	fn = get_transform_function(mode)
+	return array("q", [fn(k, n, d, base) for k in keys])
@@ -0,0 +1,136 @@
+"""Estadísticas de sondeos y agrupamiento para las tablas hash de app.core."""
+
+import json
+from array import array
+from collections import Counter
+from typing import Dict, Iterable, List, Type
+
+from app.core.hash_table import HashTable
+
+
+OPERATIONS = ("insert", "search", "delete")
+
+
+class ProbeStats:
+	"""Registra los sondeos de cada operación (asignar a `HashTable.stats`)."""
+
+	def __init__(self) -> None:
+		self.reset()
+
+	def reset(self) -> None:
+		self.probes: Dict[str, array] = {op: array("I") for op in OPERATIONS}
+		self.hits: Dict[str, int] = {op: 0 for op in OPERATIONS}
+		self.last: int = 0
+
+	def record(self, op: str, probes: int, found: bool) -> None:
+		self.probes[op].append(probes)
+		if found:
+			self.hits[op] += 1
+		self.last = probes
+
+	def summary(self) -> Dict[str, dict]:
+		result = {}
+		for op in OPERATIONS:
+			values = self.probes[op]
+			result[op] = {
+				"operaciones": len(values),
+				"exitosas": self.hits[op],
+				"sondeos_promedio": sum(values) / len(values) if values else 0.0,
+				"sondeos_max": max(values) if values else 0,
+				"histograma": {str(p): c for p, c in sorted(Counter(values).items())},
+			}
+		return result
+
+
+def _size_summary(sizes: List[int]) -> dict:
+	return {
+		"cantidad": len(sizes),
+		"promedio": sum(sizes) / len(sizes) if sizes else 0.0,
+		"max": max(sizes) if sizes else 0,
+	}
+
+
+def _primary_clusters(table: HashTable) -> List[int]:
+	"""Tamaños de las rachas de direcciones ocupadas (incluye marcas de borrado), con vuelta circular."""
+	slots = table.table
+	n = len(slots)
+	if all(v is not None for v in slots):
+		return [n] if n else []
+	# Empezar justo después de una dirección vacía para no partir la racha circular
+	start = next(i for i, v in enumerate(slots) if v is None) + 1
+	sizes = []
+	run = 0
+	for i in range(n):
+		if slots[(start + i) % n] is None:
+			if run:
+				sizes.append(run)
+			run = 0
+		else:
+			run += 1
+	if run:
+		sizes.append(run)
+	return sizes
+
+
+def cluster_report(table: HashTable) -> dict:
+	"""
+	Estado estructural de la tabla:
+	- agrupamiento primario: rachas de direcciones ocupadas (direccionamiento abierto);
+	- agrupamiento secundario: claves que comparten dirección de origen;
+	- búsqueda exitosa promedio sobre las claves almacenadas;
+	- búsqueda fallida promedio sobre las n direcciones de origen (y sobre
+	  varios pasos si el doble hash depende de la clave);
+	- cadena más larga: sondeos de la búsqueda exitosa más cara.
+	"""
+	keys = table.keys()
+	homes = Counter(table.hash(k) for k in keys)
+	hit_costs = [table.search_cost(k) for k in keys]
+	# Si el paso de la secuencia depende de la clave, cada origen promedia varios pasos
+	steps = list(table.miss_step_keys())
+	miss_costs = [sum(table.miss_cost_from(b, k) for k in steps) / len(steps) for b in range(table.n)]
+
+	report = {
+		"hash": table.hash_mode,
+		"resolucion": table.probe_mode,
+		"n": table.n,
+		"claves": len(keys),
+		"factor_carga": len(keys) / table.n,
+		"marcas_borrado": table.tombstones,
+		"reorganizaciones": table.rehashes,
+		"cluster_secundario": _size_summary([c for c in homes.values() if c > 1]),
+		"busqueda_exitosa_promedio": sum(hit_costs) / len(hit_costs) if hit_costs else 0.0,
+		"busqueda_fallida_promedio": sum(miss_costs) / len(miss_costs) if miss_costs else 0.0,
+		"cadena_mas_larga": max(hit_costs) if hit_costs else 0,
+	}
+	if table.open_addressing:
+		report["cluster_primario"] = _size_summary(_primary_clusters(table))
+	return report
+
+
+def compare_configurations(keys: Iterable[int], n: int, d: int, table_cls: Type[HashTable] = HashTable, **kwargs) -> List[dict]:
+	"""
+	Inserta las mismas claves con cada combinación función hash × resolución
+	de `table_cls` y devuelve, por combinación, el reporte estructural y los
+	sondeos de inserción y de búsqueda de todas las claves.
+	"""
+	keys = list(keys)
+	reports = []
+	for hash_mode in table_cls.hash_modes:
+		for probe_mode in table_cls.probe_modes:
+			table = table_cls(n, d, hash_mode, probe_mode, **kwargs)
+			stats = ProbeStats()
+			table.stats = stats
+			inserted = table.insert_many(keys)
+			table.search_many(keys)
+			report = cluster_report(table)
+			report["insertadas"] = inserted
+			report["operaciones"] = stats.summary()
+			reports.append(report)
+	# Primero las que alojaron más claves; a igualdad, la de búsqueda más barata
+	reports.sort(key=lambda r: (-r["insertadas"], r["busqueda_exitosa_promedio"]))
+	return reports
+
+
+def export_json(data, path: str) -> None:
+	with open(path, "w", encoding="utf-8") as f:
+		json.dump(data, f, ensure_ascii=False, indent=2)
@@ -0,0 +1,465 @@
+"""Tabla hash sin interfaz gráfica con los métodos de resolución de HashView."""
+
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from app.core.hash_functions import (
+	get_hash_function,
+	get_transform_function,
+	hash_batch,
+	transform_batch,
+)
+
+
+HASH_MODES = ("modulo", "cuadrado", "plegamiento", "truncamiento")
+PROBE_MODES = ("lineal", "cuadrática", "doble hash", "arreglo anidado", "lista enlazada")
+OPEN_ADDRESSING = ("lineal", "cuadrática", "doble hash")
+
+# Nombres usados por TransformacionClavesView
+TRANSFORM_HASH_MODES = ("modulo", "cuadrado", "plegamiento", "truncamiento", "conversion_bases")
+TRANSFORM_PROBE_MODES = ("lineal", "cuadratica", "doble_hash", "arreglo_anidado", "lista_enlazada")
+PROBE_ALIASES = {
+	"cuadratica": "cuadrática",
+	"doble_hash": "doble hash",
+	"arreglo_anidado": "arreglo anidado",
+	"lista_enlazada": "lista enlazada",
+}
+
+# Marca de dirección borrada: la búsqueda la salta, la inserción la reutiliza
+TOMBSTONE = -1
+
+# Pasos de doble hash que se promedian por dirección en las búsquedas fallidas
+MISS_STEP_SAMPLES = 16
+
+
+class HashTable:
+	"""
+	Tabla hash de n direcciones para claves de d dígitos.
+
+	- Direccionamiento abierto (lineal, cuadrática, doble hash): `table`.
+	- Arreglo anidado: `table` + colisiones en `anidado[i]`.
+	- Lista enlazada: cadenas en `enlazada[i]`.
+
+	Buscar, borrar y comprobar duplicados recorren la secuencia de prueba
+	sobre `table` (o la colisión de la dirección base en los
+	encadenamientos): la tabla no guarda otro índice de las claves.
+
+	En direccionamiento abierto el borrado deja TOMBSTONE para no cortar
+	las secuencias de prueba. Cuando claves + marcas superan `max_load`·n
+	y se han acumulado suficientes marcas, la tabla se reorganiza
+	reinsertando las claves vivas en el orden en que están en la tabla.
+
+	Si `stats` tiene un ProbeStats, cada operación registra sus sondeos.
+	"""
+
+	hash_modes = HASH_MODES
+	probe_modes = PROBE_MODES
+
+	def __init__(self, n: int, d: int, hash_mode: str = "modulo", probe_mode: str = "lineal", max_load: float = 0.75) -> None:
+		self.n = max(1, n)
+		self.d = max(1, d)
+		self.hash_mode = hash_mode
+		probe_mode = PROBE_ALIASES.get(probe_mode, probe_mode)
+		self.probe_mode = probe_mode if probe_mode in PROBE_MODES else "lineal"
+		self.max_load = max_load
+		self.rehashes = 0
+		self.stats = None
+		self.clear()
+
+	@property
+	def hash_mode(self) -> str:
+		return self._hash_mode
+
+	@hash_mode.setter
+	def hash_mode(self, mode: str) -> None:
+		self._hash_mode = mode if mode in HASH_MODES else "modulo"
+		self._hash_fn = get_hash_function(self._hash_mode)
+
+	@property
+	def open_addressing(self) -> bool:
+		return self.probe_mode in OPEN_ADDRESSING
+
+	def clear(self) -> None:
+		n = self.n
+		if self.open_addressing:
+			self.table: List[Optional[int]] = [None] * n
+			self.anidado: List[List[int]] = []
+			self.enlazada: List[List[int]] = []
+		elif self.probe_mode == "arreglo anidado":
+			self.table = [None] * n
+			self.anidado = [[] for _ in range(n)]
+			self.enlazada = []
+		else:  # lista enlazada
+			self.table = []
+			self.anidado = []
+			self.enlazada = [[] for _ in range(n)]
+		self.count = 0
+		self.tombstones = 0
+
+	def load(self, table: List[Optional[int]], anidados: Dict[int, List[int]], listas: Dict[int, List[int]]) -> None:
+		"""Carga el contenido serializado por HashView y reconstruye el índice."""
+		n = self.n
+		self.clear()
+		if self.probe_mode == "lista enlazada":
+			self.enlazada = [list(listas.get(i, [])) for i in range(n)]
+			self.count = sum(len(cadena) for cadena in self.enlazada)
+			return
+
+		self.table = (list(table) + [None] * n)[:n]
+		for v in self.table:
+			if v == TOMBSTONE:
+				self.tombstones += 1
+			elif v is not None:
+				self.count += 1
+		if self.probe_mode == "arreglo anidado":
+			self.anidado = [list(anidados.get(i, [])) for i in range(n)]
+			self.count += sum(len(arr) for arr in self.anidado)
+
+	def __len__(self) -> int:
+		return self.count
+
+	def __contains__(self, k: int) -> bool:
+		return self.locate(k) is not None
+
+	# ------------------------------------------------------------------
+	# Hash y secuencias de prueba
+	# ------------------------------------------------------------------
+
+	def hash(self, k: int) -> int:
+		return self._hash_fn(k, self.n, self.d)
+
+	def _double_hash(self, d: int) -> int:
+		"""Doble hash: H(D) = (D + 1) mod n + 1"""
+		return ((d + 1) % self.n) + 1
+
+	def _hash_many(self, keys: List[int]) -> List[int]:
+		return hash_batch(self.hash_mode, keys, self.n, self.d).tolist()
+
+	def probe_indices(self, k: int) -> Iterator[int]:
+		"""Genera las direcciones de prueba según el método seleccionado."""
+		return self._probe_from(self.hash(k), k)
+
+	def _probe_from(self, base: int, k: int) -> Iterator[int]:
+		n = self.n
+		mode = self.probe_mode
+
+		if mode == "lineal":
+			for t in range(n):
+				yield (base + t) % n
+		elif mode == "cuadrática":
+			for t in range(n):
+				yield (base + t * t) % n
+		elif mode == "doble hash":
+			current = base
+			visited = set()
+			for _ in range(n):
+				if current in visited:
+					break
+				visited.add(current)
+				yield current
+				current = (current + self._double_hash(current)) % n
+		else:
+			yield base
+
+	def trace(self, k: int) -> List[int]:
+		"""Direcciones que visita una búsqueda de k (para animaciones)."""
+		if not self.open_addressing:
+			return [self.hash(k)]
+		path = []
+		for idx in self.probe_indices(k):
+			if self.table[idx] is None:
+				break
+			path.append(idx)
+			if self.table[idx] == k:
+				break
+		return path
+
+	def insert_trace(self, k: int) -> List[int]:
+		"""Direcciones que visita la inserción de k hasta la primera libre o borrada."""
+		if not self.open_addressing:
+			return [self.hash(k)]
+		path = []
+		for idx in self.probe_indices(k):
+			path.append(idx)
+			if self.table[idx] is None or self.table[idx] == TOMBSTONE:
+				break
+		return path
+
+	# ------------------------------------------------------------------
+	# Operaciones
+	# ------------------------------------------------------------------
+
+	def insert(self, k: int) -> Optional[int]:
+		"""Inserta k. Devuelve su dirección, o None si es duplicada o la tabla está llena."""
+		if self.stats is not None:
+			self.stats.record("insert", self.insert_cost(k), self.locate(k) is None)
+		return self._insert_at(k, self.hash(k))
+
+	def _insert_at(self, k: int, base: int) -> Optional[int]:
+		if self.open_addressing:
+			# Un solo recorrido: la clave no está si se llega a una dirección
+			# vacía; se inserta en la primera borrada o vacía del camino
+			table = self.table
+			free = None
+			for idx in self._probe_from(base, k):
+				slot = table[idx]
+				if slot == k:
+					return None
+				if slot == TOMBSTONE:
+					if free is None:
+						free = idx
+				elif slot is None:
+					if free is None:
+						free = idx
+					break
+			if free is None:
+				return None
+			if table[free] == TOMBSTONE:
+				self.tombstones -= 1
+			table[free] = k
+			self.count += 1
+			return free
+
+		if self.probe_mode == "arreglo anidado":
+			if self.table[base] is None:
+				self.table[base] = k
+			elif self.table[base] == k or k in self.anidado[base]:
+				return None
+			else:
+				self.anidado[base].append(k)
+		elif k in self.enlazada[base]:
+			return None
+		else:
+			self.enlazada[base].append(k)
+		self.count += 1
+		return base
+
+	def _find(self, k: int, base: int) -> Optional[int]:
+		"""Dirección de k recorriendo la secuencia de prueba desde base, o None."""
+		if self.open_addressing:
+			table = self.table
+			for idx in self._probe_from(base, k):
+				slot = table[idx]
+				if slot == k:
+					return idx
+				if slot is None:
+					return None
+			return None
+		if self.probe_mode == "arreglo anidado":
+			return base if self.table[base] == k or k in self.anidado[base] else None
+		return base if k in self.enlazada[base] else None
+
+	def search(self, k: int) -> Optional[int]:
+		"""Dirección donde está k, o None."""
+		idx = self.locate(k)
+		if self.stats is not None:
+			self.stats.record("search", self.search_cost(k), idx is not None)
+		return idx
+
+	def locate(self, k: int) -> Optional[int]:
+		"""Como search, pero sin registrar estadísticas."""
+		return self._find(k, self.hash(k))
+
+	def position(self, k: int) -> int:
+		"""Posición de k dentro de las colisiones de su dirección (-1 si está en la tabla principal)."""
+		idx = self.locate(k)
+		if self.probe_mode == "lista enlazada":
+			return self.enlazada[idx].index(k)
+		if self.table[idx] == k:
+			return -1
+		return self.anidado[idx].index(k)
+
+	def delete(self, k: int) -> Optional[int]:
+		"""Elimina k. Devuelve la dirección que ocupaba, o None si no existe."""
+		idx = self.locate(k)
+		if self.stats is not None:
+			self.stats.record("delete", self.search_cost(k), idx is not None)
+		if idx is None:
+			return None
+		self.count -= 1
+
+		if self.open_addressing:
+			self.table[idx] = TOMBSTONE
+			self.tombstones += 1
+			if self._needs_rehash():
+				self.rehash()
+		elif self.probe_mode == "arreglo anidado":
+			if self.table[idx] == k:
+				# El primer anidado sube a la posición principal
+				self.table[idx] = self.anidado[idx].pop(0) if self.anidado[idx] else None
+			else:
+				self.anidado[idx].remove(k)
+		else:
+			self.enlazada[idx].remove(k)
+		return idx
+
+	def _needs_rehash(self) -> bool:
+		# Exigir n/8 marcas acumuladas amortiza el costo O(n) de reorganizar
+		used = self.count + self.tombstones
+		return used > self.max_load * self.n and self.tombstones >= max(1, self.n // 8)
+
+	def rehash(self) -> None:
+		"""Reconstruye la tabla sin marcas de borrado."""
+		old_table, old_count, old_tombstones = self.table, self.count, self.tombstones
+		self.clear()
+		table = self.table
+		for k in old_table:
+			if k is None or k == TOMBSTONE:
+				continue
+			for idx in self.probe_indices(k):
+				if table[idx] is None:
+					table[idx] = k
+					break
+			else:
+				# La secuencia de prueba (p. ej. cuadrática) no alcanzó una
+				# dirección libre: se conserva la tabla anterior
+				self.table, self.count, self.tombstones = old_table, old_count, old_tombstones
+				return
+		self.count = old_count
+		self.rehashes += 1
+
+	def insert_many(self, keys: Iterable[int]) -> int:
+		"""Inserta varias claves; devuelve cuántas se insertaron."""
+		if self.stats is not None:
+			insert = self.insert
+			return sum(1 for k in keys if insert(k) is not None)
+		keys = list(keys)
+		insert_at = self._insert_at
+		inserted = 0
+		for k, base in zip(keys, self._hash_many(keys)):
+			if insert_at(k, base) is not None:
+				inserted += 1
+		return inserted
+
+	def search_many(self, keys: Iterable[int]) -> List[Optional[int]]:
+		"""Direcciones de varias claves (hash en lote, cada una recorre su secuencia de prueba)."""
+		if self.stats is not None:
+			return [self.search(k) for k in keys]
+		keys = list(keys)
+		find = self._find
+		return [find(k, base) for k, base in zip(keys, self._hash_many(keys))]
+
+	def delete_many(self, keys: Iterable[int]) -> int:
+		"""Elimina varias claves; devuelve cuántas se eliminaron."""
+		delete = self.delete
+		return sum(1 for k in keys if delete(k) is not None)
+
+	def is_full(self) -> bool:
+		return self.open_addressing and self.count >= self.n
+
+	def keys(self) -> List[int]:
+		"""Claves almacenadas, en el orden de las direcciones."""
+		if self.probe_mode == "lista enlazada":
+			return [k for cadena in self.enlazada for k in cadena]
+		keys = [k for k in self.table if k is not None and k != TOMBSTONE]
+		for arr in self.anidado:
+			keys.extend(arr)
+		return keys
+
+	# ------------------------------------------------------------------
+	# Costo en sondeos (para estadísticas)
+	# ------------------------------------------------------------------
+
+	def search_cost(self, k: int) -> int:
+		"""
+		Sondeos de una búsqueda de k: direcciones examinadas en
+		direccionamiento abierto (incluida la vacía que la detiene) o
+		claves comparadas en la dirección base para los encadenamientos
+		(al menos 1: el acceso a la dirección).
+		"""
+		if self.open_addressing:
+			table = self.table
+			probes = 0
+			for idx in self.probe_indices(k):
+				probes += 1
+				slot = table[idx]
+				if slot is None or slot == k:
+					break
+			return probes
+
+		base = self.hash(k)
+		if self.probe_mode == "arreglo anidado":
+			if self.table[base] is None:
+				return 1
+			if self.table[base] == k:
+				return 1
+			anidados = self.anidado[base]
+			return anidados.index(k) + 2 if k in anidados else len(anidados) + 1
+
+		cadena = self.enlazada[base]
+		return cadena.index(k) + 1 if k in cadena else max(1, len(cadena))
+
+	def insert_cost(self, k: int) -> int:
+		"""Sondeos de insertar k (hasta la primera dirección libre o borrada)."""
+		if self.open_addressing and self.locate(k) is None:
+			return len(self.insert_trace(k))
+		return self.search_cost(k)
+
+	def miss_cost_from(self, base: int, k: int = 0) -> int:
+		"""Sondeos de una búsqueda fallida de k desde la dirección de origen base (k fija el paso si depende de la clave)."""
+		if self.open_addressing:
+			table = self.table
+			probes = 0
+			for idx in self._probe_from(base, k):
+				probes += 1
+				if table[idx] is None:
+					break
+			return probes
+		if self.probe_mode == "arreglo anidado":
+			return 1 if self.table[base] is None else len(self.anidado[base]) + 1
+		return max(1, len(self.enlazada[base]))
+
+	def miss_step_keys(self) -> Iterable[int]:
+		"""Claves con las que promediar miss_cost_from: aquí el paso no depende de la clave."""
+		return (0,)
+
+
+class TransformTable(HashTable):
+	"""
+	Tabla con las funciones de TransformacionClavesView: dirección
+	(valor conceptual - 1) mod n y doble hash con paso 1 + k mod (n - 1).
+	"""
+
+	hash_modes = TRANSFORM_HASH_MODES
+	probe_modes = TRANSFORM_PROBE_MODES
+
+	def __init__(self, n: int, d: int, hash_mode: str = "modulo", probe_mode: str = "lineal", base: int = 7, max_load: float = 0.75) -> None:
+		self.base = min(16, max(2, base))
+		super().__init__(n, d, hash_mode, probe_mode, max_load)
+
+	@property
+	def hash_mode(self) -> str:
+		return self._hash_mode
+
+	@hash_mode.setter
+	def hash_mode(self, mode: str) -> None:
+		self._hash_mode = mode if mode in TRANSFORM_HASH_MODES else "modulo"
+		self._hash_fn = get_transform_function(self._hash_mode)
+
+	def hash_value(self, k: int) -> int:
+		"""Valor hash conceptual (puede exceder n)."""
+		return self._hash_fn(k, self.n, self.d, self.base)
+
+	def hash(self, k: int) -> int:
+		return (self.hash_value(k) - 1) % self.n
+
+	def _hash_many(self, keys: List[int]) -> List[int]:
+		n = self.n
+		values = transform_batch(self.hash_mode, keys, n, self.d, self.base).tolist()
+		return [(v - 1) % n for v in values]
+
+	def miss_step_keys(self) -> Iterable[int]:
+		if self.probe_mode != "doble hash" or self.n <= 2:
+			return super().miss_step_keys()
+		# El paso 1 + k mod (n - 1) depende de la clave: pasos repartidos en todo el rango
+		return range(0, self.n - 1, max(1, (self.n - 1) // MISS_STEP_SAMPLES))
+
+	def _probe_from(self, base: int, k: int) -> Iterator[int]:
+		if self.probe_mode != "doble hash":
+			yield from super()._probe_from(base, k)
+			return
+		n = self.n
+		step = 1 if n <= 1 else 1 + (k % (n - 1))
+		current = base
+		for _ in range(n):
+			yield current
+			current = (current + step) % n
@@ -0,0 +1,263 @@
+"""
+Barrido de parámetros del modelo de costos de índices (el de IndicesView).
+
+Evalúa todas las combinaciones de rangos de r, B, R, v y p para cada tipo de
+índice y reporta, para cada cantidad de registros, la configuración que
+minimiza los accesos o los bloques de índice totales. Con NumPy instalado el
+modelo se evalúa sobre la grilla completa como arreglos; sin él se usa
+`costos` combinación por combinación (mismo resultado).
+
+Rangos: lista separada por comas cuyos elementos pueden ser un valor,
+`inicio:fin:paso` (aritmético) o `inicio:fin:*factor` (geométrico), p. ej.
+`512:8192:*2` = 512, 1024, 2048, 4096, 8192.
+
+Uso:
+	python -m app.core.index_sweep -r 10000,1000000 -B 512:8192:*2 -R 50:200:50 --csv barrido.csv
+	python -m app.core.index_sweep -r 30000 -B 256:4096:256 -R 100 --criterio bloques_indice --json barrido.json
+"""
+
+import argparse
+import csv
+import itertools
+import math
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from app.core.hash_stats import export_json
+from app.core.isam_index import costos
+
+try:
+	import numpy as np
+except ImportError:  # NumPy es opcional
+	np = None
+
+
+TIPOS = ("primary", "secondary")
+CRITERIOS = ("accesos", "bloques_indice")
+
+COLUMNS = (
+	"r", "B", "R", "v", "p", "tipo", "multinivel",
+	"bfr", "b", "Ri", "bfri", "ri", "bi", "niveles", "accesos", "bloques_indice",
+)
+
+
+def rango(texto: str) -> List[int]:
+	"""Valores enteros de un rango ('1024', '100:500:100', '512:8192:*2' o varios separados por comas)."""
+	valores: List[int] = []
+	for parte in texto.split(","):
+		parte = parte.strip()
+		if not parte:
+			continue
+		campos = parte.split(":")
+		if len(campos) == 1:
+			valores.append(int(parte))
+			continue
+		if len(campos) != 3:
+			raise ValueError(f"rango inválido: {parte}")
+		inicio, fin, paso = int(campos[0]), int(campos[1]), campos[2].strip()
+		if paso.startswith("*"):
+			factor = float(paso[1:])
+			if factor <= 1 or inicio <= 0:
+				raise ValueError(f"rango geométrico inválido: {parte}")
+			x = inicio
+			while x <= fin:
+				valores.append(x)
+				x = int(math.ceil(x * factor))
+		else:
+			if int(paso) <= 0:
+				raise ValueError(f"paso inválido: {parte}")
+			valores.extend(range(inicio, fin + 1, int(paso)))
+	if not valores:
+		raise ValueError("rango vacío")
+	return sorted(set(valores))
+
+
+def barrido(
+	rs: Sequence[int], Bs: Sequence[int], Rs: Sequence[int], vs: Sequence[int], ps: Sequence[int],
+	tipos: Sequence[str] = TIPOS, multinivel: bool = True,
+) -> Dict[str, Any]:
+	"""
+	Grilla por columnas (las de COLUMNS; arreglos de NumPy o listas), con una
+	posición por combinación válida (r, B, R, v, p, tipo). Se descartan las
+	mismas que rechaza `costos` (bfr o bfri = 0, o bfri = 1 en multinivel con
+	más de un bloque).
+
+	Todos los valores deben ser positivos, como en `costos`.
+	"""
+	if not tipos:
+		raise ValueError("no hay tipos de índice para barrer")
+	if min(min(x, default=0) for x in (rs, Bs, Rs, vs, ps)) <= 0:
+		raise ValueError("Todos los valores deben ser positivos.")
+	if np is not None:
+		partes = [_barrido_np(rs, Bs, Rs, vs, ps, tipo, multinivel) for tipo in tipos]
+		return {c: np.concatenate([parte[c] for parte in partes]) for c in COLUMNS}
+	partes = [_barrido_escalar(rs, Bs, Rs, vs, ps, tipo, multinivel) for tipo in tipos]
+	return {c: [x for parte in partes for x in parte[c]] for c in COLUMNS}
+
+
+def _barrido_escalar(rs, Bs, Rs, vs, ps, tipo: str, multinivel: bool) -> Dict[str, List[Any]]:
+	columnas: Dict[str, List[Any]] = {c: [] for c in COLUMNS}
+	for r, B, R, v, p in itertools.product(rs, Bs, Rs, vs, ps):
+		try:
+			c = costos(r, B, R, v, p, tipo, multinivel)
+		except ValueError:
+			continue
+		c.update(r=r, B=B, R=R, v=v, p=p, tipo=tipo, multinivel=multinivel)
+		c["bloques_indice"] = sum(c["multilevel_blocks"]) if multinivel else c["bi"]
+		for col in COLUMNS:
+			columnas[col].append(c[col])
+	return columnas
+
+
+def _barrido_np(rs, Bs, Rs, vs, ps, tipo: str, multinivel: bool) -> Dict[str, Any]:
+	grilla = np.meshgrid(*(np.asarray(x, dtype=np.int64) for x in (rs, Bs, Rs, vs, ps)), indexing="ij")
+	r, B, R, v, p = (g.ravel() for g in grilla)
+	bfr = B // R
+	Ri = v + p
+	bfri = B // Ri
+	# Se divide por al menos 1 y después se descartan las combinaciones sin lugar
+	b = -(-r // np.maximum(bfr, 1))
+	ri = b if tipo == "primary" else r
+	bi = -(-ri // np.maximum(bfri, 1))
+	validas = (r > 0) & (bfr > 0) & (bfri > 0)
+	if multinivel:
+		validas &= (bfri > 1) | (bi <= 1)
+	r, B, R, v, p, bfr, Ri, bfri, b, ri, bi = (a[validas] for a in (r, B, R, v, p, bfr, Ri, bfri, b, ri, bi))
+	if multinivel:
+		# Todos los niveles a la vez: los que ya llegaron a un bloque quedan fijos
+		niveles = np.ones_like(bi)
+		total = bi.copy()
+		actual = bi.copy()
+		activas = actual > 1
+		while activas.any():
+			actual = np.where(activas, -(-actual // bfri), actual)
+			niveles += activas
+			total += np.where(activas, actual, 0)
+			activas = actual > 1
+	else:
+		niveles = np.where(bi > 1, np.ceil(np.log2(np.maximum(bi, 1))).astype(np.int64), 1)
+		total = bi
+	return {
+		"r": r, "B": B, "R": R, "v": v, "p": p,
+		"tipo": np.full(len(r), tipo, dtype=object),
+		"multinivel": np.full(len(r), multinivel),
+		"bfr": bfr, "b": b, "Ri": Ri, "bfri": bfri, "ri": ri, "bi": bi,
+		"niveles": niveles, "accesos": niveles + 1, "bloques_indice": total,
+	}
+
+
+def _lista(columna) -> List[Any]:
+	return columna.tolist() if hasattr(columna, "tolist") else list(columna)
+
+
+def tamano(grilla: Dict[str, Any]) -> int:
+	return len(grilla["r"])
+
+
+def filas(grilla: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+	"""Las combinaciones de la grilla como diccionarios (para exportar)."""
+	columnas = [_lista(grilla[c]) for c in COLUMNS]
+	for valores in zip(*columnas):
+		yield dict(zip(COLUMNS, valores))
+
+
+def _fila(grilla: Dict[str, Any], i: int) -> Dict[str, Any]:
+	fila = {}
+	for c in COLUMNS:
+		x = grilla[c][i]
+		fila[c] = x.item() if hasattr(x, "item") else x
+	return fila
+
+
+def mejores(grilla: Dict[str, Any], criterio: str = "accesos") -> List[Dict[str, Any]]:
+	"""
+	La mejor combinación para cada (r, tipo): mínimo del criterio, luego del
+	otro criterio y, a igualdad, el bloque y el registro más chicos.
+	"""
+	if criterio not in CRITERIOS:
+		raise ValueError(f"criterio desconocido: {criterio}")
+	otro = CRITERIOS[1 - CRITERIOS.index(criterio)]
+	if tamano(grilla) == 0:
+		return []
+	if np is not None:
+		# Orden por (r, tipo, criterio, otro, B, R); lexsort toma la última clave como principal
+		secundario = grilla["tipo"] == "secondary"
+		orden = np.lexsort((grilla["R"], grilla["B"], grilla[otro], grilla[criterio], secundario, grilla["r"]))
+		r, s = grilla["r"][orden], secundario[orden]
+		primeras = np.ones(len(orden), dtype=bool)
+		primeras[1:] = (r[1:] != r[:-1]) | (s[1:] != s[:-1])
+		return [_fila(grilla, i) for i in orden[primeras]]
+	elegidas: Dict[tuple, Dict[str, Any]] = {}
+	for fila in filas(grilla):
+		grupo = (fila["r"], fila["tipo"])
+		actual = elegidas.get(grupo)
+		clave = (fila[criterio], fila[otro], fila["B"], fila["R"])
+		if actual is None or clave < (actual[criterio], actual[otro], actual["B"], actual["R"]):
+			elegidas[grupo] = fila
+	return [elegidas[g] for g in sorted(elegidas)]
+
+
+def write_csv(grilla: Dict[str, Any], path: str) -> None:
+	with open(path, "w", encoding="utf-8", newline="") as f:
+		writer = csv.writer(f)
+		writer.writerow(COLUMNS)
+		writer.writerows(zip(*(_lista(grilla[c]) for c in COLUMNS)))
+
+
+def write_json(grilla: Dict[str, Any], path: str, criterio: str = "accesos") -> None:
+	export_json({"criterio": criterio, "mejores": mejores(grilla, criterio), "filas": list(filas(grilla))}, path)
+
+
+def format_table(filas: Sequence[Dict[str, Any]]) -> str:
+	"""Tabla de texto alineada con las columnas principales."""
+	shown = ("r", "tipo", "B", "R", "v", "p", "bfr", "bfri", "bi", "niveles", "accesos", "bloques_indice")
+	cells = [[str(f[c]) for c in shown] for f in filas]
+	widths = [max([len(c)] + [len(row[i]) for row in cells]) for i, c in enumerate(shown)]
+	lines = ["  ".join(c.ljust(w) for c, w in zip(shown, widths))]
+	lines.append("  ".join("-" * w for w in widths))
+	for row in cells:
+		lines.append("  ".join(v.ljust(w) for v, w in zip(row, widths)))
+	return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+	parser = argparse.ArgumentParser(description="Barrido del modelo de costos de índices sobre rangos de parámetros")
+	parser.add_argument("-r", default="10000,100000,1000000", help="registros (rango)")
+	parser.add_argument("-B", default="512:8192:*2", help="bytes por bloque (rango)")
+	parser.add_argument("-R", default="50:200:50", help="bytes por registro (rango)")
+	parser.add_argument("-v", default="9", help="bytes de la clave (rango)")
+	parser.add_argument("-p", default="6", help="bytes del puntero (rango)")
+	parser.add_argument("--tipos", default=",".join(TIPOS), help="primary,secondary")
+	parser.add_argument("--un-nivel", action="store_true", help="índice de un solo nivel (búsqueda binaria)")
+	parser.add_argument("--criterio", choices=CRITERIOS, default="accesos")
+	parser.add_argument("--csv", help="ruta del CSV con la grilla completa")
+	parser.add_argument("--json", help="ruta del JSON con la grilla y las mejores configuraciones")
+	args = parser.parse_args(argv)
+
+	try:
+		rangos = [rango(x) for x in (args.r, args.B, args.R, args.v, args.p)]
+	except ValueError as e:
+		parser.error(str(e))
+	tipos = [t.strip() for t in args.tipos.split(",") if t.strip() in TIPOS]
+	if not tipos:
+		parser.error(f"--tipos debe incluir {' o '.join(TIPOS)}")
+	try:
+		grilla = barrido(*rangos, tipos=tipos, multinivel=not args.un_nivel)
+	except ValueError as e:
+		parser.error(str(e))
+	total = math.prod(len(x) for x in rangos) * len(tipos)
+	elegidas = mejores(grilla, args.criterio)
+
+	motor = "NumPy" if np is not None else "Python"
+	print(f"{total} combinaciones evaluadas ({motor}), {total - tamano(grilla)} descartadas (bfr o bfri sin espacio)")
+	print(f"Mejor configuración por r y tipo (criterio: {args.criterio}):\n")
+	print(format_table(elegidas))
+	if args.csv:
+		write_csv(grilla, args.csv)
+		print(f"\nGrilla guardada en {args.csv}")
+	if args.json:
+		write_json(grilla, args.json, args.criterio)
+		print(f"Grilla guardada en {args.json}")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,353 @@
+"""
+Índice ISAM ejecutable: archivo de datos e índice (primario o secundario,
+de uno o varios niveles) construidos con los parámetros de IndicesView.
+
+- Archivo de datos: r registros de R bytes en bloques de B bytes, bfr = ⌊B/R⌋
+  registros por bloque (el resto del bloque queda sin usar). Cada registro
+  empieza con la clave de ordenación (v bytes); en el índice secundario le
+  sigue un campo clave no ordenado de otros v bytes. La clave 0 marca una
+  posición libre.
+- Índice: entradas de Ri = v + p bytes (clave y número de bloque), bfri =
+  ⌊B/Ri⌋ por bloque. Primario (no denso): una entrada por bloque de datos con
+  su primera clave. Secundario (denso): una entrada por registro, ordenadas
+  por el campo secundario.
+- Multinivel: cada nivel tiene una entrada por bloque del nivel de abajo,
+  hasta que un nivel ocupa un solo bloque. Buscar lee un bloque por nivel y
+  luego el bloque de datos. Sin multinivel se hace búsqueda binaria sobre los
+  bloques del primer nivel.
+
+Cada bloque se lee del disco con una lectura posicionada de B bytes y se
+cuenta, así los accesos previstos por `costos` se comparan con los medidos.
+
+Uso:
+	python -m app.core.isam_index -r 30000 -B 1024 -R 100 -v 9 -p 6 --multinivel
+	python -m app.core.isam_index -r 30000 -B 1024 -R 100 -v 9 -p 6 --secundario
+"""
+
+import argparse
+import bisect
+import math
+import os
+import random
+import tempfile
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.paged_storage import ContadorIO
+
+
+CONSULTAS = 1000
+
+
+def costos(r: int, B: float, R: float, v: float, p: float, tipo: str = "primary", multinivel: bool = False) -> Dict[str, Any]:
+	"""
+	Fórmulas de IndicesView: bfr, b, Ri, bfri, ri, bi, niveles y accesos
+	previstos (niveles + 1). ValueError si bfr o bfri dan 0.
+	"""
+	if r <= 0 or B <= 0 or R <= 0 or v <= 0 or p <= 0:
+		raise ValueError("Todos los valores deben ser positivos.")
+	bfr = int(B // R)
+	if bfr <= 0:
+		raise ValueError("El factor de bloqueo bfr = B/R es 0.\nAsegúrate de que B sea mayor que R.")
+	b = int(math.ceil(r / bfr))
+	Ri = p + v
+	bfri = int(B // Ri)
+	if bfri <= 0:
+		raise ValueError(
+			"El factor de bloqueo del índice bfri = B/Ri es 0.\n"
+			"Ajusta B, p o v para que al menos quepa una entrada por bloque."
+		)
+	# Primario (no denso): una entrada por bloque; secundario (denso): una por registro
+	ri = b if tipo == "primary" else r
+	bi = int(math.ceil(ri / bfri)) if ri > 0 else 0
+
+	bloques_por_nivel: List[int] = []
+	if bi <= 0:
+		niveles = 0
+	elif multinivel:
+		if bfri < 2 and bi > 1:
+			raise ValueError("Con bfri = 1 el índice multinivel no reduce bloques entre niveles.\nAjusta B, p o v.")
+		# b1 = bi, b2 = ⌈b1/bfri⌉, ... hasta un solo bloque
+		actual = bi
+		while True:
+			bloques_por_nivel.append(actual)
+			if actual <= 1:
+				break
+			actual = math.ceil(actual / bfri)
+		niveles = len(bloques_por_nivel)
+	else:
+		# Búsqueda binaria sobre los bloques del índice: ⌈log2 bi⌉
+		niveles = max(1, int(math.ceil(math.log2(bi)))) if bi > 1 else 1
+	return {
+		"bfr": bfr,
+		"b": b,
+		"Ri": Ri,
+		"bfri": bfri,
+		"ri": ri,
+		"bi": bi,
+		"niveles": niveles,
+		"accesos": niveles + 1 if bi > 0 else 0,
+		"multilevel_blocks": bloques_por_nivel,
+	}
+
+
+class _ArchivoBloques:
+	"""Archivo de bloques de B bytes; cada lectura es de un bloque y se cuenta."""
+
+	def __init__(self, ruta: str, tam_bloque: int, io: ContadorIO) -> None:
+		self.ruta = ruta
+		self.tam_bloque = tam_bloque
+		self.io = io
+		self.bloques = 0
+		self._f = open(ruta, "w+b")
+
+	def agregar(self, datos: bytes) -> int:
+		"""Escribe un bloque al final (completado con ceros) y devuelve su número."""
+		self._f.seek(self.bloques * self.tam_bloque)
+		self._f.write(datos.ljust(self.tam_bloque, b"\0"))
+		self.io.escrituras += 1
+		self.bloques += 1
+		return self.bloques - 1
+
+	def leer(self, i: int) -> bytes:
+		offset = i * self.tam_bloque
+		if hasattr(os, "pread"):
+			datos = os.pread(self._f.fileno(), self.tam_bloque, offset)
+		else:
+			self._f.seek(offset)
+			datos = self._f.read(self.tam_bloque)
+		self.io.lecturas += 1
+		return datos
+
+	def vaciar(self) -> None:
+		self._f.flush()
+
+	def cerrar(self) -> None:
+		if not self._f.closed:
+			self._f.close()
+		try:
+			os.remove(self.ruta)
+		except OSError:
+			pass
+
+
+class IndiceISAM:
+	"""Archivo de datos + índice por niveles sobre archivos temporales, con lecturas de bloque contadas."""
+
+	def __init__(
+		self, r: int, B: int, R: int, v: int, p: int, tipo: str = "primary", multinivel: bool = True,
+		semilla: Optional[int] = None, directorio: Optional[str] = None,
+	) -> None:
+		for nombre, valor in (("B", B), ("R", R), ("v", v), ("p", p)):
+			if int(valor) != valor:
+				raise ValueError(f"{nombre} debe ser un número entero de bytes para construir el índice")
+		self.r, self.B, self.R, self.v, self.p = int(r), int(B), int(R), int(v), int(p)
+		self.tipo = tipo
+		self.multinivel = multinivel
+		self.prevision = costos(self.r, self.B, self.R, self.v, self.p, tipo, multinivel)
+		self.bfr = self.prevision["bfr"]
+		self.bfri = self.prevision["bfri"]
+		if self.R < self.v:
+			raise ValueError("El registro (R) debe tener lugar para la clave (v)")
+		if tipo != "primary" and self.R < 2 * self.v:
+			raise ValueError("El índice secundario necesita R ≥ 2v (clave de ordenación y campo secundario)")
+		if self.prevision["b"] > 256 ** self.p:
+			raise ValueError(f"Un puntero de {self.p} bytes no alcanza para {self.prevision['b']} bloques de datos")
+		# Las claves van de 1 a 256^v - 1 (0 = posición libre)
+		maximo = min(256 ** self.v - 1, max(10 * self.r, 1000))
+		if self.r > maximo:
+			raise ValueError(f"No hay {self.r} claves distintas de {self.v} bytes")
+
+		self.io = ContadorIO()
+		self.ultimas_lecturas = 0
+		self._rng = random.Random(semilla)
+		self._temporales: List[_ArchivoBloques] = []
+		self.datos = self._nuevo_archivo(directorio, ".dat")
+		self.indice = self._nuevo_archivo(directorio, ".idx")
+		# (primer bloque, bloques) de cada nivel en el archivo de índice, del 1 hacia arriba
+		self.niveles: List[Tuple[int, int]] = []
+		self.claves: List[int] = []
+		try:
+			self._construir(maximo)
+		except Exception:
+			self.cerrar()
+			raise
+
+	def __enter__(self) -> "IndiceISAM":
+		return self
+
+	def __exit__(self, *exc) -> None:
+		self.cerrar()
+
+	def cerrar(self) -> None:
+		"""Cierra y borra los archivos temporales."""
+		for archivo in self._temporales:
+			archivo.cerrar()
+		self._temporales.clear()
+
+	def _nuevo_archivo(self, directorio: Optional[str], sufijo: str) -> _ArchivoBloques:
+		fd, ruta = tempfile.mkstemp(suffix=sufijo, dir=directorio)
+		os.close(fd)
+		archivo = _ArchivoBloques(ruta, self.B, self.io)
+		self._temporales.append(archivo)
+		return archivo
+
+	# ------------------------------------------------------------
+	# Construcción
+	# ------------------------------------------------------------
+	def _construir(self, maximo: int) -> None:
+		ordenacion = sorted(self._rng.sample(range(1, maximo + 1), self.r))
+		secundarias = self._rng.sample(range(1, maximo + 1), self.r) if self.tipo != "primary" else []
+		relleno = b"\0" * (self.R - self.v * (2 if secundarias else 1))
+
+		# Archivo de datos, bfr registros por bloque
+		entradas: List[Tuple[int, int]] = []
+		for inicio in range(0, self.r, self.bfr):
+			registros = []
+			for i in range(inicio, min(inicio + self.bfr, self.r)):
+				campo = secundarias[i].to_bytes(self.v, "big") if secundarias else b""
+				registros.append(ordenacion[i].to_bytes(self.v, "big") + campo + relleno)
+			bloque = self.datos.agregar(b"".join(registros))
+			if secundarias:
+				entradas.extend((secundarias[i], bloque) for i in range(inicio, min(inicio + self.bfr, self.r)))
+			else:
+				# Ancla del bloque: su primera clave
+				entradas.append((ordenacion[inicio], bloque))
+		self.datos.vaciar()
+		entradas.sort()
+		self.claves = secundarias if secundarias else ordenacion
+
+		# Niveles del índice: cada uno indexa los bloques del anterior
+		while True:
+			primero = self.indice.bloques
+			anclas: List[Tuple[int, int]] = []
+			for inicio in range(0, len(entradas), self.bfri):
+				grupo = entradas[inicio:inicio + self.bfri]
+				relativo = self.indice.agregar(b"".join(self._entrada(k, ptr) for k, ptr in grupo)) - primero
+				anclas.append((grupo[0][0], relativo))
+			self.niveles.append((primero, len(anclas)))
+			if not self.multinivel or len(anclas) <= 1:
+				break
+			entradas = anclas
+		self.indice.vaciar()
+
+	def _entrada(self, clave: int, puntero: int) -> bytes:
+		return clave.to_bytes(self.v, "big") + puntero.to_bytes(self.p, "big")
+
+	def _entradas(self, bloque: bytes) -> List[Tuple[int, int]]:
+		tam = self.v + self.p
+		entradas = []
+		for i in range(0, self.bfri * tam, tam):
+			clave = int.from_bytes(bloque[i:i + self.v], "big")
+			if clave == 0:
+				break
+			entradas.append((clave, int.from_bytes(bloque[i + self.v:i + tam], "big")))
+		return entradas
+
+	def _leer_indice(self, nivel: int, i: int) -> List[Tuple[int, int]]:
+		self.ultimas_lecturas += 1
+		return self._entradas(self.indice.leer(self.niveles[nivel][0] + i))
+
+	# ------------------------------------------------------------
+	# Búsqueda
+	# ------------------------------------------------------------
+	def buscar(self, clave: int) -> Optional[Tuple[int, int]]:
+		"""(bloque de datos, posición) del registro con esa clave, o None; cuenta las lecturas."""
+		self.ultimas_lecturas = 0
+		if self.multinivel:
+			entradas = self._leer_indice(len(self.niveles) - 1, 0)
+			for nivel in range(len(self.niveles) - 1, 0, -1):
+				j = bisect.bisect_right(entradas, (clave, math.inf)) - 1
+				if j < 0:
+					return None
+				entradas = self._leer_indice(nivel - 1, entradas[j][1])
+		else:
+			entradas = self._binaria_primer_nivel(clave)
+		j = bisect.bisect_right(entradas, (clave, math.inf)) - 1
+		if j < 0 or (self.tipo != "primary" and entradas[j][0] != clave):
+			# En el índice denso la clave tiene que estar en la entrada
+			return None
+		return self._buscar_en_datos(entradas[j][1], clave)
+
+	def _binaria_primer_nivel(self, clave: int) -> List[Tuple[int, int]]:
+		"""Bloque del primer nivel que cubre clave, por búsqueda binaria entre bloques."""
+		izq, der = 0, self.niveles[0][1] - 1
+		candidato: List[Tuple[int, int]] = []
+		while izq <= der:
+			medio = (izq + der) // 2
+			entradas = self._leer_indice(0, medio)
+			if clave < entradas[0][0]:
+				der = medio - 1
+			else:
+				candidato = entradas
+				if clave <= entradas[-1][0]:
+					break
+				izq = medio + 1
+		return candidato
+
+	def _buscar_en_datos(self, bloque: int, clave: int) -> Optional[Tuple[int, int]]:
+		self.ultimas_lecturas += 1
+		datos = self.datos.leer(bloque)
+		inicio = self.v if self.tipo != "primary" else 0
+		for pos in range(self.bfr):
+			campo = int.from_bytes(datos[pos * self.R + inicio:pos * self.R + inicio + self.v], "big")
+			if campo == clave:
+				return bloque, pos
+			if campo == 0:
+				break
+		return None
+
+	def medir(self, consultas: int = CONSULTAS) -> Dict[str, Any]:
+		"""Busca claves presentes al azar y compara las lecturas con los accesos previstos."""
+		lecturas: List[int] = []
+		encontradas = 0
+		for _ in range(max(1, consultas)):
+			if self.buscar(self._rng.choice(self.claves)) is not None:
+				encontradas += 1
+			lecturas.append(self.ultimas_lecturas)
+		return {
+			"consultas": len(lecturas),
+			"encontradas": encontradas,
+			"previstos": self.prevision["accesos"],
+			"media": sum(lecturas) / len(lecturas),
+			"minimo": min(lecturas),
+			"maximo": max(lecturas),
+			"bloques_datos": self.datos.bloques,
+			"bloques_por_nivel": [bloques for _, bloques in self.niveles],
+		}
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+	parser = argparse.ArgumentParser(description="Construye un índice ISAM con los parámetros de la vista de índices y mide sus accesos")
+	parser.add_argument("-r", type=int, default=30000, help="número de registros")
+	parser.add_argument("-B", type=int, default=1024, help="bytes por bloque")
+	parser.add_argument("-R", type=int, default=100, help="bytes por registro")
+	parser.add_argument("-v", type=int, default=9, help="bytes de la clave")
+	parser.add_argument("-p", type=int, default=6, help="bytes del puntero")
+	parser.add_argument("--secundario", action="store_true", help="índice secundario (denso)")
+	parser.add_argument("--multinivel", action="store_true", help="índice multinivel")
+	parser.add_argument("--consultas", type=int, default=CONSULTAS)
+	parser.add_argument("--semilla", type=int, default=None)
+	args = parser.parse_args(argv)
+
+	tipo = "secondary" if args.secundario else "primary"
+	inicio = time.perf_counter()
+	try:
+		indice = IndiceISAM(args.r, args.B, args.R, args.v, args.p, tipo, args.multinivel, args.semilla)
+	except ValueError as e:
+		parser.error(str(e))
+	with indice:
+		construccion = time.perf_counter() - inicio
+		resultado = indice.medir(args.consultas)
+	prevision = indice.prevision
+	print(f"bfr={prevision['bfr']} b={prevision['b']} bfri={prevision['bfri']} ri={prevision['ri']} bi={prevision['bi']}")
+	print(f"Bloques de índice por nivel: {resultado['bloques_por_nivel']} (previstos: {prevision['multilevel_blocks'] or [prevision['bi']]})")
+	print(
+		f"Accesos previstos: {resultado['previstos']}  medidos: media={resultado['media']:.2f} "
+		f"mín={resultado['minimo']} máx={resultado['maximo']} ({resultado['encontradas']}/{resultado['consultas']} encontradas)"
+	)
+	print(f"Construcción: {construccion:.2f} s")
+
+
+if __name__ == "__main__":
+	main()
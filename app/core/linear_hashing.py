@@ -0,0 +1,281 @@
+"""
+Hash lineal (Litwin): la tabla crece de a una cubeta con un puntero de división.
+
+Con N0 cubetas iniciales y nivel i se usan dos funciones:
+	h_i(k)     = k mod (N0 · 2^i)
+	h_{i+1}(k) = k mod (N0 · 2^(i+1))
+Las cubetas anteriores al puntero p ya se dividieron en esta ronda y usan
+h_{i+1}; las demás usan h_i. Cada expansión divide solo la cubeta p y reparte
+sus registros entre p y p + N0 · 2^i, de modo que crecer cuesta O(registros
+de una cubeta) en lugar de reubicar toda la tabla.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from app.core.bucket_storage import EN_OVERFLOW
+
+
+class HashTableLineal:
+	"""
+	Cubetas de tamaño fijo con overflow por cubeta, igual que HashTableTotales,
+	pero con expansiones y reducciones de una cubeta por paso.
+
+	- Expansión: cuando densidad_actual >= densidad_objetivo se divide la cubeta
+	  señalada por el puntero.
+	- Reducción: cuando densidad_actual <= 1 - densidad_objetivo la última
+	  cubeta se fusiona con su cubeta de origen (nunca por debajo de las iniciales).
+	"""
+
+	def __init__(self, num_cubetas: int, tam_cubeta: int, densidad_objetivo: float) -> None:
+		self.num_cubetas_inicial = max(1, num_cubetas)
+		self.num_cubetas = self.num_cubetas_inicial
+		self.tam_cubeta = max(1, tam_cubeta)
+		self.densidad_objetivo = densidad_objetivo
+
+		self.nivel = 0
+		self.puntero = 0
+
+		self.buckets: List[List[Optional[int]]] = [[None] * self.tam_cubeta for _ in range(self.num_cubetas)]
+		self.overflow: List[List[int]] = [[] for _ in range(self.num_cubetas)]
+		self.total_registros = 0
+
+		# Claves en orden de inserción (dict: pertenencia y borrado en O(1))
+		self._orden: Dict[int, None] = {}
+
+		self.divisiones = 0
+		self.fusiones = 0
+		self.registros_movidos = 0
+
+	# ------------------------------------------------------------
+	# Propiedades
+	# ------------------------------------------------------------
+	@property
+	def capacidad_total(self) -> int:
+		return self.num_cubetas * self.tam_cubeta
+
+	@property
+	def densidad_actual(self) -> float:
+		if self.capacidad_total == 0:
+			return 0.0
+		return self.total_registros / self.capacidad_total
+
+	@property
+	def insertion_order(self) -> List[int]:
+		return list(self._orden)
+
+	@property
+	def _ronda(self) -> int:
+		"""Cubetas al inicio de la ronda actual: N0 · 2^nivel."""
+		return self.num_cubetas_inicial << self.nivel
+
+	def __contains__(self, clave: int) -> bool:
+		return clave in self._orden
+
+	def __len__(self) -> int:
+		return self.total_registros
+
+	def direccion(self, clave: int) -> int:
+		"""h_i(clave), o h_{i+1}(clave) si esa cubeta ya se dividió en esta ronda."""
+		idx = clave % self._ronda
+		if idx < self.puntero:
+			idx = clave % (self._ronda * 2)
+		return idx
+
+	def _formula(self, clave: int) -> str:
+		ronda = self._ronda
+		idx = clave % ronda
+		if idx < self.puntero:
+			return f"h{self.nivel + 1}: {clave} % {ronda * 2} = {clave % (ronda * 2)}"
+		return f"h{self.nivel}: {clave} % {ronda} = {idx}"
+
+	# ------------------------------------------------------------
+	# Operaciones básicas
+	# ------------------------------------------------------------
+	def insertar(self, clave: int) -> str:
+		if clave in self._orden:
+			return f"La clave {clave} ya se encuentra almacenada. No se permiten duplicados."
+
+		idx = self.direccion(clave)
+		pos = self._colocar(clave, idx)
+		self._orden[clave] = None
+		self.total_registros += 1
+
+		if pos is None:
+			msg = f"Cubeta {idx} llena, registro {clave} insertado en OVERFLOW de la cubeta {idx} ({self._formula(clave)})."
+		else:
+			msg = f"Registro {clave} insertado en cubeta {idx}, posición {pos} ({self._formula(clave)})."
+
+		if self.densidad_actual >= self.densidad_objetivo:
+			msg += (
+				f" | Densidad actual {self.densidad_actual:.2f} ≥ objetivo "
+				f"{self.densidad_objetivo:.2f}: " + self._dividir()
+			)
+		else:
+			msg += f" | Densidad actual {self.densidad_actual:.2f}, no se requiere expansión."
+		return msg
+
+	def eliminar(self, clave: int) -> str:
+		idx = self.direccion(clave)
+		if clave not in self._orden:
+			return f"Registro {clave} no encontrado en la cubeta {idx}."
+
+		bucket = self.buckets[idx]
+		if clave in bucket:
+			pos = bucket.index(clave)
+			bucket[pos] = None
+			msg = f"Registro {clave} eliminado de la cubeta {idx}, posición {pos}."
+		else:
+			self.overflow[idx].remove(clave)
+			msg = f"Registro {clave} eliminado del overflow de la cubeta {idx}."
+		del self._orden[clave]
+		self.total_registros -= 1
+		msg += f" Densidad actual: {self.densidad_actual:.2f}"
+
+		umbral_baja = 1.0 - self.densidad_objetivo
+		if self.densidad_actual <= umbral_baja and self.num_cubetas > self.num_cubetas_inicial:
+			msg += f" | Densidad actual ≤ {umbral_baja:.2f}: " + self._fusionar()
+		return msg
+
+	def localizar(self, clave: int) -> Optional[Tuple[int, int]]:
+		"""(cubeta, posición o EN_OVERFLOW) de la clave, o None si no está."""
+		if clave not in self._orden:
+			return None
+		idx = self.direccion(clave)
+		if clave in self.buckets[idx]:
+			return idx, self.buckets[idx].index(clave)
+		return idx, EN_OVERFLOW
+
+	def buscar(self, clave: int) -> str:
+		encontrada = self.localizar(clave)
+		if encontrada is None:
+			return f"Registro {clave} no encontrado en la cubeta {self.direccion(clave)}."
+		idx, pos = encontrada
+		if pos != EN_OVERFLOW:
+			return f"Registro {clave} encontrado en la cubeta {idx}, posición {pos} ({self._formula(clave)})."
+		return f"Registro {clave} encontrado en el overflow de la cubeta {idx} ({self._formula(clave)})."
+
+	def expansion_lineal(self) -> str:
+		"""Divide la cubeta del puntero (expansión forzada)."""
+		return self._dividir()
+
+	def reduccion_lineal(self) -> str:
+		"""Fusiona la última cubeta con su cubeta de origen (reducción forzada)."""
+		if self.num_cubetas <= self.num_cubetas_inicial:
+			return "No se puede reducir más, ya se alcanzó el número mínimo de cubetas."
+		return self._fusionar()
+
+	# ------------------------------------------------------------
+	# Serialización para guardar/cargar
+	# ------------------------------------------------------------
+	def to_dict(self) -> dict:
+		return {
+			"tipo": "lineal",
+			"num_cubetas_inicial": self.num_cubetas_inicial,
+			"num_cubetas": self.num_cubetas,
+			"tam_cubeta": self.tam_cubeta,
+			"densidad_objetivo": self.densidad_objetivo,
+			"nivel": self.nivel,
+			"puntero": self.puntero,
+			"buckets": self.buckets,
+			"overflow": self.overflow,
+			"insertion_order": self.insertion_order,
+			"divisiones": self.divisiones,
+			"fusiones": self.fusiones,
+			"registros_movidos": self.registros_movidos,
+		}
+
+	@classmethod
+	def from_dict(cls, data: dict) -> "HashTableLineal":
+		obj = cls(data.get("num_cubetas_inicial", data["num_cubetas"]), data["tam_cubeta"], data["densidad_objetivo"])
+		obj.num_cubetas = data["num_cubetas"]
+		obj.nivel = data.get("nivel", 0)
+		obj.puntero = data.get("puntero", 0)
+		obj.buckets = data["buckets"]
+		obj.overflow = data["overflow"]
+		obj.divisiones = data.get("divisiones", 0)
+		obj.fusiones = data.get("fusiones", 0)
+		obj.registros_movidos = data.get("registros_movidos", 0)
+
+		orden = data.get("insertion_order")
+		if orden is None:
+			orden = [v for b in range(obj.num_cubetas) for v in obj.buckets[b] + obj.overflow[b] if v is not None]
+		obj._orden = dict.fromkeys(orden)
+		obj.total_registros = len(obj._orden)
+		return obj
+
+	# ------------------------------------------------------------
+	# Internos
+	# ------------------------------------------------------------
+	def _colocar(self, clave: int, idx: int) -> Optional[int]:
+		"""Ubica la clave en la cubeta idx; devuelve la posición o None si fue a overflow."""
+		bucket = self.buckets[idx]
+		for i in range(self.tam_cubeta):
+			if bucket[i] is None:
+				bucket[i] = clave
+				return i
+		self.overflow[idx].append(clave)
+		return None
+
+	def _vaciar(self, idx: int) -> List[int]:
+		"""Quita y devuelve los registros de la cubeta idx (área principal y overflow)."""
+		registros = [v for v in self.buckets[idx] if v is not None] + self.overflow[idx]
+		self.buckets[idx] = [None] * self.tam_cubeta
+		self.overflow[idx] = []
+		return registros
+
+	def _dividir(self) -> str:
+		"""Divide la cubeta p: sus registros se reparten con h_{i+1} entre p y p + N0·2^i."""
+		ronda = self._ronda
+		origen = self.puntero
+		destino = origen + ronda
+		registros = self._vaciar(origen)
+
+		self.buckets.append([None] * self.tam_cubeta)
+		self.overflow.append([])
+		self.num_cubetas += 1
+
+		movidos = 0
+		for v in registros:
+			if v % (ronda * 2) == destino:
+				self._colocar(v, destino)
+				movidos += 1
+			else:
+				self._colocar(v, origen)
+
+		self.puntero += 1
+		if self.puntero == ronda:
+			self.nivel += 1
+			self.puntero = 0
+
+		self.divisiones += 1
+		self.registros_movidos += movidos
+		return (
+			f"se divide la cubeta {origen} en {origen} y {destino} "
+			f"(k % {ronda * 2}), {movidos} registro(s) movido(s). "
+			f"Nivel {self.nivel}, puntero {self.puntero}."
+		)
+
+	def _fusionar(self) -> str:
+		"""Deshace la última división: la última cubeta vuelve a su cubeta de origen."""
+		if self.puntero == 0:
+			self.nivel -= 1
+			self.puntero = self._ronda
+		self.puntero -= 1
+
+		origen = self.puntero
+		ultima = self.num_cubetas - 1
+		movidos = self._vaciar(ultima)
+		registros = self._vaciar(origen) + movidos
+		self.buckets.pop()
+		self.overflow.pop()
+		self.num_cubetas -= 1
+
+		for v in registros:
+			self._colocar(v, origen)
+		self.fusiones += 1
+		self.registros_movidos += len(movidos)
+		return (
+			f"se fusiona la cubeta {ultima} con la {origen}, {len(movidos)} registro(s) movido(s). "
+			f"Nivel {self.nivel}, puntero {self.puntero}."
+		)
+
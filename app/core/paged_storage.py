@@ -0,0 +1,392 @@
+"""
+Cubetas en un archivo de páginas de tamaño fijo, leídas a través de un buffer pool.
+
+- Página = 8 bytes de enlace (siguiente página de overflow o -1) + tam_cubeta
+  claves int64, con VACIO en las posiciones libres, + tam_cubeta rangos
+  (número de inserción de cada clave, para reubicar en orden).
+- La cubeta b es la página b; su overflow es una cadena de páginas ubicadas
+  después de las primarias (las que se liberan se reutilizan).
+- BufferPool mantiene en memoria las páginas usadas más recientemente (LRU),
+  escribe de vuelta solo las modificadas y cuenta lecturas y escrituras
+  reales de página. Lo que se lee solo para dibujar (`buckets` / `overflow`)
+  no pasa por el conteo.
+
+PagedBucketStorage tiene la misma interfaz que BucketStorage salvo
+`reconstruir` y `reubicar`: en disco la tabla reubica cubeta por cubeta con
+IncrementalStorage, sin juntar todas las claves en memoria. Un archivo ya
+escrito se reabre con su `estado` sin leer ninguna página.
+"""
+
+import os
+from array import array
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from app.core.bucket_storage import EN_OVERFLOW, VACIO, _Filas
+
+
+_FIN = -1
+
+PAGINAS_EN_MEMORIA = 64
+
+
+class ContadorIO:
+	"""Lecturas/escrituras de página y aciertos del buffer (compartido entre archivos de una tabla)."""
+
+	def __init__(self) -> None:
+		self.lecturas = 0
+		self.escrituras = 0
+		self.aciertos = 0
+
+	def copia(self) -> "ContadorIO":
+		c = ContadorIO()
+		c.lecturas, c.escrituras, c.aciertos = self.lecturas, self.escrituras, self.aciertos
+		return c
+
+
+class BufferPool:
+	"""Páginas de un archivo en memoria con reemplazo LRU y escritura diferida."""
+
+	def __init__(self, ruta: str, tam_pagina: int, capacidad: int = PAGINAS_EN_MEMORIA, io: Optional[ContadorIO] = None) -> None:
+		self.ruta = ruta
+		self.tam_pagina = tam_pagina
+		self.capacidad = max(1, capacidad)
+		self.io = io if io is not None else ContadorIO()
+		# Un archivo existente se abre sin truncar: sus páginas se leen al usarlas
+		self._f = open(ruta, "r+b" if os.path.exists(ruta) else "w+b")
+		self._paginas: "OrderedDict[int, array]" = OrderedDict()
+		self._sucias: Set[int] = set()
+
+	def leer(self, n: int) -> array:
+		pagina = self._paginas.get(n)
+		if pagina is not None:
+			self._paginas.move_to_end(n)
+			self.io.aciertos += 1
+			return pagina
+		self._f.seek(n * self.tam_pagina)
+		pagina = array("q")
+		pagina.frombytes(self._f.read(self.tam_pagina))
+		self.io.lecturas += 1
+		self._paginas[n] = pagina
+		self._desalojar()
+		return pagina
+
+	def ver(self, n: int) -> array:
+		"""Página n sin contar E/S ni cambiar el orden LRU (para dibujar)."""
+		pagina = self._paginas.get(n)
+		if pagina is not None:
+			return pagina
+		self._f.seek(n * self.tam_pagina)
+		pagina = array("q")
+		pagina.frombytes(self._f.read(self.tam_pagina))
+		return pagina
+
+	def escribir(self, n: int, pagina: array) -> None:
+		"""Reemplaza la página n completa (no hace falta leerla antes)."""
+		self._paginas[n] = pagina
+		self._paginas.move_to_end(n)
+		self._sucias.add(n)
+		self._desalojar()
+
+	def marcar(self, n: int) -> None:
+		"""La página n (ya leída) fue modificada en memoria."""
+		self._sucias.add(n)
+
+	def _escribir_disco(self, n: int, pagina: array) -> None:
+		self._f.seek(n * self.tam_pagina)
+		self._f.write(pagina.tobytes())
+		self.io.escrituras += 1
+		self._sucias.discard(n)
+
+	def _desalojar(self) -> None:
+		while len(self._paginas) > self.capacidad:
+			n, pagina = self._paginas.popitem(last=False)
+			if n in self._sucias:
+				self._escribir_disco(n, pagina)
+
+	def vaciar(self) -> None:
+		"""Escribe en disco todas las páginas modificadas."""
+		for n in sorted(self._sucias):
+			self._escribir_disco(n, self._paginas[n])
+		self._f.flush()
+
+	def reiniciar(self) -> None:
+		"""Descarta el contenido (memoria y archivo)."""
+		self._paginas.clear()
+		self._sucias.clear()
+		self._f.seek(0)
+		self._f.truncate()
+
+	@property
+	def paginas_en_disco(self) -> int:
+		self._f.seek(0, os.SEEK_END)
+		return self._f.tell() // self.tam_pagina
+
+	@property
+	def abierto(self) -> bool:
+		return not self._f.closed
+
+	def cerrar(self) -> None:
+		if not self._f.closed:
+			self._f.close()
+
+
+class PagedBucketStorage:
+	"""
+	Misma interfaz que BucketStorage (salvo `reconstruir` y `reubicar`), con
+	las cubetas en un archivo paginado. Sin `estado` el archivo empieza vacío;
+	con el `estado()` de un almacén ya sincronizado se reabre tal como quedó.
+	"""
+
+	def __init__(
+		self,
+		ruta: str,
+		num_cubetas: int,
+		tam_cubeta: int,
+		paginas_en_memoria: int = PAGINAS_EN_MEMORIA,
+		io: Optional[ContadorIO] = None,
+		estado: Optional[Dict] = None,
+	) -> None:
+		self.ruta = ruta
+		self.tam_cubeta = tam_cubeta
+		self.paginas_en_memoria = paginas_en_memoria
+		self.pool = BufferPool(ruta, 8 * (1 + 2 * tam_cubeta), paginas_en_memoria, io)
+		if estado is None:
+			self._vaciar(num_cubetas)
+			return
+		if self.pool.paginas_en_disco < estado["proxima"]:
+			self.pool.cerrar()
+			raise ValueError(f"El archivo de páginas {ruta} no corresponde a la tabla guardada")
+		self.num_cubetas = num_cubetas
+		self._proxima = estado["proxima"]
+		self._libres = list(estado["libres"])
+		self.en_overflow = estado["en_overflow"]
+
+	def estado(self) -> Dict:
+		"""Lo que, además de las páginas, hace falta para reabrir el archivo (llamar tras `sincronizar`)."""
+		return {"proxima": self._proxima, "libres": list(self._libres), "en_overflow": self.en_overflow}
+
+	@property
+	def io(self) -> ContadorIO:
+		return self.pool.io
+
+	def _pagina_vacia(self) -> array:
+		t = self.tam_cubeta
+		return array("q", [_FIN]) + array("q", [VACIO]) * t + array("q", [0]) * t
+
+	def _pagina(self, pares: Sequence[Tuple[int, int]], enlace: int) -> array:
+		t = self.tam_cubeta
+		pagina = self._pagina_vacia()
+		pagina[0] = enlace
+		for i, (rango, clave) in enumerate(pares):
+			pagina[1 + i] = clave
+			pagina[1 + t + i] = rango
+		return pagina
+
+	def _pares_pagina(self, pagina: array) -> List[Tuple[int, int]]:
+		t = self.tam_cubeta
+		return [(pagina[1 + t + i], pagina[1 + i]) for i in range(t) if pagina[1 + i] != VACIO]
+
+	def _vaciar(self, num_cubetas: int) -> None:
+		self.pool.reiniciar()
+		self.num_cubetas = num_cubetas
+		self._proxima = num_cubetas
+		self._libres: List[int] = []
+		self.en_overflow = 0
+		for b in range(num_cubetas):
+			self.pool.escribir(b, self._pagina_vacia())
+
+	def _nueva_pagina(self) -> int:
+		if self._libres:
+			return self._libres.pop()
+		n = self._proxima
+		self._proxima += 1
+		return n
+
+	def _cadena(self, b: int, leer: Optional[Callable[[int], array]] = None) -> List[int]:
+		"""Números de las páginas de overflow de la cubeta b, en orden."""
+		leer = leer or self.pool.leer
+		paginas = []
+		n = leer(b)[0]
+		while n != _FIN:
+			paginas.append(n)
+			n = leer(n)[0]
+		return paginas
+
+	def _pares_desborde(self, b: int) -> List[Tuple[int, int]]:
+		pares = []
+		for n in self._cadena(b):
+			pares.extend(self._pares_pagina(self.pool.leer(n)))
+		return pares
+
+	# ------------------------------------------------------------
+	# Lectura
+	# ------------------------------------------------------------
+	def cubeta(self, b: int, leer: Optional[Callable[[int], array]] = None) -> List[Optional[int]]:
+		leer = leer or self.pool.leer
+		return [None if v == VACIO else v for v in leer(b)[1:self.tam_cubeta + 1]]
+
+	def desborde(self, b: int, leer: Optional[Callable[[int], array]] = None) -> List[int]:
+		leer = leer or self.pool.leer
+		claves = []
+		for n in self._cadena(b, leer):
+			claves.extend(v for v in leer(n)[1:self.tam_cubeta + 1] if v != VACIO)
+		return claves
+
+	def claves(self, b: int) -> List[int]:
+		return [clave for _, clave in self.pares(b)]
+
+	def pares(self, b: int) -> List[Tuple[int, int]]:
+		return self._pares_pagina(self.pool.leer(b)) + self._pares_desborde(b)
+
+	def posicion(self, clave: int, b: int) -> Optional[int]:
+		t = self.tam_cubeta
+		pagina = self.pool.leer(b)
+		for i in range(1, t + 1):
+			if pagina[i] == clave:
+				return i - 1
+		for n in self._cadena(b):
+			if clave in self.pool.leer(n)[1:t + 1]:
+				return EN_OVERFLOW
+		return None
+
+	@property
+	def buckets(self) -> _Filas:
+		"""Para dibujar: lee las páginas sin contarlas como E/S."""
+		return _Filas(lambda b: self.cubeta(b, self.pool.ver), self.num_cubetas)
+
+	@property
+	def overflow(self) -> _Filas:
+		"""Para dibujar: lee las páginas sin contarlas como E/S."""
+		return _Filas(lambda b: self.desborde(b, self.pool.ver), self.num_cubetas)
+
+	# ------------------------------------------------------------
+	# Escritura
+	# ------------------------------------------------------------
+	def colocar(self, clave: int, b: int, rango: int = 0) -> Optional[int]:
+		t = self.tam_cubeta
+		pagina = self.pool.leer(b)
+		for i in range(1, t + 1):
+			if pagina[i] == VACIO:
+				pagina[i] = clave
+				pagina[i + t] = rango
+				self.pool.marcar(b)
+				return i - 1
+
+		# Overflow: las páginas de la cadena están compactas, se agrega al final
+		cadena = self._cadena(b)
+		if cadena:
+			ultima = self.pool.leer(cadena[-1])
+			for i in range(1, t + 1):
+				if ultima[i] == VACIO:
+					ultima[i] = clave
+					ultima[i + t] = rango
+					self.pool.marcar(cadena[-1])
+					self.en_overflow += 1
+					return None
+		n = self._nueva_pagina()
+		self.pool.escribir(n, self._pagina([(rango, clave)], _FIN))
+		anterior = cadena[-1] if cadena else b
+		self.pool.leer(anterior)[0] = n
+		self.pool.marcar(anterior)
+		self.en_overflow += 1
+		return None
+
+	def extraer(self, clave: int, b: int) -> Optional[Tuple[int, int]]:
+		"""Como BucketStorage.extraer: deja libre la posición del área principal."""
+		t = self.tam_cubeta
+		pagina = self.pool.leer(b)
+		for i in range(1, t + 1):
+			if pagina[i] == clave:
+				pagina[i] = VACIO
+				self.pool.marcar(b)
+				return i - 1, pagina[i + t]
+
+		desborde = self._pares_desborde(b)
+		for k, (rango, v) in enumerate(desborde):
+			if v == clave:
+				self._escribir_cadena(b, desborde[:k] + desborde[k + 1:])
+				return EN_OVERFLOW, rango
+		return None
+
+	def quitar(self, clave: int, b: int) -> Optional[int]:
+		hallada = self.extraer(clave, b)
+		return None if hallada is None else hallada[0]
+
+	def _escribir_cadena(self, b: int, pares: Sequence[Tuple[int, int]]) -> None:
+		"""Reescribe compacto el overflow de b, reutilizando y liberando páginas."""
+		t = self.tam_cubeta
+		paginas = self._cadena(b)
+		self.en_overflow -= sum(1 for n in paginas for v in self.pool.leer(n)[1:t + 1] if v != VACIO)
+		necesarias = -(-len(pares) // t)
+		while len(paginas) > necesarias:
+			self._libres.append(paginas.pop())
+		while len(paginas) < necesarias:
+			paginas.append(self._nueva_pagina())
+
+		for k, n in enumerate(paginas):
+			siguiente = paginas[k + 1] if k + 1 < len(paginas) else _FIN
+			self.pool.escribir(n, self._pagina(pares[k * t:(k + 1) * t], siguiente))
+		self.pool.leer(b)[0] = paginas[0] if paginas else _FIN
+		self.pool.marcar(b)
+		self.en_overflow += len(pares)
+
+	def reescribir(
+		self,
+		b: int,
+		principal: Sequence[Optional[Tuple[int, int]]],
+		desborde: Sequence[Tuple[int, int]],
+	) -> None:
+		t = self.tam_cubeta
+		pagina = self._pagina_vacia()
+		pagina[0] = self.pool.leer(b)[0]
+		for i, par in enumerate(principal[:t]):
+			if par is not None:
+				pagina[1 + t + i], pagina[1 + i] = par
+		self.pool.escribir(b, pagina)
+		self._escribir_cadena(b, desborde)
+
+	def cargar(self, buckets: Sequence, overflow: Sequence, rangos: Dict[int, int]) -> int:
+		self._vaciar(len(buckets))
+		t = self.tam_cubeta
+		total = 0
+		for b, fila in enumerate(buckets):
+			pagina = self._pagina_vacia()
+			for i, v in enumerate(fila[:t]):
+				if v is not None:
+					pagina[1 + i] = v
+					pagina[1 + t + i] = rangos.get(v, 0)
+					total += 1
+			self.pool.escribir(b, pagina)
+			if overflow[b]:
+				self._escribir_cadena(b, [(rangos.get(v, 0), v) for v in overflow[b]])
+				total += len(overflow[b])
+		return total
+
+	# ------------------------------------------------------------
+	# Archivo
+	# ------------------------------------------------------------
+	def nuevo_almacen(self, num_cubetas: int) -> "PagedBucketStorage":
+		"""Archivo hermano (para una migración incremental), con los mismos contadores."""
+		if self.ruta.endswith(".nuevo"):
+			ruta = self.ruta[: -len(".nuevo")]
+		else:
+			ruta = self.ruta + ".nuevo"
+		return PagedBucketStorage(ruta, num_cubetas, self.tam_cubeta, self.paginas_en_memoria, self.io)
+
+	def sincronizar(self) -> None:
+		self.pool.vaciar()
+
+	def descartar(self) -> None:
+		"""Cierra y borra el archivo (almacén reemplazado tras una migración)."""
+		self.pool.cerrar()
+		try:
+			os.remove(self.ruta)
+		except OSError:
+			pass
+
+	def cerrar(self) -> None:
+		"""Escribe las páginas modificadas y cierra el archivo (la tabla ya no se usa)."""
+		if self.pool.abierto:
+			self.pool.vaciar()
+			self.pool.cerrar()
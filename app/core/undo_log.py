@@ -0,0 +1,99 @@
+"""
+Deshacer/rehacer por registro de operaciones (compartido por las vistas).
+
+- Cada operación se registra con su inversa (insertar ↔ eliminar,
+  dividir ↔ fusionar): se guardan solo los datos para repetirla o revertirla
+  (clave, bloque, posición...), así registrar es O(1) y no depende del tamaño
+  de la estructura.
+- Las operaciones que reemplazan la estructura completa (generar, reorganizar,
+  reiniciar, cargar) son puntos de control: se guarda la estructura anterior
+  por referencia, que al deshacer se intercambia con la actual.
+- No hay límite de operaciones; el presupuesto de memoria (en unidades, en
+  general registros) descarta las más antiguas cuando se excede.
+"""
+
+from collections import deque
+from typing import Any, Callable, Deque, List, NamedTuple, Optional
+
+
+PRESUPUESTO = 1_000_000
+
+
+class Operacion(NamedTuple):
+	deshacer: Callable[[], None]
+	rehacer: Callable[[], None]
+	descripcion: str
+	costo: int
+
+
+class UndoLog:
+	"""Pilas de deshacer/rehacer con presupuesto de memoria."""
+
+	def __init__(self, presupuesto: int = PRESUPUESTO) -> None:
+		self.presupuesto = max(1, presupuesto)
+		self.costo = 0
+		self.descartadas = 0
+		# Cambia con cada operación registrada, deshecha o rehecha
+		self.version = 0
+		self._deshacer: Deque[Operacion] = deque()
+		self._rehacer: List[Operacion] = []
+
+	def __len__(self) -> int:
+		return len(self._deshacer)
+
+	@property
+	def pendientes_rehacer(self) -> int:
+		return len(self._rehacer)
+
+	def registrar(self, deshacer: Callable[[], None], rehacer: Callable[[], None], descripcion: str, costo: int = 1) -> None:
+		"""Agrega una operación ya aplicada; una operación nueva invalida lo que había para rehacer."""
+		for op in self._rehacer:
+			self.costo -= op.costo
+		self._rehacer.clear()
+		self._deshacer.append(Operacion(deshacer, rehacer, descripcion, max(1, costo)))
+		self.costo += max(1, costo)
+		self.version += 1
+		# Se conserva siempre la última, aunque sola exceda el presupuesto
+		while self.costo > self.presupuesto and len(self._deshacer) > 1:
+			self.costo -= self._deshacer.popleft().costo
+			self.descartadas += 1
+
+	def checkpoint(self, anterior: Any, capturar: Callable[[], Any], restaurar: Callable[[Any], None], descripcion: str, costo: int = 1) -> None:
+		"""
+		Registra una operación que reemplazó la estructura. `anterior` es lo que
+		devolvía `capturar()` antes de aplicarla; deshacer y rehacer intercambian
+		ese estado con el actual.
+		"""
+		celda = [anterior]
+
+		def intercambiar() -> None:
+			actual = capturar()
+			restaurar(celda[0])
+			celda[0] = actual
+
+		self.registrar(intercambiar, intercambiar, descripcion, costo)
+
+	def deshacer(self) -> Optional[str]:
+		"""Revierte la última operación y devuelve su descripción (None si no hay)."""
+		if not self._deshacer:
+			return None
+		op = self._deshacer.pop()
+		op.deshacer()
+		self._rehacer.append(op)
+		self.version += 1
+		return op.descripcion
+
+	def rehacer(self) -> Optional[str]:
+		"""Vuelve a aplicar la última operación deshecha (None si no hay)."""
+		if not self._rehacer:
+			return None
+		op = self._rehacer.pop()
+		op.rehacer()
+		self._deshacer.append(op)
+		self.version += 1
+		return op.descripcion
+
+	def limpiar(self) -> None:
+		self._deshacer.clear()
+		self._rehacer.clear()
+		self.costo = 0
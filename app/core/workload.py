@@ -0,0 +1,398 @@
+"""
+Trazas de operaciones: se graban desde la interfaz y se reproducen sin
+interfaz, a máxima velocidad, sobre cualquier estructura.
+
+Formato: texto, una operación por línea separada por comas
+	insertar,1234,0.000
+	buscar,1234,1.250
+	eliminar,77
+El tercer campo (opcional) es el instante en segundos desde que empezó la
+grabación. Se ignoran las líneas vacías y las que empiezan con '#'.
+
+Uso:
+	python -m app.core.workload traza.csv -n 1000 -d 4
+	python -m app.core.workload traza.csv --motores hash,bloques,totales --csv resultados.csv
+"""
+
+import argparse
+import csv
+import time
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+from app.core.block_search import FACTOR_LLENADO, BlockTable
+from app.core.bucket_hashing import BucketHashTable, HashTableParciales, HashTableTotales
+from app.core.extendible_hashing import HashTableExtendible
+from app.core.hash_stats import ProbeStats, export_json
+from app.core.hash_table import HashTable, TransformTable
+from app.core.linear_hashing import HashTableLineal
+
+
+OPERACIONES = ("insertar", "buscar", "eliminar")
+
+COLUMNS = (
+	"motor", "operaciones", "segundos", "ops_s",
+	"lat_p50_us", "lat_p95_us", "lat_p99_us", "lat_max_us",
+	"insertar", "insertar_ok", "buscar", "buscar_ok", "eliminar", "eliminar_ok",
+	"contadores",
+)
+
+
+class Evento(NamedTuple):
+	op: str
+	clave: int
+	t: Optional[float] = None
+
+
+# ------------------------------------------------------------------
+# Archivo de traza
+# ------------------------------------------------------------------
+
+def leer_traza(path: str) -> List[Evento]:
+	eventos = []
+	with open(path, "r", encoding="utf-8", newline="") as f:
+		for num, fila in enumerate(csv.reader(f), 1):
+			if not fila or not fila[0].strip() or fila[0].lstrip().startswith("#"):
+				continue
+			op = fila[0].strip().lower()
+			if op not in OPERACIONES or len(fila) < 2:
+				raise ValueError(f"Línea {num}: se esperaba 'operación,clave[,t]'")
+			t = float(fila[2]) if len(fila) > 2 and fila[2].strip() else None
+			eventos.append(Evento(op, int(fila[1]), t))
+	return eventos
+
+
+def escribir_traza(eventos: Iterable[Evento], path: str) -> None:
+	with open(path, "w", encoding="utf-8", newline="") as f:
+		f.write("# operacion,clave,t\n")
+		writer = csv.writer(f)
+		for e in eventos:
+			writer.writerow([e.op, e.clave] if e.t is None else [e.op, e.clave, f"{e.t:.6f}"])
+
+
+class TraceRecorder:
+	"""Graba las operaciones hechas desde las vistas (una por clave validada)."""
+
+	def __init__(self) -> None:
+		self.eventos: List[Evento] = []
+		self.grabando = False
+		self._inicio = 0.0
+
+	def iniciar(self) -> None:
+		self.eventos = []
+		self.grabando = True
+		self._inicio = time.perf_counter()
+
+	def detener(self) -> None:
+		self.grabando = False
+
+	def registrar(self, op: str, clave) -> None:
+		if self.grabando:
+			self.eventos.append(Evento(op, int(clave), time.perf_counter() - self._inicio))
+
+	def guardar(self, path: str) -> None:
+		escribir_traza(self.eventos, path)
+
+
+# ------------------------------------------------------------------
+# Motores: misma interfaz para todas las estructuras
+# ------------------------------------------------------------------
+
+class _Lineal:
+	"""Arreglo ordenado con búsqueda secuencial (BusquedaLinealView)."""
+
+	def __init__(self, n: int, d: int, **_) -> None:
+		self.n = n
+		self.datos: List[int] = []
+		self.comparaciones = 0
+
+	def _indice(self, k: int) -> int:
+		for i, v in enumerate(self.datos):
+			self.comparaciones += 1
+			if v == k:
+				return i
+		return -1
+
+	def insertar(self, k: int) -> bool:
+		if len(self.datos) >= self.n or self._indice(k) >= 0:
+			return False
+		self.datos.append(k)
+		self.datos.sort()
+		return True
+
+	def buscar(self, k: int) -> bool:
+		return self._indice(k) >= 0
+
+	def eliminar(self, k: int) -> bool:
+		i = self._indice(k)
+		if i < 0:
+			return False
+		del self.datos[i]
+		return True
+
+	def contadores(self) -> dict:
+		return {"registros": len(self.datos), "comparaciones": self.comparaciones}
+
+
+class _Binaria(_Lineal):
+	"""Arreglo ordenado con búsqueda binaria (BusquedaBinariaView)."""
+
+	def _limite(self, k: int) -> int:
+		lo, hi = 0, len(self.datos)
+		while lo < hi:
+			mid = (lo + hi) // 2
+			self.comparaciones += 1
+			if self.datos[mid] < k:
+				lo = mid + 1
+			else:
+				hi = mid
+		return lo
+
+	def _indice(self, k: int) -> int:
+		i = self._limite(k)
+		return i if i < len(self.datos) and self.datos[i] == k else -1
+
+	def insertar(self, k: int) -> bool:
+		if len(self.datos) >= self.n:
+			return False
+		i = self._limite(k)
+		if i < len(self.datos) and self.datos[i] == k:
+			return False
+		self.datos.insert(i, k)
+		return True
+
+
+class _Hash:
+	"""HashTable / TransformTable con sondeos registrados."""
+
+	def __init__(self, n: int, d: int, hash_mode: str = "modulo", probe_mode: str = "lineal", familia=HashTable, **_) -> None:
+		self.tabla = familia(n, d, hash_mode, probe_mode)
+		self.tabla.stats = ProbeStats()
+
+	def insertar(self, k: int) -> bool:
+		return self.tabla.insert(k) is not None
+
+	def buscar(self, k: int) -> bool:
+		return self.tabla.search(k) is not None
+
+	def eliminar(self, k: int) -> bool:
+		return self.tabla.delete(k) is not None
+
+	def contadores(self) -> dict:
+		resumen = self.tabla.stats.summary()
+		return {
+			"registros": len(self.tabla),
+			"sondeos_insertar_prom": round(resumen["insert"]["sondeos_promedio"], 4),
+			"sondeos_buscar_prom": round(resumen["search"]["sondeos_promedio"], 4),
+			"sondeos_eliminar_prom": round(resumen["delete"]["sondeos_promedio"], 4),
+			"sondeos_max": max(resumen[op]["sondeos_max"] for op in resumen),
+			"reorganizaciones": self.tabla.rehashes,
+		}
+
+
+class _Bloques:
+	"""BlockTable (bloques con búsqueda secuencial o binaria)."""
+
+	def __init__(self, n: int, d: int, binaria: bool = False, factor_llenado: Optional[float] = None, **_) -> None:
+		self.tabla = BlockTable(n, binaria, factor_llenado)
+
+	def insertar(self, k: int) -> bool:
+		return self.tabla.insertar(k) is not None
+
+	def buscar(self, k: int) -> bool:
+		return self.tabla.buscar(k) is not None
+
+	def eliminar(self, k: int) -> bool:
+		return self.tabla.eliminar(k)
+
+	def contadores(self) -> dict:
+		t = self.tabla
+		return {
+			"registros": len(t),
+			"bloques": len(t.blocks),
+			"bloques_leidos": t.bloques_leidos,
+			"comparaciones": t.comparaciones,
+			"registros_desplazados": t.registros_desplazados,
+		}
+
+
+class _Dinamica:
+	"""Tablas de cubetas (totales, parciales, lineal de Litwin, extensible)."""
+
+	def __init__(self, n: int, d: int, familia=None, cubetas: int = 4, tam_cubeta: int = 4, densidad: float = 0.75, paginas: Optional[str] = None, **_) -> None:
+		if paginas and issubclass(familia, BucketHashTable):
+			self.tabla = familia(cubetas, tam_cubeta, densidad, archivo=paginas)
+		else:
+			self.tabla = familia(cubetas, tam_cubeta, densidad)
+
+	# El éxito se ve en el número de registros: consultar antes `k in tabla`
+	# leería la cubeta otra vez (en disco, una página más por operación)
+	def insertar(self, k: int) -> bool:
+		antes = len(self.tabla)
+		self.tabla.insertar(k)
+		return len(self.tabla) > antes
+
+	def buscar(self, k: int) -> bool:
+		return self.tabla.localizar(k) is not None
+
+	def eliminar(self, k: int) -> bool:
+		antes = len(self.tabla)
+		self.tabla.eliminar(k)
+		return len(self.tabla) < antes
+
+	def contadores(self) -> dict:
+		t = self.tabla
+		cont = {
+			"registros": len(t),
+			"cubetas": t.num_cubetas,
+			"registros_movidos": t.registros_movidos,
+		}
+		for campo in ("divisiones", "fusiones", "duplicaciones"):
+			if hasattr(t, campo):
+				cont[campo] = getattr(t, campo)
+		io = getattr(t, "io_paginas", None)
+		if io is not None:
+			cont.update(paginas_leidas=io.lecturas, paginas_escritas=io.escrituras, aciertos_buffer=io.aciertos)
+		return cont
+
+	def cerrar(self) -> None:
+		if isinstance(self.tabla, BucketHashTable):
+			self.tabla.cerrar()
+
+
+MOTORES: Dict[str, Callable] = {
+	"lineal": _Lineal,
+	"binaria": _Binaria,
+	"hash": lambda n, d, **o: _Hash(n, d, familia=HashTable, **o),
+	"transformacion": lambda n, d, **o: _Hash(n, d, familia=TransformTable, **o),
+	"bloques": lambda n, d, **o: _Bloques(n, d, binaria=False),
+	"bloques_binaria": lambda n, d, **o: _Bloques(n, d, binaria=True),
+	"bloques_division": lambda n, d, **o: _Bloques(n, d, binaria=True, factor_llenado=o.get("factor_llenado", FACTOR_LLENADO)),
+	"totales": lambda n, d, **o: _Dinamica(n, d, familia=HashTableTotales, **o),
+	"parciales": lambda n, d, **o: _Dinamica(n, d, familia=HashTableParciales, **o),
+	"hash_lineal": lambda n, d, **o: _Dinamica(n, d, familia=HashTableLineal, **o),
+	"extensible": lambda n, d, **o: _Dinamica(n, d, familia=HashTableExtendible, **o),
+}
+
+
+def crear_motor(nombre: str, n: int, d: int, **opciones):
+	return MOTORES[nombre](n, d, **opciones)
+
+
+# ------------------------------------------------------------------
+# Reproducción
+# ------------------------------------------------------------------
+
+def _percentil(valores: List[int], q: float) -> int:
+	if not valores:
+		return 0
+	return valores[min(len(valores) - 1, int(q * len(valores)))]
+
+
+def reproducir(eventos: List[Evento], motor) -> dict:
+	"""Ejecuta la traza sin pausas; latencias por operación con perf_counter_ns."""
+	operaciones = {op: getattr(motor, op) for op in OPERACIONES}
+	latencias: List[int] = []
+	cuenta = {op: 0 for op in OPERACIONES}
+	exitosas = {op: 0 for op in OPERACIONES}
+	reloj = time.perf_counter_ns
+
+	inicio = reloj()
+	for e in eventos:
+		t0 = reloj()
+		ok = operaciones[e.op](e.clave)
+		latencias.append(reloj() - t0)
+		cuenta[e.op] += 1
+		if ok:
+			exitosas[e.op] += 1
+	segundos = (reloj() - inicio) / 1e9
+
+	latencias.sort()
+	fila = {
+		"operaciones": len(eventos),
+		"segundos": round(segundos, 6),
+		"ops_s": round(len(eventos) / segundos) if segundos > 0 else 0,
+		"lat_p50_us": round(_percentil(latencias, 0.50) / 1000, 2),
+		"lat_p95_us": round(_percentil(latencias, 0.95) / 1000, 2),
+		"lat_p99_us": round(_percentil(latencias, 0.99) / 1000, 2),
+		"lat_max_us": round((latencias[-1] if latencias else 0) / 1000, 2),
+	}
+	for op in OPERACIONES:
+		fila[op] = cuenta[op]
+		fila[f"{op}_ok"] = exitosas[op]
+	fila["contadores"] = motor.contadores()
+	return fila
+
+
+def comparar(eventos: List[Evento], motores: Iterable[str], n: int, d: int, **opciones) -> List[dict]:
+	"""Reproduce la misma traza sobre cada motor (cada uno desde vacío)."""
+	filas = []
+	for nombre in motores:
+		fila = {"motor": nombre}
+		motor = crear_motor(nombre, n, d, **opciones)
+		fila.update(reproducir(eventos, motor))
+		# El siguiente motor puede usar el mismo archivo de páginas
+		if hasattr(motor, "cerrar"):
+			motor.cerrar()
+		filas.append(fila)
+	return filas
+
+
+def _texto_contadores(contadores: dict) -> str:
+	return " ".join(f"{k}={v}" for k, v in contadores.items())
+
+
+def format_table(rows: List[dict]) -> str:
+	shown = ("motor", "operaciones", "ops_s", "lat_p50_us", "lat_p95_us", "lat_p99_us", "lat_max_us", "contadores")
+	cells = [[_texto_contadores(r[c]) if c == "contadores" else str(r[c]) for c in shown] for r in rows]
+	widths = [max([len(c)] + [len(row[i]) for row in cells]) for i, c in enumerate(shown)]
+	lines = ["  ".join(c.ljust(w) for c, w in zip(shown, widths))]
+	lines.append("  ".join("-" * w for w in widths))
+	for row in cells:
+		lines.append("  ".join(v.ljust(w) for v, w in zip(row, widths)))
+	return "\n".join(lines)
+
+
+def write_csv(rows: List[dict], path: str) -> None:
+	with open(path, "w", encoding="utf-8", newline="") as f:
+		writer = csv.DictWriter(f, fieldnames=COLUMNS)
+		writer.writeheader()
+		for r in rows:
+			writer.writerow(dict(r, contadores=_texto_contadores(r["contadores"])))
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+	parser = argparse.ArgumentParser(description="Reproduce una traza de operaciones sobre varias estructuras")
+	parser.add_argument("traza", help="archivo de traza (operacion,clave[,t])")
+	parser.add_argument("--motores", default=",".join(MOTORES), help=",".join(MOTORES))
+	parser.add_argument("-n", type=int, default=1000, help="capacidad (lineal, binaria, hash, bloques)")
+	parser.add_argument("-d", "--digitos", type=int, default=4, help="dígitos por clave (funciones hash)")
+	parser.add_argument("--hash", default="modulo", help="función hash")
+	parser.add_argument("--resolucion", default="lineal", help="resolución de colisiones")
+	parser.add_argument("--cubetas", type=int, default=4, help="cubetas iniciales (dinámicas)")
+	parser.add_argument("--tam-cubeta", type=int, default=4)
+	parser.add_argument("--densidad", type=float, default=0.75)
+	parser.add_argument("--llenado", type=float, default=FACTOR_LLENADO, help="factor de llenado al dividir (bloques_division)")
+	parser.add_argument("--paginas", help="archivo de páginas para totales/parciales (E/S en disco)")
+	parser.add_argument("--csv", help="ruta del CSV de resultados")
+	parser.add_argument("--json", help="ruta del JSON de resultados")
+	args = parser.parse_args(argv)
+
+	eventos = leer_traza(args.traza)
+	motores = [m.strip() for m in args.motores.split(",") if m.strip() in MOTORES]
+	rows = comparar(
+		eventos, motores, args.n, args.digitos,
+		hash_mode=args.hash, probe_mode=args.resolucion,
+		cubetas=args.cubetas, tam_cubeta=args.tam_cubeta, densidad=args.densidad,
+		paginas=args.paginas, factor_llenado=args.llenado,
+	)
+	print(format_table(rows))
+	if args.csv:
+		write_csv(rows, args.csv)
+		print(f"\nResultados guardados en {args.csv}")
+	if args.json:
+		export_json(rows, args.json)
+		print(f"Resultados guardados en {args.json}")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,106 @@
+"""Animaciones paso a paso que no bloquean el ciclo de eventos de Tk."""
+
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, Dict, Generator, Optional
+
+
+# Cada paso hace `yield ms`: se dibuja el estado y se espera ms antes del siguiente
+Steps = Generator[int, None, None]
+
+SPEEDS: Dict[str, float] = {"x0.5": 0.5, "x1": 1.0, "x2": 2.0, "x4": 4.0, "x10": 10.0}
+
+
+class StepScheduler:
+	"""
+	Ejecuta un generador de pasos con `after(ms, callback)`.
+
+	- `render` dibuja el estado después de cada paso.
+	- `reset` limpia los resaltados cuando se cancela una animación.
+	- Solo hay una animación activa: iniciar otra completa la anterior al
+	  instante para que su operación no quede a medias.
+	"""
+
+	def __init__(self, widget: tk.Misc, render: Callable[[], None], reset: Optional[Callable[[], None]] = None) -> None:
+		self.widget = widget
+		self.render = render
+		self.reset = reset
+		self.speed = 1.0
+		self._steps: Optional[Steps] = None
+		self._job: Optional[str] = None
+
+	@property
+	def running(self) -> bool:
+		return self._steps is not None
+
+	def run(self, steps: Steps) -> None:
+		self.skip()
+		self._steps = steps
+		self._advance()
+
+	def _advance(self) -> None:
+		self._job = None
+		steps = self._steps
+		if steps is None:
+			return
+		try:
+			ms = next(steps)
+		except StopIteration:
+			if self._steps is steps:
+				self._steps = None
+			return
+		self.render()
+		delay = max(1, int((ms or 0) / self.speed))
+		self._job = self.widget.after(delay, self._advance)
+
+	def _stop_timer(self) -> None:
+		if self._job is not None:
+			self.widget.after_cancel(self._job)
+			self._job = None
+
+	def skip(self) -> None:
+		"""Termina la animación actual sin esperas ni dibujos intermedios."""
+		steps = self._steps
+		# gi_running: el paso actual está mostrando un diálogo modal
+		if steps is None or steps.gi_running:
+			return
+		self._stop_timer()
+		self._steps = None
+		for _ in steps:
+			pass
+		self.render()
+
+	def cancel(self) -> None:
+		"""Descarta los pasos restantes (la operación en curso no se completa)."""
+		steps = self._steps
+		if steps is None or steps.gi_running:
+			return
+		self._stop_timer()
+		self._steps = None
+		steps.close()
+		if self.reset is not None:
+			self.reset()
+		self.render()
+
+
+class AnimationControls(ttk.Frame):
+	"""Velocidad, saltar y cancelar para un StepScheduler."""
+
+	def __init__(self, parent: tk.Misc, scheduler: StepScheduler) -> None:
+		super().__init__(parent)
+		self.scheduler = scheduler
+
+		ttk.Label(self, text="Velocidad:").grid(row=0, column=0, sticky="w")
+		self.speed = tk.StringVar(value="x1")
+		combo = ttk.Combobox(self, values=list(SPEEDS), state="readonly", textvariable=self.speed, width=5)
+		combo.grid(row=0, column=1, sticky="w", padx=(4, 0))
+		combo.bind("<<ComboboxSelected>>", self._on_speed)
+
+		btn_skip = ttk.Button(self, text="Saltar", command=scheduler.skip)
+		btn_skip.grid(row=1, column=0, pady=(4, 0), sticky="ew")
+
+		btn_cancel = ttk.Button(self, text="Cancelar", command=scheduler.cancel)
+		btn_cancel.grid(row=1, column=1, pady=(4, 0), padx=(4, 0), sticky="ew")
+
+	def _on_speed(self, event=None) -> None:
+		self.scheduler.speed = SPEEDS.get(self.speed.get(), 1.0)
@@ -1,11 +1,18 @@
 import math
+import os
 import random
+from bisect import bisect_left
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Set
 
+from app.core.block_file import BlockFile
+from app.core.block_search import BITS_POR_CLAVE, ESTRATEGIAS, FenceIndex, buscar_bloque
+from app.core.undo_log import UndoLog
+from app.views.bloques_comun import BloquesComun
 
-class BloquesBinariaView(ttk.Frame):
+
+class BloquesBinariaView(BloquesComun, ttk.Frame):
 	def __init__(self, parent: tk.Misc, app) -> None:
 		super().__init__(parent)
 
@@ -40,6 +47,33 @@ class BloquesBinariaView(ttk.Frame):
 		btn_gen_struct = ttk.Button(params, text="Generar estructura", command=self._on_generate_structure)
 		btn_gen_struct.grid(row=0, column=7, padx=(0, 6))
 
+		# Estrategia para ubicar el bloque sobre las fence keys
+		lbl_strategy = ttk.Label(params, text="Búsqueda entre bloques:")
+		lbl_strategy.grid(row=1, column=0, sticky="w", padx=(0, 6), pady=(6, 0))
+		self.strategy = tk.StringVar(value="binaria")
+		strategy_combo = ttk.Combobox(
+			params, values=list(ESTRATEGIAS), state="readonly", textvariable=self.strategy, width=14
+		)
+		strategy_combo.grid(row=1, column=1, columnspan=2, sticky="w", pady=(6, 0))
+
+		# Filtros de Bloom por bloque: las búsquedas fallidas no leen el bloque
+		self.bloom_var = tk.BooleanVar(value=False)
+		ttk.Checkbutton(
+			params, text="Filtros de Bloom por bloque", variable=self.bloom_var, command=self._on_bloom_toggle
+		).grid(row=2, column=0, columnspan=3, sticky="w", pady=(6, 0))
+		lbl_bits = ttk.Label(params, text="Bits por clave:")
+		lbl_bits.grid(row=2, column=4, sticky="w", padx=(0, 6), pady=(6, 0))
+		self.entry_bits = ttk.Entry(params, width=10)
+		self.entry_bits.insert(0, str(BITS_POR_CLAVE))
+		self.entry_bits.grid(row=2, column=5, padx=(0, 16), pady=(6, 0))
+		self.entry_bits.bind("<Return>", self._on_bloom_toggle)
+
+		# Sin animación la búsqueda va directo al resultado y no arma ningún paso
+		self.result_only_var = tk.BooleanVar(value=False)
+		ttk.Checkbutton(
+			params, text="Solo resultado (sin animación)", variable=self.result_only_var
+		).grid(row=3, column=0, columnspan=3, sticky="w", pady=(6, 0))
+
 		# Panel paralelo
 		panel = ttk.Frame(self, padding=6)
 		panel.pack(fill=tk.BOTH, expand=True)
@@ -85,9 +119,11 @@ class BloquesBinariaView(ttk.Frame):
 		# Botón de deshacer
 		btn_undo = ttk.Button(ops, text="↶ Deshacer (Ctrl+Z)", command=self._on_undo)
 		btn_undo.grid(row=13, column=0, pady=2, sticky="ew")
+		btn_redo = ttk.Button(ops, text="↷ Rehacer (Ctrl+Y)", command=self._on_redo)
+		btn_redo.grid(row=14, column=0, pady=2, sticky="ew")
 
 		self.status = ttk.Label(ops, text="Estado: listo")
-		self.status.grid(row=14, column=0, pady=(12, 0), sticky="w")
+		self.status.grid(row=15, column=0, pady=(12, 0), sticky="w")
 
 		viz = ttk.Frame(panel, style="Panel.TFrame", padding=8)
 		viz.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -114,6 +150,13 @@ class BloquesBinariaView(ttk.Frame):
 		btn_load = ttk.Button(file_panel, text="Cargar", command=self._on_load)
 		btn_load.grid(row=0, column=2, padx=4, pady=2)
 
+		# Archivo binario de bloques (registros de ancho fijo, E/S real)
+		btn_save_bin = ttk.Button(file_panel, text="Guardar binario", command=self._on_save_binary)
+		btn_save_bin.grid(row=0, column=3, padx=4, pady=2)
+
+		btn_load_bin = ttk.Button(file_panel, text="Cargar binario", command=self._on_load_binary)
+		btn_load_bin.grid(row=0, column=4, padx=4, pady=2)
+
 		back = ttk.Button(self, text="← Volver", command=lambda: app.navigate("externas"))
 		back.pack(pady=6)
 
@@ -124,32 +167,52 @@ class BloquesBinariaView(ttk.Frame):
 		self.b: int = 4
 		self.block_size: int = 4
 		self.blocks: List[List[int]] = []
+		# Máximo de cada bloque no vacío (ver FenceIndex)
+		self._fences = FenceIndex()
+		# Archivo binario asociado: las búsquedas se repiten sobre él contando lecturas de bloque
+		self._archivo: Optional[BlockFile] = None
+		# Bloques modificados desde la última escritura del archivo
+		self._sucios: Set[int] = set()
+		self._lecturas_archivo: Optional[int] = None
+		# Bloques leídos por cada estrategia en la última búsqueda
+		self._lecturas_estrategias: Dict[str, int] = {}
 		self._highlight_block: Optional[int] = None
 		self._highlight_position: Optional[int] = None
 		
-		# Animation
+		# Animation: los pasos se generan al reproducirlos y se guardan para repetirla
 		self._anim_steps: List[Dict[str, Any]] = []
+		self._anim_source: Optional[Iterator[Dict[str, Any]]] = None
+		self._anim_version: int = 0
 		self._anim_index: int = 0
 		self._anim_running: bool = False
 		
-		# Undo mechanism
-		self._history: List[Dict[str, Any]] = []
-		self._max_history = 20
+		# Deshacer/rehacer: registro de operaciones con su inversa
+		self._log = UndoLog()
 		self.bind_all("<Control-z>", self._on_undo)
+		self.bind_all("<Control-y>", self._on_redo)
 
 		self._initialize_blocks()
 		self.after(100, self._draw)
 
-	def _save_state(self) -> None:
-		current_state = {
-			'n': self.n,
-			'b': self.b,
-			'block_size': self.block_size,
-			'blocks': [block[:] for block in self.blocks]
-		}
-		self._history.append(current_state)
-		if len(self._history) > self._max_history:
-			self._history.pop(0)
+	def _capture_state(self) -> tuple:
+		# Por referencia: los puntos de control reemplazan la lista de bloques, no la modifican
+		return self.n, self.b, self.block_size, self.blocks
+
+	def _restore_state(self, state: tuple) -> None:
+		self.n, self.b, self.block_size, self.blocks = state
+		self.entry_n.delete(0, tk.END)
+		self.entry_n.insert(0, str(self.n))
+		self.lbl_b_value.configure(text=str(self.b))
+		self._fences.reconstruir(self.blocks)
+
+	def _checkpoint(self, anterior: tuple, descripcion: str) -> None:
+		self._release_block_file(anterior)
+		self._log.checkpoint(anterior, self._capture_state, self._restore_checkpoint, descripcion, sum(len(block) for block in anterior[3]))
+
+	def _restore_checkpoint(self, state: tuple) -> None:
+		# El archivo asociado refleja la estructura que se reemplaza
+		self._release_block_file(self._capture_state())
+		self._restore_state(state)
 
 	def _on_n_change(self, event=None) -> None:
 		try:
@@ -188,11 +251,12 @@ class BloquesBinariaView(ttk.Frame):
 		self.n, self.b, _ = self._read_params()
 		self.block_size = math.ceil(self.n / self.b) if self.b > 0 else self.n
 		self.blocks = [[] for _ in range(self.b)]
+		self._fences.reconstruir(self.blocks)
 		self._highlight_block = None
 		self._highlight_position = None
 
 	def _on_generate(self) -> None:
-		self._save_state()
+		anterior = self._capture_state()
 		n, b, digits = self._read_params()
 		self.n, self.b = n, b
 		self.block_size = math.ceil(n / b) if b > 0 else n
@@ -208,24 +272,26 @@ class BloquesBinariaView(ttk.Frame):
 		for i, num in enumerate(numbers):
 			block_idx = min(i // self.block_size, b - 1)
 			self.blocks[block_idx].append(num)
+		self._fences.reconstruir(self.blocks)
+		self._checkpoint(anterior, "generar datos")
 		self.status.configure(text=f"Generados {len(numbers)} registros en {b} bloques")
 		self._draw()
 
 	def _on_generate_structure(self) -> None:
 		"""Genera/Regenera la estructura vacía con n, B y tamaño de bloque calculados"""
-		self._save_state()
+		anterior = self._capture_state()
 		n, b, _ = self._read_params()
 		self.n, self.b = n, b
 		self.block_size = math.ceil(n / b) if b > 0 else n
 		self.blocks = [[] for _ in range(b)]
+		self._fences.reconstruir(self.blocks)
+		self._checkpoint(anterior, "generar estructura")
 		self.status.configure(text=f"Estructura generada (vacía): n={n}, B={b}, tamaño de bloque={self.block_size}")
 		self._draw()
 
 	def _key_exists(self, key: int) -> bool:
-		for block in self.blocks:
-			if key in block:
-				return True
-		return False
+		# Fence keys: bisect para ubicar el bloque y bisect dentro de él
+		return self._fences.contiene(self.blocks, key)
 
 	def _on_insert(self) -> None:
 		_, _, digits = self._read_params()
@@ -233,83 +299,93 @@ class BloquesBinariaView(ttk.Frame):
 		key = self._validate_key(key_str, digits)
 		if key is None:
 			return
+		# Solo las inserciones aceptadas van a la traza (no duplicados ni estructura llena)
+		if self._insertar(key):
+			self.app.traza.registrar("insertar", key)
+
+	def _insertar(self, key: int) -> bool:
+		"""Inserta key; devuelve False si se rechaza (duplicado o sin espacio)."""
 		if self._key_exists(key):
 			messagebox.showwarning("Registro duplicado", f"El registro{key} ya existe")
-			return
-		self._save_state()
+			return False
 		
 		# Verificar si hay espacio total disponible
 		total_elements = sum(len(block) for block in self.blocks)
 		if total_elements >= self.n:
 			messagebox.showerror("Error", "La estructura está llena")
-			return
-		
-		# Encontrar la posición correcta en toda la estructura (como lista continua)
-		insert_position = 0
-		for block_idx, block in enumerate(self.blocks):
-			for pos, value in enumerate(block):
-				if key <= value:
-					# Encontramos la posición correcta
-					insert_block_idx = block_idx
-					insert_pos = pos
-					
-					# Insertar en la posición correcta
-					block.insert(insert_pos, key)
-					
-					# Si el bloque se desborda, desplazar elementos hacia adelante
-					if len(block) > self.block_size:
-						# El último elemento debe moverse al siguiente bloque
-						overflow_element = block.pop()
-						
-						# Buscar el siguiente bloque con espacio
-						next_block_idx = insert_block_idx + 1
-						while next_block_idx < len(self.blocks):
-							if len(self.blocks[next_block_idx]) < self.block_size:
-								# Insertar al inicio del siguiente bloque
-								self.blocks[next_block_idx].insert(0, overflow_element)
-								break
-							else:
-								# Este bloque también está lleno, desplazar su último elemento
-								next_overflow = self.blocks[next_block_idx].pop()
-								self.blocks[next_block_idx].insert(0, overflow_element)
-								overflow_element = next_overflow
-								next_block_idx += 1
-						else:
-							# No hay más bloques, crear uno nuevo si es posible
-							if len(self.blocks) < self.b:
-								self.blocks.append([overflow_element])
-							else:
-								# No se puede insertar más
-								messagebox.showerror("Error", "No hay espacio disponible")
-								return
-					
-					self.status.configure(text=f"Insertado registro {key} en bloque {insert_block_idx}")
-					self.entry_key.delete(0, tk.END)
-					self._draw()
-					return
-				insert_position += 1
-			insert_position += len(block)
+			return False
 		
-		# Si llegamos aquí, el valor va al final
-		# Buscar el último bloque con espacio
-		for block_idx in range(len(self.blocks)):
+		# Ubicar bloque y posición con las fence keys (bisect) sin recorrer los registros
+		insert_block_idx, insert_pos = self._ubicar_con_lugar(key)
+		if insert_block_idx >= 0:
+			block = self.blocks[insert_block_idx]
+			block.insert(insert_pos, key)
+			last_block_idx = insert_block_idx
+
+			# Si el bloque se desborda, desplazar elementos hacia adelante
+			if len(block) > self.block_size:
+				# El último elemento debe moverse al siguiente bloque
+				overflow_element = block.pop()
+
+				# Buscar el siguiente bloque con espacio
+				next_block_idx = insert_block_idx + 1
+				nuevo = False
+				while next_block_idx < len(self.blocks):
+					if len(self.blocks[next_block_idx]) < self.block_size:
+						# Insertar al inicio del siguiente bloque
+						self.blocks[next_block_idx].insert(0, overflow_element)
+						break
+					else:
+						# Este bloque también está lleno, desplazar su último elemento
+						next_overflow = self.blocks[next_block_idx].pop()
+						self.blocks[next_block_idx].insert(0, overflow_element)
+						overflow_element = next_overflow
+						next_block_idx += 1
+				else:
+					# No hay más bloques: _ubicar_con_lugar ya confirmó que cabe uno nuevo
+					self.blocks.append([overflow_element])
+					next_block_idx = len(self.blocks) - 1
+					nuevo = True
+				last_block_idx = next_block_idx
+				self._log_insert(key, insert_block_idx, insert_pos, last_block_idx, nuevo)
+			else:
+				self._log_insert(key, insert_block_idx, insert_pos, insert_block_idx, False)
+
+			# Solo cambian las fence keys de los bloques tocados
+			for block_idx in range(insert_block_idx, last_block_idx + 1):
+				self._fences.actualizar(self.blocks, block_idx)
+
+			self.status.configure(text=f"Insertado registro {key} en bloque {insert_block_idx}")
+			self.entry_key.delete(0, tk.END)
+			self._draw()
+			return True
+
+		# Si llegamos aquí, el valor va al final: en el último bloque con datos
+		# o en uno vacío posterior (antes rompería el orden)
+		ultimo = self._fences.bloques[-1] if self._fences.bloques else 0
+		for block_idx in range(ultimo, len(self.blocks)):
 			if len(self.blocks[block_idx]) < self.block_size:
 				self.blocks[block_idx].append(key)
+				self._fences.actualizar(self.blocks, block_idx)
+				self._log_insert(key, block_idx, len(self.blocks[block_idx]) - 1, block_idx, False)
 				self.status.configure(text=f"Insertado registro {key} en bloque {block_idx}")
 				self.entry_key.delete(0, tk.END)
 				self._draw()
-				return
+				return True
 		
 		# Si no hay espacio en ningún bloque existente, crear uno nuevo
 		if len(self.blocks) < self.b:
 			self.blocks.append([key])
+			self._fences.actualizar(self.blocks, len(self.blocks) - 1)
+			self._log_insert(key, len(self.blocks) - 1, 0, len(self.blocks) - 1, True)
 			self.status.configure(text=f"Insertado registro {key} en nuevo bloque {len(self.blocks)-1}")
 		else:
 			messagebox.showerror("Error", "No hay espacio disponible")
-			return
+			return False
 		
 		self.entry_key.delete(0, tk.END)
 		self._draw()
+		return True
 
 	def _on_delete(self) -> None:
 		"""Elimina un registro con animación de búsqueda binaria"""
@@ -318,107 +394,46 @@ class BloquesBinariaView(ttk.Frame):
 		key = self._validate_key(key_str, digits)
 		if key is None:
 			return
-		self._save_state()
+		self.app.traza.registrar("eliminar", key)
 		
 		# Preparar animación de búsqueda binaria para eliminar
-		self._anim_steps = []
 		self._highlight_block = None
 		self._highlight_position = None
 		self._delete_key = key
+		if self.result_only_var.get():
+			self._delete_result_only(key)
+			return
 		self._delete_mode = True
 		
-		self._search_binary_blocks_for_delete(key)
+		self._start_steps(self._search_strategy_blocks(key, digits, for_delete=True))
 		
 		self._prepare_animation()
-		if self._anim_steps:
+		if self._step_at(0) is not None:
 			self._anim_index = 0
 			self._anim_running = True
 			self._anim_step_delete()
 	
-	def _search_binary_blocks_for_delete(self, key: int) -> None:
-		"""Búsqueda binaria entre bloques para eliminar"""
-		self._anim_steps.append({
-			'type': 'start',
-			'message': f'Buscando registro {key} para eliminar (búsqueda binaria)...',
-			'highlight_block': None,
-			'highlight_position': None
-		})
-		
-		left, right = 0, len(self.blocks) - 1
-		target_block = -1
-		
-		while left <= right:
-			mid = (left + right) // 2
-			
-			self._anim_steps.append({
-				'type': 'check_block',
-				'message': f'Evaluando bloque {mid + 1} (izq={left + 1}, der={right + 1}, mid={mid + 1})',
-				'highlight_block': mid,
-				'highlight_position': None,
-				'left': left,
-				'right': right,
-				'mid': mid
-			})
-			
-			if not self.blocks[mid]:
-				right = mid - 1
-				continue
-			
-			last_element = self.blocks[mid][-1]
-			
-			self._anim_steps.append({
-				'type': 'compare',
-				'message': f'¿{key} ≤ {last_element}? (último elemento del bloque {mid + 1})',
-				'highlight_block': mid,
-				'highlight_position': len(self.blocks[mid]) - 1,
-				'comparing': True
-			})
-			
-			if key <= last_element:
-				target_block = mid
-				right = mid - 1
-				self._anim_steps.append({
-					'type': 'decision',
-					'message': f'Sí, {key} ≤ {last_element}. Puede estar aquí o a la izquierda',
-					'highlight_block': mid,
-					'highlight_position': len(self.blocks[mid]) - 1
-				})
-			else:
-				left = mid + 1
-				self._anim_steps.append({
-					'type': 'decision',
-					'message': f'No, {key} > {last_element}. Ir a bloques de la derecha',
-					'highlight_block': mid,
-					'highlight_position': len(self.blocks[mid]) - 1
-				})
-		
-		if target_block >= 0:
-			self._search_within_block_for_delete(target_block, key)
-		else:
-			self._anim_steps.append({
-				'type': 'not_found',
-				'message': 'Registro no encontrado',
-				'highlight_block': None,
-				'highlight_position': None
-			})
-	
-	def _search_within_block_for_delete(self, block_idx: int, key: int) -> None:
+	def _search_within_block_for_delete(self, block_idx: int, key: int) -> Iterator[Dict[str, Any]]:
 		"""Búsqueda binaria dentro del bloque para eliminar"""
-		self._anim_steps.append({
+		descarte = self._bloom_step(block_idx, key)
+		if descarte is not None:
+			yield descarte
+			return
+		yield {
 			'type': 'block_search_start',
 			'message': f'Búsqueda binaria en bloque {block_idx + 1}...',
 			'highlight_block': block_idx,
 			'highlight_position': None
-		})
+		}
 		
 		block = self.blocks[block_idx]
 		if not block:
-			self._anim_steps.append({
+			yield {
 				'type': 'not_found',
 				'message': f'Bloque {block_idx + 1} está vacío',
 				'highlight_block': block_idx,
 				'highlight_position': None
-			})
+			}
 			return
 		
 		left, right = 0, len(block) - 1
@@ -426,7 +441,7 @@ class BloquesBinariaView(ttk.Frame):
 		while left <= right:
 			mid = (left + right) // 2
 			
-			self._anim_steps.append({
+			yield {
 				'type': 'binary_check',
 				'message': f'Comparando {key} con {block[mid]} en posición {mid}',
 				'highlight_block': block_idx,
@@ -435,45 +450,46 @@ class BloquesBinariaView(ttk.Frame):
 				'left': left,
 				'right': right,
 				'mid': mid
-			})
+			}
 			
 			if block[mid] == key:
-				self._anim_steps.append({
+				yield {
 					'type': 'found_delete',
 					'message': f'¡Encontrado! Eliminando {key} del bloque {block_idx + 1}',
 					'highlight_block': block_idx,
 					'highlight_position': mid,
 					'delete_block': block_idx,
 					'delete_pos': mid
-				})
+				}
 				return
 			elif block[mid] < key:
 				left = mid + 1
-				self._anim_steps.append({
+				yield {
 					'type': 'decision',
 					'message': f'{key} > {block[mid]}. Buscar en la mitad derecha',
 					'highlight_block': block_idx,
 					'highlight_position': mid
-				})
+				}
 			else:
 				right = mid - 1
-				self._anim_steps.append({
+				yield {
 					'type': 'decision',
 					'message': f'{key} < {block[mid]}. Buscar en la mitad izquierda',
 					'highlight_block': block_idx,
 					'highlight_position': mid
-				})
+				}
 		
-		self._anim_steps.append({
+		yield {
 			'type': 'not_found',
 			'message': f'Registro {key} no encontrado',
 			'highlight_block': block_idx,
 			'highlight_position': None
-		})
+		}
 	
 	def _anim_step_delete(self) -> None:
 		"""Ejecuta un paso de la animación de eliminación"""
-		if self._anim_index >= len(self._anim_steps):
+		step = self._step_at(self._anim_index)
+		if step is None:
 			self._anim_running = False
 			self._delete_mode = False
 			if self._anim_steps:
@@ -482,7 +498,6 @@ class BloquesBinariaView(ttk.Frame):
 					messagebox.showwarning("⚠️ No Encontrado", "El registro NO se encuentra en la estructura")
 			return
 		
-		step = self._anim_steps[self._anim_index]
 		self._highlight_block = step.get('highlight_block')
 		self._highlight_position = step.get('highlight_position')
 		
@@ -504,19 +519,15 @@ class BloquesBinariaView(ttk.Frame):
 		"""Realiza la eliminación después de la animación"""
 		key = self._delete_key
 		
-		# Eliminar el elemento
-		if block_idx < len(self.blocks) and pos < len(self.blocks[block_idx]):
-			self.blocks[block_idx].pop(pos)
-		
-		# Reorganizar elementos
-		all_elements = []
-		for b in self.blocks:
-			all_elements.extend(b)
-		
-		self.blocks = [[] for _ in range(self.b)]
-		for i, num in enumerate(all_elements):
-			block_idx_new = min(i // self.block_size, self.b - 1)
-			self.blocks[block_idx_new].append(num)
+		# Para deshacer alcanza con el largo de cada bloque antes de reorganizar
+		largos = [len(block) for block in self.blocks]
+		self._repack_without(block_idx, pos)
+		self._log.registrar(
+			lambda: self._undo_repack(key, block_idx, pos, largos),
+			lambda: self._repack_without(block_idx, pos),
+			f"eliminar {key}",
+			len(largos)
+		)
 		
 		self._highlight_block = None
 		self._highlight_position = None
@@ -532,57 +543,81 @@ class BloquesBinariaView(ttk.Frame):
 		key = self._validate_key(key_str, digits)
 		if key is None:
 			return
-		self._anim_steps = []
+		self.app.traza.registrar("buscar", key)
 		self._highlight_block = None
 		self._highlight_position = None
-		self._search_binary_blocks(key)
+		if self._archivo is not None:
+			# La misma búsqueda sobre el archivo binario, contando lecturas reales de bloque
+			self._sync_block_file()
+			self._archivo.buscar(key, binaria=True)
+			self._lecturas_archivo = self._archivo.ultimas_lecturas
+		# Los sondeos de cada estrategia salen de buscar_bloque, sin construir los pasos
+		self._count_strategy_reads(key, digits)
+		if self.result_only_var.get():
+			self._search_result_only(key)
+			return
+		self._start_steps(self._search_strategy_blocks(key, digits))
 		self._prepare_animation()
-		if self._anim_steps:
+		if self._step_at(0) is not None:
 			self._anim_index = 0
 			self._anim_running = True
 			self._anim_step()
 
-	def _search_binary_blocks(self, key: int) -> None:
-		self._anim_steps.append({'type': 'start','message': f'Iniciando búsqueda binaria de {key}','highlight_block': None,'highlight_position': None})
-		left, right = 0, len(self.blocks) - 1
-		target_block = -1
-		while left <= right:
-			mid = (left + right) // 2
-			self._anim_steps.append({'type': 'check_block','message': f'Evaluando bloque {mid}','highlight_block': mid,'highlight_position': None,'left': left,'right': right,'mid': mid})
-			if not self.blocks[mid]:
-				right = mid - 1
-				continue
-			last_element = self.blocks[mid][-1]
-			self._anim_steps.append({'type': 'compare','message': f'¿{key} ≤ {last_element}? (último elemento del bloque {mid})','highlight_block': mid,'highlight_position': len(self.blocks[mid]) - 1,'comparing': True})
+	def _key_domain(self, digits: int) -> tuple[int, int]:
+		"""Menor y mayor registro posible con 'digits' dígitos"""
+		return (10 ** (digits - 1) if digits > 1 else 0), 10 ** digits - 1
+
+	def _count_strategy_reads(self, key: int, digits: int) -> None:
+		"""Bloques que leería cada estrategia para ubicar key (se muestran bajo el canvas)"""
+		self._lecturas_estrategias = {
+			estrategia: len(buscar_bloque(self._fences.maximos, key, estrategia, self._key_domain(digits))[1])
+			for estrategia in ESTRATEGIAS
+		}
+
+	def _search_strategy_blocks(self, key: int, digits: int, for_delete: bool = False) -> Iterator[Dict[str, Any]]:
+		"""Búsqueda por la estrategia elegida sobre el último registro de cada bloque con datos (los mismos sondeos que se cuentan)"""
+		estrategia = self.strategy.get()
+		yield {'type': 'start', 'message': f'Iniciando búsqueda por {estrategia} de {key}', 'highlight_block': None, 'highlight_position': None}
+		target, sondeos = buscar_bloque(self._fences.maximos, key, estrategia, self._key_domain(digits))
+		for i, tipo in sondeos:
+			block_idx = self._fences.bloques[i]
+			last_element = self.blocks[block_idx][-1]
+			yield {'type': 'check_block', 'message': f'Evaluando bloque {block_idx} (paso {tipo})', 'highlight_block': block_idx, 'highlight_position': None}
+			yield {'type': 'compare', 'message': f'¿{key} ≤ {last_element}? (último elemento del bloque {block_idx})', 'highlight_block': block_idx, 'highlight_position': len(self.blocks[block_idx]) - 1, 'comparing': True}
 			if key <= last_element:
-				target_block = mid
-				right = mid - 1
-				self._anim_steps.append({'type': 'decision','message': f'Sí, {key} ≤ {last_element}. Puede estar aquí o a la izquierda','highlight_block': mid,'highlight_position': len(self.blocks[mid]) - 1})
+				message = f'Sí, {key} ≤ {last_element}. Puede estar aquí o a la izquierda'
 			else:
-				left = mid + 1
-				self._anim_steps.append({'type': 'decision','message': f'No, {key} > {last_element}. Ir a bloques de la derecha','highlight_block': mid,'highlight_position': len(self.blocks[mid]) - 1})
-		if target_block >= 0:
-			self._search_within_block(target_block, key)
+				message = f'No, {key} > {last_element}. Ir a bloques de la derecha'
+			yield {'type': 'decision', 'message': message, 'highlight_block': block_idx, 'highlight_position': len(self.blocks[block_idx]) - 1}
+		if target >= 0:
+			if for_delete:
+				yield from self._search_within_block_for_delete(self._fences.bloques[target], key)
+			else:
+				yield from self._search_within_block(self._fences.bloques[target], key)
 		else:
-			self._anim_steps.append({'type': 'not_found','message': 'Valor no encontrado en ningún bloque','highlight_block': None,'highlight_position': None})
+			yield {'type': 'not_found', 'message': 'Valor no encontrado en ningún bloque', 'highlight_block': None, 'highlight_position': None}
 
-	def _search_within_block(self, block_idx: int, key: int) -> None:
+	def _search_within_block(self, block_idx: int, key: int) -> Iterator[Dict[str, Any]]:
 		"""Búsqueda binaria dentro del bloque"""
-		self._anim_steps.append({
+		descarte = self._bloom_step(block_idx, key)
+		if descarte is not None:
+			yield descarte
+			return
+		yield {
 			'type': 'block_search_start',
 			'message': f'Iniciando búsqueda binaria en bloque {block_idx}',
 			'highlight_block': block_idx,
 			'highlight_position': None
-		})
+		}
 		
 		block = self.blocks[block_idx]
 		if not block:
-			self._anim_steps.append({
+			yield {
 				'type': 'not_found',
 				'message': f'Bloque {block_idx} está vacío',
 				'highlight_block': block_idx,
 				'highlight_position': None
-			})
+			}
 			return
 		
 		left, right = 0, len(block) - 1
@@ -591,7 +626,7 @@ class BloquesBinariaView(ttk.Frame):
 			mid = (left + right) // 2
 			
 			# Mostrar posición actual siendo evaluada
-			self._anim_steps.append({
+			yield {
 				'type': 'binary_check',
 				'message': f'Comparando {key} con {block[mid]} en posición {mid}',
 				'highlight_block': block_idx,
@@ -600,45 +635,45 @@ class BloquesBinariaView(ttk.Frame):
 				'left': left,
 				'right': right,
 				'mid': mid
-			})
+			}
 			
 			if block[mid] == key:
-				self._anim_steps.append({
+				yield {
 					'type': 'found',
 					'message': f'¡Encontrado! {key} en bloque {block_idx}, posición {mid}',
 					'highlight_block': block_idx,
 					'highlight_position': mid
-				})
+				}
 				return
 			elif block[mid] < key:
 				left = mid + 1
-				self._anim_steps.append({
+				yield {
 					'type': 'decision',
 					'message': f'{key} > {block[mid]}. Buscar en la mitad derecha',
 					'highlight_block': block_idx,
 					'highlight_position': mid
-				})
+				}
 			else:
 				right = mid - 1
-				self._anim_steps.append({
+				yield {
 					'type': 'decision',
 					'message': f'{key} < {block[mid]}. Buscar en la mitad izquierda',
 					'highlight_block': block_idx,
 					'highlight_position': mid
-				})
+				}
 		
-		self._anim_steps.append({
+		yield {
 			'type': 'not_found',
 			'message': f'Valor {key} no encontrado en bloque {block_idx}',
 			'highlight_block': block_idx,
 			'highlight_position': None
-		})
+		}
 
 	def _on_rebuild_structure(self) -> None:
 		if not any(self.blocks):
 			messagebox.showinfo("Información", "No hay datos para reorganizar. Use 'Generar datos' primero.")
 			return
-		self._save_state()
+		anterior = self._capture_state()
 		all_data = []
 		for block in self.blocks:
 			all_data.extend(block)
@@ -653,12 +688,15 @@ class BloquesBinariaView(ttk.Frame):
 		for i, num in enumerate(all_data):
 			block_idx = min(i // self.block_size, b - 1)
 			self.blocks[block_idx].append(num)
+		self._fences.reconstruir(self.blocks)
+		self._checkpoint(anterior, "reorganizar")
 		self.status.configure(text=f"Estructura reorganizada: {len(all_data)} elementos en {b} bloques")
 		self._draw()
 
 	def _on_reset(self) -> None:
-		self._save_state()
+		anterior = self._capture_state()
 		self._initialize_blocks()
+		self._checkpoint(anterior, "reiniciar")
 		self.status.configure(text="Estructura reiniciada")
 		self._draw()
 
@@ -667,34 +705,104 @@ class BloquesBinariaView(ttk.Frame):
 		if not any(self.blocks):
 			self.status.configure(text="Estructura ya vacía")
 			return
-		self._save_state()
+		anterior = self._capture_state()
 		self.blocks = [[] for _ in range(self.b)]
+		self._fences.reconstruir(self.blocks)
+		self._checkpoint(anterior, "borrar")
 		self.status.configure(text="Estructura borrada")
 		self._draw()
 
 	def _on_undo(self, event=None) -> None:
-		if not self._history:
+		descripcion = self._log.deshacer()
+		if descripcion is None:
 			self.status.configure(text="No hay operaciones para deshacer")
 			messagebox.showinfo("Deshacer", "No hay operaciones para deshacer")
 			return
-		last_state = self._history.pop()
-		self.n = last_state['n']
-		self.b = last_state['b']
-		self.block_size = last_state['block_size']
-		self.blocks = last_state['blocks']
-		self.entry_n.delete(0, tk.END)
-		self.entry_n.insert(0, str(self.n))
-		self.lbl_b_value.configure(text=str(self.b))
-		self.status.configure(text=f"Operación deshecha. Estados restantes: {len(self._history)}")
+		self._after_history(f"Deshecho: {descripcion}")
+
+	def _on_redo(self, event=None) -> None:
+		descripcion = self._log.rehacer()
+		if descripcion is None:
+			self.status.configure(text="No hay operaciones para rehacer")
+			return
+		self._after_history(f"Rehecho: {descripcion}")
+
+	def _after_history(self, texto: str) -> None:
+		self._highlight_block = None
+		self._highlight_position = None
+		self.status.configure(text=f"{texto}. Deshacer: {len(self._log)}, rehacer: {self._log.pendientes_rehacer}")
+		self._draw()
+
+	def _start_steps(self, pasos: Iterator[Dict[str, Any]]) -> None:
+		"""Nueva animación: los pasos de la búsqueda se piden de a uno"""
+		self._anim_steps = []
+		self._anim_source = pasos
+		self._anim_version = self._log.version
+
+	def _step_at(self, index: int) -> Optional[Dict[str, Any]]:
+		"""Paso index de la animación (None al terminar), generándolo si todavía no se pidió"""
+		while index >= len(self._anim_steps) and self._anim_source is not None:
+			paso = None
+			# Si la estructura cambió, los pasos que faltan ya no corresponden a ella
+			if self._anim_version == self._log.version:
+				paso = next(self._anim_source, None)
+			if paso is None:
+				self._anim_source = None
+			else:
+				self._anim_steps.append(paso)
+		return self._anim_steps[index] if index < len(self._anim_steps) else None
+
+	def _locate(self, key: int) -> Optional[tuple[int, int]]:
+		"""(bloque, posición) de key sobre las fence keys, sin pasos; None si no está"""
+		block_idx = self._fences.bloque_de(key)
+		if block_idx < 0:
+			return None
+		filtros = self._fences.filtros
+		if filtros is not None and not filtros.consultar(self.blocks, block_idx, key):
+			return None
+		pos = bisect_left(self.blocks[block_idx], key)
+		return (block_idx, pos) if self.blocks[block_idx][pos] == key else None
+
+	def _clear_animation(self) -> None:
+		self._anim_steps = []
+		self._anim_source = None
+		self._anim_index = 0
+		self._anim_running = False
+
+	def _search_result_only(self, key: int) -> None:
+		"""Búsqueda sin animación: el mismo resultado, sin construir los pasos"""
+		self._clear_animation()
+		encontrado = self._locate(key)
+		if encontrado is None:
+			self.status.configure(text=f"Registro {key} no encontrado")
+			self._draw()
+			messagebox.showwarning("⚠️ No Encontrado", "El registro NO se encuentra en la estructura")
+			return
+		block_idx, pos = encontrado
+		self._highlight_block = block_idx
+		self._highlight_position = pos
+		self.status.configure(text=f"¡Encontrado! {key} en bloque {block_idx}, posición {pos}")
 		self._draw()
+		messagebox.showwarning("✅ ¡ENCONTRADO!", f"Registro encontrado en:\n\n   📦 Bloque: {block_idx + 1}\n   📍 Posición: {pos}")
+
+	def _delete_result_only(self, key: int) -> None:
+		"""Eliminación sin animación"""
+		self._clear_animation()
+		encontrado = self._locate(key)
+		if encontrado is None:
+			self.status.configure(text=f"Registro {key} no encontrado")
+			messagebox.showwarning("⚠️ No Encontrado", "El registro NO se encuentra en la estructura")
+			return
+		self._perform_delete(*encontrado)
 
 	def _prepare_animation(self) -> None:
 		self._anim_index = 0
 		self._anim_running = False
-		self.status.configure(text=f"Animación lista: {len(self._anim_steps)} pasos")
+		self.status.configure(text="Animación lista")
 
 	def _anim_step(self) -> None:
-		if self._anim_index >= len(self._anim_steps):
+		step = self._step_at(self._anim_index)
+		if step is None:
 			self._anim_running = False
 			self.status.configure(text="Animación terminada")
 			if self._anim_steps:
@@ -706,7 +814,6 @@ class BloquesBinariaView(ttk.Frame):
 					pos = last_step.get('highlight_position', 0)
 					messagebox.showwarning("✅ ¡ENCONTRADO!", f"Registro encontrado en:\n\n   📦 Bloque: {block_idx + 1}\n   📍 Posición: {pos}")
 			return
-		step = self._anim_steps[self._anim_index]
 		self._highlight_block = step.get('highlight_block')
 		self._highlight_position = step.get('highlight_position')
 		self.status.configure(text=step['message'])
@@ -717,9 +824,9 @@ class BloquesBinariaView(ttk.Frame):
 			self.after(1000, self._anim_step)
 
 	def _on_play(self) -> None:
-		if not self._anim_steps:
+		if not self._anim_steps and self._anim_source is None:
 			return
-		if self._anim_index >= len(self._anim_steps):
+		if self._step_at(self._anim_index) is None:
 			self._anim_index = 0
 		self._anim_running = True
 		self._anim_step()
@@ -792,30 +899,54 @@ class BloquesBinariaView(ttk.Frame):
 			messagebox.showerror("Error", f"No se pudo guardar: {e}")
 
 	def _on_load(self) -> None:
-		self._save_state()
 		path = filedialog.askopenfilename(title="Cargar estructura (binaria)", filetypes=[("Texto", "*.txt")])
 		if not path:
-			if self._history:
-				self._history.pop()
 			return
 		try:
 			with open(path, "r", encoding="utf-8") as f:
 				content = f.read()
 		except Exception as e:
 			messagebox.showerror("Error", f"No se pudo leer: {e}")
-			if self._history:
-				self._history.pop()
 			return
+		anterior = self._capture_state()
 		self.blocks = []
 		success = self._parse(content)
 		if not success:
 			messagebox.showerror("Error", "Formato inválido")
-			if self._history:
-				self._history.pop()
+			self._restore_state(anterior)
 			return
+		self._fences.reconstruir(self.blocks)
+		self._checkpoint(anterior, "cargar")
 		self.status.configure(text="Estructura cargada")
 		self._draw()
 
+	def _on_save_binary(self) -> None:
+		"""Guarda la estructura como archivo binario de bloques y lo asocia a las búsquedas"""
+		path = filedialog.asksaveasfilename(
+			title="Guardar archivo binario de bloques",
+			defaultextension=".blq",
+			filetypes=[("Archivo de bloques", "*.blq")]
+		)
+		if not path or self._file_in_use(path):
+			return
+		try:
+			archivo = BlockFile.crear(path, self.n, self.blocks, max(self.b, len(self.blocks)), self.block_size)
+		except Exception as e:
+			messagebox.showerror("Error", f"No se pudo guardar: {e}")
+			return
+		self._attach_block_file(archivo)
+		self.status.configure(text=f"Archivo binario guardado: {archivo.b} bloques de {archivo.block_size} registros")
+		self._draw()
+
+	def _on_load_binary(self) -> None:
+		"""Carga un archivo binario de bloques (una lectura por bloque) y lo asocia a las búsquedas"""
+		path = filedialog.askopenfilename(
+			title="Cargar archivo binario de bloques",
+			filetypes=[("Archivo de bloques", "*.blq")]
+		)
+		if path:
+			self._load_block_file(path)
+
 	def _draw(self) -> None:
 		self.canvas.delete("all")
 		
@@ -940,8 +1071,21 @@ class BloquesBinariaView(ttk.Frame):
 		
 		# Información adicional
 		info_text = f"n={self.n}, B={self.b}, Tamaño de bloque={self.block_size}"
+		filtros = self._fences.filtros
+		if filtros is not None and filtros.consultas:
+			info_text += (
+				f"\nBloom ({filtros.bits_por_clave} bits/clave, {filtros.num_hashes} hashes): "
+				f"{filtros.lecturas_evitadas} lecturas evitadas, {filtros.falsos_positivos} falsos positivos "
+				f"(tasa {filtros.tasa_falsos_positivos:.1%}, teórica {filtros.tasa_teorica:.1%})"
+			)
+		if self._lecturas_estrategias:
+			info_text += "\nBloques leídos para ubicar el registro: " + ", ".join(
+				f"{estrategia}={lecturas}" for estrategia, lecturas in self._lecturas_estrategias.items()
+			)
+		if self._archivo is not None and self._lecturas_archivo is not None:
+			info_text += f"\nArchivo {os.path.basename(self._archivo.ruta)}: {self._lecturas_archivo} lecturas de bloque en la última búsqueda"
 		self.canvas.create_text(
-			width // 2, height - 30,
+			width // 2, height - 12, anchor="s",
 			text=info_text, fill="#666666", font=("MS Sans Serif", 9)
 		)
 		# Definir región de scroll
@@ -0,0 +1,208 @@
+"""Operaciones compartidas por las vistas de bloques: archivo asociado, deshacer de inserciones y filtros de Bloom."""
+
+import os
+from tkinter import messagebox
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.block_file import BlockFile
+from app.core.block_search import BITS_POR_CLAVE, BloomFilters
+
+
+class BloquesComun:
+	"""
+	Se mezcla con una vista de bloques. La vista define `blocks`, `b`,
+	`block_size`, `_fences`, `_log`, `_archivo`, `_sucios`,
+	`_lecturas_archivo`, `status`, `bloom_var`, `entry_bits` y los métodos
+	`_capture_state`, `_restore_state`, `_checkpoint` y `_draw`
+	"""
+
+	def _log_insert(self, key: int, block_idx: int, pos: int, last_idx: int, nuevo: bool) -> None:
+		"""Inserción con corrimiento: el registro entró en (block_idx, pos) y la cascada llegó a last_idx"""
+		self._marcar_sucios(block_idx, last_idx + 1)
+		self._log.registrar(
+			lambda: self._undo_insert(block_idx, pos, last_idx, nuevo),
+			lambda: self._redo_insert(key, block_idx, pos, last_idx, nuevo),
+			f"insertar {key}"
+		)
+
+	def _undo_insert(self, block_idx: int, pos: int, last_idx: int, nuevo: bool) -> None:
+		"""Quita el registro y devuelve un lugar hacia atrás el corrimiento en cascada"""
+		self._marcar_sucios(block_idx, last_idx + 1)
+		self.blocks[block_idx].pop(pos)
+		for i in range(block_idx + 1, last_idx + 1):
+			self.blocks[i - 1].append(self.blocks[i].pop(0))
+		if nuevo:
+			self.blocks.pop()
+			self._fences.reconstruir(self.blocks)
+			return
+		for i in range(block_idx, last_idx + 1):
+			self._fences.actualizar(self.blocks, i)
+
+	def _redo_insert(self, key: int, block_idx: int, pos: int, last_idx: int, nuevo: bool) -> None:
+		if nuevo:
+			self.blocks.append([])
+		self._marcar_sucios(block_idx, last_idx + 1)
+		self.blocks[block_idx].insert(pos, key)
+		for i in range(block_idx, last_idx):
+			self.blocks[i + 1].insert(0, self.blocks[i].pop())
+		for i in range(block_idx, last_idx + 1):
+			self._fences.actualizar(self.blocks, i)
+
+	def _primer_incompleto(self, largos: List[int], hasta: int) -> int:
+		"""Primer bloque antes de `hasta` con lugar libre; los anteriores no cambian al repartir en bloques llenos"""
+		return next((i for i, largo in enumerate(largos[:hasta]) if largo < self.block_size), hasta)
+
+	def _llenar_bloques(self) -> None:
+		"""Reparte los registros, en orden, en B bloques llenos"""
+		all_elements = [k for block in self.blocks for k in block]
+		self.blocks = [[] for _ in range(self.b)]
+		for i, num in enumerate(all_elements):
+			block_idx_new = min(i // self.block_size, self.b - 1)
+			self.blocks[block_idx_new].append(num)
+		self._fences.reconstruir(self.blocks)
+
+	def _partir(self, registros: List[int], largos: List[int]) -> None:
+		"""Vuelve a partir los registros con los largos de bloque dados"""
+		self.blocks, inicio = [], 0
+		for largo in largos:
+			self.blocks.append(registros[inicio:inicio + largo])
+			inicio += largo
+		self._fences.reconstruir(self.blocks)
+
+	def _repack_without(self, block_idx: int, pos: int) -> None:
+		"""Quita blocks[block_idx][pos] y reparte los registros en B bloques llenos"""
+		desde = self._primer_incompleto([len(block) for block in self.blocks], block_idx)
+		if block_idx < len(self.blocks) and pos < len(self.blocks[block_idx]):
+			self.blocks[block_idx].pop(pos)
+		self._llenar_bloques()
+		# Desde el borrado (o un hueco anterior) cada bloque siguiente cede registros al anterior
+		self._marcar_sucios(desde)
+
+	def _undo_repack(self, key: int, block_idx: int, pos: int, largos: List[int]) -> None:
+		"""Reinserta el registro y vuelve a partir los registros con los largos previos al borrado"""
+		registros = [k for block in self.blocks for k in block]
+		registros.insert(sum(largos[:block_idx]) + pos, key)
+		self._partir(registros, largos)
+		self._marcar_sucios(self._primer_incompleto(largos, block_idx))
+
+	def _ubicar_con_lugar(self, key: int) -> Tuple[int, int]:
+		"""
+		Ubica key con las fence keys para el corrimiento en cascada, que solo
+		avanza. Si desde ese bloque no queda lugar (los huecos quedaron en
+		bloques anteriores tras divisiones/fusiones o al cargar un archivo),
+		antes de correr registros se reparten en bloques llenos
+		"""
+		block_idx, pos = self._fences.ubicar(self.blocks, key)
+		desde = block_idx if block_idx >= 0 else (self._fences.bloques[-1] if self._fences.bloques else 0)
+		if len(self.blocks) < self.b or any(len(block) < self.block_size for block in self.blocks[desde:]):
+			return block_idx, pos
+		largos = [len(block) for block in self.blocks]
+		self._compactar(largos)
+		self._log.registrar(
+			lambda: self._undo_compactar(largos),
+			lambda: self._compactar(largos),
+			"compactar bloques",
+			len(largos)
+		)
+		return self._fences.ubicar(self.blocks, key)
+
+	def _compactar(self, largos: List[int]) -> None:
+		self._llenar_bloques()
+		self._marcar_sucios(self._primer_incompleto(largos, len(largos)))
+
+	def _undo_compactar(self, largos: List[int]) -> None:
+		self._partir([k for block in self.blocks for k in block], largos)
+		self._marcar_sucios(self._primer_incompleto(largos, len(largos)))
+
+	def _on_bloom_toggle(self, event=None) -> None:
+		"""Activa o desactiva los filtros de Bloom (con los bits por clave actuales)"""
+		if self.bloom_var.get():
+			try:
+				bits = int(self.entry_bits.get())
+			except ValueError:
+				bits = BITS_POR_CLAVE
+			self._fences.filtros = BloomFilters(max(1, bits))
+		else:
+			self._fences.filtros = None
+		self._fences.reconstruir(self.blocks)
+		self._draw()
+
+	def _bloom_step(self, block_idx: int, key: int) -> Optional[Dict[str, Any]]:
+		"""Consulta el filtro del bloque; si descarta el registro devuelve el paso final (no se lee el bloque)"""
+		filtros = self._fences.filtros
+		if filtros is None or filtros.consultar(self.blocks, block_idx, key):
+			return None
+		return {
+			'type': 'not_found',
+			'message': f'El filtro de Bloom del bloque {block_idx + 1} descarta {key}: no se lee el bloque',
+			'highlight_block': block_idx,
+			'highlight_position': None
+		}
+
+	def _file_in_use(self, path: str) -> bool:
+		"""Sobrescribir el archivo asociado borraría la estructura que se lee o escribe en él"""
+		if self._archivo is None or os.path.abspath(path) != os.path.abspath(self._archivo.ruta):
+			return False
+		messagebox.showerror("Error", "El archivo está asociado a la estructura actual; elija otro destino")
+		return True
+
+	def _load_block_file(self, path: str) -> None:
+		"""Lee un archivo binario de bloques (una lectura por bloque) y lo asocia a las búsquedas"""
+		try:
+			archivo = BlockFile(path)
+			blocks = list(archivo.bloques())
+		except Exception as e:
+			messagebox.showerror("Error", f"No se pudo leer: {e}")
+			return
+
+		anterior = self._capture_state()
+		self._restore_state((archivo.n, archivo.b, archivo.block_size, blocks))
+		self._checkpoint(anterior, "cargar binario")
+		self._attach_block_file(archivo)
+		self.status.configure(text=f"Archivo cargado: {sum(len(b) for b in blocks)} registros ({archivo.io.lecturas} lecturas de bloque)")
+		self._draw()
+
+	def _attach_block_file(self, archivo: BlockFile) -> None:
+		"""Asocia el archivo binario; su contenido coincide con los bloques actuales"""
+		if self._archivo is not None and self._archivo is not archivo:
+			self._release_block_file(self._capture_state())
+		self._archivo = archivo
+		self._sucios.clear()
+		self._lecturas_archivo = None
+
+	def _marcar_sucios(self, desde: int, hasta: Optional[int] = None) -> None:
+		"""Anota los bloques [desde, hasta) (hasta el último si no se da) para escribirlos en el archivo asociado"""
+		if self._archivo is None:
+			return
+		if hasta is None:
+			hasta = max(len(self.blocks), self._archivo.b)
+		self._sucios.update(range(max(0, desde), hasta))
+
+	def _release_block_file(self, state: tuple) -> None:
+		"""
+		La estructura `state` se reemplaza por otra (punto de control, deshacer
+		o rehacer): el archivo recibe sus cambios pendientes y se desasocia,
+		para no escribir en él una estructura distinta
+		"""
+		if self._archivo is None:
+			return
+		self._sync_block_file(state)
+		self._archivo.cerrar()
+		self._archivo = None
+		self._sucios.clear()
+		self._lecturas_archivo = None
+
+	def _sync_block_file(self, state: Optional[tuple] = None) -> None:
+		"""Escribe en el archivo solo los bloques anotados como modificados desde la última sincronización"""
+		n, b, block_size, blocks = state if state is not None else self._capture_state()
+		archivo = self._archivo
+		if len(blocks) > archivo.b or block_size != archivo.block_size:
+			# Cambió la geometría (n, B o tamaño de bloque): se reescribe completo
+			archivo.cerrar()
+			self._archivo = None
+			self._attach_block_file(BlockFile.crear(archivo.ruta, n, blocks, max(b, len(blocks)), block_size))
+			return
+		for i in sorted(self._sucios):
+			if i < archivo.b:
+				archivo.escribir_bloque(i, blocks[i] if i < len(blocks) else [])
+		self._sucios.clear()
@@ -1,11 +1,23 @@
 import math
+import os
 import random
+from bisect import bisect_left
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
-from typing import List, Optional, Dict, Any
+from tkinter import ttk, messagebox, filedialog, simpledialog
+from typing import List, Optional, Dict, Any, Iterator, Set
 
+from app.core.block_file import BlockFile, BloquesEnArchivo
+from app.core.block_search import BITS_POR_CLAVE, FACTOR_LLENADO, FenceIndex, SplitMergeBlocks
+from app.core.external_sort import REGISTROS_EN_MEMORIA, cargar_bloques
+from app.core.paged_storage import ContadorIO
+from app.core.undo_log import UndoLog
+from app.views.bloques_comun import BloquesComun
 
-class BloquesView(ttk.Frame):
+
+# Bloques que se dibujan a la vez (además del primero y el último)
+BLOQUES_VISIBLES = 20
+
+class BloquesView(BloquesComun, ttk.Frame):
 	def __init__(self, parent: tk.Misc, app) -> None:
 		super().__init__(parent)
 
@@ -40,6 +52,35 @@ class BloquesView(ttk.Frame):
 		btn_gen_struct = ttk.Button(params, text="Generar estructura", command=self._on_generate_structure)
 		btn_gen_struct.grid(row=0, column=7, padx=(0, 6))
 
+		# Inserción por división / borrado por fusión en lugar del corrimiento en cascada
+		self.division_var = tk.BooleanVar(value=False)
+		ttk.Checkbutton(
+			params, text="Dividir/fusionar bloques (sin corrimiento)", variable=self.division_var
+		).grid(row=1, column=0, columnspan=3, sticky="w", pady=(6, 0))
+		lbl_fill = ttk.Label(params, text="Factor de llenado:")
+		lbl_fill.grid(row=1, column=4, sticky="w", padx=(0, 6), pady=(6, 0))
+		self.entry_fill = ttk.Entry(params, width=10)
+		self.entry_fill.insert(0, str(FACTOR_LLENADO))
+		self.entry_fill.grid(row=1, column=5, padx=(0, 16), pady=(6, 0))
+
+		# Filtros de Bloom por bloque: las búsquedas fallidas no leen el bloque
+		self.bloom_var = tk.BooleanVar(value=False)
+		ttk.Checkbutton(
+			params, text="Filtros de Bloom por bloque", variable=self.bloom_var, command=self._on_bloom_toggle
+		).grid(row=2, column=0, columnspan=3, sticky="w", pady=(6, 0))
+		lbl_bits = ttk.Label(params, text="Bits por clave:")
+		lbl_bits.grid(row=2, column=4, sticky="w", padx=(0, 6), pady=(6, 0))
+		self.entry_bits = ttk.Entry(params, width=10)
+		self.entry_bits.insert(0, str(BITS_POR_CLAVE))
+		self.entry_bits.grid(row=2, column=5, padx=(0, 16), pady=(6, 0))
+		self.entry_bits.bind("<Return>", self._on_bloom_toggle)
+
+		# Sin animación la búsqueda va directo al resultado y no arma ningún paso
+		self.result_only_var = tk.BooleanVar(value=False)
+		ttk.Checkbutton(
+			params, text="Solo resultado (sin animación)", variable=self.result_only_var
+		).grid(row=3, column=0, columnspan=3, sticky="w", pady=(6, 0))
+
 		# Panel paralelo
 		panel = ttk.Frame(self, padding=6)
 		panel.pack(fill=tk.BOTH, expand=True)
@@ -86,9 +127,11 @@ class BloquesView(ttk.Frame):
 		# Botón de deshacer
 		btn_undo = ttk.Button(ops, text="↶ Deshacer (Ctrl+Z)", command=self._on_undo)
 		btn_undo.grid(row=15, column=0, pady=2, sticky="ew")
+		btn_redo = ttk.Button(ops, text="↷ Rehacer (Ctrl+Y)", command=self._on_redo)
+		btn_redo.grid(row=16, column=0, pady=2, sticky="ew")
 
 		self.status = ttk.Label(ops, text="Estado: listo")
-		self.status.grid(row=16, column=0, pady=(12, 0), sticky="w")
+		self.status.grid(row=17, column=0, pady=(12, 0), sticky="w")
 
 		viz = ttk.Frame(panel, style="Panel.TFrame", padding=8)
 		viz.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -115,6 +158,16 @@ class BloquesView(ttk.Frame):
 		btn_load = ttk.Button(file_panel, text="Cargar", command=self._on_load)
 		btn_load.grid(row=0, column=2, padx=4, pady=2)
 
+		# Archivo binario de bloques (registros de ancho fijo, E/S real)
+		btn_save_bin = ttk.Button(file_panel, text="Guardar binario", command=self._on_save_binary)
+		btn_save_bin.grid(row=0, column=3, padx=4, pady=2)
+
+		btn_load_bin = ttk.Button(file_panel, text="Cargar binario", command=self._on_load_binary)
+		btn_load_bin.grid(row=0, column=4, padx=4, pady=2)
+
+		btn_bulk = ttk.Button(file_panel, text="Carga masiva…", command=self._on_bulk_load)
+		btn_bulk.grid(row=0, column=5, padx=4, pady=2)
+
 		back = ttk.Button(self, text="← Volver", command=lambda: app.navigate("externas"))
 		back.pack(pady=6)
 
@@ -125,37 +178,101 @@ class BloquesView(ttk.Frame):
 		self.b: int = 4
 		self.block_size: int = 4
 		self.blocks: List[List[int]] = []
+		# Máximo de cada bloque no vacío (ver FenceIndex)
+		self._fences = FenceIndex()
+		# Archivo binario asociado: las búsquedas se repiten sobre él contando lecturas de bloque
+		self._archivo: Optional[BlockFile] = None
+		# Bloques modificados desde la última escritura del archivo
+		self._sucios: Set[int] = set()
+		self._lecturas_archivo: Optional[int] = None
+		# Bloques leídos/escritos al reorganizar (acumulado y última operación)
+		self._io = ContadorIO()
+		self._io_ultima: Optional[tuple[int, int]] = None
 		self._highlight_block: Optional[int] = None
 		self._highlight_position: Optional[int] = None
 		self._current_block: Optional[int] = None
 		self._current_position: Optional[int] = None
 		
-		# Animation
+		# Animation: los pasos se generan al reproducirlos y se guardan para repetirla
 		self._anim_steps: List[Dict[str, Any]] = []
+		self._anim_source: Optional[Iterator[Dict[str, Any]]] = None
+		self._anim_version: int = 0
 		self._anim_index: int = 0
 		self._anim_running: bool = False
 		
-		# Undo mechanism
-		self._history: List[Dict[str, Any]] = []
-		self._max_history = 20
+		# Deshacer/rehacer: registro de operaciones con su inversa
+		self._log = UndoLog()
 		self.bind_all("<Control-z>", self._on_undo)
+		self.bind_all("<Control-y>", self._on_redo)
 
 		self._initialize_blocks()
 		# Esperar un poco antes de dibujar para que el canvas se inicialice correctamente
 		self.after(100, self._draw)
 
-	def _save_state(self) -> None:
-		"""Guarda el estado actual en el historial"""
-		current_state = {
-			'n': self.n,
-			'b': self.b,
-			'block_size': self.block_size,
-			'blocks': [block[:] for block in self.blocks]  # Deep copy
-		}
-		self._history.append(current_state)
-		
-		if len(self._history) > self._max_history:
-			self._history.pop(0)
+	def _capture_state(self) -> tuple:
+		"""Estructura actual por referencia: los puntos de control la reemplazan, no la modifican"""
+		return self.n, self.b, self.block_size, self.blocks
+
+	def _restore_state(self, state: tuple) -> None:
+		self.n, self.b, self.block_size, self.blocks = state
+		self.entry_n.delete(0, tk.END)
+		self.entry_n.insert(0, str(self.n))
+		self.lbl_b_value.configure(text=str(self.b))
+		self._fences.reconstruir(self.blocks)
+
+	def _checkpoint(self, anterior: tuple, descripcion: str) -> None:
+		"""Registra una operación que reemplazó la estructura completa"""
+		self._release_block_file(anterior)
+		bloques = anterior[3]
+		# Una estructura paginada desde su archivo no guarda registros en memoria
+		costo = len(bloques) if isinstance(bloques, BloquesEnArchivo) else sum(len(block) for block in bloques)
+		self._log.checkpoint(anterior, self._capture_state, self._restore_checkpoint, descripcion, costo)
+
+	def _restore_checkpoint(self, state: tuple) -> None:
+		"""Deshacer/rehacer un punto de control: el archivo asociado refleja la estructura que se reemplaza"""
+		self._release_block_file(self._capture_state())
+		bloques = state[3]
+		if isinstance(bloques, BloquesEnArchivo):
+			bloques.reabrir()
+		self._restore_state(state)
+		if isinstance(bloques, BloquesEnArchivo):
+			self._attach_block_file(bloques.archivo)
+
+	def _paged(self) -> bool:
+		"""La estructura se lee por páginas desde el archivo de una carga masiva: no se modifica"""
+		if not isinstance(self.blocks, BloquesEnArchivo):
+			return False
+		self.status.configure(text="La estructura se lee desde el archivo de la carga masiva; use 'Cargar binario' para modificarla")
+		return True
+
+	def _log_split_merge(self, reorganizador: SplitMergeBlocks, descripcion: str) -> None:
+		"""División/fusión: se deshace con la operación opuesta sobre los mismos bloques"""
+		cambio = reorganizador.cambio
+		repetir = SplitMergeBlocks(reorganizador.block_size, reorganizador.factor_llenado, reorganizador.bloques_minimos)
+		self._marcar_cambio(cambio)
+		self._log.registrar(
+			lambda: self._undo_split_merge(cambio),
+			lambda: self._redo_split_merge(repetir, cambio),
+			descripcion
+		)
+
+	def _undo_split_merge(self, cambio: tuple) -> None:
+		self._marcar_cambio(cambio)
+		SplitMergeBlocks.revertir(self.blocks, self._fences, cambio)
+
+	def _redo_split_merge(self, repetir: SplitMergeBlocks, cambio: tuple) -> None:
+		self._marcar_cambio(cambio)
+		repetir.repetir(self.blocks, self._fences, cambio)
+
+	def _marcar_cambio(self, cambio: tuple) -> None:
+		"""Bloques que toca una división/fusión; si cambia la cantidad de bloques, se corren todos los siguientes"""
+		operacion, idx, _, _, ajuste = cambio
+		if ajuste is None:
+			self._marcar_sucios(idx, idx + 1)
+		elif ajuste[0] == "redistribuir":
+			self._marcar_sucios(ajuste[1], ajuste[1] + 2)
+		else:
+			self._marcar_sucios(idx if operacion == "insertar" else ajuste[1])
 
 	def _on_n_change(self, event=None) -> None:
 		"""Actualiza B cuando cambia n"""
@@ -185,6 +302,23 @@ class BloquesView(ttk.Frame):
 		
 		return n, b, digits
 
+	def _read_fill_factor(self) -> float:
+		"""Fracción del bloque que conserva al dividirse (0.1 a 1.0)"""
+		try:
+			factor = float(self.entry_fill.get())
+		except ValueError:
+			factor = FACTOR_LLENADO
+		return min(1.0, max(0.1, factor))
+
+	def _split_merge(self) -> SplitMergeBlocks:
+		"""Reorganizador por división/fusión con los parámetros actuales"""
+		return SplitMergeBlocks(self.block_size, self._read_fill_factor(), self.b, self._io)
+
+	def _count_io(self, antes: ContadorIO) -> str:
+		"""Registra la E/S de la última operación y la devuelve como texto"""
+		self._io_ultima = (self._io.lecturas - antes.lecturas, self._io.escrituras - antes.escrituras)
+		return f" ({self._io_ultima[0]} bloques leídos, {self._io_ultima[1]} escritos)"
+
 	def _validate_key(self, key_str: str, digits: int) -> Optional[int]:
 		"""Valida una registro numérico con exactamente el número de dígitos especificado"""
 		if not key_str.isdigit():
@@ -200,6 +334,9 @@ class BloquesView(ttk.Frame):
 		self.n, self.b, _ = self._read_params()
 		self.block_size = math.ceil(self.n / self.b) if self.b > 0 else self.n
 		self.blocks = [[] for _ in range(self.b)]
+		self._fences.reconstruir(self.blocks)
+		self._io = ContadorIO()
+		self._io_ultima = None
 		self._highlight_block = None
 		self._highlight_position = None
 		self._current_block = None
@@ -207,7 +344,7 @@ class BloquesView(ttk.Frame):
 
 	def _on_generate(self) -> None:
 		"""Genera datos aleatorios completos con exactamente el número de dígitos especificado"""
-		self._save_state()
+		anterior = self._capture_state()
 		
 		n, b, digits = self._read_params()
 		self.n, self.b = n, b
@@ -231,236 +368,274 @@ class BloquesView(ttk.Frame):
 			block_idx = min(i // self.block_size, b - 1)
 			self.blocks[block_idx].append(num)
 		
+		self._fences.reconstruir(self.blocks)
+		self._checkpoint(anterior, "generar datos")
 		self.status.configure(text=f"Generados {len(numbers)} registros en {b} bloques")
 		self._draw()
 
 	def _on_generate_structure(self) -> None:
 		"""Genera/Regenera la estructura vacía con n, B y tamaño de bloque calculados"""
-		self._save_state()
+		anterior = self._capture_state()
 		n, b, _ = self._read_params()
 		self.n, self.b = n, b
 		self.block_size = math.ceil(n / b) if b > 0 else n
 		self.blocks = [[] for _ in range(b)]
+		self._fences.reconstruir(self.blocks)
+		self._checkpoint(anterior, "generar estructura")
 		self.status.configure(text=f"Estructura generada (vacía): n={n}, B={b}, tamaño de bloque={self.block_size}")
 		self._draw()
 
 
 	def _key_exists(self, key: int) -> bool:
 		"""Verifica si el registro ya existe en la estructura"""
-		for block in self.blocks:
-			if key in block:
-				return True
-		return False
+		# Fence keys: bisect para ubicar el bloque y bisect dentro de él
+		return self._fences.contiene(self.blocks, key)
 
 	def _on_insert(self) -> None:
 		"""Inserte  un registro manteniendo el orden"""
+		if self._paged():
+			return
 		_, _, digits = self._read_params()
 		key_str = self.entry_key.get().strip()
 		key = self._validate_key(key_str, digits)
 		if key is None:
 			return
-		
+		# Solo las inserciones aceptadas van a la traza (no duplicados ni estructura llena)
+		if self._insertar(key):
+			self.app.traza.registrar("insertar", key)
+
+	def _insertar(self, key: int) -> bool:
+		"""Inserta key; devuelve False si se rechaza (duplicado o sin espacio)."""
 		# Verificar si la clave ya existe
 		if self._key_exists(key):
 			messagebox.showwarning("Registro duplicado", f" El registro {key} ya existe en la estructura. No se permiten registros repetidos.")
-			return
-		
-		self._save_state()
+			return False
 		
 		# Verificar si hay espacio total disponible
 		total_elements = sum(len(block) for block in self.blocks)
 		if total_elements >= self.n:
 			messagebox.showerror("Error", "La estructura está llena")
-			return
-		
-		# Encontrar la posición correcta en toda la estructura (como lista continua)
-		insert_position = 0
-		for block_idx, block in enumerate(self.blocks):
-			for pos, value in enumerate(block):
-				if key <= value:
-					# Encontramos la posición correcta
-					insert_block_idx = block_idx
-					insert_pos = pos
-					
-					# Insertar en la posición correcta
-					block.insert(insert_pos, key)
-					
-					# Si el bloque se desborda, desplazar elementos hacia adelante
-					if len(block) > self.block_size:
-						# El último elemento debe moverse al siguiente bloque
-						overflow_element = block.pop()
-						
-						# Buscar el siguiente bloque con espacio
-						next_block_idx = insert_block_idx + 1
-						while next_block_idx < len(self.blocks):
-							if len(self.blocks[next_block_idx]) < self.block_size:
-								# Insertar al inicio del siguiente bloque
-								self.blocks[next_block_idx].insert(0, overflow_element)
-								break
-							else:
-								# Este bloque también está lleno, desplazar su último elemento
-								next_overflow = self.blocks[next_block_idx].pop()
-								self.blocks[next_block_idx].insert(0, overflow_element)
-								overflow_element = next_overflow
-								next_block_idx += 1
-						else:
-							# No hay más bloques, crear uno nuevo si es posible
-							if len(self.blocks) < self.b:
-								self.blocks.append([overflow_element])
-							else:
-								# No se puede insertar más
-								messagebox.showerror("Error", "No hay espacio disponible")
-								return
-					
-					self.status.configure(text=f"Insertado registro {key} en bloque {insert_block_idx}")
-					self.entry_key.delete(0, tk.END)
-					self._draw()
-					return
-				insert_position += 1
-			insert_position += len(block)
+			return False
+
+		antes = self._io.copia()
+		if self.division_var.get():
+			# A lo sumo dos bloques reescritos: el destino y, si se divide, el nuevo
+			reorganizador = self._split_merge()
+			block_idx = reorganizador.insertar(self.blocks, self._fences, key)
+			self._log_split_merge(reorganizador, f"insertar {key}")
+			self.status.configure(text=f"Insertado registro {key} en bloque {block_idx}" + self._count_io(antes))
+			self.entry_key.delete(0, tk.END)
+			self._draw()
+			return True
 		
-		# Si llegamos aquí, el valor va al final
-		# Buscar el último bloque con espacio
-		for block_idx in range(len(self.blocks)):
+		# Ubicar bloque y posición con las fence keys (bisect) sin recorrer los registros
+		insert_block_idx, insert_pos = self._ubicar_con_lugar(key)
+		if insert_block_idx >= 0:
+			block = self.blocks[insert_block_idx]
+			block.insert(insert_pos, key)
+			last_block_idx = insert_block_idx
+
+			# Si el bloque se desborda, desplazar elementos hacia adelante
+			if len(block) > self.block_size:
+				# El último elemento debe moverse al siguiente bloque
+				overflow_element = block.pop()
+
+				# Buscar el siguiente bloque con espacio
+				next_block_idx = insert_block_idx + 1
+				nuevo = False
+				while next_block_idx < len(self.blocks):
+					if len(self.blocks[next_block_idx]) < self.block_size:
+						# Insertar al inicio del siguiente bloque
+						self.blocks[next_block_idx].insert(0, overflow_element)
+						break
+					else:
+						# Este bloque también está lleno, desplazar su último elemento
+						next_overflow = self.blocks[next_block_idx].pop()
+						self.blocks[next_block_idx].insert(0, overflow_element)
+						overflow_element = next_overflow
+						next_block_idx += 1
+				else:
+					# No hay más bloques: _ubicar_con_lugar ya confirmó que cabe uno nuevo
+					self.blocks.append([overflow_element])
+					next_block_idx = len(self.blocks) - 1
+					nuevo = True
+				last_block_idx = next_block_idx
+				self._log_insert(key, insert_block_idx, insert_pos, last_block_idx, nuevo)
+			else:
+				self._log_insert(key, insert_block_idx, insert_pos, insert_block_idx, False)
+
+			# Solo cambian las fence keys de los bloques tocados
+			for block_idx in range(insert_block_idx, last_block_idx + 1):
+				self._fences.actualizar(self.blocks, block_idx)
+			# Cada bloque de la cascada se lee y se reescribe
+			self._io.lecturas += last_block_idx - insert_block_idx + 1
+			self._io.escrituras += last_block_idx - insert_block_idx + 1
+
+			self.status.configure(text=f"Insertado registro {key} en bloque {insert_block_idx}" + self._count_io(antes))
+			self.entry_key.delete(0, tk.END)
+			self._draw()
+			return True
+
+		# Si llegamos aquí, el valor va al final: en el último bloque con datos
+		# o en uno vacío posterior. Si tras divisiones/fusiones solo quedaba
+		# lugar en bloques anteriores, _ubicar_con_lugar ya los repartió
+		ultimo = self._fences.bloques[-1] if self._fences.bloques else 0
+		for block_idx in range(ultimo, len(self.blocks)):
 			if len(self.blocks[block_idx]) < self.block_size:
 				self.blocks[block_idx].append(key)
-				self.status.configure(text=f"Insertado registro {key} en bloque {block_idx}")
+				self._fences.actualizar(self.blocks, block_idx)
+				self._log_insert(key, block_idx, len(self.blocks[block_idx]) - 1, block_idx, False)
+				self._io.lecturas += 1
+				self._io.escrituras += 1
+				self.status.configure(text=f"Insertado registro {key} en bloque {block_idx}" + self._count_io(antes))
 				self.entry_key.delete(0, tk.END)
 				self._draw()
-				return
+				return True
 		
 		# Si no hay espacio en ningún bloque existente, crear uno nuevo
 		if len(self.blocks) < self.b:
 			self.blocks.append([key])
-			self.status.configure(text=f"Insertado registro {key} en nuevo bloque {len(self.blocks)-1}")
+			self._fences.actualizar(self.blocks, len(self.blocks) - 1)
+			self._log_insert(key, len(self.blocks) - 1, 0, len(self.blocks) - 1, True)
+			self._io.escrituras += 1
+			self.status.configure(text=f"Insertado registro {key} en nuevo bloque {len(self.blocks)-1}" + self._count_io(antes))
 		else:
 			messagebox.showerror("Error", "No hay espacio disponible")
-			return
+			return False
 		
 		self.entry_key.delete(0, tk.END)
 		self._draw()
+		return True
 
 	def _on_delete(self) -> None:
 		"""Elimina un registro con animación de búsqueda lineal"""
+		if self._paged():
+			return
 		_, _, digits = self._read_params()
 		key_str = self.entry_key.get().strip()
 		key = self._validate_key(key_str, digits)
 		if key is None:
 			return
-		
-		self._save_state()
+		self.app.traza.registrar("eliminar", key)
 		
 		# Preparar animación de búsqueda lineal para eliminar
-		self._anim_steps = []
 		self._highlight_block = None
 		self._highlight_position = None
 		self._delete_key = key  # Guardar la clave a eliminar
+		if self.result_only_var.get():
+			self._delete_result_only(key)
+			return
 		self._delete_mode = True  # Indicar modo eliminación
 		
-		self._search_sequential_blocks_for_delete(key)
+		self._start_steps(self._search_sequential_blocks_for_delete(key))
 		
 		self._prepare_animation()
-		if self._anim_steps:
+		if self._step_at(0) is not None:
 			self._anim_index = 0
 			self._anim_running = True
 			self._anim_step_delete()
 	
-	def _search_sequential_blocks_for_delete(self, key: int) -> None:
+	def _search_sequential_blocks_for_delete(self, key: int) -> Iterator[Dict[str, Any]]:
 		"""Búsqueda secuencial entre bloques para eliminar"""
-		self._anim_steps.append({
+		yield {
 			'type': 'start',
 			'message': f'Buscando registro {key} para eliminar...',
 			'highlight_block': None,
 			'highlight_position': None
-		})
+		}
 		
 		for block_idx in range(len(self.blocks)):
 			if not self.blocks[block_idx]:
 				continue
 			
-			self._anim_steps.append({
+			yield {
 				'type': 'check_block',
 				'message': f'Evaluando bloque {block_idx + 1}',
 				'highlight_block': block_idx,
 				'highlight_position': None
-			})
+			}
 			
 			last_element = self.blocks[block_idx][-1]
 			
-			self._anim_steps.append({
+			yield {
 				'type': 'compare',
 				'message': f'¿{key} ≤ {last_element}? (último elemento del bloque {block_idx + 1})',
 				'highlight_block': block_idx,
 				'highlight_position': len(self.blocks[block_idx]) - 1,
 				'comparing': True
-			})
+			}
 			
 			if key <= last_element:
-				self._anim_steps.append({
+				yield {
 					'type': 'decision',
 					'message': f'Sí, {key} ≤ {last_element}. Buscar en este bloque',
 					'highlight_block': block_idx,
 					'highlight_position': len(self.blocks[block_idx]) - 1
-				})
-				self._search_within_block_for_delete(block_idx, key)
+				}
+				yield from self._search_within_block_for_delete(block_idx, key)
 				return
 			else:
-				self._anim_steps.append({
+				yield {
 					'type': 'decision',
 					'message': f'No, {key} > {last_element}. Continuar con siguiente bloque',
 					'highlight_block': block_idx,
 					'highlight_position': len(self.blocks[block_idx]) - 1
-				})
+				}
 		
-		self._anim_steps.append({
+		yield {
 			'type': 'not_found',
 			'message': 'Registro no encontrado',
 			'highlight_block': None,
 			'highlight_position': None
-		})
+		}
 	
-	def _search_within_block_for_delete(self, block_idx: int, key: int) -> None:
+	def _search_within_block_for_delete(self, block_idx: int, key: int) -> Iterator[Dict[str, Any]]:
 		"""Búsqueda lineal dentro del bloque para eliminar"""
-		self._anim_steps.append({
+		descarte = self._bloom_step(block_idx, key)
+		if descarte is not None:
+			yield descarte
+			return
+		yield {
 			'type': 'block_search_start',
 			'message': f'Buscando en bloque {block_idx + 1}...',
 			'highlight_block': block_idx,
 			'highlight_position': None
-		})
+		}
 		
 		block = self.blocks[block_idx]
 		for pos, value in enumerate(block):
-			self._anim_steps.append({
+			yield {
 				'type': 'linear_check',
 				'message': f'Comparando {key} con {value} en posición {pos}',
 				'highlight_block': block_idx,
 				'highlight_position': pos,
 				'comparing': True
-			})
+			}
 			
 			if value == key:
-				self._anim_steps.append({
+				yield {
 					'type': 'found_delete',
 					'message': f'¡Encontrado! Eliminando {key} del bloque {block_idx + 1}',
 					'highlight_block': block_idx,
 					'highlight_position': pos,
 					'delete_block': block_idx,
 					'delete_pos': pos
-				})
+				}
 				return
 			elif value > key:
 				break
 		
-		self._anim_steps.append({
+		yield {
 			'type': 'not_found',
 			'message': f'Registro {key} no encontrado',
 			'highlight_block': block_idx,
 			'highlight_position': None
-		})
+		}
 	
 	def _anim_step_delete(self) -> None:
 		"""Ejecuta un paso de la animación de eliminación"""
-		if self._anim_index >= len(self._anim_steps):
+		step = self._step_at(self._anim_index)
+		if step is None:
 			self._anim_running = False
 			self._delete_mode = False
 			if self._anim_steps:
@@ -469,7 +644,6 @@ class BloquesView(ttk.Frame):
 					messagebox.showwarning("⚠️ No Encontrado", "El registro NO se encuentra en la estructura")
 			return
 		
-		step = self._anim_steps[self._anim_index]
 		self._highlight_block = step.get('highlight_block')
 		self._highlight_position = step.get('highlight_position')
 		
@@ -490,25 +664,36 @@ class BloquesView(ttk.Frame):
 	def _perform_delete(self, block_idx: int, pos: int) -> None:
 		"""Realiza la eliminación después de la animación"""
 		key = self._delete_key
-		
-		# Eliminar el elemento
-		if block_idx < len(self.blocks) and pos < len(self.blocks[block_idx]):
-			self.blocks[block_idx].pop(pos)
-		
-		# Reorganizar elementos
-		all_elements = []
-		for b in self.blocks:
-			all_elements.extend(b)
-		
-		self.blocks = [[] for _ in range(self.b)]
-		for i, num in enumerate(all_elements):
-			block_idx_new = min(i // self.block_size, self.b - 1)
-			self.blocks[block_idx_new].append(num)
+		antes = self._io.copia()
+
+		if self.division_var.get():
+			# Si el bloque queda corto se fusiona o redistribuye con un vecino
+			reorganizador = self._split_merge()
+			reorganizador.eliminar(self.blocks, self._fences, block_idx, pos)
+			self._log_split_merge(reorganizador, f"eliminar {key}")
+		else:
+			previos = [block[:] for block in self.blocks]
+			# Para deshacer alcanza con el largo de cada bloque antes de reorganizar
+			largos = [len(block) for block in previos]
+			self._repack_without(block_idx, pos)
+			self._log.registrar(
+				lambda: self._undo_repack(key, block_idx, pos, largos),
+				lambda: self._repack_without(block_idx, pos),
+				f"eliminar {key}",
+				len(largos)
+			)
+
+			# Se leen los bloques desde el borrado hasta el último con datos y se reescriben los que cambian
+			self._io.lecturas += sum(1 for i in range(block_idx, len(previos)) if previos[i])
+			self._io.escrituras += sum(
+				1 for i in range(max(len(previos), len(self.blocks)))
+				if (previos[i] if i < len(previos) else []) != (self.blocks[i] if i < len(self.blocks) else [])
+			)
 		
 		self._highlight_block = None
 		self._highlight_position = None
 		self._delete_mode = False
-		self.status.configure(text=f"Eliminado registro {key}")
+		self.status.configure(text=f"Eliminado registro {key}" + self._count_io(antes))
 		self.entry_key.delete(0, tk.END)
 		self._draw()
 		messagebox.showwarning("✅ ¡ELIMINADO!", f"Registro {key} eliminado correctamente\n\n🗑️ La estructura ha sido reorganizada")
@@ -520,28 +705,36 @@ class BloquesView(ttk.Frame):
 		key = self._validate_key(key_str, digits)
 		if key is None:
 			return
+		self.app.traza.registrar("buscar", key)
 		
 		# Búsqueda lineal fija (externas - Lineal)
-		self._anim_steps = []
 		self._highlight_block = None
 		self._highlight_position = None
-		self._search_sequential_blocks(key)
+		if self._archivo is not None:
+			# La misma búsqueda sobre el archivo binario, contando lecturas reales de bloque
+			self._sync_block_file()
+			self._archivo.buscar(key, binaria=False)
+			self._lecturas_archivo = self._archivo.ultimas_lecturas
+		if self.result_only_var.get():
+			self._search_result_only(key)
+			return
+		self._start_steps(self._search_sequential_blocks(key))
 		
 		self._prepare_animation()
 		# Iniciar la animación automáticamente
-		if self._anim_steps:
+		if self._step_at(0) is not None:
 			self._anim_index = 0
 			self._anim_running = True
 			self._anim_step()
 
-	def _search_binary_blocks(self, key: int) -> None:
+	def _search_binary_blocks(self, key: int) -> Iterator[Dict[str, Any]]:
 		"""Búsqueda binaria entre bloques"""
-		self._anim_steps.append({
+		yield {
 			'type': 'start',
 			'message': f'Iniciando búsqueda binaria de {key}',
 			'highlight_block': None,
 			'highlight_position': None
-		})
+		}
 		
 		left, right = 0, len(self.blocks) - 1
 		target_block = -1
@@ -550,7 +743,7 @@ class BloquesView(ttk.Frame):
 			mid = (left + right) // 2
 			
 			# Mostrar bloque actual siendo evaluado
-			self._anim_steps.append({
+			yield {
 				'type': 'check_block',
 				'message': f'Evaluando bloque {mid}',
 				'highlight_block': mid,
@@ -558,7 +751,7 @@ class BloquesView(ttk.Frame):
 				'left': left,
 				'right': right,
 				'mid': mid
-			})
+			}
 			
 			if not self.blocks[mid]:
 				right = mid - 1
@@ -567,142 +760,148 @@ class BloquesView(ttk.Frame):
 			last_element = self.blocks[mid][-1]
 			
 			# Mostrar comparación con último elemento
-			self._anim_steps.append({
+			yield {
 				'type': 'compare',
 				'message': f'¿{key} ≤ {last_element}? (último elemento del bloque {mid})',
 				'highlight_block': mid,
 				'highlight_position': len(self.blocks[mid]) - 1,
 				'comparing': True
-			})
+			}
 			
 			if key <= last_element:
 				target_block = mid
 				right = mid - 1
-				self._anim_steps.append({
+				yield {
 					'type': 'decision',
 					'message': f'Sí, {key} ≤ {last_element}. El bloque podría estar aquí o a la izquierda',
 					'highlight_block': mid,
 					'highlight_position': len(self.blocks[mid]) - 1
-				})
+				}
 			else:
 				left = mid + 1
-				self._anim_steps.append({
+				yield {
 					'type': 'decision',
 					'message': f'No, {key} > {last_element}. Buscar en bloques de la derecha',
 					'highlight_block': mid,
 					'highlight_position': len(self.blocks[mid]) - 1
-				})
+				}
 		
 		if target_block >= 0:
-			self._search_within_block(target_block, key)
+			yield from self._search_within_block(target_block, key)
 		else:
-			self._anim_steps.append({
+			yield {
 				'type': 'not_found',
 				'message': 'Valor no encontrado en ningún bloque',
 				'highlight_block': None,
 				'highlight_position': None
-			})
+			}
 
-	def _search_sequential_blocks(self, key: int) -> None:
+	def _search_sequential_blocks(self, key: int) -> Iterator[Dict[str, Any]]:
 		"""Búsqueda secuencial entre bloques"""
-		self._anim_steps.append({
+		yield {
 			'type': 'start',
 			'message': f'Iniciando búsqueda secuencial de {key}',
 			'highlight_block': None,
 			'highlight_position': None
-		})
+		}
 		
 		for block_idx in range(len(self.blocks)):
 			if not self.blocks[block_idx]:
 				continue
 			
 			# Mostrar bloque actual
-			self._anim_steps.append({
+			yield {
 				'type': 'check_block',
 				'message': f'Evaluando bloque {block_idx}',
 				'highlight_block': block_idx,
 				'highlight_position': None
-			})
+			}
 			
 			last_element = self.blocks[block_idx][-1]
 			
 			# Mostrar comparación
-			self._anim_steps.append({
+			yield {
 				'type': 'compare',
 				'message': f'¿{key} ≤ {last_element}? (último elemento del bloque {block_idx})',
 				'highlight_block': block_idx,
 				'highlight_position': len(self.blocks[block_idx]) - 1,
 				'comparing': True
-			})
+			}
 			
 			if key <= last_element:
-				self._anim_steps.append({
+				yield {
 					'type': 'decision',
 					'message': f'Sí, {key} ≤ {last_element}. Buscar en este bloque',
 					'highlight_block': block_idx,
 					'highlight_position': len(self.blocks[block_idx]) - 1
-				})
-				self._search_within_block(block_idx, key)
+				}
+				yield from self._search_within_block(block_idx, key)
 				return
 			else:
-				self._anim_steps.append({
+				yield {
 					'type': 'decision',
 					'message': f'No, {key} > {last_element}. Continuar con siguiente bloque',
 					'highlight_block': block_idx,
 					'highlight_position': len(self.blocks[block_idx]) - 1
-				})
+				}
 		
-		self._anim_steps.append({
+		yield {
 			'type': 'not_found',
 			'message': 'Valor no encontrado en ningún bloque',
 			'highlight_block': None,
 			'highlight_position': None
-		})
+		}
 
-	def _search_within_block(self, block_idx: int, key: int) -> None:
+	def _search_within_block(self, block_idx: int, key: int) -> Iterator[Dict[str, Any]]:
 		"""Búsqueda lineal dentro del bloque"""
-		self._anim_steps.append({
+		descarte = self._bloom_step(block_idx, key)
+		if descarte is not None:
+			yield descarte
+			return
+		yield {
 			'type': 'block_search_start',
 			'message': f'Iniciando búsqueda lineal en bloque {block_idx}',
 			'highlight_block': block_idx,
 			'highlight_position': None
-		})
+		}
 		
 		block = self.blocks[block_idx]
 		for pos, value in enumerate(block):
-			self._anim_steps.append({
+			yield {
 				'type': 'linear_check',
 				'message': f'Comparando {key} con {value} en posición {pos}',
 				'highlight_block': block_idx,
 				'highlight_position': pos,
 				'comparing': True
-			})
+			}
 			
 			if value == key:
-				self._anim_steps.append({
+				yield {
 					'type': 'found',
 					'message': f'¡Encontrado! {key} en bloque {block_idx}, posición {pos}',
 					'highlight_block': block_idx,
 					'highlight_position': pos
-				})
+				}
 				return
 			elif value > key:
 				break
 		
-		self._anim_steps.append({
+		yield {
 			'type': 'not_found',
 			'message': f'Valor {key} no encontrado en bloque {block_idx}',
 			'highlight_block': block_idx,
 			'highlight_position': None
-		})
+		}
 
 	def _on_rebuild_structure(self) -> None:
 		"""Regenera la estructura con los parámetros actuales manteniendo los datos"""
+		if self._paged():
+			return
 		if not any(self.blocks):  # Si no hay datos
 			messagebox.showinfo("Información", "No hay datos para reorganizar. Use 'Generar datos' primero.")
 			return
 		
-		self._save_state()
+		anterior = self._capture_state()
 		
 		# Recopilar todos los datos actuales
 		all_data = []
@@ -726,13 +925,16 @@ class BloquesView(ttk.Frame):
 			block_idx = min(i // self.block_size, b - 1)
 			self.blocks[block_idx].append(num)
 		
+		self._fences.reconstruir(self.blocks)
+		self._checkpoint(anterior, "reorganizar")
 		self.status.configure(text=f"Estructura reorganizada: {len(all_data)} elementos en {b} bloques")
 		self._draw()
 
 	def _on_reset(self) -> None:
 		"""Reinicia la estructura"""
-		self._save_state()
+		anterior = self._capture_state()
 		self._initialize_blocks()
+		self._checkpoint(anterior, "reiniciar")
 		self.status.configure(text="Estructura reiniciada")
 		self._draw()
 
@@ -741,40 +943,109 @@ class BloquesView(ttk.Frame):
 		if not any(self.blocks):
 			self.status.configure(text="Estructura ya vacía")
 			return
-		self._save_state()
+		anterior = self._capture_state()
 		self.blocks = [[] for _ in range(self.b)]
+		self._fences.reconstruir(self.blocks)
+		self._checkpoint(anterior, "borrar")
 		self.status.configure(text="Estructura borrada")
 		self._draw()
 
 	def _on_undo(self, event=None) -> None:
 		"""Deshace la última operación"""
-		if not self._history:
+		descripcion = self._log.deshacer()
+		if descripcion is None:
 			self.status.configure(text="No hay operaciones para deshacer")
 			messagebox.showinfo("Deshacer", "No hay operaciones para deshacer")
 			return
-		
-		last_state = self._history.pop()
-		self.n = last_state['n']
-		self.b = last_state['b']
-		self.block_size = last_state['block_size']
-		self.blocks = last_state['blocks']
-		
-		self.entry_n.delete(0, tk.END)
-		self.entry_n.insert(0, str(self.n))
-		self.lbl_b_value.configure(text=str(self.b))
-		
-		self.status.configure(text=f"Operación deshecha. Estados restantes: {len(self._history)}")
+		self._after_history(f"Deshecho: {descripcion}")
+
+	def _on_redo(self, event=None) -> None:
+		"""Rehace la última operación deshecha"""
+		descripcion = self._log.rehacer()
+		if descripcion is None:
+			self.status.configure(text="No hay operaciones para rehacer")
+			return
+		self._after_history(f"Rehecho: {descripcion}")
+
+	def _after_history(self, texto: str) -> None:
+		self._highlight_block = None
+		self._highlight_position = None
+		self._io_ultima = None
+		self.status.configure(text=f"{texto}. Deshacer: {len(self._log)}, rehacer: {self._log.pendientes_rehacer}")
 		self._draw()
 
+	def _start_steps(self, pasos: Iterator[Dict[str, Any]]) -> None:
+		"""Nueva animación: los pasos de la búsqueda se piden de a uno"""
+		self._anim_steps = []
+		self._anim_source = pasos
+		self._anim_version = self._log.version
+
+	def _step_at(self, index: int) -> Optional[Dict[str, Any]]:
+		"""Paso index de la animación (None al terminar), generándolo si todavía no se pidió"""
+		while index >= len(self._anim_steps) and self._anim_source is not None:
+			paso = None
+			# Si la estructura cambió, los pasos que faltan ya no corresponden a ella
+			if self._anim_version == self._log.version:
+				paso = next(self._anim_source, None)
+			if paso is None:
+				self._anim_source = None
+			else:
+				self._anim_steps.append(paso)
+		return self._anim_steps[index] if index < len(self._anim_steps) else None
+
+	def _locate(self, key: int) -> Optional[tuple[int, int]]:
+		"""(bloque, posición) de key sobre las fence keys, sin pasos; None si no está"""
+		block_idx = self._fences.bloque_de(key)
+		if block_idx < 0:
+			return None
+		filtros = self._fences.filtros
+		if filtros is not None and not filtros.consultar(self.blocks, block_idx, key):
+			return None
+		pos = bisect_left(self.blocks[block_idx], key)
+		return (block_idx, pos) if self.blocks[block_idx][pos] == key else None
+
+	def _clear_animation(self) -> None:
+		self._anim_steps = []
+		self._anim_source = None
+		self._anim_index = 0
+		self._anim_running = False
+
+	def _search_result_only(self, key: int) -> None:
+		"""Búsqueda sin animación: el mismo resultado, sin construir los pasos"""
+		self._clear_animation()
+		encontrado = self._locate(key)
+		if encontrado is None:
+			self.status.configure(text=f"Registro {key} no encontrado")
+			self._draw()
+			messagebox.showwarning("⚠️ No Encontrado", "El registro NO se encuentra en la estructura")
+			return
+		block_idx, pos = encontrado
+		self._highlight_block = block_idx
+		self._highlight_position = pos
+		self.status.configure(text=f"¡Encontrado! {key} en bloque {block_idx}, posición {pos}")
+		self._draw()
+		messagebox.showwarning("✅ ¡ENCONTRADO!", f"Registro encontrado en:\n\n   📦 Bloque: {block_idx + 1}\n   📍 Posición: {pos}")
+
+	def _delete_result_only(self, key: int) -> None:
+		"""Eliminación sin animación"""
+		self._clear_animation()
+		encontrado = self._locate(key)
+		if encontrado is None:
+			self.status.configure(text=f"Registro {key} no encontrado")
+			messagebox.showwarning("⚠️ No Encontrado", "El registro NO se encuentra en la estructura")
+			return
+		self._perform_delete(*encontrado)
+
 	def _prepare_animation(self) -> None:
 		"""Prepara la animación"""
 		self._anim_index = 0
 		self._anim_running = False
-		self.status.configure(text=f"Animación lista: {len(self._anim_steps)} pasos")
+		self.status.configure(text="Animación lista")
 
 	def _anim_step(self) -> None:
 		"""Ejecuta un paso de la animación"""
-		if self._anim_index >= len(self._anim_steps):
+		step = self._step_at(self._anim_index)
+		if step is None:
 			self._anim_running = False
 			self.status.configure(text="Animación terminada")
 			# Verificar si necesitamos mostrar mensaje
@@ -788,7 +1059,6 @@ class BloquesView(ttk.Frame):
 					messagebox.showwarning("✅ ¡ENCONTRADO!", f"Registro encontrado en:\n\n   📦 Bloque: {block_idx + 1}\n   📍 Posición: {pos}")
 			return
 		
-		step = self._anim_steps[self._anim_index]
 		self._highlight_block = step.get('highlight_block')
 		self._highlight_position = step.get('highlight_position')
 		
@@ -802,9 +1072,9 @@ class BloquesView(ttk.Frame):
 
 	def _on_play(self) -> None:
 		"""Reproduce la animación"""
-		if not self._anim_steps:
+		if not self._anim_steps and self._anim_source is None:
 			return
-		if self._anim_index >= len(self._anim_steps):
+		if self._step_at(self._anim_index) is None:
 			self._anim_index = 0
 		self._anim_running = True
 		self._anim_step()
@@ -905,15 +1175,11 @@ class BloquesView(ttk.Frame):
 
 	def _on_load(self) -> None:
 		"""Carga una estructura"""
-		self._save_state()
-		
 		path = filedialog.askopenfilename(
 			title="Cargar estructura de bloques",
 			filetypes=[("Texto", "*.txt")]
 		)
 		if not path:
-			if self._history:
-				self._history.pop()
 			return
 		
 		try:
@@ -921,21 +1187,87 @@ class BloquesView(ttk.Frame):
 				content = f.read()
 		except Exception as e:
 			messagebox.showerror("Error", f"No se pudo leer: {e}")
-			if self._history:
-				self._history.pop()
 			return
 		
+		anterior = self._capture_state()
 		self.blocks = []
 		success = self._parse(content)
 		if not success:
 			messagebox.showerror("Error", "Formato inválido")
-			if self._history:
-				self._history.pop()
+			self._restore_state(anterior)
 			return
 		
+		self._fences.reconstruir(self.blocks)
+		self._checkpoint(anterior, "cargar")
 		self.status.configure(text="Estructura cargada")
 		self._draw()
 
+	def _on_save_binary(self) -> None:
+		"""Guarda la estructura como archivo binario de bloques y lo asocia a las búsquedas"""
+		path = filedialog.asksaveasfilename(
+			title="Guardar archivo binario de bloques",
+			defaultextension=".blq",
+			filetypes=[("Archivo de bloques", "*.blq")]
+		)
+		if not path or self._file_in_use(path):
+			return
+		try:
+			archivo = BlockFile.crear(path, self.n, self.blocks, max(self.b, len(self.blocks)), self.block_size)
+		except Exception as e:
+			messagebox.showerror("Error", f"No se pudo guardar: {e}")
+			return
+		self._attach_block_file(archivo)
+		self.status.configure(text=f"Archivo binario guardado: {archivo.b} bloques de {archivo.block_size} registros")
+		self._draw()
+
+	def _on_load_binary(self) -> None:
+		"""Carga un archivo binario de bloques (una lectura por bloque) y lo asocia a las búsquedas"""
+		path = filedialog.askopenfilename(
+			title="Cargar archivo binario de bloques",
+			filetypes=[("Archivo de bloques", "*.blq")]
+		)
+		if path:
+			self._load_block_file(path)
+
+	def _on_bulk_load(self) -> None:
+		"""Ordena externamente un archivo de claves (sin cargarlo entero) y lo vuelca a un archivo de bloques"""
+		source = filedialog.askopenfilename(
+			title="Archivo de claves sin ordenar",
+			filetypes=[("Texto", "*.txt"), ("CSV", "*.csv"), ("Todos los archivos", "*.*")]
+		)
+		if not source:
+			return
+		memoria = simpledialog.askinteger(
+			"Carga masiva", "Claves en memoria a la vez:",
+			initialvalue=REGISTROS_EN_MEMORIA, minvalue=2, parent=self
+		)
+		if memoria is None:
+			return
+		path = filedialog.asksaveasfilename(
+			title="Guardar archivo binario de bloques",
+			defaultextension=".blq",
+			filetypes=[("Archivo de bloques", "*.blq")]
+		)
+		if not path or self._file_in_use(path):
+			return
+		try:
+			resultado = cargar_bloques(source, path, memoria)
+			archivo = BlockFile(path)
+		except Exception as e:
+			messagebox.showerror("Error", f"No se pudo cargar: {e}")
+			return
+
+		# El archivo no se carga: la vista lee por páginas los bloques que recorre o dibuja
+		anterior = self._capture_state()
+		self._restore_state((archivo.n, archivo.b, archivo.block_size, BloquesEnArchivo(archivo)))
+		self._checkpoint(anterior, "carga masiva")
+		self._attach_block_file(archivo)
+		self.status.configure(
+			text=f"Archivo asociado: {resultado['registros'] - resultado['duplicados']} registros en {archivo.b} bloques"
+			f" | {resultado['corridas']} corridas, {resultado['pasadas']} pasadas, {resultado['duplicados']} repetidas"
+		)
+		self._draw()
+
 	def _draw(self) -> None:
 		"""Dibuja la estructura de bloques"""
 		self.canvas.delete("all")
@@ -973,27 +1305,26 @@ class BloquesView(ttk.Frame):
 			# Mostrar todos los bloques cuando la estructura es pequeña
 			blocks_to_draw = list(range(total_blocks))
 		else:
-			# Encontrar el último bloque que tiene datos
-			last_block_with_data = -1
-			for i in range(total_blocks - 1, -1, -1):
-				if self.blocks[i]:
-					last_block_with_data = i
-					break
+			# Último bloque con datos, según las fence keys (sin leer bloques)
+			last_block_with_data = self._fences.bloques[-1] if self._fences.bloques else -1
 			
 			# Índice máximo visible por defecto (primeros 5 bloques: 0..4)
 			initial_visible_end = 4
-			visible_end = initial_visible_end
-			
-			if last_block_with_data >= 0:
-				visible_end = max(visible_end, last_block_with_data)
+			visible_end = max(initial_visible_end, last_block_with_data)
 			
-			# Asegurar que el bloque resaltado sea visible
+			# Asegurar que el bloque resaltado sea visible, centrado en la ventana
 			if self._highlight_block is not None:
-				visible_end = max(visible_end, min(self._highlight_block, total_blocks - 1))
+				visible_end = max(min(visible_end, self._highlight_block + BLOQUES_VISIBLES // 2), self._highlight_block)
 			
 			visible_end = min(visible_end, total_blocks - 1)
 			
-			blocks_to_draw = list(range(visible_end + 1))
+			# A lo sumo BLOQUES_VISIBLES seguidos; antes, el primero y "..."
+			visible_start = max(0, visible_end - BLOQUES_VISIBLES + 1)
+			if visible_start > 0:
+				blocks_to_draw.append(0)
+				if visible_start > 1:
+					blocks_to_draw.append(None)
+			blocks_to_draw.extend(range(visible_start, visible_end + 1))
 			
 			# Si todavía hay bloques ocultos, mostrar "..." y el último bloque
 			if visible_end < total_blocks - 1:
@@ -1062,8 +1393,24 @@ class BloquesView(ttk.Frame):
 		
 		# Información adicional
 		info_text = f"n={self.n}, B={self.b}, Tamaño de bloque={self.block_size}"
+		filtros = self._fences.filtros
+		if filtros is not None and filtros.consultas:
+			info_text += (
+				f"\nBloom ({filtros.bits_por_clave} bits/clave, {filtros.num_hashes} hashes): "
+				f"{filtros.lecturas_evitadas} lecturas evitadas, {filtros.falsos_positivos} falsos positivos "
+				f"(tasa {filtros.tasa_falsos_positivos:.1%}, teórica {filtros.tasa_teorica:.1%})"
+			)
+		if self._archivo is not None and self._lecturas_archivo is not None:
+			info_text += f"\nArchivo {os.path.basename(self._archivo.ruta)}: {self._lecturas_archivo} lecturas de bloque en la última búsqueda"
+		if len(self.blocks) != self.b:
+			info_text += f", bloques en uso={len(self.blocks)}"
+		if self._io_ultima is not None:
+			info_text += (
+				f"\nE/S última operación: {self._io_ultima[0]} leídos, {self._io_ultima[1]} escritos"
+				f" | acumulado: {self._io.lecturas} leídos, {self._io.escrituras} escritos"
+			)
 		self.canvas.create_text(
-			width // 2, height - 30,
+			width // 2, height - 12, anchor="s",
 			text=info_text, fill="#666666", font=("MS Sans Serif", 9)
 		)
 		# Definir región de scroll
@@ -3,6 +3,8 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from typing import List, Optional
 
+from app.views.animation import AnimationControls, StepScheduler, Steps
+
 
 class BusquedaBinariaView(ttk.Frame):
 	def __init__(self, parent: tk.Misc, app) -> None:
@@ -59,6 +61,9 @@ class BusquedaBinariaView(ttk.Frame):
 		self.status = ttk.Label(ops, text="Estado: listo")
 		self.status.grid(row=6, column=0, pady=(12, 0), sticky="w")
 
+		self._anim = StepScheduler(self, render=self._draw, reset=self._clear_marks)
+		AnimationControls(ops, self._anim).grid(row=7, column=0, pady=(12, 0), sticky="w")
+
 		viz = ttk.Frame(panel, style="Panel.TFrame", padding=8)
 		viz.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
@@ -105,6 +110,7 @@ class BusquedaBinariaView(ttk.Frame):
 	# no-op: visualización fija
 
 	def _serialize(self) -> str:
+		self._anim.skip()
 		_, digits = self._read_params()
 		numbers = ",".join(str(x) for x in self._array)
 		return f"digits:{digits}\narray:{numbers}\n"
@@ -214,6 +220,7 @@ class BusquedaBinariaView(ttk.Frame):
 		self.entry_digits.delete(0, tk.END)
 		self.entry_digits.insert(0, str(max(digits, loaded_digits)))
 
+		self._anim.cancel()
 		self._array = sorted(numbers)
 		self._low = None
 		self._high = None
@@ -221,7 +228,14 @@ class BusquedaBinariaView(ttk.Frame):
 		self.status.configure(text=f"Cargado {len(self._array)} elementos desde archivo")
 		self._draw()
 
+	def _clear_marks(self) -> None:
+		self._highlight_index = None
+		self._low = None
+		self._high = None
+		self._delete_index = None
+
 	def _on_reset(self) -> None:
+		self._anim.cancel()
 		self._array = []
 		self._highlight_index = None
 		self._low = None
@@ -251,6 +265,7 @@ class BusquedaBinariaView(ttk.Frame):
 		return int(key_str)
 
 	def _on_generate(self) -> None:
+		self._anim.cancel()
 		n, digits = self._read_params()
 		max_value = 10 ** digits - 1
 		min_value = 0 if digits == 1 else 10 ** (digits - 1)
@@ -268,6 +283,7 @@ class BusquedaBinariaView(ttk.Frame):
 		self._draw()
 
 	def _on_insert(self) -> None:
+		self._anim.skip()
 		_, digits = self._read_params()
 		try:
 			capacity = int(self.entry_n.get())
@@ -292,37 +308,38 @@ class BusquedaBinariaView(ttk.Frame):
 			messagebox.showerror("Duplicado", f"La clave {str(value).zfill(digits)} ya existe.")
 			return
 		self._array.insert(lo, value)
+		self.app.traza.registrar("insertar", value)
 		self.status.configure(text=f"Insertado {value}")
 		self._draw()
 
-	def _on_delete(self) -> None:
+	def _read_key(self) -> Optional[int]:
+		self._anim.skip()
 		_, digits = self._read_params()
 		key_str = self.entry_key.get().strip()
-		value = self._validate_key(key_str, digits)
-		if value is None:
-			return
+		return self._validate_key(key_str, digits)
 
+	def _on_delete(self) -> None:
+		value = self._read_key()
+		if value is not None:
+			self.app.traza.registrar("eliminar", value)
+			self._anim.run(self._delete_steps(value))
+
+	def _delete_steps(self, value: int) -> Steps:
 		lo, hi = 0, len(self._array) - 1
 		self._low, self._high = lo, hi
 		self._highlight_index = None
 		self._delete_index = None
-		self._draw()
-		self.update_idletasks()
 
 		while lo <= hi:
 			mid = (lo + hi) // 2
 			self._highlight_index = mid
 			self._low, self._high = lo, hi
-			self._draw()
-			self.after(700)
-			self.update_idletasks()
+			yield 700
 
 			if self._array[mid] == value:
 				# highlight in red before deletion
 				self._delete_index = mid
-				self._draw()
-				self.after(1400)
-				self.update_idletasks()
+				yield 1400
 				del self._array[mid]
 				self._delete_index = None
 				self._highlight_index = None
@@ -344,25 +361,21 @@ class BusquedaBinariaView(ttk.Frame):
 		messagebox.showinfo("Búsqueda", "Valor no encontrado")
 
 	def _on_search(self) -> None:
-		_, digits = self._read_params()
-		key_str = self.entry_key.get().strip()
-		value = self._validate_key(key_str, digits)
-		if value is None:
-			return
+		value = self._read_key()
+		if value is not None:
+			self.app.traza.registrar("buscar", value)
+			self._anim.run(self._search_steps(value))
 
+	def _search_steps(self, value: int) -> Steps:
 		lo, hi = 0, len(self._array) - 1
 		self._low, self._high = lo, hi
 		self._highlight_index = None
-		self._draw()
-		self.update_idletasks()
 
 		while lo <= hi:
 			mid = (lo + hi) // 2
 			self._highlight_index = mid
 			self._low, self._high = lo, hi
-			self._draw()
-			self.after(700)
-			self.update_idletasks()
+			yield 700
 
 			if self._array[mid] == value:
 				self.status.configure(text=f"Encontrado {value} en dirección {mid}")
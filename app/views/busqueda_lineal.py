@@ -4,6 +4,8 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from typing import List, Optional
 
+from app.views.animation import AnimationControls, StepScheduler, Steps
+
 
 class BusquedaLinealView(ttk.Frame):
 	def __init__(self, parent: tk.Misc, app) -> None:  # app: RetroApp
@@ -63,6 +65,9 @@ class BusquedaLinealView(ttk.Frame):
 		self.status = ttk.Label(ops, text="Estado: listo")
 		self.status.grid(row=6, column=0, pady=(8, 0), sticky="w")
 
+		self._anim = StepScheduler(self, render=self._draw, reset=self._clear_marks)
+		AnimationControls(ops, self._anim).grid(row=7, column=0, pady=(12, 0), sticky="w")
+
 		viz_panel = ttk.Frame(panel, style="Panel.TFrame", padding=12)
 		viz_panel.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
@@ -145,7 +150,12 @@ class BusquedaLinealView(ttk.Frame):
 		except Exception:
 			self._data.sort()
 
+	def _clear_marks(self) -> None:
+		self._selected_index = None
+		self._delete_index = None
+
 	def _on_generate(self) -> None:
+		self._anim.cancel()
 		n, max_len = self._read_params()
 		self._data = []
 		seen = set()
@@ -163,12 +173,14 @@ class BusquedaLinealView(ttk.Frame):
 		self._draw()
 
 	def _on_reset(self) -> None:
+		self._anim.cancel()
 		self._data = []
 		self._selected_index = None
 		self._delete_index = None
 		self._draw()
 
 	def _on_insert(self) -> None:
+		self._anim.skip()
 		_, max_len = self._read_params()
 		inp = self.entry_target.get().strip()
 		if inp:
@@ -185,22 +197,26 @@ class BusquedaLinealView(ttk.Frame):
 		dup_idx = self._find_existing_index(key)
 		if dup_idx is not None:
 			# Resaltar la fila duplicada y avisar
-			self._selected_index = dup_idx
-			self._delete_index = None
-			self._draw()
-			self.after(400)  # pequeño parpadeo/pausa visual
-			messagebox.showerror("Duplicado", f"La clave '{key}' ya existe en la posición {dup_idx}.")
-			self._selected_index = None
-			self._draw()
+			self._anim.run(self._duplicate_steps(key, dup_idx))
 			return
 
 		# 5) Insertar + ordenar + dibujar
 		self._data.append(key)
+		self.app.traza.registrar("insertar", key)
 		self._sort_data()
 		self._draw()
 
 
+	def _duplicate_steps(self, key: str, dup_idx: int) -> Steps:
+		self._selected_index = dup_idx
+		self._delete_index = None
+		yield 400  # pequeño parpadeo/pausa visual
+		messagebox.showerror("Duplicado", f"La clave '{key}' ya existe en la posición {dup_idx}.")
+		self._selected_index = None
+		self._draw()
+
 	def _on_delete(self) -> None:
+		self._anim.skip()
 		inp = self.entry_target.get().strip()
 		if not inp or not self._data:
 			return
@@ -208,18 +224,18 @@ class BusquedaLinealView(ttk.Frame):
 		target = self._validate_numeric(inp, max_len)
 		if target is None:
 			return
+		self.app.traza.registrar("eliminar", target)
+		self._anim.run(self._delete_steps(target))
+
+	def _delete_steps(self, target: str) -> Steps:
 		self._selected_index = None
 		self._delete_index = None
 		for idx, value in enumerate(self._data):
 			self._selected_index = idx
-			self._draw()
-			self.after(700)
-			self.update_idletasks()
+			yield 700
 			if value == target:
 				self._delete_index = idx
-				self._draw()
-				self.after(1400)
-				self.update_idletasks()
+				yield 1400
 				del self._data[idx]
 				self._selected_index = None
 				self._delete_index = None
@@ -233,19 +249,23 @@ class BusquedaLinealView(ttk.Frame):
 		messagebox.showinfo("Búsqueda", "Valor no encontrado")
 
 	def _on_search(self) -> None:
+		self._anim.skip()
 		inp = self.entry_target.get().strip()
 		_, max_len = self._read_params()
 		target = self._validate_numeric(inp, max_len)
 		if target is None:
 			return
+		self.app.traza.registrar("buscar", target)
+		self._anim.run(self._search_steps(target))
+
+	def _search_steps(self, target: str) -> Steps:
 		self._selected_index = None
 		self._delete_index = None
 		for idx, value in enumerate(self._data):
 			self._selected_index = idx
-			self._draw()
-			self.after(700)
-			self.update_idletasks()
+			yield 700
 			if value == target:
+				self._draw()
 				messagebox.showinfo("Búsqueda", f"Número encontrado en la dirección {idx}")
 				return
 		self._selected_index = None
@@ -253,6 +273,7 @@ class BusquedaLinealView(ttk.Frame):
 		messagebox.showinfo("Búsqueda", "Valor no encontrado")
 
 	def _serialize(self) -> str:
+		self._anim.skip()
 		_, max_len = self._read_params()
 		joined = ",".join(self._data)
 		return f"max_len:{max_len}\narray:{joined}\n"
@@ -332,6 +353,7 @@ class BusquedaLinealView(ttk.Frame):
 		if not parsed:
 			messagebox.showerror("Error", "Formato inválido")
 			return
+		self._anim.cancel()
 		max_len, arr = parsed
 		# update max_len field
 		self.entry_len.delete(0, tk.END)
@@ -4,314 +4,15 @@ from __future__ import annotations
 
 import tkinter as tk
 from tkinter import ttk
-from typing import List, Optional
+from typing import Optional
 from tkinter import messagebox, filedialog
 import json
 
+from app.core.bucket_hashing import HashTableParciales
+from app.core.bucket_storage import clave_valida
+from app.core.paged_storage import ContadorIO
 
 
-class HashTableParciales:
-    """
-    Tabla hash basada en cubetas, con expansiones y reducciones PARCIALES.
-
-    Expansión parcial:
-        - Se dispara cuando densidad_actual >= densidad_objetivo
-        - Aumenta el número de cubetas en 1: N -> N + 1
-        - Reubica todos los registros recalculando el módulo.
-
-    Reducción parcial:
-        - Forzada por botón
-        - Disminuye el número de cubetas en 1: N -> N - 1
-        - Nunca baja del número inicial de cubetas.
-    """
-
-    def __init__(self, num_cubetas: int, tam_cubeta: int, densidad_objetivo: float) -> None:
-        self.num_cubetas_inicial = max(1, num_cubetas)
-        self.num_cubetas = max(1, num_cubetas)
-        self.tam_cubeta = max(1, tam_cubeta)
-        self.densidad_objetivo = densidad_objetivo
-
-        self.buckets: list[list[int | None]] = [
-            [None] * self.tam_cubeta for _ in range(self.num_cubetas)
-        ]
-        self.overflow: list[list[int]] = [[] for _ in range(self.num_cubetas)]
-        self.total_registros: int = 0
-
-        # 🔹 Estado para el ciclo de expansiones parciales
-        self._partial_cycle_base: int | None = self.num_cubetas
-        self._partial_cycle_steps: int = 0
-        # 🔹 Nuevo: orden en que se insertaron las claves
-        self.insertion_order: list[int] = []
-
-    # ------------------------------------------------------------
-    @property
-    def capacidad_total(self) -> int:
-        return self.num_cubetas * self.tam_cubeta
-
-    @property
-    def densidad_actual(self) -> float:
-        if self.capacidad_total == 0:
-            return 0.0
-        return self.total_registros / self.capacidad_total
-
-    # ------------------------------------------------------------
-    # Operaciones
-    # ------------------------------------------------------------
-    
-    def _existe_clave(self, clave: int) -> bool:
-        """Retorna True si la clave ya está en la tabla (cubeta u overflow)."""
-        return clave in self.insertion_order
-
-    def insertar(self, clave: int) -> str:
-        # verificar duplicados
-        if self._existe_clave(clave):
-            messagebox.showwarning(
-                "Clave duplicada",
-                f"La clave {clave} ya se encuentra almacenada en la tabla."
-            )
-            return f"La clave {clave} ya se encuentra almacenada. No se permiten duplicados."
-
-        ok, msg = self._insertar_en_cubeta_o_expandir_parcial(clave)
-
-        if not ok:
-            return msg  # caso extremo
-
-        if self.densidad_actual >= self.densidad_objetivo:
-            msg += (
-                f" | Densidad actual {self.densidad_actual:.2f} ≥ objetivo "
-                f"{self.densidad_objetivo:.2f}, se realiza expansión PARCIAL."
-            )
-            self._expansion_parcial()
-        else:
-            msg += f" | Densidad actual {self.densidad_actual:.2f}, no se requiere expansión."
-
-        return msg
-    
-    def _remove_from_insertion_order(self, clave: int) -> None:
-        try:
-            self.insertion_order.remove(clave)
-        except ValueError:
-            # Por si acaso no está; no queremos que explote la app docente
-            pass
-
-    # ------------------------------------------------------------
-    # Serialización para guardar/cargar
-    # ------------------------------------------------------------
-    def to_dict(self) -> dict:
-        return {
-            "tipo": "parciales",
-            "num_cubetas_inicial": self.num_cubetas_inicial,
-            "num_cubetas": self.num_cubetas,
-            "tam_cubeta": self.tam_cubeta,
-            "densidad_objetivo": self.densidad_objetivo,
-            "buckets": self.buckets,
-            "overflow": self.overflow,
-            "insertion_order": self.insertion_order,
-            # si usas ciclo parcial:
-            "_partial_cycle_base": getattr(self, "_partial_cycle_base", None),
-            "_partial_cycle_steps": getattr(self, "_partial_cycle_steps", 0),
-        }
-
-    @classmethod
-    def from_dict(cls, data: dict) -> "HashTableParciales":
-        num_cubetas = data["num_cubetas"]
-        tam_cubeta = data["tam_cubeta"]
-        densidad_objetivo = data["densidad_objetivo"]
-
-        obj = cls(num_cubetas=num_cubetas, tam_cubeta=tam_cubeta, densidad_objetivo=densidad_objetivo)
-        obj.num_cubetas_inicial = data.get("num_cubetas_inicial", num_cubetas)
-        obj.buckets = data["buckets"]
-        obj.overflow = data["overflow"]
-        obj.insertion_order = data.get("insertion_order", [])
-
-        obj.total_registros = 0
-        for b in range(obj.num_cubetas):
-            for v in obj.buckets[b]:
-                if v is not None:
-                    obj.total_registros += 1
-            obj.total_registros += len(obj.overflow[b])
-
-        obj._partial_cycle_base = data.get("_partial_cycle_base", obj.num_cubetas)
-        obj._partial_cycle_steps = data.get("_partial_cycle_steps", 0)
-
-        return obj
-
-    def eliminar(self, clave: int) -> str:
-        bucket_idx = clave % self.num_cubetas
-
-        # Buscar en área principal
-        bucket = self.buckets[bucket_idx]
-        for i, val in enumerate(bucket):
-            if val == clave:
-                bucket[i] = None
-                self.total_registros -= 1
-                self._remove_from_insertion_order(clave)  # 🔹 nuevo
-                msg = (
-                    f"Registro {clave} eliminado de la cubeta {bucket_idx}, posición {i}. "
-                    f"Densidad actual: {self.densidad_actual:.2f}"
-                )
-                return self._post_delete_maybe_reduce(msg)
-
-        # Buscar en overflow
-        overflow_list = self.overflow[bucket_idx]
-        if clave in overflow_list:
-            overflow_list.remove(clave)
-            self.total_registros -= 1
-            self._remove_from_insertion_order(clave)  # 🔹 nuevo
-            msg = (
-                f"Registro {clave} eliminado del overflow de la cubeta {bucket_idx}. "
-                f"Densidad actual: {self.densidad_actual:.2f}"
-            )
-            return self._post_delete_maybe_reduce(msg)
-
-        return f"Registro {clave} no encontrado en la cubeta {bucket_idx}."
-
-
-    def _post_delete_maybe_reduce(self, base_msg: str) -> str:
-        """
-        Tras una eliminación exitosa, verifica si la densidad
-        cayó por debajo del umbral de reducción.
-
-        Umbral de reducción: 1 - densidad_objetivo.
-        """
-        if self.capacidad_total == 0:
-            return base_msg
-
-        umbral_baja = 1.0 - self.densidad_objetivo
-
-        if self.densidad_actual <= umbral_baja:
-            reduccion_msg = self.reduccion_parcial()
-            return (
-                base_msg
-                + f" | Densidad actual ≤ {umbral_baja:.2f}, se intenta REDUCCIÓN PARCIAL. "
-                + reduccion_msg
-            )
-
-        return base_msg
-
-
-    # ------------------------------------------------------------
-    # Internos
-    # ------------------------------------------------------------
-    def _insertar_en_cubeta_o_expandir_parcial(self, clave: int) -> tuple[bool, str]:
-        """
-        Intenta insertar la clave en la cubeta correspondiente.
-        Si la cubeta está llena, la clave se coloca en el OVERFLOW de esa cubeta.
-        Aquí **no** se realizan expansiones; eso se hace en `insertar` según la densidad.
-
-        Devuelve (ok, mensaje).
-        """
-        bucket_idx = clave % self.num_cubetas
-        bucket = self.buckets[bucket_idx]
-
-        # 1) Intentar en área principal de la cubeta
-        for i in range(self.tam_cubeta):
-            if bucket[i] is None:
-                bucket[i] = clave
-                self.total_registros += 1
-                # Registrar orden de inserción
-                self.insertion_order.append(clave)
-                return True, (
-                    f"Registro {clave} insertado en cubeta {bucket_idx}, posición {i} "
-                    f"(clave % {self.num_cubetas} = {bucket_idx})."
-                )
-
-        # 2) Cubeta llena → insertar en overflow de esa cubeta
-        self.overflow[bucket_idx].append(clave)
-        self.total_registros += 1
-        self.insertion_order.append(clave)
-
-        msg = (
-            f"Cubeta {bucket_idx} llena al insertar {clave}, "
-            f"registro colocado en OVERFLOW de la cubeta {bucket_idx}."
-        )
-        return True, msg
-
-
-    def _expansion_parcial(self) -> None:
-        """
-        Expansión PARCIAL con la regla:
-        - Dos expansiones parciales equivalen a una expansión total.
-
-        Si N es el número de cubetas al inicio del ciclo:
-        1ª parcial: num_cubetas = N + N//2
-        2ª parcial: num_cubetas = 2 * N
-
-        En cada expansión parcial se rehashean TODOS los registros
-        usando el nuevo número de cubetas. Por eso, después de la
-        segunda parcial, el estado es equivalente a haber hecho
-        directamente una expansión total desde N a 2N.
-        """
-        # N al inicio del ciclo de parciales
-        if self._partial_cycle_base is None:
-            self._partial_cycle_base = self.num_cubetas
-
-        base = self._partial_cycle_base
-
-        if self._partial_cycle_steps == 0:
-            # Primera expansión parcial del ciclo: N -> N + N//2
-            incremento = max(1, base // 2)
-            nuevas_cubetas = base + incremento
-            self._partial_cycle_steps = 1
-        else:
-            # Segunda expansión parcial del ciclo: -> 2 * N
-            nuevas_cubetas = max(self.num_cubetas, base * 2)
-            # Ciclo completo, reseteamos
-            self._partial_cycle_steps = 0
-            self._partial_cycle_base = nuevas_cubetas  # nuevo N base para próximos ciclos
-
-        # Reconstituir tabla con el nuevo número de cubetas
-        valores = self._extraer_todos_los_valores()
-        self.num_cubetas = nuevas_cubetas
-
-        self.buckets = [[None] * self.tam_cubeta for _ in range(self.num_cubetas)]
-        self.overflow = [[] for _ in range(self.num_cubetas)]
-        self.total_registros = 0
-
-        for v in valores:
-            self._insertar_sin_expandir(v)
-
-
-    def reduccion_parcial(self) -> str:
-        if self.num_cubetas <= self.num_cubetas_inicial:
-            return "No se puede reducir más, ya se alcanzó el número mínimo de cubetas."
-
-        nuevas_cubetas = max(self.num_cubetas_inicial, self.num_cubetas - 1)
-        if nuevas_cubetas == self.num_cubetas:
-            return "El número de cubetas ya es el mínimo permitido."
-
-        valores = self._extraer_todos_los_valores()
-        self.num_cubetas = nuevas_cubetas
-
-        self.buckets = [[None] * self.tam_cubeta for _ in range(self.num_cubetas)]
-        self.overflow = [[] for _ in range(self.num_cubetas)]
-        self.total_registros = 0
-
-        for v in valores:
-            self._insertar_sin_expandir(v)
-
-        # 🔹 Reiniciamos ciclo parcial
-        self._partial_cycle_base = self.num_cubetas
-        self._partial_cycle_steps = 0
-
-        return (
-            f"Reducción PARCIAL realizada: ahora hay {self.num_cubetas} cubetas. "
-            f"Densidad actual: {self.densidad_actual:.2f}"
-        )
-
-
-    def _extraer_todos_los_valores(self) -> list[int]:
-        return list(self.insertion_order)
-
-    def _insertar_sin_expandir(self, clave: int) -> None:
-        bucket_idx = clave % self.num_cubetas
-        bucket = self.buckets[bucket_idx]
-        for i in range(self.tam_cubeta):
-            if bucket[i] is None:
-                bucket[i] = clave
-                self.total_registros += 1
-                return
-
 
 class DinamicasParcialesView(ttk.Frame):
     """
@@ -327,6 +28,8 @@ class DinamicasParcialesView(ttk.Frame):
         self.app = app
 
         self.hash_table: Optional[HashTableParciales] = None
+        # Contadores de E/S tras el último dibujo, para mostrar la E/S de cada operación
+        self._io_previo: Optional[ContadorIO] = None
 
         self._build_widgets()
         self._configure_layout()
@@ -376,6 +79,22 @@ class DinamicasParcialesView(ttk.Frame):
         )
         self.btn_init.grid(row=0, column=6, padx=10)
 
+        # Reubicación por pasos en lugar de reconstruir toda la tabla de una vez
+        self.incremental_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            self.frame_config,
+            text="Migración incremental",
+            variable=self.incremental_var,
+        ).grid(row=1, column=4, columnspan=3, sticky="w", padx=5)
+
+        # Cubetas en un archivo de páginas leído con buffer pool (E/S medida)
+        self.disco_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            self.frame_config,
+            text="Cubetas en disco (archivo paginado)",
+            variable=self.disco_var,
+        ).grid(row=2, column=4, columnspan=3, sticky="w", padx=5)
+
         # === Operaciones ===
         self.frame_ops = ttk.LabelFrame(self, text="Operaciones", padding=10)
 
@@ -407,14 +126,28 @@ class DinamicasParcialesView(ttk.Frame):
         )
         self.btn_delete.grid(row=1, column=2, padx=5)
 
-        # Fila 2 - Expansión / Reducción forzada
+        # Fila 2 - Buscar
+        ttk.Label(self.frame_ops, text="Buscar registro:").grid(
+            row=2, column=0, sticky="e", padx=5
+        )
+        self.entry_search = ttk.Entry(self.frame_ops, width=10)
+        self.entry_search.grid(row=2, column=1, padx=5)
+        self.btn_search = ttk.Button(
+            self.frame_ops,
+            text="Buscar",
+            command=self._on_search,
+            state="disabled",
+        )
+        self.btn_search.grid(row=2, column=2, padx=5, pady=5)
+
+        # Fila 3 - Expansión / Reducción forzada
         self.btn_expand_total = ttk.Button(
             self.frame_ops,
             text="Expansión parcial",
             command=self._on_force_expand,
             state="disabled",
         )
-        self.btn_expand_total.grid(row=2, column=0, padx=5, pady=10)
+        self.btn_expand_total.grid(row=3, column=0, padx=5, pady=10)
 
         self.btn_reduce_total = ttk.Button(
             self.frame_ops,
@@ -422,7 +155,7 @@ class DinamicasParcialesView(ttk.Frame):
             command=self._on_force_reduce,
             state="disabled",
         )
-        self.btn_reduce_total.grid(row=2, column=1, padx=5, pady=10)
+        self.btn_reduce_total.grid(row=3, column=1, padx=5, pady=10)
 
         # Canvas
         self.canvas = tk.Canvas(
@@ -508,7 +241,7 @@ class DinamicasParcialesView(ttk.Frame):
     # Guardar / Cargar
     # ------------------------------------------------------------
     def _on_save(self) -> None:
-        if not self.hash_table:
+        if self.hash_table is None:
             messagebox.showwarning("Guardar tabla", "Primero inicializa la tabla para poder guardarla.")
             return
 
@@ -532,7 +265,7 @@ class DinamicasParcialesView(ttk.Frame):
         """
         Guarda la tabla y luego vuelve a la vista anterior (externas).
         """
-        if not self.hash_table:
+        if self.hash_table is None:
             messagebox.showwarning("Guardar tabla", "Primero inicializa la tabla para poder guardarla.")
             return
 
@@ -576,7 +309,11 @@ class DinamicasParcialesView(ttk.Frame):
                     "El archivo no parece corresponder a una tabla de dinámicas parciales.",
                 )
 
+            self._cerrar_tabla()
             self.hash_table = HashTableParciales.from_dict(data)
+            self.incremental_var.set(self.hash_table.incremental)
+            self.disco_var.set(bool(self.hash_table.archivo))
+            self._io_previo = None
 
             # Actualizar controles de configuración con los valores cargados
             self.entry_cubetas.delete(0, tk.END)
@@ -591,6 +328,7 @@ class DinamicasParcialesView(ttk.Frame):
             # Habilitar botones
             self.btn_insert.config(state="normal")
             self.btn_delete.config(state="normal")
+            self.btn_search.config(state="normal")
             self.btn_expand_total.config(state="normal")
             self.btn_reduce_total.config(state="normal")
             self.btn_save.config(state="normal")
@@ -605,6 +343,12 @@ class DinamicasParcialesView(ttk.Frame):
 
 
 
+    def _cerrar_tabla(self) -> None:
+        """Libera el archivo de páginas de la tabla actual antes de reemplazarla."""
+        if self.hash_table is not None:
+            self.hash_table.cerrar()
+        self.hash_table = None
+
     # ------------------------------------------------------------
     # Callbacks
     # ------------------------------------------------------------
@@ -624,12 +368,27 @@ class DinamicasParcialesView(ttk.Frame):
             )
             return
 
-        self.hash_table = HashTableParciales(num_cubetas, tam_cubeta, densidad_obj)
+        archivo = None
+        if self.disco_var.get():
+            archivo = filedialog.asksaveasfilename(
+                title="Archivo de páginas de las cubetas",
+                defaultextension=".pag",
+                filetypes=[("Archivo de páginas", "*.pag"), ("Todos los archivos", "*.*")],
+            )
+            if not archivo:
+                return
+
+        self._io_previo = None
+        self._cerrar_tabla()
+        self.hash_table = HashTableParciales(
+            num_cubetas, tam_cubeta, densidad_obj, self.incremental_var.get(), archivo
+        )
         self._update_estado()
         self._draw_table()
 
         self.btn_insert.config(state="normal")
         self.btn_delete.config(state="normal")
+        self.btn_search.config(state="normal")
         self.btn_expand_total.config(state="normal")
         self.btn_reduce_total.config(state="normal")
         # 🔹 habilitar guardar / guardar y cerrar
@@ -639,7 +398,7 @@ class DinamicasParcialesView(ttk.Frame):
         self.label_log.config(text="Tabla inicializada correctamente.")
 
     def _on_insert(self) -> None:
-        if not self.hash_table:
+        if self.hash_table is None:
             return
 
         try:
@@ -648,13 +407,22 @@ class DinamicasParcialesView(ttk.Frame):
             self.label_log.config(text="La clave a insertar debe ser un entero.")
             return
 
+        # Sin consultar antes si está: eso leería la cubeta dos veces
+        antes = len(self.hash_table)
         msg = self.hash_table.insertar(clave)
+        if len(self.hash_table) > antes:
+            self.app.traza.registrar("insertar", clave)
+        elif clave_valida(clave):
+            messagebox.showwarning(
+                "Clave duplicada",
+                f"La clave {clave} ya se encuentra almacenada en la tabla."
+            )
         self._update_estado()
         self._draw_table()
         self.label_log.config(text=msg)
 
     def _on_delete(self) -> None:
-        if not self.hash_table:
+        if self.hash_table is None:
             return
 
         try:
@@ -663,13 +431,30 @@ class DinamicasParcialesView(ttk.Frame):
             self.label_log.config(text="La clave a eliminar debe ser un entero.")
             return
 
+        self.app.traza.registrar("eliminar", clave)
         msg = self.hash_table.eliminar(clave)
         self._update_estado()
         self._draw_table()
         self.label_log.config(text=msg)
 
+    def _on_search(self) -> None:
+        if self.hash_table is None:
+            return
+
+        try:
+            clave = int(self.entry_search.get())
+        except ValueError:
+            self.label_log.config(text="La clave a buscar debe ser un entero.")
+            return
+
+        self.app.traza.registrar("buscar", clave)
+        msg = self.hash_table.buscar(clave)
+        self._update_estado()
+        self._draw_table()
+        self.label_log.config(text=msg)
+
     def _on_force_expand(self) -> None:
-        if not self.hash_table:
+        if self.hash_table is None:
             return
         self.hash_table._expansion_parcial()
         self._update_estado()
@@ -679,7 +464,7 @@ class DinamicasParcialesView(ttk.Frame):
         )
 
     def _on_force_reduce(self) -> None:
-        if not self.hash_table:
+        if self.hash_table is None:
             return
         msg = self.hash_table.reduccion_parcial()
         self._update_estado()
@@ -688,11 +473,22 @@ class DinamicasParcialesView(ttk.Frame):
 
     # ------------------------------------------------------------
     def _update_estado(self) -> None:
-        if not self.hash_table:
+        if self.hash_table is None:
             self.label_estado.config(text="Tabla no inicializada.")
             return
 
         ht = self.hash_table
+        # E/S de página (solo con cubetas en disco): total y de la última operación
+        io = ht.io_paginas
+        if io is not None:
+            previo = self._io_previo or ContadorIO()
+            texto_io = (
+                f" | Páginas leídas: {io.lecturas} (+{io.lecturas - previo.lecturas}) | "
+                f"escritas: {io.escrituras} (+{io.escrituras - previo.escrituras}) | "
+                f"aciertos del buffer: {io.aciertos}"
+            )
+        else:
+            texto_io = ""
         self.label_estado.config(
             text=(
                 f"Cubetas: {ht.num_cubetas} | "
@@ -700,17 +496,24 @@ class DinamicasParcialesView(ttk.Frame):
                 f"Capacidad total: {ht.capacidad_total} | "
                 f"Registros: {ht.total_registros} | "
                 f"Densidad actual: {ht.densidad_actual:.2f} "
-                f"(objetivo: {ht.densidad_objetivo:.2f})"
+                f"(objetivo: {ht.densidad_objetivo:.2f}) | "
+                f"Registros movidos: {ht.registros_movidos}" + texto_io
             )
         )
+        if ht.migrando:
+            self.label_estado.config(
+                text=self.label_estado.cget("text")
+                + f" | Migrando: {len(ht.cubetas_pendientes())} cubetas antiguas pendientes"
+            )
 
     def _draw_table(self) -> None:
         self.canvas.delete("all")
-        if not self.hash_table:
+        if self.hash_table is None:
             return
 
         ht = self.hash_table
-        num_buckets = ht.num_cubetas
+        # Cubetas dibujables: con una migración encadenada pueden ser menos o más que num_cubetas
+        num_buckets = len(ht.buckets)
         tam = ht.tam_cubeta
 
         width = self.canvas.winfo_width()
@@ -728,9 +531,14 @@ class DinamicasParcialesView(ttk.Frame):
         if cubetas_por_fila <= 0:
             cubetas_por_fila = 1
 
-        for b_idx in range(num_buckets):
-            fila = b_idx // cubetas_por_fila
-            col = b_idx % cubetas_por_fila
+        # Cubetas actuales y, durante una migración incremental, las antiguas pendientes
+        cubetas = [(b, ht.buckets[b], ht.overflow[b], False) for b in range(num_buckets)]
+        if getattr(ht, "migrando", False):
+            cubetas += [(j, m, o, True) for j, m, o in ht.cubetas_pendientes()]
+
+        for celda, (b_idx, bucket, overflow_vals, antigua) in enumerate(cubetas):
+            fila = celda // cubetas_por_fila
+            col = celda % cubetas_por_fila
 
             x0 = margin + col * (bucket_w + margin)
             # algo de espacio vertical entre filas de cubetas
@@ -746,24 +554,23 @@ class DinamicasParcialesView(ttk.Frame):
                 width=1,
             )
 
-            # Header con índice de cubeta
+            # Header con índice de cubeta (las antiguas aún sin migrar en rojo claro)
             self.canvas.create_rectangle(
                 x0,
                 y0,
                 x0 + bucket_w,
                 y0 + cell_h,
-                fill="#e0e0e0",
+                fill="#f3d6d6" if antigua else "#e0e0e0",
                 outline="#333333",
             )
             self.canvas.create_text(
                 x0 + bucket_w / 2,
                 y0 + cell_h / 2,
-                text=f"b{b_idx}",
+                text=f"ant. b{b_idx}" if antigua else f"b{b_idx}",
                 font=("TkDefaultFont", 9, "bold"),
             )
 
             # Celdas principales de la cubeta
-            bucket = ht.buckets[b_idx]
             for i in range(tam):
                 cy0 = y0 + cell_h * (i + 1)
                 cy1 = cy0 + cell_h
@@ -786,7 +593,6 @@ class DinamicasParcialesView(ttk.Frame):
                     )
 
             # --- Dibujar OVERFLOW debajo de la cubeta ---
-            overflow_vals = ht.overflow[b_idx]
             if overflow_vals:
                 base_y = y0 + cell_h * (tam + 1) + 4  # un poquito debajo de la cubeta
 
@@ -818,3 +624,7 @@ class DinamicasParcialesView(ttk.Frame):
                         fill="#cc0000",
                     )
 
+        # Punto de partida de la E/S de la próxima operación (dibujar no cuenta páginas)
+        io = ht.io_paginas
+        if io is not None:
+            self._io_previo = io.copia()
@@ -4,319 +4,16 @@ from __future__ import annotations
 
 import tkinter as tk
 from tkinter import ttk
-from typing import List, Optional
+from typing import Optional
 from tkinter import messagebox, filedialog
 import json
 
+from app.core.bucket_hashing import HashTableTotales
+from app.core.bucket_storage import clave_valida
+from app.core.paged_storage import ContadorIO
 
-class HashTableTotales:
-    """
-    Tabla hash basada en cubetas, con expansiones y reducciones TOTALES.
-
-    - #cubetas iniciales
-    - tamaño de cubeta
-    - densidad de ocupación objetivo (ej: 0.75)
-
-    Manejo de colisiones:
-        - Si la cubeta está llena, el nuevo registro va a una lista de
-          *desbordamiento (overflow)* asociada a esa cubeta.
-
-    Expansión total:
-        - Se dispara cuando densidad_actual >= densidad_objetivo
-        - Duplica el número de cubetas (N -> 2N) y reubica todos los registros
-        (cubetas + overflow).
-
-    Reducción total:
-        - Forzada manualmente (botón)
-        - Reduce a la mitad el número de cubetas (N -> N/2), hasta un mínimo
-        de num_cubetas_inicial, reubicando todos los registros.
-    """
-
-    def __init__(self, num_cubetas: int, tam_cubeta: int, densidad_objetivo: float) -> None:
-        self.num_cubetas_inicial = max(1, num_cubetas)
-        self.num_cubetas = max(1, num_cubetas)
-        self.tam_cubeta = max(1, tam_cubeta)
-        self.densidad_objetivo = densidad_objetivo  # ej: 0.75
-
-        # buckets: lista de cubetas (área principal)
-        self.buckets: list[list[int | None]] = [
-            [None] * self.tam_cubeta for _ in range(self.num_cubetas)
-        ]
-        # overflow: lista de listas, una por cubeta
-        self.overflow: list[list[int]] = [[] for _ in range(self.num_cubetas)]
-
-        self.total_registros: int = 0  # cuenta principal + overflow
-                # 🔹 Nuevo: orden en que se insertaron las claves
-        self.insertion_order: list[int] = []
-
-    # ------------------------------------------------------------
-    # Propiedades
-    # ------------------------------------------------------------
-    @property
-    def capacidad_total(self) -> int:
-        # Capacidad del área principal (sin contar overflow)
-        return self.num_cubetas * self.tam_cubeta
-
-    @property
-    def densidad_actual(self) -> float:
-        if self.capacidad_total == 0:
-            return 0.0
-        # Todos los registros (incluyendo overflow) sobre la capacidad principal
-        return self.total_registros / self.capacidad_total
-
-    # ------------------------------------------------------------
-    # Operaciones básicas
-    # ------------------------------------------------------------
-    def _existe_clave(self, clave: int) -> bool:
-        """Retorna True si la clave ya está en la tabla (cubeta u overflow)."""
-        # Como insertion_order mantiene TODAS las claves existentes
-        return clave in self.insertion_order
-    
-    def insertar(self, clave: int) -> str:
-        """
-        Inserta una clave en la tabla.
-
-        - Calcula bucket_index = clave % num_cubetas.
-        - Si hay espacio en la cubeta principal, se inserta allí.
-        - Si la cubeta está llena, se inserta en la lista de overflow de esa cubeta.
-        - Después de insertar, si densidad >= objetivo, realiza expansión total.
-        """
-        if self._existe_clave(clave):
-            messagebox.showwarning(
-                "Clave duplicada",
-                f"La clave {clave} ya se encuentra almacenada en la cubeta."
-            )
-            return f"La clave {clave} ya se encuentra almacenada. No se permiten duplicados."
-        msg = self._insertar_en_cubeta_o_overflow(clave)
-
-        # Verificar densidad para posible expansión total
-        if self.densidad_actual >= self.densidad_objetivo:
-            msg += (
-                f" | Densidad actual {self.densidad_actual:.2f} ≥ objetivo "
-                f"{self.densidad_objetivo:.2f}, se realiza expansión TOTAL (duplicar cubetas)."
-            )
-            self._expansion_total()
-        else:
-            msg += f" | Densidad actual {self.densidad_actual:.2f}, no se requiere expansión."
-
-        return msg
-
-    def eliminar(self, clave: int) -> str:
-        bucket_idx = clave % self.num_cubetas
-
-        # Buscar en área principal
-        bucket = self.buckets[bucket_idx]
-        for i, val in enumerate(bucket):
-            if val == clave:
-                bucket[i] = None
-                self.total_registros -= 1
-                self._remove_from_insertion_order(clave)  # 🔹 nuevo
-                msg = (
-                    f"Registro {clave} eliminado de la cubeta {bucket_idx}, posición {i}. "
-                    f"Densidad actual: {self.densidad_actual:.2f}"
-                )
-                return self._post_delete_maybe_reduce(msg)
-
-        # Buscar en overflow
-        overflow_list = self.overflow[bucket_idx]
-        if clave in overflow_list:
-            overflow_list.remove(clave)
-            self.total_registros -= 1
-            self._remove_from_insertion_order(clave)  # 🔹 nuevo
-            msg = (
-                f"Registro {clave} eliminado del overflow de la cubeta {bucket_idx}. "
-                f"Densidad actual: {self.densidad_actual:.2f}"
-            )
-            return self._post_delete_maybe_reduce(msg)
-
-        return f"Registro {clave} no encontrado en la cubeta {bucket_idx}."
-
-    def _post_delete_maybe_reduce(self, base_msg: str) -> str:
-        """
-        Tras una eliminación exitosa, verifica si la densidad
-        cayó por debajo del umbral de reducción.
-
-        Umbral de reducción: 1 - densidad_objetivo.
-        Ejemplo: objetivo = 0.75 -> umbral_baja = 0.25.
-        """
-        # Si no hay capacidad (caso extremo), no reducimos más.
-        if self.capacidad_total == 0:
-            return base_msg
-
-        umbral_baja = 1.0 - self.densidad_objetivo
-
-        if self.densidad_actual <= umbral_baja:
-            # Intentar reducción total (la función ya respeta el mínimo de cubetas)
-            reduccion_msg = self.reduccion_total()
-            return (
-                base_msg
-                + f" | Densidad actual ≤ {umbral_baja:.2f}, se intenta REDUCCIÓN TOTAL. "
-                + reduccion_msg
-            )
-
-        return base_msg
-    
-    def _remove_from_insertion_order(self, clave: int) -> None:
-        try:
-            self.insertion_order.remove(clave)
-        except ValueError:
-            # Por si acaso no está; no queremos que explote la app docente
-            pass
-        
-    # ------------------------------------------------------------
-    # Serialización para guardar/cargar
-    # ------------------------------------------------------------
-    def to_dict(self) -> dict:
-        """
-        Devuelve un diccionario JSON-serializable con el estado de la tabla.
-        """
-        return {
-            "tipo": "totales",
-            "num_cubetas_inicial": self.num_cubetas_inicial,
-            "num_cubetas": self.num_cubetas,
-            "tam_cubeta": self.tam_cubeta,
-            "densidad_objetivo": self.densidad_objetivo,
-            "buckets": self.buckets,
-            "overflow": self.overflow,
-            "insertion_order": self.insertion_order,
-        }
-
-    @classmethod
-    def from_dict(cls, data: dict) -> "HashTableTotales":
-        """
-        Crea una tabla a partir de un diccionario generado por to_dict().
-        """
-        num_cubetas = data["num_cubetas"]
-        tam_cubeta = data["tam_cubeta"]
-        densidad_objetivo = data["densidad_objetivo"]
-
-        obj = cls(num_cubetas=num_cubetas, tam_cubeta=tam_cubeta, densidad_objetivo=densidad_objetivo)
-        obj.num_cubetas_inicial = data.get("num_cubetas_inicial", num_cubetas)
-        obj.buckets = data["buckets"]
-        obj.overflow = data["overflow"]
-        obj.insertion_order = data.get("insertion_order", [])
-
-        # Recalcular total_registros
-        obj.total_registros = 0
-        for b in range(obj.num_cubetas):
-            for v in obj.buckets[b]:
-                if v is not None:
-                    obj.total_registros += 1
-            obj.total_registros += len(obj.overflow[b])
-
-        return obj
-
-    # ------------------------------------------------------------
-    # Internos: inserción con overflow
-    # ------------------------------------------------------------
-    def _insertar_en_cubeta_o_overflow(self, clave: int) -> str:
-        bucket_idx = clave % self.num_cubetas
-        bucket = self.buckets[bucket_idx]
-
-        # Intentar en el área principal
-        for i in range(self.tam_cubeta):
-            if bucket[i] is None:
-                bucket[i] = clave
-                self.total_registros += 1
-                # 🔹 registrar orden de inserción
-                self.insertion_order.append(clave)
-                return (
-                    f"Registro {clave} insertado en cubeta {bucket_idx}, posición {i} "
-                    f"(clave % {self.num_cubetas} = {bucket_idx})."
-                )
-
-        # Cubeta llena: insertar en overflow
-        self.overflow[bucket_idx].append(clave)
-        self.total_registros += 1
-        # 🔹 registrar orden de inserción
-        self.insertion_order.append(clave)
-        return (
-            f"Cubeta {bucket_idx} llena, registro {clave} insertado en OVERFLOW "
-            f"de la cubeta {bucket_idx}."
-        )
-
-
-    # ------------------------------------------------------------
-    # Expansión y reducción TOTALES
-    # ------------------------------------------------------------
-    def _expansion_total(self) -> None:
-        """
-        Expansión TOTAL:
-        - Duplica el número de cubetas: N -> 2N
-        - Reubica todos los registros (principal + overflow) recalculando el módulo.
-        """
-        nuevas_cubetas = self.num_cubetas * 2
-        if nuevas_cubetas == self.num_cubetas:
-            return
-
-        valores = self._extraer_todos_los_valores()
-        self.num_cubetas = nuevas_cubetas
-
-        self.buckets = [[None] * self.tam_cubeta for _ in range(self.num_cubetas)]
-        self.overflow = [[] for _ in range(self.num_cubetas)]
-        self.total_registros = 0
-
-        for v in valores:
-            self._insertar_sin_expandir(v)
-
-    def reduccion_total(self) -> str:
-        """
-        Reducción TOTAL (forzada):
-        - num_cubetas: N -> N/2, sin bajar del número inicial.
-        - Reubica todos los registros.
-        """
-        if self.num_cubetas <= self.num_cubetas_inicial:
-            return "No se puede reducir más, ya se alcanzó el número mínimo de cubetas."
-
-        nuevas_cubetas = max(self.num_cubetas_inicial, self.num_cubetas // 2)
-        if nuevas_cubetas == self.num_cubetas:
-            return "El número de cubetas ya es el mínimo permitido."
-
-        valores = self._extraer_todos_los_valores()
-        self.num_cubetas = nuevas_cubetas
-
-        self.buckets = [[None] * self.tam_cubeta for _ in range(self.num_cubetas)]
-        self.overflow = [[] for _ in range(self.num_cubetas)]
-        self.total_registros = 0
-
-        for v in valores:
-            self._insertar_sin_expandir(v)
-
-        return (
-            f"Reducción TOTAL realizada: ahora hay {self.num_cubetas} cubetas. "
-            f"Densidad actual: {self.densidad_actual:.2f}"
-        )
-
-    # ------------------------------------------------------------
-    # Helpers internos
-    # ------------------------------------------------------------
-    def _extraer_todos_los_valores(self) -> list[int]:
-        """
-        Devuelve los registros en el orden EXACTO en que fueron insertados.
-        Esto garantiza que en cualquier expansión/reducción los módulos
-        se recalculen en ese mismo orden.
-        """
-        return list(self.insertion_order)
-
-
-    def _insertar_sin_expandir(self, clave: int) -> None:
-        """
-        Inserta un valor sin disparar expansiones (se usa únicamente
-        dentro de expansión/reducción).
-        """
-        bucket_idx = clave % self.num_cubetas
-        bucket = self.buckets[bucket_idx]
-
-        for i in range(self.tam_cubeta):
-            if bucket[i] is None:
-                bucket[i] = clave
-                self.total_registros += 1
-                return
-
-        # Si la cubeta está llena en la reconstrucción, se va a overflow
-        self.overflow[bucket_idx].append(clave)
-        self.total_registros += 1
-
+from app.core.extendible_hashing import HashTableExtendible
+from app.core.linear_hashing import HashTableLineal
 
 
 class DinamicasTotalesView(ttk.Frame):
@@ -324,6 +21,19 @@ class DinamicasTotalesView(ttk.Frame):
     Vista para manejar y visualizar cubetas con expansiones / reducciones TOTALES.
     """
 
+    # Motor de la tabla según el modo elegido
+    MODOS = {
+        "Expansión total": HashTableTotales,
+        "Hash lineal (Litwin)": HashTableLineal,
+        "Hash extensible": HashTableExtendible,
+    }
+    # Clase según el campo "tipo" de un archivo guardado
+    TIPOS = {
+        "totales": HashTableTotales,
+        "lineal": HashTableLineal,
+        "extendible": HashTableExtendible,
+    }
+
     BUCKET_WIDTH = 70
     CELL_HEIGHT = 26
     MARGIN = 10
@@ -332,7 +42,9 @@ class DinamicasTotalesView(ttk.Frame):
         super().__init__(parent)
         self.app = app
 
-        self.hash_table: Optional[HashTableTotales] = None
+        self.hash_table: Optional[HashTableTotales | HashTableLineal | HashTableExtendible] = None
+        # Contadores de E/S tras el último dibujo, para mostrar la E/S de cada operación
+        self._io_previo: Optional[ContadorIO] = None
 
         self._build_widgets()
         self._configure_layout()
@@ -384,6 +96,36 @@ class DinamicasTotalesView(ttk.Frame):
         )
         self.btn_init.grid(row=0, column=6, padx=10)
 
+        # Reubicación por pasos en lugar de reconstruir toda la tabla de una vez
+        self.incremental_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            self.frame_config,
+            text="Migración incremental",
+            variable=self.incremental_var,
+        ).grid(row=1, column=4, columnspan=3, sticky="w", padx=5)
+
+        # Cubetas en un archivo de páginas leído con buffer pool (E/S medida)
+        self.disco_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            self.frame_config,
+            text="Cubetas en disco (archivo paginado)",
+            variable=self.disco_var,
+        ).grid(row=2, column=4, columnspan=3, sticky="w", padx=5)
+
+        ttk.Label(self.frame_config, text="Modo:").grid(
+            row=1, column=0, sticky="e", padx=5, pady=5
+        )
+        self.modo_var = tk.StringVar(value="Expansión total")
+        self.combo_modo = ttk.Combobox(
+            self.frame_config,
+            textvariable=self.modo_var,
+            values=list(self.MODOS),
+            state="readonly",
+            width=22,
+        )
+        self.combo_modo.grid(row=1, column=1, columnspan=3, sticky="w", padx=5)
+        self.combo_modo.bind("<<ComboboxSelected>>", lambda e: self._update_mode_buttons())
+
         # === Operaciones ===
         self.frame_ops = ttk.LabelFrame(self, text="Operaciones", padding=10)
 
@@ -415,14 +157,28 @@ class DinamicasTotalesView(ttk.Frame):
         )
         self.btn_delete.grid(row=1, column=2, padx=5)
 
-        # Fila 2 - Expansión / Reducción forzada
+        # Fila 2 - Buscar
+        ttk.Label(self.frame_ops, text="Buscar registro:").grid(
+            row=2, column=0, sticky="e", padx=5
+        )
+        self.entry_search = ttk.Entry(self.frame_ops, width=10)
+        self.entry_search.grid(row=2, column=1, padx=5)
+        self.btn_search = ttk.Button(
+            self.frame_ops,
+            text="Buscar",
+            command=self._on_search,
+            state="disabled",
+        )
+        self.btn_search.grid(row=2, column=2, padx=5, pady=5)
+
+        # Fila 3 - Expansión / Reducción forzada
         self.btn_expand_total = ttk.Button(
             self.frame_ops,
             text="Expansión total",
             command=self._on_force_expand,
             state="disabled",
         )
-        self.btn_expand_total.grid(row=2, column=0, padx=5, pady=10)
+        self.btn_expand_total.grid(row=3, column=0, padx=5, pady=10)
 
         self.btn_reduce_total = ttk.Button(
             self.frame_ops,
@@ -430,7 +186,7 @@ class DinamicasTotalesView(ttk.Frame):
             command=self._on_force_reduce,
             state="disabled",
         )
-        self.btn_reduce_total.grid(row=2, column=1, padx=5, pady=10)
+        self.btn_reduce_total.grid(row=3, column=1, padx=5, pady=10)
 
         # === BOTONES INFERIORES (Guardar / Cargar) ===
         self.frame_bottom_buttons = ttk.Frame(self, padding=10)
@@ -517,7 +273,7 @@ class DinamicasTotalesView(ttk.Frame):
     # Guardar / Cargar
     # ------------------------------------------------------------
     def _on_save(self) -> None:
-        if not self.hash_table:
+        if self.hash_table is None:
             messagebox.showwarning("Guardar tabla", "Primero inicializa la tabla para poder guardarla.")
             return
 
@@ -541,7 +297,7 @@ class DinamicasTotalesView(ttk.Frame):
         """
         Guarda la tabla y luego vuelve a la vista anterior (externas).
         """
-        if not self.hash_table:
+        if self.hash_table is None:
             messagebox.showwarning("Guardar tabla", "Primero inicializa la tabla para poder guardarla.")
             return
 
@@ -579,13 +335,20 @@ class DinamicasTotalesView(ttk.Frame):
                 data = json.load(f)
 
             # Verificación mínima de tipo
-            if data.get("tipo") not in (None, "totales"):
+            if data.get("tipo") not in (None, *self.TIPOS):
                 messagebox.showwarning(
                     "Cargar tabla",
                     "El archivo no parece corresponder a una tabla de dinámicas totales.",
                 )
 
-            self.hash_table = HashTableTotales.from_dict(data)
+            cls = self.TIPOS.get(data.get("tipo"), HashTableTotales)
+            self._cerrar_tabla()
+            self.hash_table = cls.from_dict(data)
+            self.modo_var.set(next(m for m, c in self.MODOS.items() if c is cls))
+            self.incremental_var.set(getattr(self.hash_table, "incremental", False))
+            self.disco_var.set(bool(getattr(self.hash_table, "archivo", None)))
+            self._io_previo = None
+            self._update_mode_buttons()
 
             # Actualizar controles de configuración con los valores cargados
             self.entry_cubetas.delete(0, tk.END)
@@ -600,6 +363,7 @@ class DinamicasTotalesView(ttk.Frame):
             # Habilitar botones
             self.btn_insert.config(state="normal")
             self.btn_delete.config(state="normal")
+            self.btn_search.config(state="normal")
             self.btn_expand_total.config(state="normal")
             self.btn_reduce_total.config(state="normal")
             self.btn_save.config(state="normal")
@@ -613,6 +377,14 @@ class DinamicasTotalesView(ttk.Frame):
             messagebox.showerror("Error al cargar", f"No se pudo cargar la tabla:\n{e}")
 
 
+    def _cerrar_tabla(self) -> None:
+        """Libera el archivo de páginas de la tabla actual antes de reemplazarla."""
+        # Lineal y extensible no usan archivo (no tienen cerrar)
+        cerrar = getattr(self.hash_table, "cerrar", None)
+        if cerrar is not None:
+            cerrar()
+        self.hash_table = None
+
     # ------------------------------------------------------------
     # Callbacks
     # ------------------------------------------------------------
@@ -632,12 +404,30 @@ class DinamicasTotalesView(ttk.Frame):
             )
             return
 
-        self.hash_table = HashTableTotales(num_cubetas, tam_cubeta, densidad_obj)
+        cls = self.MODOS.get(self.modo_var.get(), HashTableTotales)
+        archivo = None
+        if self.disco_var.get() and cls is HashTableTotales:
+            archivo = filedialog.asksaveasfilename(
+                title="Archivo de páginas de las cubetas",
+                defaultextension=".pag",
+                filetypes=[("Archivo de páginas", "*.pag"), ("Todos los archivos", "*.*")],
+            )
+            if not archivo:
+                return
+
+        self._io_previo = None
+        self._cerrar_tabla()
+        if cls is HashTableTotales:
+            self.hash_table = cls(num_cubetas, tam_cubeta, densidad_obj, self.incremental_var.get(), archivo)
+        else:
+            self.hash_table = cls(num_cubetas, tam_cubeta, densidad_obj)
+        self._update_mode_buttons()
         self._update_estado()
         self._draw_table()
 
         self.btn_insert.config(state="normal")
         self.btn_delete.config(state="normal")
+        self.btn_search.config(state="normal")
         self.btn_expand_total.config(state="normal")
         self.btn_reduce_total.config(state="normal")
         # 🔹 habilitar guardar / guardar y cerrar
@@ -647,7 +437,7 @@ class DinamicasTotalesView(ttk.Frame):
         self.label_log.config(text="Estructura inicializada correctamente.")
 
     def _on_insert(self) -> None:
-        if not self.hash_table:
+        if self.hash_table is None:
             return
 
         try:
@@ -656,13 +446,22 @@ class DinamicasTotalesView(ttk.Frame):
             self.label_log.config(text="La clave a insertar debe ser un entero.")
             return
 
+        # Sin consultar antes si está: eso leería la cubeta dos veces
+        antes = len(self.hash_table)
         msg = self.hash_table.insertar(clave)
+        if len(self.hash_table) > antes:
+            self.app.traza.registrar("insertar", clave)
+        elif clave_valida(clave):
+            messagebox.showwarning(
+                "Clave duplicada",
+                f"La clave {clave} ya se encuentra almacenada en la cubeta."
+            )
         self._update_estado()
         self._draw_table()
         self.label_log.config(text=msg)
 
     def _on_delete(self) -> None:
-        if not self.hash_table:
+        if self.hash_table is None:
             return
 
         try:
@@ -671,26 +470,52 @@ class DinamicasTotalesView(ttk.Frame):
             self.label_log.config(text="La clave a eliminar debe ser un entero.")
             return
 
+        self.app.traza.registrar("eliminar", clave)
         msg = self.hash_table.eliminar(clave)
         self._update_estado()
         self._draw_table()
         self.label_log.config(text=msg)
 
+    def _on_search(self) -> None:
+        if self.hash_table is None:
+            return
+
+        try:
+            clave = int(self.entry_search.get())
+        except ValueError:
+            self.label_log.config(text="La clave a buscar debe ser un entero.")
+            return
+
+        self.app.traza.registrar("buscar", clave)
+        msg = self.hash_table.buscar(clave)
+        self._update_estado()
+        self._draw_table()
+        self.label_log.config(text=msg)
+
     def _on_force_expand(self) -> None:
-        if not self.hash_table:
+        if self.hash_table is None:
             return
-        # Forzamos una expansión total manual
-        self.hash_table._expansion_total()
+        if isinstance(self.hash_table, HashTableLineal):
+            msg = "Expansión lineal forzada: " + self.hash_table.expansion_lineal()
+        elif isinstance(self.hash_table, HashTableExtendible):
+            msg = self.hash_table.expansion_extendible()
+        else:
+            # Forzamos una expansión total manual
+            self.hash_table._expansion_total()
+            msg = f"Expansión TOTAL forzada. Ahora hay {self.hash_table.num_cubetas} cubetas."
         self._update_estado()
         self._draw_table()
-        self.label_log.config(
-            text=f"Expansión TOTAL forzada. Ahora hay {self.hash_table.num_cubetas} cubetas."
-        )
+        self.label_log.config(text=msg)
 
     def _on_force_reduce(self) -> None:
-        if not self.hash_table:
+        if self.hash_table is None:
             return
-        msg = self.hash_table.reduccion_total()
+        if isinstance(self.hash_table, HashTableLineal):
+            msg = self.hash_table.reduccion_lineal()
+        elif isinstance(self.hash_table, HashTableExtendible):
+            msg = self.hash_table.reduccion_extendible()
+        else:
+            msg = self.hash_table.reduccion_total()
         self._update_estado()
         self._draw_table()
         self.label_log.config(text=msg)
@@ -698,12 +523,35 @@ class DinamicasTotalesView(ttk.Frame):
     # ------------------------------------------------------------
     # Helpers UI
     # ------------------------------------------------------------
+    def _update_mode_buttons(self) -> None:
+        cls = self.MODOS.get(self.modo_var.get())
+        if cls is HashTableLineal:
+            self.btn_expand_total.config(text="Dividir cubeta (puntero)")
+            self.btn_reduce_total.config(text="Fusionar última cubeta")
+        elif cls is HashTableExtendible:
+            self.btn_expand_total.config(text="Duplicar directorio")
+            self.btn_reduce_total.config(text="Fusionar cubetas")
+        else:
+            self.btn_expand_total.config(text="Expansión total")
+            self.btn_reduce_total.config(text="Reducción total")
+
     def _update_estado(self) -> None:
-        if not self.hash_table:
+        if self.hash_table is None:
             self.label_estado.config(text="Estructura no inicializada.")
             return
 
         ht = self.hash_table
+        # E/S de página (solo con cubetas en disco): total y de la última operación
+        io = getattr(ht, "io_paginas", None)
+        if io is not None:
+            previo = self._io_previo or ContadorIO()
+            texto_io = (
+                f" | Páginas leídas: {io.lecturas} (+{io.lecturas - previo.lecturas}) | "
+                f"escritas: {io.escrituras} (+{io.escrituras - previo.escrituras}) | "
+                f"aciertos del buffer: {io.aciertos}"
+            )
+        else:
+            texto_io = ""
         self.label_estado.config(
             text=(
                 f"Cubetas: {ht.num_cubetas} | "
@@ -714,14 +562,30 @@ class DinamicasTotalesView(ttk.Frame):
                 f"(objetivo: {ht.densidad_objetivo:.2f})"
             )
         )
+        if isinstance(ht, HashTableLineal):
+            extra = f" | Nivel: {ht.nivel} | Puntero: {ht.puntero} | Divisiones: {ht.divisiones}"
+        elif isinstance(ht, HashTableExtendible):
+            extra = (
+                f" | Profundidad global: {ht.profundidad_global} | "
+                f"Directorio: {len(ht.directorio)} entradas | Divisiones: {ht.divisiones}"
+            )
+        else:
+            extra = ""
+        if getattr(ht, "migrando", False):
+            extra += f" | Migrando: {len(ht.cubetas_pendientes())} cubetas antiguas pendientes"
+        self.label_estado.config(
+            text=self.label_estado.cget("text") + extra
+            + f" | Registros movidos: {ht.registros_movidos}" + texto_io
+        )
 
     def _draw_table(self) -> None:
         self.canvas.delete("all")
-        if not self.hash_table:
+        if self.hash_table is None:
             return
 
         ht = self.hash_table
-        num_buckets = ht.num_cubetas
+        # Cubetas dibujables: con una migración encadenada pueden ser menos o más que num_cubetas
+        num_buckets = len(ht.buckets)
         tam = ht.tam_cubeta
 
         width = self.canvas.winfo_width()
@@ -741,9 +605,14 @@ class DinamicasTotalesView(ttk.Frame):
         if cubetas_por_fila <= 0:
             cubetas_por_fila = 1
 
-        for b_idx in range(num_buckets):
-            fila = b_idx // cubetas_por_fila
-            col = b_idx % cubetas_por_fila
+        # Cubetas actuales y, durante una migración incremental, las antiguas pendientes
+        cubetas = [(b, ht.buckets[b], ht.overflow[b], False) for b in range(num_buckets)]
+        if getattr(ht, "migrando", False):
+            cubetas += [(j, m, o, True) for j, m, o in ht.cubetas_pendientes()]
+
+        for celda, (b_idx, bucket, overflow_vals, antigua) in enumerate(cubetas):
+            fila = celda // cubetas_por_fila
+            col = celda % cubetas_por_fila
 
             x0 = margin + col * (bucket_w + margin)
             y0 = margin + fila * (cell_h * (tam + 1) + 2 * margin)
@@ -758,24 +627,33 @@ class DinamicasTotalesView(ttk.Frame):
                 width=1,
             )
 
-            # Header con índice de cubeta
+            # Header con índice de cubeta (resaltado si es la siguiente a dividir)
+            es_puntero = isinstance(ht, HashTableLineal) and b_idx == ht.puntero
+            if antigua:
+                titulo = f"ant. b{b_idx}"
+            elif es_puntero:
+                titulo = f"b{b_idx} ← p"
+            elif isinstance(ht, HashTableExtendible):
+                # Bits bajos que comparten sus claves (profundidad local)
+                titulo = f"b{b_idx} [{ht.patron(b_idx)}]"
+            else:
+                titulo = f"b{b_idx}"
             self.canvas.create_rectangle(
                 x0,
                 y0,
                 x0 + bucket_w,
                 y0 + cell_h,
-                fill="#e0e0e0",
+                fill="#ffe08a" if es_puntero else "#f3d6d6" if antigua else "#e0e0e0",
                 outline="#333333",
             )
             self.canvas.create_text(
                 x0 + bucket_w / 2,
                 y0 + cell_h / 2,
-                text=f"b{b_idx}",
+                text=titulo,
                 font=("TkDefaultFont", 9, "bold"),
             )
 
             # Celdas internas (área principal)
-            bucket = ht.buckets[b_idx]
             for i in range(tam):
                 cy0 = y0 + cell_h * (i + 1)
                 cy1 = cy0 + cell_h
@@ -798,7 +676,6 @@ class DinamicasTotalesView(ttk.Frame):
                     )
 
             # --- Dibujar OVERFLOW debajo de la cubeta ---
-            overflow_vals = ht.overflow[b_idx]
             if overflow_vals:
                 base_y = y0 + cell_h * (tam + 1) + 4  # un poquito debajo de la cubeta
 
@@ -830,3 +707,7 @@ class DinamicasTotalesView(ttk.Frame):
                         fill="#cc0000",
                     )
 
+        # Punto de partida de la E/S de la próxima operación (dibujar no cuenta páginas)
+        io = getattr(ht, "io_paginas", None)
+        if io is not None:
+            self._io_previo = io.copia()
@@ -3,6 +3,14 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from typing import List, Optional, Dict
 
+from app.core.hash_stats import ProbeStats, cluster_report, compare_configurations, export_json
+from app.core.hash_table import HashTable, HASH_MODES, PROBE_MODES, TOMBSTONE
+from app.views.animation import AnimationControls, StepScheduler, Steps
+
+
+# A partir de este tamaño la tabla se dibuja en modo virtual
+VIRTUAL_THRESHOLD = 500
+
 
 class HashView(ttk.Frame):
 	def __init__(self, parent: tk.Misc, app) -> None:
@@ -30,7 +38,7 @@ class HashView(ttk.Frame):
 		lbl_hash = ttk.Label(params, text="Función Hash:")
 		lbl_hash.grid(row=0, column=4, sticky="w", padx=(0, 6))
 		self.hash_mode = tk.StringVar(value="modulo")
-		combo_hash = ttk.Combobox(params, values=["modulo", "cuadrado", "plegamiento", "truncamiento"], state="readonly", textvariable=self.hash_mode, width=14)
+		combo_hash = ttk.Combobox(params, values=list(HASH_MODES), state="readonly", textvariable=self.hash_mode, width=14)
 		combo_hash.grid(row=0, column=5, padx=(0, 12))
 
 		# Segunda fila de parámetros
@@ -39,7 +47,7 @@ class HashView(ttk.Frame):
 		self.probe_mode = tk.StringVar(value="lineal")
 		probe_combo = ttk.Combobox(
 			params, 
-			values=["lineal", "cuadrática", "doble hash", "arreglo anidado", "lista enlazada"], 
+			values=list(PROBE_MODES), 
 			state="readonly", 
 			textvariable=self.probe_mode, 
 			width=14
@@ -77,6 +85,10 @@ class HashView(ttk.Frame):
 		self.status = ttk.Label(ops, text="Estado: listo", wraplength=120)
 		self.status.grid(row=6, column=0, pady=(12, 0), sticky="w")
 
+		# Animación sin bloquear la ventana
+		self._anim = StepScheduler(self, render=self._draw, reset=self._clear_marks)
+		AnimationControls(ops, self._anim).grid(row=7, column=0, pady=(12, 0), sticky="w")
+
 		# Panel de visualización
 		viz = ttk.Frame(panel, style="Panel.TFrame", padding=8)
 		viz.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -96,10 +108,20 @@ class HashView(ttk.Frame):
 		self.tree.tag_configure("hit", background="#cfe8ff")
 		self.tree.tag_configure("delete", background="#ffd6d6")
 		
-		scroll = ttk.Scrollbar(tree_container, orient="vertical", command=self.tree.yview)
-		self.tree.configure(yscrollcommand=scroll.set)
-		scroll.pack(side=tk.RIGHT, fill=tk.Y)
+		# En tablas grandes el scroll es virtual: solo existen las filas visibles
+		self._scroll = ttk.Scrollbar(tree_container, orient="vertical", command=self._on_scroll)
+		self.tree.configure(yscrollcommand=self._on_tree_scroll)
+		self._scroll.pack(side=tk.RIGHT, fill=tk.Y)
 		self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+		self.tree.bind("<MouseWheel>", self._on_wheel)
+		self.tree.bind("<Button-4>", self._on_wheel)
+		self.tree.bind("<Button-5>", self._on_wheel)
+		self.tree.bind("<Configure>", lambda e: self._virtual and self._draw())
+
+		self._rows: List[str] = []  # id de cada fila del Treeview
+		self._row_cache: List[Optional[tuple]] = []  # (valores, tag) dibujados en cada fila
+		self._offset = 0  # primera dirección visible en modo virtual
+		self._virtual = False
 
 		# Save/load panel
 		file_panel = ttk.Frame(self, style="Panel.TFrame", padding=8)
@@ -114,18 +136,17 @@ class HashView(ttk.Frame):
 		btn_load = ttk.Button(file_panel, text="Cargar", command=self._on_load)
 		btn_load.grid(row=0, column=2, padx=4, pady=2)
 
+		btn_stats = ttk.Button(file_panel, text="Exportar estadísticas", command=self._on_export_stats)
+		btn_stats.grid(row=0, column=3, padx=4, pady=2)
+
 		back = ttk.Button(self, text="← Volver", command=lambda: app.navigate("internas"))
 		back.pack(pady=6)
 
 		self.app = app
 
-		# Estructuras de datos
-		# Para lineal, cuadrática, doble_hash: lista simple
-		self._table: List[Optional[int]] = []
-		# Para arreglo_anidado: lista de listas
-		self._table_anidado: List[List[int]] = []
-		# Para lista_enlazada: lista de listas (cadenas)
-		self._table_enlazada: List[List[int]] = []
+		# Estructura de datos (tabla hash sin interfaz) y sondeos por operación
+		self._engine = HashTable(10, 4)
+		self._stats = ProbeStats()
 		
 		self._highlight: Optional[int] = None
 		self._delete_index: Optional[int] = None
@@ -166,108 +187,9 @@ class HashView(ttk.Frame):
 			d = 4
 		return max(1, n), max(1, d)
 
-	def _hash(self, k: int, n: int, d: int) -> int:
+	def _hash(self, k: int) -> int:
 		"""Calcula el hash de una clave"""
-		mode = self.hash_mode.get()
-		table_size, _ = self._read_params()
-		
-		if mode == "modulo":
-			return k % table_size
-			
-		elif mode == "cuadrado":
-			# Cuadrado: toma dígitos centrales de K²
-			k2 = k * k
-			k2_str = str(k2).zfill(2 * d)
-			center_len = d
-			start = max(0, (len(k2_str) - center_len) // 2)
-			center = int(k2_str[start:start + center_len]) if k2_str[start:start + center_len] else 0
-			return center % table_size
-			
-		elif mode == "plegamiento":
-			# Plegamiento: H(K) = dig_men_sig(K) + 1
-			# El tamaño de parte depende de los dígitos de N (cantidad de ceros)
-			# n=10 → 1 dígito → partes de 1: 1035 → 1*0*3*5
-			# n=100 → 2 dígitos → partes de 2: 1035 → 10*35
-			k_str = str(k)
-			
-			# Calcular tamaño de parte según dígitos de table_size
-			part_size = len(str(table_size)) - 1  # n=10→1, n=100→2, n=1000→3
-			if part_size < 1:
-				part_size = 1
-			
-			# Dividir en partes y multiplicar
-			parts = []
-			for i in range(0, len(k_str), part_size):
-				part = k_str[i:i + part_size]
-				if part:
-					parts.append(int(part))
-			
-			# Multiplicar todas las partes
-			if not parts:
-				result = 0
-			elif len(parts) == 1:
-				result = parts[0]
-			else:
-				result = 1
-				for p in parts:
-					result *= p
-			
-			# Tomar primeros dígitos (según part_size) de izquierda a derecha + 1
-			result_str = str(result)
-			if len(result_str) >= part_size:
-				direccion = int(result_str[:part_size])
-			else:
-				direccion = result
-			
-			return (direccion + 1) % table_size
-			
-		elif mode == "truncamiento":
-			# Truncamiento: H(K) = elegir_dig(d1, d2, ...) + 1
-			# Cantidad de dígitos a elegir depende de N
-			# n=10 → 1 dígito → elegir d1
-			# n=100 → 2 dígitos → elegir d1, d2
-			k_str = str(k).zfill(d)
-			
-			# Calcular cuántos dígitos elegir según table_size
-			num_digits = len(str(table_size)) - 1  # n=10→1, n=100→2, n=1000→3
-			if num_digits < 1:
-				num_digits = 1
-			
-			# Elegir los primeros num_digits dígitos
-			selected = k_str[:num_digits] if len(k_str) >= num_digits else k_str
-			direccion = int(selected) if selected else 0
-			
-			return (direccion + 1) % table_size
-		
-		return k % table_size
-
-	def _double_hash(self, d: int, n: int) -> int:
-		"""Doble hash: H(D) = (D + 1) mod n + 1"""
-		return ((d + 1) % n) + 1
-
-	def _probe_indices(self, k: int, n: int, d: int):
-		"""Genera índices de prueba según el método seleccionado"""
-		base = self._hash(k, n, d)
-		mode = self.probe_mode.get()
-		
-		if mode == "lineal":
-			# D, D+1, D+2, D+3...
-			for t in range(n):
-				yield (base + t) % n
-		elif mode == "cuadrática":
-			# D, D+1², D+2², D+3²... (D+1, D+4, D+9...)
-			for t in range(n):
-				yield (base + t * t) % n
-		elif mode == "doble hash":
-			# Aplica doble hash a la dirección colisionada
-			current = base
-			visited = set()
-			for _ in range(n):
-				if current in visited:
-					break
-				visited.add(current)
-				yield current
-				current = (current + self._double_hash(current, n)) % n
+		return self._engine.hash(k)
 
 	def _validate_key(self, s: str, d: int) -> Optional[int]:
 		if not s.isdigit():
@@ -279,28 +201,26 @@ class HashView(ttk.Frame):
 		return int(s)
 
 	def _on_init(self) -> None:
-		n, _ = self._read_params()
-		mode = self.probe_mode.get()
+		self._anim.cancel()
+		n, d = self._read_params()
 		self._configure_columns()
-		
-		if mode in ["lineal", "cuadrática", "doble hash"]:
-			self._table = [None] * n
-			self._table_anidado = []
-			self._table_enlazada = []
-		elif mode == "arreglo anidado":
-			self._table = [None] * n
-			self._table_anidado = [[] for _ in range(n)]
-			self._table_enlazada = []
-		else:  # lista enlazada
-			self._table = []
-			self._table_anidado = []
-			self._table_enlazada = [[] for _ in range(n)]
-		
+		self._new_engine(n, d)
 		self._highlight = None
 		self._delete_index = None
 		self.status.configure(text=f"Tabla reiniciada (n={n})")
 		self._draw()
 
+	def _new_engine(self, n: int, d: int) -> None:
+		self._engine = HashTable(n, d, self.hash_mode.get(), self.probe_mode.get())
+		self._stats = ProbeStats()
+		self._engine.stats = self._stats
+
+	def _sync_engine(self) -> None:
+		"""Aplica a la tabla la función hash y los dígitos seleccionados."""
+		_, d = self._read_params()
+		self._engine.hash_mode = self.hash_mode.get()
+		self._engine.d = d
+
 	def _on_generate(self) -> None:
 		n, d = self._read_params()
 		self._on_init()
@@ -313,8 +233,6 @@ class HashView(ttk.Frame):
 		attempts = 0
 		max_attempts = target * 50
 		
-		mode = self.probe_mode.get()
-		
 		while inserted < target and attempts < max_attempts:
 			attempts += 1
 			k = random.randint(min_value, max_value)
@@ -322,286 +240,221 @@ class HashView(ttk.Frame):
 				continue
 			seen.add(k)
 			
-			if self._insert_key(k, n, d, animate=False):
+			if self._engine.insert(k) is not None:
 				inserted += 1
 		
 		self.status.configure(text=f"Generados {inserted} elementos")
 		self._draw()
 
-	def _insert_key(self, k: int, n: int, d: int, animate: bool = True) -> bool:
-		"""Inserta una clave según el método de resolución"""
-		mode = self.probe_mode.get()
-		base = self._hash(k, n, d)
-		
-		if mode in ["lineal", "cuadrática", "doble hash"]:
-			# Verificar duplicado
-			for idx in self._probe_indices(k, n, d):
-				if self._table[idx] is None:
-					break
-				if self._table[idx] == k:
-					return False  # Duplicado
-			
-			# Insertar
-			for idx in self._probe_indices(k, n, d):
-				if animate:
-					self._highlight = idx
-					self._draw()
-					self.update_idletasks()
-					self.after(300)
-				if self._table[idx] is None:
-					self._table[idx] = k
-					return True
-			return False  # Tabla llena
-			
-		elif mode == "arreglo anidado":
-			# Verificar duplicado en posición base y anidados
-			if self._table[base] == k:
-				return False
-			if k in self._table_anidado[base]:
-				return False
-			
-			if animate:
-				self._highlight = base
-				self._draw()
-				self.update_idletasks()
-				self.after(300)
-			
-			if self._table[base] is None:
-				self._table[base] = k
-			else:
-				self._table_anidado[base].append(k)
-			return True
-			
-		else:  # lista enlazada
-			# Verificar duplicado en la cadena
-			if k in self._table_enlazada[base]:
-				return False
-			
-			if animate:
-				self._highlight = base
-				self._draw()
-				self.update_idletasks()
-				self.after(300)
-			
-			self._table_enlazada[base].append(k)
-			return True
+	def _highlight_steps(self, indices: List[int], ms: int) -> Steps:
+		"""Resalta cada dirección de la secuencia de prueba."""
+		for idx in indices:
+			self._highlight = idx
+			yield ms
 
-	def _on_insert(self) -> None:
-		n, d = self._read_params()
+	def _clear_marks(self) -> None:
+		self._highlight = None
+		self._delete_index = None
+
+	def _location_text(self, k: int, idx: int) -> str:
+		pos = self._engine.position(k)
+		if pos < 0:
+			return f"dirección {idx}"
+		if self._engine.probe_mode == "arreglo anidado":
+			return f"dirección {idx}, colisión #{pos+1}"
+		return f"dirección {idx}, posición {pos}"
+
+	def _read_key(self) -> Optional[int]:
+		"""Completa la animación pendiente, sincroniza la tabla y valida la clave."""
+		self._anim.skip()
+		self._sync_engine()
+		_, d = self._read_params()
 		key_str = self.entry_key.get().strip()
-		k = self._validate_key(key_str, d)
+		return self._validate_key(key_str, d)
+
+	def _on_insert(self) -> None:
+		k = self._read_key()
 		if k is None:
 			return
 		
-		mode = self.probe_mode.get()
-		
 		# Verificar capacidad para métodos de direccionamiento abierto
-		if mode in ["lineal", "cuadrática", "doble hash"]:
-			if sum(1 for v in self._table if v is not None) >= n:
-				messagebox.showerror("Error", "Tabla llena")
-				return
+		if self._engine.is_full():
+			messagebox.showerror("Error", "Tabla llena")
+			return
 		
-		if self._insert_key(k, n, d, animate=True):
-			base = self._hash(k, n, d)
-			self.status.configure(text=f"Insertado {k} (hash={base})")
+		self._anim.run(self._insert_steps(k))
+
+	def _insert_steps(self, k: int) -> Steps:
+		if k not in self._engine:
+			yield from self._highlight_steps(self._engine.insert_trace(k), 300)
+		if self._engine.insert(k) is not None:
+			self.app.traza.registrar("insertar", k)
+			base = self._hash(k)
+			self.status.configure(text=f"Insertado {k} (hash={base}, sondeos={self._stats.last})")
 			self._draw()
 		else:
 			messagebox.showerror("Error", "No se pudo insertar (duplicado o tabla llena)")
 
 	def _on_search(self) -> None:
-		n, d = self._read_params()
-		key_str = self.entry_key.get().strip()
-		k = self._validate_key(key_str, d)
-		if k is None:
-			return
-		
-		mode = self.probe_mode.get()
-		base = self._hash(k, n, d)
-		
-		if mode in ["lineal", "cuadrática", "doble hash"]:
-			for idx in self._probe_indices(k, n, d):
-				if self._table[idx] is None:
-					break
-				self._highlight = idx
-				self._draw()
-				self.update_idletasks()
-				self.after(500)
-				if self._table[idx] == k:
-					self.status.configure(text=f"Encontrado {k} en dirección {idx}")
-					messagebox.showinfo("Búsqueda", f"Número encontrado en la dirección {idx}")
-					return
-					
-		elif mode == "arreglo anidado":
-			self._highlight = base
-			self._draw()
-			self.update_idletasks()
-			self.after(500)
-			
-			if self._table[base] == k:
-				self.status.configure(text=f"Encontrado {k} en dirección {base}")
-				messagebox.showinfo("Búsqueda", f"Número encontrado en la dirección {base}")
-				return
-			if k in self._table_anidado[base]:
-				pos = self._table_anidado[base].index(k)
-				self.status.configure(text=f"Encontrado {k} en dirección {base}, colisión #{pos+1}")
-				messagebox.showinfo("Búsqueda", f"Número encontrado en la dirección {base}, colisión #{pos+1}")
-				return
-				
-		else:  # lista enlazada
-			self._highlight = base
+		k = self._read_key()
+		if k is not None:
+			self.app.traza.registrar("buscar", k)
+			self._anim.run(self._search_steps(k))
+
+	def _search_steps(self, k: int) -> Steps:
+		yield from self._highlight_steps(self._engine.trace(k), 500)
+		idx = self._engine.search(k)
+		if idx is not None:
+			where = self._location_text(k, idx)
 			self._draw()
-			self.update_idletasks()
-			self.after(500)
-			
-			if k in self._table_enlazada[base]:
-				pos = self._table_enlazada[base].index(k)
-				self.status.configure(text=f"Encontrado {k} en dirección {base}, posición {pos}")
-				messagebox.showinfo("Búsqueda", f"Número encontrado en la dirección {base}, posición {pos}")
-				return
+			self.status.configure(text=f"Encontrado {k} en {where} (sondeos={self._stats.last})")
+			messagebox.showinfo("Búsqueda", f"Número encontrado en la {where}")
+			return
 		
 		self._highlight = None
 		self._draw()
-		self.status.configure(text="No encontrado")
+		self.status.configure(text=f"No encontrado (sondeos={self._stats.last})")
 		messagebox.showinfo("Búsqueda", "Valor no encontrado")
 
 	def _on_delete(self) -> None:
-		n, d = self._read_params()
-		key_str = self.entry_key.get().strip()
-		k = self._validate_key(key_str, d)
-		if k is None:
-			return
-		
-		mode = self.probe_mode.get()
-		base = self._hash(k, n, d)
-		
-		if mode in ["lineal", "cuadrática", "doble hash"]:
-			for idx in self._probe_indices(k, n, d):
-				if self._table[idx] is None:
-					break
-				self._highlight = idx
-				self._draw()
-				self.update_idletasks()
-				self.after(500)
-				if self._table[idx] == k:
-					self._delete_index = idx
-					self._draw()
-					self.update_idletasks()
-					self.after(800)
-					self._table[idx] = None
-					self._delete_index = None
-					self._highlight = None
-					self.status.configure(text=f"Eliminado {k}")
-					self._draw()
-					return
-					
-		elif mode == "arreglo anidado":
-			self._highlight = base
-			self._draw()
-			self.update_idletasks()
-			self.after(500)
-			
-			if self._table[base] == k:
-				self._delete_index = base
-				self._draw()
-				self.update_idletasks()
-				self.after(800)
-				# Mover primer anidado a posición principal si existe
-				if self._table_anidado[base]:
-					self._table[base] = self._table_anidado[base].pop(0)
-				else:
-					self._table[base] = None
-				self._delete_index = None
-				self._highlight = None
-				self.status.configure(text=f"Eliminado {k}")
-				self._draw()
-				return
-			elif k in self._table_anidado[base]:
-				self._delete_index = base
-				self._draw()
-				self.update_idletasks()
-				self.after(800)
-				self._table_anidado[base].remove(k)
-				self._delete_index = None
-				self._highlight = None
-				self.status.configure(text=f"Eliminado {k}")
-				self._draw()
-				return
-				
-		else:  # lista enlazada
-			self._highlight = base
+		k = self._read_key()
+		if k is not None:
+			self.app.traza.registrar("eliminar", k)
+			self._anim.run(self._delete_steps(k))
+
+	def _delete_steps(self, k: int) -> Steps:
+		yield from self._highlight_steps(self._engine.trace(k), 500)
+		idx = self._engine.locate(k)
+		if idx is not None:
+			self._delete_index = idx
+			yield 800
+			rehashes = self._engine.rehashes
+			self._engine.delete(k)
+			self._delete_index = None
+			self._highlight = None
+			if self._engine.rehashes > rehashes:
+				self.status.configure(text=f"Eliminado {k} (sondeos={self._stats.last}, tabla reorganizada sin marcas de borrado)")
+			else:
+				self.status.configure(text=f"Eliminado {k} (sondeos={self._stats.last})")
 			self._draw()
-			self.update_idletasks()
-			self.after(500)
-			
-			if k in self._table_enlazada[base]:
-				self._delete_index = base
-				self._draw()
-				self.update_idletasks()
-				self.after(800)
-				self._table_enlazada[base].remove(k)
-				self._delete_index = None
-				self._highlight = None
-				self.status.configure(text=f"Eliminado {k}")
-				self._draw()
-				return
+			return
 		
 		self._highlight = None
 		self._draw()
-		self.status.configure(text="No encontrado")
+		self._engine.delete(k)  # registra el borrado fallido
+		self.status.configure(text=f"No encontrado (sondeos={self._stats.last})")
 		messagebox.showinfo("Búsqueda", "Valor no encontrado")
 
-	def _draw(self) -> None:
-		self.tree.delete(*self.tree.get_children())
-		n, d = self._read_params()
-		mode = self.probe_mode.get()
-		
-		for idx in range(n):
-			if self._delete_index == idx:
-				tags = ("delete",)
-			elif self._highlight == idx:
-				tags = ("hit",)
+	def _row(self, idx: int, d: int) -> tuple:
+		"""Valores y tag de la fila de una dirección."""
+		engine = self._engine
+		if self._delete_index == idx:
+			tag = "delete"
+		elif self._highlight == idx:
+			tag = "hit"
+		else:
+			tag = "normal"
+		
+		if engine.open_addressing:
+			val = engine.table[idx]
+			if val is None:
+				val_str = "-"
+			elif val == TOMBSTONE:
+				val_str = "(borrado)"
 			else:
-				tags = ("normal",)
+				val_str = str(val).zfill(d)
+			return (idx, val_str, ""), tag
+		
+		if engine.probe_mode == "arreglo anidado":
+			val = engine.table[idx]
+			val_str = "-" if val is None else str(val).zfill(d)
 			
-			if mode in ["lineal", "cuadrática", "doble hash"]:
-				# Asegurar que la tabla tiene el tamaño correcto
-				if len(self._table) <= idx:
-					self._table.extend([None] * (idx + 1 - len(self._table)))
-				val = self._table[idx]
-				val_str = "-" if val is None else str(val).zfill(d)
-				self.tree.insert("", "end", values=(idx, val_str, ""), tags=tags)
-				
-			elif mode == "arreglo anidado":
-				if len(self._table) <= idx:
-					self._table.extend([None] * (idx + 1 - len(self._table)))
-				if len(self._table_anidado) <= idx:
-					self._table_anidado.extend([[] for _ in range(idx + 1 - len(self._table_anidado))])
-				
-				val = self._table[idx]
-				val_str = "-" if val is None else str(val).zfill(d)
-				
-				# Mostrar arreglo anidado
-				anidados = self._table_anidado[idx]
-				anidado_str = ", ".join(str(x).zfill(d) for x in anidados) if anidados else "-"
-				
-				self.tree.insert("", "end", values=(idx, val_str, anidado_str), tags=tags)
-				
-			else:  # lista enlazada
-				if len(self._table_enlazada) <= idx:
-					self._table_enlazada.extend([[] for _ in range(idx + 1 - len(self._table_enlazada))])
-				
-				cadena = self._table_enlazada[idx]
-				if cadena:
-					# Mostrar como: 2035 -> 4035 -> 6035
-					val_str = " → ".join(str(x).zfill(d) for x in cadena)
-				else:
-					val_str = "-"
-				
-				self.tree.insert("", "end", values=(idx, val_str, ""), tags=tags)
+			# Mostrar arreglo anidado
+			anidados = engine.anidado[idx]
+			anidado_str = ", ".join(str(x).zfill(d) for x in anidados) if anidados else "-"
+			return (idx, val_str, anidado_str), tag
+		
+		# lista enlazada, mostrar como: 2035 -> 4035 -> 6035
+		cadena = engine.enlazada[idx]
+		val_str = " → ".join(str(x).zfill(d) for x in cadena) if cadena else "-"
+		return (idx, val_str, ""), tag
+
+	def _visible_rows(self) -> int:
+		"""Filas que caben en el Treeview (mínimo su altura configurada)."""
+		row_height = 20
+		if self._rows:
+			bbox = self.tree.bbox(self._rows[0])
+			if bbox:
+				row_height = max(1, bbox[3])
+		return max(int(self.tree.cget("height")), self.tree.winfo_height() // row_height)
+
+	def _draw(self) -> None:
+		"""Actualiza solo las filas cuyo contenido o resaltado cambió."""
+		_, d = self._read_params()
+		n = self._engine.n
+		self._virtual = n > VIRTUAL_THRESHOLD
+		
+		if self._virtual:
+			count = min(n, self._visible_rows())
+			# Llevar a la vista la dirección resaltada
+			target = self._delete_index if self._delete_index is not None else self._highlight
+			if target is not None and not (self._offset <= target < self._offset + count):
+				self._offset = target - count // 2
+			self._offset = max(0, min(self._offset, n - count))
+		else:
+			count = n
+			self._offset = 0
+		
+		if len(self._rows) > count:
+			self.tree.delete(*self._rows[count:])
+			del self._rows[count:]
+			del self._row_cache[count:]
+		while len(self._rows) < count:
+			self._rows.append(self.tree.insert("", "end"))
+			self._row_cache.append(None)
+		
+		offset = self._offset
+		for i, iid in enumerate(self._rows):
+			row = self._row(offset + i, d)
+			if row != self._row_cache[i]:
+				values, tag = row
+				self.tree.item(iid, values=values, tags=(tag,))
+				self._row_cache[i] = row
+		
+		if self._virtual:
+			self._scroll.set(offset / n, (offset + count) / n)
+
+	def _on_tree_scroll(self, first, last) -> None:
+		if not self._virtual:
+			self._scroll.set(first, last)
+
+	def _on_scroll(self, *args) -> None:
+		if not self._virtual:
+			self.tree.yview(*args)
+			return
+		n = self._engine.n
+		count = len(self._rows)
+		if args[0] == "moveto":
+			self._offset = int(float(args[1]) * n)
+		elif args[0] == "scroll":
+			step = count if args[2] == "pages" else 1
+			self._offset += int(args[1]) * step
+		self._draw()
+
+	def _on_wheel(self, event):
+		if not self._virtual:
+			return None
+		up = getattr(event, "num", None) == 4 or getattr(event, "delta", 0) > 0
+		self._offset += -3 if up else 3
+		self._draw()
+		return "break"
 
 	def _serialize(self) -> str:
-		n, d = self._read_params()
-		mode = self.probe_mode.get()
+		self._anim.skip()
+		_, d = self._read_params()
+		engine = self._engine
+		n = engine.n
+		mode = engine.probe_mode
 		
 		lines = [
 			f"n:{n}",
@@ -611,16 +464,16 @@ class HashView(ttk.Frame):
 		]
 		
 		if mode in ["lineal", "cuadrática", "doble hash"]:
-			vals = ["" if v is None else str(v) for v in self._table[:n]]
+			vals = ["" if v is None else str(v) for v in engine.table[:n]]
 			lines.append(f"table:{','.join(vals)}")
 		elif mode == "arreglo anidado":
-			vals = ["" if v is None else str(v) for v in self._table[:n]]
+			vals = ["" if v is None else str(v) for v in engine.table[:n]]
 			lines.append(f"table:{','.join(vals)}")
-			for i, arr in enumerate(self._table_anidado[:n]):
+			for i, arr in enumerate(engine.anidado[:n]):
 				if arr:
 					lines.append(f"anidado_{i}:{','.join(str(x) for x in arr)}")
 		else:  # lista enlazada
-			for i, cadena in enumerate(self._table_enlazada[:n]):
+			for i, cadena in enumerate(engine.enlazada[:n]):
 				if cadena:
 					lines.append(f"lista_{i}:{','.join(str(x) for x in cadena)}")
 		
@@ -687,6 +540,7 @@ class HashView(ttk.Frame):
 		path = filedialog.askopenfilename(title="Cargar tabla", filetypes=[("Texto", "*.txt")])
 		if not path:
 			return
+		self._anim.cancel()
 		try:
 			with open(path, "r", encoding="utf-8") as f:
 				content = f.read()
@@ -705,23 +559,32 @@ class HashView(ttk.Frame):
 		self.entry_n.insert(0, str(n))
 		self.entry_digits.delete(0, tk.END)
 		self.entry_digits.insert(0, str(d))
-		self.hash_mode.set(hash_mode if hash_mode in ("modulo", "cuadrado", "plegamiento", "truncamiento") else "modulo")
-		self.probe_mode.set(probe_mode if probe_mode in ("lineal", "cuadrática", "doble hash", "arreglo anidado", "lista enlazada") else "lineal")
+		self.hash_mode.set(hash_mode if hash_mode in HASH_MODES else "modulo")
+		self.probe_mode.set(probe_mode if probe_mode in PROBE_MODES else "lineal")
 		
-		if probe_mode in ["lineal", "cuadrática", "doble hash"]:
-			self._table = table + [None] * (n - len(table))
-			self._table_anidado = []
-			self._table_enlazada = []
-		elif probe_mode == "arreglo anidado":
-			self._table = table + [None] * (n - len(table))
-			self._table_anidado = [anidados.get(i, []) for i in range(n)]
-			self._table_enlazada = []
-		else:  # lista enlazada
-			self._table = []
-			self._table_anidado = []
-			self._table_enlazada = [listas.get(i, []) for i in range(n)]
+		self._configure_columns()
+		self._new_engine(n, d)
+		self._engine.load(table, anidados, listas)
 		
 		self._highlight = None
 		self._delete_index = None
 		self.status.configure(text=f"Tabla cargada (n={n}, d={d})")
 		self._draw()
+
+	def _on_export_stats(self) -> None:
+		"""Exporta sondeos, agrupamiento y la comparación de todas las combinaciones."""
+		path = filedialog.asksaveasfilename(title="Exportar estadísticas", defaultextension=".json", filetypes=[("JSON", "*.json")])
+		if not path:
+			return
+		engine = self._engine
+		data = {
+			"tabla": cluster_report(engine),
+			"operaciones": self._stats.summary(),
+			"comparacion": compare_configurations(engine.keys(), engine.n, engine.d),
+		}
+		try:
+			export_json(data, path)
+			best = data["comparacion"][0]
+			messagebox.showinfo("Éxito", f"Estadísticas exportadas. Mejor configuración: {best['hash']} + {best['resolucion']}")
+		except Exception as e:
+			messagebox.showerror("Error", f"No se pudo guardar: {e}")
@@ -3,6 +3,8 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from typing import Dict, Optional, List, Tuple, Any
 
+from app.core.undo_log import UndoLog
+
 
 class HuffmanNode:
 	def __init__(self, char: Optional[str] = None, freq: int = 0, left: Optional['HuffmanNode'] = None, right: Optional['HuffmanNode'] = None) -> None:
@@ -62,9 +64,11 @@ class HuffmanView(ttk.Frame):
 		# Botón de deshacer
 		btn_undo = ttk.Button(ops, text="↶ Deshacer (Ctrl+Z)", command=self._on_undo)
 		btn_undo.grid(row=row_base + 4, column=0, pady=2, sticky="ew")
+		btn_redo = ttk.Button(ops, text="↷ Rehacer (Ctrl+Y)", command=self._on_redo)
+		btn_redo.grid(row=row_base + 5, column=0, pady=2, sticky="ew")
 
 		self.status = ttk.Label(ops, text="Estado: listo")
-		self.status.grid(row=row_base + 5, column=0, pady=(12, 0), sticky="w")
+		self.status.grid(row=row_base + 6, column=0, pady=(12, 0), sticky="w")
 
 		viz = ttk.Frame(panel, style="Panel.TFrame", padding=8)
 		viz.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -102,51 +106,67 @@ class HuffmanView(ttk.Frame):
 		self._anim_index: int = 0
 		self._anim_running: bool = False
 		
-		# Undo mechanism
-		self._history: List[Dict[str, Any]] = []
-		self._max_history = 20  # Máximo 20 estados en el historial
+		# Deshacer/rehacer: registro de operaciones con su inversa
+		self._log = UndoLog()
 		
-		# Bind Ctrl+Z
+		# Bind Ctrl+Z / Ctrl+Y
 		self.bind_all("<Control-z>", self._on_undo)
+		self.bind_all("<Control-y>", self._on_redo)
 		
 		self._draw()
 
-	def _save_state(self) -> None:
-		"""Guarda el estado actual en el historial para poder deshacerlo"""
-		current_state = {
-			'text': self.current_text,
-			'frequencies': dict(self.frequencies),
-			'huffman_codes': dict(self.huffman_codes),
-			'root_node': self._serialize_node(self.root_node) if self.root_node else None
-		}
-		self._history.append(current_state)
-		
-		# Mantener solo los últimos N estados
-		if len(self._history) > self._max_history:
-			self._history.pop(0)
-
-	def _serialize_node(self, node: Optional[HuffmanNode]) -> Optional[Dict[str, Any]]:
-		"""Serializa un nodo del árbol de Huffman"""
-		if node is None:
-			return None
-		return {
-			'char': node.char,
-			'freq': node.freq,
-			'left': self._serialize_node(node.left),
-			'right': self._serialize_node(node.right)
-		}
-
-	def _deserialize_node(self, data: Optional[Dict[str, Any]]) -> Optional[HuffmanNode]:
-		"""Deserializa un nodo del árbol de Huffman"""
-		if data is None:
-			return None
-		node = HuffmanNode(
-			char=data['char'],
-			freq=data['freq']
-		)
-		node.left = self._deserialize_node(data.get('left'))
-		node.right = self._deserialize_node(data.get('right'))
-		return node
+	def _capture_state(self) -> tuple:
+		"""Estado actual por referencia (reiniciar y cargar lo reemplazan, no lo modifican)"""
+		return self.current_text, self.frequencies, self.huffman_codes, self.root_node
+
+	def _restore_state(self, state: tuple) -> None:
+		self.current_text, self.frequencies, self.huffman_codes, self.root_node = state
+		self._highlight_nodes = []
+
+	def _checkpoint(self, anterior: tuple, descripcion: str) -> None:
+		self._log.checkpoint(anterior, self._capture_state, self._restore_state, descripcion, len(anterior[0]) + len(anterior[1]))
+
+	def _log_add(self, char: str) -> None:
+		"""La letra se agregó al final del texto; se deshace quitándola (el árbol se recalcula)"""
+		def deshacer() -> None:
+			self.current_text = self.current_text[:-1]
+			self.frequencies[char] -= 1
+			if self.frequencies[char] <= 0:
+				del self.frequencies[char]
+			self._rebuild_tree()
+
+		def rehacer() -> None:
+			self.current_text += char
+			self.frequencies[char] = self.frequencies.get(char, 0) + 1
+			self._rebuild_tree()
+
+		self._log.registrar(deshacer, rehacer, f"agregar '{char}'")
+
+	def _log_remove(self, char: str, text_idx: int, position: int) -> None:
+		"""
+		Se quitó la letra de text_idx (-1 si no estaba en el texto); `position` es su
+		lugar entre las frecuencias, que define el desempate al construir el árbol.
+		"""
+		def deshacer() -> None:
+			if text_idx >= 0:
+				self.current_text = self.current_text[:text_idx] + char + self.current_text[text_idx:]
+			if char in self.frequencies:
+				self.frequencies[char] += 1
+			else:
+				items = list(self.frequencies.items())
+				items.insert(position, (char, 1))
+				self.frequencies = dict(items)
+			self._rebuild_tree()
+
+		def rehacer() -> None:
+			if text_idx >= 0:
+				self.current_text = self.current_text[:text_idx] + self.current_text[text_idx + 1:]
+			self.frequencies[char] -= 1
+			if self.frequencies[char] <= 0:
+				del self.frequencies[char]
+			self._rebuild_tree()
+
+		self._log.registrar(deshacer, rehacer, f"eliminar '{char}'")
 
 	def _validate_char(self, char_str: str) -> Optional[str]:
 		"""Valida que la entrada sea una letra válida"""
@@ -223,12 +243,10 @@ class HuffmanView(ttk.Frame):
 		if char is None:
 			return
 		
-		# Guardar estado antes de agregar
-		self._save_state()
-		
 		# Agregar la letra al texto y frecuencias
 		self.current_text += char
 		self.frequencies[char] = self.frequencies.get(char, 0) + 1
+		self._log_add(char)
 		
 		# Reconstruir árbol automáticamente
 		self._rebuild_tree()
@@ -247,8 +265,7 @@ class HuffmanView(ttk.Frame):
 			messagebox.showwarning("Advertencia", f"La letra '{char}' no está en el texto")
 			return
 		
-		# Guardar estado antes de eliminar
-		self._save_state()
+		position = list(self.frequencies).index(char)
 		
 		# Eliminar una instancia de la letra
 		self.frequencies[char] -= 1
@@ -256,9 +273,10 @@ class HuffmanView(ttk.Frame):
 			del self.frequencies[char]
 		
 		# Eliminar del texto actual
-		if char in self.current_text:
-			idx = self.current_text.find(char)
+		idx = self.current_text.find(char)
+		if idx >= 0:
 			self.current_text = self.current_text[:idx] + self.current_text[idx+1:]
+		self._log_remove(char, idx, position)
 		
 		# Reconstruir árbol automáticamente
 		self._rebuild_tree()
@@ -276,8 +294,7 @@ class HuffmanView(ttk.Frame):
 			messagebox.showinfo("Información", "Agregue letras primero para construir el árbol")
 			return
 
-		# Guardar estado antes de construir
-		self._save_state()
+		# Construir no cambia las frecuencias (el árbol ya está al día): no se registra para deshacer
 
 		# Preparar animación de construcción
 		self._anim_steps = [("frequencies", dict(self.frequencies))]
@@ -312,34 +329,37 @@ class HuffmanView(ttk.Frame):
 		self._prepare_animation()
 
 	def _on_reset(self) -> None:
-		self._save_state()  # Guardar estado antes de reiniciar
+		anterior = self._capture_state()
 		self.root_node = None
 		self.huffman_codes = {}
 		self.frequencies = {}
 		self.current_text = ""
+		self._checkpoint(anterior, "reiniciar")
 		self._highlight_nodes = []
 		self.status.configure(text="Estructura reiniciada")
 		self._draw()
 
 	def _on_undo(self, event=None) -> None:
 		"""Deshace la última operación realizada"""
-		if not self._history:
+		descripcion = self._log.deshacer()
+		if descripcion is None:
 			self.status.configure(text="No hay operaciones para deshacer")
 			messagebox.showinfo("Deshacer", "No hay operaciones para deshacer")
 			return
-		
-		# Restaurar el último estado guardado
-		last_state = self._history.pop()
-		
-		self.current_text = last_state['text']
-		self.frequencies = last_state['frequencies']
-		self.huffman_codes = last_state['huffman_codes']
-		self.root_node = self._deserialize_node(last_state['root_node'])
-		
-		self.status.configure(text=f"Operación deshecha. Estados restantes: {len(self._history)}")
-		self._draw()
+		self._after_history(f"Deshecho: {descripcion}")
 
+	def _on_redo(self, event=None) -> None:
+		"""Rehace la última operación deshecha"""
+		descripcion = self._log.rehacer()
+		if descripcion is None:
+			self.status.configure(text="No hay operaciones para rehacer")
+			return
+		self._after_history(f"Rehecho: {descripcion}")
 
+	def _after_history(self, texto: str) -> None:
+		self._highlight_nodes = []
+		self.status.configure(text=f"{texto}. Deshacer: {len(self._log)}, rehacer: {self._log.pendientes_rehacer}")
+		self._draw()
 
 	def _serialize(self) -> str:
 		"""Serializa el estado actual para guardar"""
@@ -413,32 +433,24 @@ class HuffmanView(ttk.Frame):
 			messagebox.showerror("Error", f"No se pudo guardar: {e}")
 
 	def _on_load(self) -> None:
-		# Guardar estado antes de cargar
-		self._save_state()
-		
 		path = filedialog.askopenfilename(title="Cargar árbol de Huffman", filetypes=[("Texto", "*.txt")])
 		if not path:
-			# Restaurar estado ya que no se cargó nada
-			if self._history:
-				self._history.pop()
 			return
 		try:
 			with open(path, "r", encoding="utf-8") as f:
 				content = f.read()
 		except Exception as e:
 			messagebox.showerror("Error", f"No se pudo leer: {e}")
-			# Restaurar estado ya que no se cargó nada
-			if self._history:
-				self._history.pop()
 			return
 		
+		anterior = self._capture_state()
 		success = self._parse(content)
 		if not success:
 			messagebox.showerror("Error", "Formato inválido")
 			# Restaurar estado ya que no se cargó nada
-			if self._history:
-				self._history.pop()
+			self._restore_state(anterior)
 			return
+		self._checkpoint(anterior, "cargar")
 		
 		self.status.configure(text="Árbol de Huffman cargado")
 		self._draw()
@@ -3,6 +3,10 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import json
 
+from app.core.bplus_tree import comparar
+from app.core.index_sweep import CRITERIOS, TIPOS, barrido, format_table, mejores, rango, tamano, write_csv, write_json
+from app.core.isam_index import CONSULTAS, IndiceISAM, costos
+
 
 class IndicesView(ttk.Frame):
     def __init__(self, parent: tk.Misc, app) -> None:  # app: RetroApp
@@ -100,6 +104,21 @@ class IndicesView(ttk.Frame):
         btn_calc = ttk.Button(ops, text="Calcular", command=self._on_calculate)
         btn_calc.grid(row=row, column=0, columnspan=2, pady=(8, 8))
 
+        # Construye los archivos reales y cuenta las lecturas de bloque de cada búsqueda
+        row += 1
+        btn_build = ttk.Button(ops, text="Construir índice y medir", command=self._on_build)
+        btn_build.grid(row=row, column=0, columnspan=2, pady=(0, 8))
+
+        # Árbol B+ dinámico con el mismo fanout bfri, frente al índice estático
+        row += 1
+        btn_bplus = ttk.Button(ops, text="Comparar con árbol B+", command=self._on_compare_bplus)
+        btn_bplus.grid(row=row, column=0, columnspan=2, pady=(0, 8))
+
+        # Muchas configuraciones a la vez (rangos de r, B y R)
+        row += 1
+        btn_sweep = ttk.Button(ops, text="Barrido de parámetros…", command=self._on_sweep)
+        btn_sweep.grid(row=row, column=0, columnspan=2, pady=(0, 8))
+
         # ---------------------------------------------------------------------
         # Resultados
         # ---------------------------------------------------------------------
@@ -122,6 +141,7 @@ class IndicesView(ttk.Frame):
         make_result_row("bi (bloques índice):", "var_bi")
         make_result_row("Niveles índice:", "var_levels")
         make_result_row("Accesos a memoria:", "var_accesses")
+        make_result_row("Accesos medidos:", "var_measured")
 
         # ---------------------------------------------------------------------
         # Panel derecho: visualización en el Canvas
@@ -144,6 +164,10 @@ class IndicesView(ttk.Frame):
         # Para guardar últimos cálculos (para la visualización)
         self._last_calc = None
 
+        # Ventana y grilla del último barrido de parámetros
+        self.ventana_barrido: tk.Toplevel | None = None
+        self._sweep_grid = None
+
         # ---------------------------------------------------------------------
         # Panel inferior: guardar / cargar / limpiar
         # ---------------------------------------------------------------------
@@ -170,7 +194,7 @@ class IndicesView(ttk.Frame):
     # -------------------------------------------------------------------------
     # Cálculos principales (ahora con opción de multinivel)
     # -------------------------------------------------------------------------
-    def _on_calculate(self) -> None:
+    def _on_calculate(self) -> bool:
         try:
             r = int(self.entry_r.get())
             B = float(self.entry_B.get())
@@ -179,77 +203,23 @@ class IndicesView(ttk.Frame):
             p = float(self.entry_p.get())
         except ValueError:
             messagebox.showerror("Error", "Verifica que todos los campos numéricos sean válidos.")
-            return
+            return False
 
         if r <= 0 or B <= 0 or R <= 0 or v <= 0 or p <= 0:
             messagebox.showerror("Error", "Todos los valores deben ser positivos.")
-            return
-
-        # bfr = Factor de bloqueo = B / R (aproximando hacia abajo)
-        bfr = int(B // R)
-        if bfr <= 0:
-            messagebox.showerror(
-                "Error",
-                "El factor de bloqueo bfr = B/R es 0.\nAsegúrate de que B sea mayor que R."
-            )
-            return
-
-        # b = número de bloques = r / bfr (aproximando hacia arriba)
-        b = int(math.ceil(r / bfr))
-
-        # Ri = tamaño entrada de índice = p + v
-        Ri = p + v
+            return False
 
-        # bfri = factor de bloqueo índice = B / Ri (aprox. hacia abajo)
-        bfri = int(B // Ri)
-        if bfri <= 0:
-            messagebox.showerror(
-                "Error",
-                "El factor de bloqueo del índice bfri = B/Ri es 0.\n"
-                "Ajusta B, p o v para que al menos quepa una entrada por bloque."
-            )
-            return
-
-        # ri = nº total de entradas del índice
-        if self.index_type.get() == "primary":
-            # Índice primario (no denso): una entrada por bloque de datos
-            ri = b
-        else:
-            # Índice secundario (denso): una entrada por registro
-            ri = r
-
-        # bi = número de bloques de índice (primer nivel) = ri / bfri (aprox. hacia arriba)
-        bi = int(math.ceil(ri / bfri)) if ri > 0 else 0
-
-        # ¿Multinivel activado?
-        multilevel_blocks = []
-        if bi <= 0:
-            niveles = 0
-            accesos = 0
-        else:
-            if self.is_multilevel.get():
-                # -------------------- MULTINIVEL explícito --------------------
-                # f0 = bfri (entradas por bloque de índice)
-                # b1 = bi  (bloques del índice de primer nivel)
-                # b2 = ceil(b1 / f0), b3 = ceil(b2 / f0), ...
-                current = bi
-                while True:
-                    multilevel_blocks.append(current)
-                    if current <= 1:
-                        break
-                    current = math.ceil(current / bfri)
-
-                niveles = len(multilevel_blocks)        # niveles reales (b1, b2, ..., bn)
-                accesos = niveles + 1                   # niveles + 1 acceso a datos
-            else:
-                # -------------------- SIN multinivel (aprox. log2) ---------
-                # niveles ≈ ceil(log2(bi)), accesos = niveles + 1
-                levels_approx = int(math.ceil(math.log2(bi))) if bi > 1 else 1
-                if levels_approx < 1:
-                    levels_approx = 1
-                niveles = levels_approx
-                accesos = niveles + 1
-                multilevel_blocks = []  # no mostramos niveles explícitos
+        # bfr = ⌊B/R⌋, b = ⌈r/bfr⌉, Ri = p + v, bfri = ⌊B/Ri⌋, ri y bi según el tipo,
+        # niveles (b1, b2, ... en multinivel, ⌈log2 bi⌉ si no) y accesos = niveles + 1
+        try:
+            calc = costos(r, B, R, v, p, self.index_type.get(), self.is_multilevel.get())
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return False
+        bfr, b, Ri, bfri = calc["bfr"], calc["b"], calc["Ri"], calc["bfri"]
+        ri, bi = calc["ri"], calc["bi"]
+        niveles, accesos = calc["niveles"], calc["accesos"]
+        multilevel_blocks = calc["multilevel_blocks"]
 
         # Actualizamos resultados
         self.var_bfr.set(str(bfr))
@@ -260,6 +230,7 @@ class IndicesView(ttk.Frame):
         self.var_bi.set(str(bi))
         self.var_levels.set(str(niveles))
         self.var_accesses.set(str(accesos))
+        self.var_measured.set("-")
 
         # Guardamos parámetros y niveles para la visualización
         self._last_calc = {
@@ -281,6 +252,162 @@ class IndicesView(ttk.Frame):
 
         # Dibujar visualización
         self._draw_visualization()
+        return True
+
+    def _on_build(self) -> None:
+        """Construye el archivo de datos y el índice con los parámetros actuales y mide los accesos reales."""
+        if not self._on_calculate():
+            return
+        calc = self._last_calc
+        try:
+            with IndiceISAM(
+                calc["r"], calc["B"], calc["R"], calc["v"], calc["p"], calc["index_type"], calc["is_multilevel"]
+            ) as indice:
+                medida = indice.medir(CONSULTAS)
+        except (ValueError, OSError) as e:
+            messagebox.showerror("Error", f"No se pudo construir el índice:\n{e}")
+            return
+
+        calc["measured"] = medida
+        self.var_measured.set(f"media {medida['media']:.2f}, máx {medida['maximo']}")
+        messagebox.showinfo(
+            "Índice construido",
+            f"Bloques de datos: {medida['bloques_datos']}\n"
+            f"Bloques de índice por nivel: {medida['bloques_por_nivel']}\n\n"
+            f"Accesos previstos: {medida['previstos']}\n"
+            f"Accesos medidos ({medida['consultas']} búsquedas): media {medida['media']:.2f}, "
+            f"mín {medida['minimo']}, máx {medida['maximo']}"
+        )
+
+    def _on_compare_bplus(self) -> None:
+        """Inserta r claves en un árbol B+ (nodos de B bytes) y compara sus accesos con el índice multinivel."""
+        if not self._on_calculate():
+            return
+        calc = self._last_calc
+        try:
+            resultado = comparar(calc["r"], calc["B"], calc["R"], calc["v"], calc["p"])
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
+
+        denso, primario = resultado["estatico_denso"], resultado["estatico_primario"]
+        messagebox.showinfo(
+            "Árbol B+",
+            f"Árbol B+ (bfri = {resultado['capacidad']} entradas por nodo):\n"
+            f"   Altura: {resultado['altura']}\n"
+            f"   Nodos por nivel: {resultado['nodos_por_nivel']}\n"
+            f"   Accesos por búsqueda: media {resultado['media']:.2f}, máx {resultado['maximo']}\n\n"
+            f"Índice multinivel estático:\n"
+            f"   Denso: bloques {denso['multilevel_blocks']}, accesos {denso['accesos']}\n"
+            f"   Primario: bloques {primario['multilevel_blocks']}, accesos {primario['accesos']}"
+        )
+
+    # -------------------------------------------------------------------------
+    # Barrido de parámetros
+    # -------------------------------------------------------------------------
+    def _on_sweep(self) -> None:
+        """Ventana para evaluar el modelo de costos sobre rangos de r, B y R."""
+        if self.ventana_barrido and self.ventana_barrido.winfo_exists():
+            self.ventana_barrido.lift()
+            self.ventana_barrido.focus_force()
+            return
+
+        self.ventana_barrido = tk.Toplevel(self)
+        self.ventana_barrido.title("Barrido de parámetros de índices")
+        self.ventana_barrido.geometry("900x520")
+
+        main_frame = ttk.Frame(self.ventana_barrido, padding=10)
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        form = ttk.Frame(main_frame)
+        form.pack(fill=tk.X)
+        ttk.Label(
+            form,
+            text="Rangos: valores separados por comas, inicio:fin:paso o inicio:fin:*factor (p. ej. 512:8192:*2)",
+        ).grid(row=0, column=0, columnspan=6, sticky="w", pady=(0, 6))
+
+        def campo(fila: int, columna: int, texto: str, valor: str) -> ttk.Entry:
+            ttk.Label(form, text=texto).grid(row=fila, column=columna, sticky="w", padx=(0, 4), pady=2)
+            entry = ttk.Entry(form, width=22)
+            entry.insert(0, valor)
+            entry.grid(row=fila, column=columna + 1, sticky="w", padx=(0, 12), pady=2)
+            return entry
+
+        # Los valores actuales de la vista sirven de punto de partida
+        self.sweep_r = campo(1, 0, "r (registros):", self.entry_r.get().strip() or "10000,100000,1000000")
+        self.sweep_B = campo(1, 2, "B (bytes por bloque):", "512:8192:*2")
+        self.sweep_R = campo(1, 4, "R (bytes registro):", self.entry_R.get().strip() or "50:200:50")
+        self.sweep_v = campo(2, 0, "v (bytes clave):", self.entry_v.get().strip() or "9")
+        self.sweep_p = campo(2, 2, "p (bytes puntero):", self.entry_p.get().strip() or "6")
+
+        ttk.Label(form, text="Minimizar:").grid(row=2, column=4, sticky="w", padx=(0, 4), pady=2)
+        self.sweep_criterio = ttk.Combobox(form, state="readonly", values=list(CRITERIOS), width=16)
+        self.sweep_criterio.current(0)
+        self.sweep_criterio.grid(row=2, column=5, sticky="w", pady=2)
+
+        self.sweep_multinivel = tk.BooleanVar(value=True)
+        ttk.Checkbutton(form, text="Índice multinivel", variable=self.sweep_multinivel).grid(
+            row=3, column=0, columnspan=2, sticky="w", pady=(4, 0)
+        )
+
+        botones = ttk.Frame(main_frame)
+        botones.pack(fill=tk.X, pady=8)
+        ttk.Button(botones, text="Calcular barrido", command=self._on_sweep_run).pack(side=tk.LEFT, padx=(0, 6))
+        ttk.Button(botones, text="Exportar CSV…", command=lambda: self._on_sweep_export("csv")).pack(side=tk.LEFT, padx=(0, 6))
+        ttk.Button(botones, text="Exportar JSON…", command=lambda: self._on_sweep_export("json")).pack(side=tk.LEFT)
+
+        self.sweep_text = tk.Text(main_frame, height=20, font=("Consolas", 9), wrap="none")
+        self.sweep_text.pack(fill=tk.BOTH, expand=True)
+
+    def _on_sweep_run(self) -> None:
+        """Evalúa toda la grilla y muestra la mejor configuración para cada r y tipo de índice."""
+        try:
+            rangos = [
+                rango(entry.get())
+                for entry in (self.sweep_r, self.sweep_B, self.sweep_R, self.sweep_v, self.sweep_p)
+            ]
+        except ValueError as e:
+            messagebox.showerror("Error", f"Rango inválido:\n{e}", parent=self.ventana_barrido)
+            return
+        if min(min(x) for x in rangos) <= 0:
+            messagebox.showerror("Error", "Todos los valores deben ser positivos.", parent=self.ventana_barrido)
+            return
+
+        criterio = self.sweep_criterio.get()
+        self._sweep_grid = barrido(*rangos, multinivel=self.sweep_multinivel.get())
+        self._sweep_criterio = criterio
+        total = math.prod(len(x) for x in rangos) * len(TIPOS)
+        validas = tamano(self._sweep_grid)
+
+        self.sweep_text.delete("1.0", tk.END)
+        self.sweep_text.insert(
+            tk.END,
+            f"{total} combinaciones, {validas} válidas, {total - validas} descartadas (bfr o bfri sin espacio)\n"
+            f"Mejor configuración por r y tipo (minimizando {criterio}):\n\n",
+        )
+        self.sweep_text.insert(tk.END, format_table(mejores(self._sweep_grid, criterio)))
+
+    def _on_sweep_export(self, formato: str) -> None:
+        if self._sweep_grid is None:
+            messagebox.showinfo("Exportar", "Primero calcula un barrido.", parent=self.ventana_barrido)
+            return
+        file_path = filedialog.asksaveasfilename(
+            parent=self.ventana_barrido,
+            title="Exportar barrido de parámetros",
+            defaultextension=f".{formato}",
+            filetypes=[(f"Archivos {formato.upper()}", f"*.{formato}"), ("Todos los archivos", "*.*")]
+        )
+        if not file_path:
+            return
+        try:
+            if formato == "csv":
+                write_csv(self._sweep_grid, file_path)
+            else:
+                write_json(self._sweep_grid, file_path, self._sweep_criterio)
+        except OSError as e:
+            messagebox.showerror("Error al exportar", f"No se pudo guardar el archivo:\n{e}", parent=self.ventana_barrido)
+            return
+        messagebox.showinfo("Exportar", f"Barrido guardado en:\n{file_path}", parent=self.ventana_barrido)
 
     # -------------------------------------------------------------------------
     # Visualización en Canvas
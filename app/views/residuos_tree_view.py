@@ -3,6 +3,8 @@ from tkinter import ttk, messagebox, filedialog
 from typing import Optional, Dict, List, Tuple, Any
 from enum import Enum
 
+from app.core.undo_log import UndoLog
+
 
 class NodeType(Enum):
 	LINK = "enlace"
@@ -64,6 +66,8 @@ class ResiduosTreeView(ttk.Frame):
 
 		btn_undo = ttk.Button(ops, text="↶ Deshacer (Ctrl+Z)", command=self._on_undo)
 		btn_undo.grid(row=11, column=0, pady=2, sticky="ew")
+		btn_redo = ttk.Button(ops, text="↷ Rehacer (Ctrl+Y)", command=self._on_redo)
+		btn_redo.grid(row=12, column=0, pady=2, sticky="ew")
 
 		self.status = ttk.Label(
 			ops,
@@ -71,7 +75,7 @@ class ResiduosTreeView(ttk.Frame):
 			wraplength=180,   # ancho máximo en píxeles
 			justify="left"
 		)
-		self.status.grid(row=12, column=0, pady=(10, 0), sticky="w")
+		self.status.grid(row=13, column=0, pady=(10, 0), sticky="w")
 
 		viz = ttk.Frame(panel, style="Panel.TFrame", padding=8)
 		viz.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -110,43 +114,63 @@ class ResiduosTreeView(ttk.Frame):
 		#Edges
 		self._edge_hint: Optional[Tuple[ResidNode, ResidNode]] = None
 
-		# Undo
-		self._history: List[Dict[str, Any]] = []
-		self._max_history = 20
+		# Deshacer/rehacer: registro de operaciones con su inversa
+		self._log = UndoLog()
 		self.bind_all("<Control-z>", self._on_undo)
+		self.bind_all("<Control-y>", self._on_redo)
 		self._draw()
 		
 
-	def _save_state(self) -> None:
-		self._history.append({
-			"symbols": dict(self.symbols),
-			"tree": self._serialize_tree(self.root),
-		})
-		if len(self._history) > self._max_history:
-			self._history.pop(0)
+	def _capture_state(self) -> Tuple[ResidNode, Dict[str, int]]:
+		# Por referencia: reiniciar y cargar crean un árbol y un índice nuevos
+		return self.root, self.symbols
 
-	def _serialize_tree(self, node: Optional[ResidNode]) -> Optional[Dict[str, Any]]:
-		if node is None:
-			return None
-		return {
-			"type": node.node_type.value,
-			"symbol": node.symbol,
-			"value": node.value,
-			"bits": node.bits,
-			"left": self._serialize_tree(node.left),
-			"right": self._serialize_tree(node.right),
-		}
-
-	def _deserialize_tree(self, data: Optional[Dict[str, Any]]) -> Optional[ResidNode]:
-		if data is None:
-			return None
-		node = ResidNode(NodeType(data["type"]))
-		node.symbol = data["symbol"]
-		node.value = data["value"]
-		node.bits = data["bits"]
-		node.left = self._deserialize_tree(data.get("left"))
-		node.right = self._deserialize_tree(data.get("right"))
-		return node
+	def _restore_state(self, state: Tuple[ResidNode, Dict[str, int]]) -> None:
+		self.root, self.symbols = state
+		self._highlight_nodes = []
+
+	def _checkpoint(self, anterior: Tuple[ResidNode, Dict[str, int]], descripcion: str) -> None:
+		self._log.checkpoint(anterior, self._capture_state, self._restore_state, descripcion, len(anterior[1]))
+
+	def _touched_node(self, bits: str, insert: bool) -> Optional[ResidNode]:
+		"""
+		Único nodo que modifica la operación: el enlace que gana o pierde la hoja,
+		o (al insertar con colisión) la hoja que pasa a ser enlace.
+		"""
+		node = self.root
+		for bit in bits:
+			child = node.left if bit == '0' else node.right
+			if child is None:
+				return node if insert else None
+			if child.node_type == NodeType.LEAF:
+				return child if insert else node
+			node = child
+		return None
+
+	def _node_fields(self, node: ResidNode) -> tuple:
+		return node.node_type, node.symbol, node.value, node.bits, node.left, node.right
+
+	def _log_node_change(self, node: ResidNode, fields: tuple, symbol: str, position: Optional[int], descripcion: str) -> None:
+		"""
+		Deshacer/rehacer intercambian los campos del nodo tocado y agregan o quitan
+		el símbolo del índice (`position`: lugar que tenía antes de borrarlo).
+		"""
+		celda = [fields]
+
+		def intercambiar() -> None:
+			actuales = self._node_fields(node)
+			node.node_type, node.symbol, node.value, node.bits, node.left, node.right = celda[0]
+			celda[0] = actuales
+			if symbol in self.symbols:
+				del self.symbols[symbol]
+			elif position is None:
+				self.symbols[symbol] = self._char_to_value(symbol)
+			else:
+				items = list(self.symbols.items())
+				items.insert(position, (symbol, self._char_to_value(symbol)))
+				self.symbols = dict(items)
+
+		self._log.registrar(intercambiar, intercambiar, descripcion)
 
 	def _char_to_value(self, ch: str) -> int:
 		ch = ch.upper()
@@ -542,8 +566,12 @@ class ResiduosTreeView(ttk.Frame):
 		ch = self._validate_char(self.entry.get().strip())
 		if not ch:
 			return
-		self._save_state()
+		nuevo = ch not in self.symbols
+		node = self._touched_node(self._value_to_bits_msb(self._char_to_value(ch)), insert=True)
+		fields = self._node_fields(node) if node is not None else None
 		self._insert_symbol(ch, animate=True)
+		if nuevo and node is not None:
+			self._log_node_change(node, fields, ch, None, f"insertar {ch}")
 		self._prepare_animation()
 
 		self.entry.delete(0, tk.END)
@@ -554,10 +582,16 @@ class ResiduosTreeView(ttk.Frame):
 		if not ch:
 			return
 
-		self._save_state()
+		node = None
+		if ch in self.symbols:
+			position = list(self.symbols).index(ch)
+			node = self._touched_node(self._value_to_bits_msb(self.symbols[ch]), insert=False)
+			fields = self._node_fields(node) if node is not None else None
 
 		# Construye pasos de animación y elimina solo la hoja (sin reconfigurar el árbol)
 		ok = self._delete_symbol(ch, animate=True)
+		if ok and node is not None:
+			self._log_node_change(node, fields, ch, position, f"eliminar {ch}")
 
 		# Preparar y lanzar animación
 		self._prepare_animation()
@@ -598,9 +632,10 @@ class ResiduosTreeView(ttk.Frame):
 		self._draw()
 
 	def _on_reset(self) -> None:
-		self._save_state()
+		anterior = self._capture_state()
 		self.root = ResidNode(NodeType.LINK)
 		self.symbols = {}
+		self._checkpoint(anterior, "reiniciar")
 		self._anim_steps = []
 		self._anim_index = 0
 		self._anim_running = False
@@ -608,13 +643,23 @@ class ResiduosTreeView(ttk.Frame):
 		self._draw()
 
 	def _on_undo(self, event=None) -> None:
-		if not self._history:
+		descripcion = self._log.deshacer()
+		if descripcion is None:
 			messagebox.showinfo("Deshacer", "No hay operaciones para deshacer")
 			return
-		state = self._history.pop()
-		self.symbols = state["symbols"]
-		self.root = self._deserialize_tree(state["tree"]) or ResidNode(NodeType.LINK)
-		self.status.configure(text=f"Operación deshecha. Estados: {len(self._history)}")
+		self._after_history(f"Deshecho: {descripcion}")
+
+	def _on_redo(self, event=None) -> None:
+		descripcion = self._log.rehacer()
+		if descripcion is None:
+			self.status.configure(text="No hay operaciones para rehacer")
+			return
+		self._after_history(f"Rehecho: {descripcion}")
+
+	def _after_history(self, texto: str) -> None:
+		self._highlight_nodes = []
+		self._edge_hint = None
+		self.status.configure(text=f"{texto}. Deshacer: {len(self._log)}, rehacer: {self._log.pendientes_rehacer}")
 		self._draw()
 
 	def _prepare_animation(self) -> None:
@@ -724,25 +769,21 @@ class ResiduosTreeView(ttk.Frame):
 			messagebox.showerror("Error", f"No se pudo guardar: {e}")
 
 	def _on_load(self) -> None:
-		self._save_state()
 		path = filedialog.askopenfilename(title="Cargar árbol por residuos", filetypes=[("Texto", "*.txt")])
 		if not path:
-			if self._history:
-				self._history.pop()
 			return
 		try:
 			with open(path, "r", encoding="utf-8") as f:
 				content = f.read()
 		except Exception as e:
 			messagebox.showerror("Error", f"No se pudo leer: {e}")
-			if self._history:
-				self._history.pop()
 			return
+		anterior = self._capture_state()
 		if not self._parse(content):
 			messagebox.showerror("Error", "Formato inválido")
-			if self._history:
-				self._history.pop()
+			self._restore_state(anterior)
 			return
+		self._checkpoint(anterior, "cargar")
 		self.status.configure(text="Árbol cargado")
 		self._draw()
 	def _draw(self) -> None:
@@ -1,9 +1,15 @@
 import math
+import os
 import random
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from typing import List, Optional, Dict
 
+from app.core.block_file import BlockFile
+from app.core.hash_functions import get_transform_function
+from app.core.hash_stats import compare_configurations, export_json
+from app.core.hash_table import TransformTable
+
 
 class TransformacionClavesView(ttk.Frame):
     def __init__(self, parent: tk.Misc, app) -> None:
@@ -121,6 +127,13 @@ class TransformacionClavesView(ttk.Frame):
         btn_load = ttk.Button(file_panel, text="Cargar", command=self._on_load)
         btn_load.grid(row=0, column=2, padx=4, pady=2)
 
+        btn_stats = ttk.Button(file_panel, text="Exportar estadísticas", command=self._on_export_stats)
+        btn_stats.grid(row=0, column=3, padx=4, pady=2)
+
+        # Tabla en archivo binario de bloques (direcciones de ancho fijo, E/S real)
+        btn_save_bin = ttk.Button(file_panel, text="Guardar binario", command=self._on_save_binary)
+        btn_save_bin.grid(row=0, column=4, padx=4, pady=2)
+
         back = ttk.Button(self, text="← Volver", command=lambda: app.navigate("externas"))
         back.pack(pady=6)
 
@@ -137,6 +150,11 @@ class TransformacionClavesView(ttk.Frame):
 
         self._highlight_index: Optional[int] = None  # índice de dirección que se resalta
 
+        # Archivo binario asociado (solo direccionamiento abierto): las búsquedas
+        # se repiten sobre él contando lecturas de bloque
+        self._archivo: Optional[BlockFile] = None
+        self._archivo_copia: List[Optional[int]] = []
+
     # ------------------------------------------------------------------
     # Lectura de parámetros y creación de bloques
     # ------------------------------------------------------------------
@@ -181,61 +199,8 @@ class TransformacionClavesView(ttk.Frame):
         Devuelve el valor hash "conceptual" según el método elegido.
         Este valor puede exceder n; para indexar en la tabla se reduce con módulo.
         """
-        mode = self.hash_mode.get()
-
-        if mode == "modulo":
-            # Clásico: k mod n, luego +1 (desplazamiento)
-            base = k % n
-            return base + 1
-
-        elif mode == "cuadrado":
-            # Método del cuadrado central
-            k2 = k * k
-            k2_str = str(k2).zfill(2 * d)
-            center_len = d
-            start = max(0, (len(k2_str) - center_len) // 2)
-            center_str = k2_str[start:start + center_len]
-            center = int(center_str) if center_str else 0
-            base = center % n
-            return base + 1
-
-        elif mode == "plegamiento":
-            # Plegamiento: sumar parejas de 2 dígitos (último dígito suelto si sobra) + 1
-            k_str = str(k)
-            grupos: List[int] = []
-            i = 0
-            while i < len(k_str):
-                if i + 2 <= len(k_str):
-                    grupos.append(int(k_str[i:i + 2]))
-                    i += 2
-                else:
-                    grupos.append(int(k_str[i:]))
-                    i += 1
-            direccion = sum(grupos)
-            return direccion + 1  # sin % interno, como pediste
-
-        elif mode == "truncamiento":
-            # Truncamiento: usar dígitos 1 y 3 (posición 0 y 2) + 1
-            k_str = str(k).zfill(d)
-            d1 = k_str[0] if len(k_str) > 0 else "0"
-            d3 = k_str[2] if len(k_str) > 2 else "0"
-            direccion = int(d1 + d3)
-            return direccion + 1
-
-        elif mode == "conversion_bases":
-            # Conversión de bases: suma de dígitos en base 'base', luego % n y +1
-            base_b = self._read_base()
-            valor = k
-            suma = 0
-            while valor > 0:
-                suma += valor % base_b
-                valor //= base_b
-            base = suma % n
-            return base + 1
-
-        # Por defecto, módulo
-        base = k % n
-        return base + 1
+        transform = get_transform_function(self.hash_mode.get())
+        return transform(k, n, d, self._read_base())
 
     def _hash_index(self, k: int, n: int, d: int) -> int:
         """
@@ -276,6 +241,31 @@ class TransformacionClavesView(ttk.Frame):
                 yield current
                 current = (current + step) % n
 
+    def _probe_cost(self, k: int, n: int, d: int, insert: bool = False) -> int:
+        """
+        Sondeos de buscar (o insertar) k: direcciones examinadas en
+        direccionamiento abierto, claves comparadas en los encadenamientos.
+        """
+        mode = self.probe_mode.get()
+        base = self._hash_index(k, n, d)
+
+        if mode in ["lineal", "cuadratica", "doble_hash"]:
+            probes = 0
+            for idx in self._probe_indices(k, n, d):
+                probes += 1
+                if self._table[idx] is None or (not insert and self._table[idx] == k):
+                    break
+            return probes
+
+        if mode == "arreglo_anidado":
+            if self._table[base] is None or self._table[base] == k:
+                return 1
+            anidados = self._table_anidado[base]
+            return anidados.index(k) + 2 if k in anidados else len(anidados) + 1
+
+        cadena = self._table_enlazada[base]
+        return cadena.index(k) + 1 if k in cadena else len(cadena)
+
     # ------------------------------------------------------------------
     # Validación de clave
     # ------------------------------------------------------------------
@@ -453,9 +443,11 @@ class TransformacionClavesView(ttk.Frame):
                 messagebox.showerror("Error", "Tabla llena")
                 return
 
+        probes = self._probe_cost(k, n, d, insert=True)
         if self._insert_key(k, n, d, animate=True):
+            self.app.traza.registrar("insertar", k)
             hv = self._hash_value(k, n, d)
-            self.status.configure(text=f"Insertado {k} (hash={hv})")
+            self.status.configure(text=f"Insertado {k} (hash={hv}, sondeos={probes})")
             self.entry_key.delete(0, tk.END)
             self._highlight_index = None
             self._draw()
@@ -471,9 +463,12 @@ class TransformacionClavesView(ttk.Frame):
         k = self._validate_key(key_str, d)
         if k is None:
             return
+        self.app.traza.registrar("buscar", k)
 
         mode = self.probe_mode.get()
         base = self._hash_index(k, n, d)
+        probes = self._probe_cost(k, n, d)
+        disco = self._file_search_reads(k, n, d)
 
         if mode in ["lineal", "cuadratica", "doble_hash"]:
             for idx in self._probe_indices(k, n, d):
@@ -484,7 +479,7 @@ class TransformacionClavesView(ttk.Frame):
                 self.update_idletasks()
                 self.after(400)
                 if self._table[idx] == k:
-                    self.status.configure(text=f"Encontrado {k} en dirección {idx}")
+                    self.status.configure(text=f"Encontrado {k} en dirección {idx} [sondeos={probes}]{disco}")
                     return
 
         elif mode == "arreglo_anidado":
@@ -494,13 +489,13 @@ class TransformacionClavesView(ttk.Frame):
             self.after(400)
 
             if self._table[base] == k:
-                self.status.configure(text=f"Encontrado {k} en dirección {base} (principal)")
+                self.status.configure(text=f"Encontrado {k} en dirección {base} (principal) [sondeos={probes}]")
                 return
 
             if k in self._table_anidado[base]:
                 pos = self._table_anidado[base].index(k)
                 self.status.configure(
-                    text=f"Encontrado {k} en dirección {base}, colisión #{pos + 1} (arreglo anidado)"
+                    text=f"Encontrado {k} en dirección {base}, colisión #{pos + 1} (arreglo anidado) [sondeos={probes}]"
                 )
                 return
 
@@ -512,12 +507,12 @@ class TransformacionClavesView(ttk.Frame):
 
             if k in self._table_enlazada[base]:
                 pos = self._table_enlazada[base].index(k)
-                self.status.configure(text=f"Encontrado {k} en dirección {base}, nodo {pos}")
+                self.status.configure(text=f"Encontrado {k} en dirección {base}, nodo {pos} [sondeos={probes}]")
                 return
 
         self._highlight_index = None
         self._draw()
-        self.status.configure(text="No encontrado")
+        self.status.configure(text=f"No encontrado [sondeos={probes}]{disco}")
         messagebox.showinfo("Búsqueda", "Valor no encontrado")
 
     def _on_delete(self) -> None:
@@ -529,9 +524,11 @@ class TransformacionClavesView(ttk.Frame):
         k = self._validate_key(key_str, d)
         if k is None:
             return
+        self.app.traza.registrar("eliminar", k)
 
         mode = self.probe_mode.get()
         base = self._hash_index(k, n, d)
+        probes = self._probe_cost(k, n, d)
 
         if mode in ["lineal", "cuadratica", "doble_hash"]:
             for idx in self._probe_indices(k, n, d):
@@ -544,7 +541,7 @@ class TransformacionClavesView(ttk.Frame):
                 if self._table[idx] == k:
                     self._table[idx] = None
                     self._highlight_index = None
-                    self.status.configure(text=f"Eliminado {k}")
+                    self.status.configure(text=f"Eliminado {k} [sondeos={probes}]")
                     self._draw()
                     return
 
@@ -564,7 +561,7 @@ class TransformacionClavesView(ttk.Frame):
                     self._table[base] = None
 
                 self._highlight_index = None
-                self.status.configure(text=f"Eliminado {k} (principal)")
+                self.status.configure(text=f"Eliminado {k} (principal) [sondeos={probes}]")
                 self._draw()
                 return
 
@@ -572,7 +569,7 @@ class TransformacionClavesView(ttk.Frame):
             if k in self._table_anidado[base]:
                 self._table_anidado[base].remove(k)
                 self._highlight_index = None
-                self.status.configure(text=f"Eliminado {k} (arreglo anidado)")
+                self.status.configure(text=f"Eliminado {k} (arreglo anidado) [sondeos={probes}]")
                 self._draw()
                 return
 
@@ -585,15 +582,98 @@ class TransformacionClavesView(ttk.Frame):
             if k in self._table_enlazada[base]:
                 self._table_enlazada[base].remove(k)
                 self._highlight_index = None
-                self.status.configure(text=f"Eliminado {k}")
+                self.status.configure(text=f"Eliminado {k} [sondeos={probes}]")
                 self._draw()
                 return
 
         self._highlight_index = None
         self._draw()
-        self.status.configure(text="No encontrado")
+        self.status.configure(text=f"No encontrado [sondeos={probes}]")
         messagebox.showinfo("Borrado", "Valor no encontrado")
 
+    # ------------------------------------------------------------------
+    # Archivo binario de bloques
+    # ------------------------------------------------------------------
+
+    def _on_save_binary(self) -> None:
+        """Guarda la tabla (direccionamiento abierto) como archivo binario de bloques."""
+        if not self._ensure_structure():
+            return
+        if self.probe_mode.get() not in ["lineal", "cuadratica", "doble_hash"]:
+            messagebox.showinfo("Archivo binario", "Solo las tablas de direccionamiento abierto tienen registros de ancho fijo.")
+            return
+        path = filedialog.asksaveasfilename(
+            title="Guardar archivo binario de bloques",
+            defaultextension=".blq",
+            filetypes=[("Archivo de bloques", "*.blq")],
+        )
+        if not path:
+            return
+        try:
+            archivo = BlockFile.crear(path, self.n, self._table_blocks(), self.b, self.block_size)
+        except Exception as e:
+            messagebox.showerror("Error", f"No se pudo guardar: {e}")
+            return
+        if self._archivo is not None:
+            self._archivo.cerrar()
+        self._archivo = archivo
+        self._archivo_copia = list(self._table)
+        self.status.configure(text=f"Archivo binario guardado: {archivo.b} bloques de {archivo.block_size} direcciones")
+
+    def _table_blocks(self) -> List[List[Optional[int]]]:
+        """Direcciones agrupadas por bloque (dirección i en el bloque i // block_size)."""
+        return [self._table[i:i + self.block_size] for i in range(0, self.n, self.block_size)]
+
+    def _file_search_reads(self, k: int, n: int, d: int) -> str:
+        """Repite la búsqueda sobre el archivo asociado; texto con las lecturas de bloque."""
+        archivo = self._archivo
+        if archivo is None or self.probe_mode.get() not in ["lineal", "cuadratica", "doble_hash"]:
+            return ""
+        if archivo.n != n or archivo.block_size != self.block_size or len(self._table) != n:
+            # Cambió la geometría de la tabla: se reescribe completo
+            archivo.cerrar()
+            archivo = self._archivo = BlockFile.crear(archivo.ruta, n, self._table_blocks(), self.b, self.block_size)
+        else:
+            # Solo se escriben los bloques que cambiaron desde la última búsqueda
+            for i, bloque in enumerate(self._table_blocks()):
+                inicio = i * self.block_size
+                if bloque != self._archivo_copia[inicio:inicio + self.block_size]:
+                    archivo.escribir_bloque(i, bloque)
+        self._archivo_copia = list(self._table)
+        archivo.buscar_direcciones(k, self._probe_indices(k, n, d))
+        return f" [{os.path.basename(archivo.ruta)}: {archivo.ultimas_lecturas} lecturas de bloque]"
+
+    def _on_export_stats(self) -> None:
+        """Compara todas las combinaciones función hash × resolución con las claves actuales."""
+        if not self._ensure_structure():
+            return
+        path = filedialog.asksaveasfilename(
+            title="Exportar estadísticas", defaultextension=".json", filetypes=[("JSON", "*.json")]
+        )
+        if not path:
+            return
+
+        n, d = self._read_params()
+        keys = [v for v in self._table if v is not None]
+        for arr in self._table_anidado:
+            keys.extend(arr)
+        for cadena in self._table_enlazada:
+            keys.extend(cadena)
+
+        reports = compare_configurations(keys, n, d, TransformTable, base=self._read_base())
+        data = {
+            "configuracion_actual": {"hash": self.hash_mode.get(), "resolucion": self.probe_mode.get()},
+            "comparacion": reports,
+        }
+        try:
+            export_json(data, path)
+            best = reports[0]
+            messagebox.showinfo(
+                "Éxito", f"Estadísticas exportadas. Mejor configuración: {best['hash']} + {best['resolucion']}"
+            )
+        except Exception as e:
+            messagebox.showerror("Error", f"No se pudo guardar: {e}")
+
     # ------------------------------------------------------------------
     # Dibujo de bloques en el canvas (horizontal)
     # ------------------------------------------------------------------
@@ -2,6 +2,8 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from typing import Dict, Optional, List, Tuple
 
+from app.core.undo_log import UndoLog
+
 
 class TrieNode:
 	def __init__(self) -> None:
@@ -58,9 +60,11 @@ class TrieView(ttk.Frame):
 		# Botón de deshacer
 		btn_undo = ttk.Button(ops, text="↶ Deshacer (Ctrl+Z)", command=self._on_undo)
 		btn_undo.grid(row=row_base + 4, column=0, pady=2, sticky="ew")
+		btn_redo = ttk.Button(ops, text="↷ Rehacer (Ctrl+Y)", command=self._on_redo)
+		btn_redo.grid(row=row_base + 5, column=0, pady=2, sticky="ew")
 
 		self.status = ttk.Label(ops, text="Estado: listo")
-		self.status.grid(row=row_base + 5, column=0, pady=(12, 0), sticky="w")
+		self.status.grid(row=row_base + 6, column=0, pady=(12, 0), sticky="w")
 
 		viz = ttk.Frame(panel, style="Panel.TFrame", padding=8)
 		viz.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -97,30 +101,76 @@ class TrieView(ttk.Frame):
 		self._anim_running: bool = False
 		self._anim_delete: bool = False
 		
-		# Undo mechanism
-		self._history: List[List[str]] = []
-		self._max_history = 20  # Máximo 20 estados en el historial
+		# Deshacer/rehacer: registro de operaciones con su inversa
+		self._log = UndoLog()
 		
-		# Bind Ctrl+Z
+		# Bind Ctrl+Z / Ctrl+Y
 		self.bind_all("<Control-z>", self._on_undo)
+		self.bind_all("<Control-y>", self._on_redo)
 		
 		self._draw()
 
-	def _save_state(self) -> None:
-		"""Guarda el estado actual en el historial para poder deshacerlo"""
-		current_state = list(self._insert_order)  # Copia de la lista
-		self._history.append(current_state)
-		
-		# Mantener solo los últimos N estados
-		if len(self._history) > self._max_history:
-			self._history.pop(0)
+	def _capture_state(self) -> Tuple[TrieNode, List[str]]:
+		"""Trie y orden de inserción por referencia (reiniciar y cargar los reemplazan)"""
+		return self.root, self._insert_order
+
+	def _restore_state(self, state: Tuple[TrieNode, List[str]]) -> None:
+		self.root, self._insert_order = state
+		self._path_highlight = []
+		self._delete_highlight = None
+
+	def _checkpoint(self, anterior: Tuple[TrieNode, List[str]], descripcion: str) -> None:
+		self._log.checkpoint(anterior, self._capture_state, self._restore_state, descripcion, len(anterior[1]))
+
+	def _node_at(self, path: str) -> Optional[TrieNode]:
+		node = self.root
+		for b in path:
+			node = node.children.get(b)
+			if node is None:
+				return None
+		return node
+
+	def _log_insert(self, letter: str, path: str, created: bool) -> None:
+		"""La letra ocupó el nodo en `path` (creándolo si `created`); se deshace vaciándolo o quitándolo"""
+		def deshacer() -> None:
+			self._insert_order.pop()
+			node = self._node_at(path)
+			if created and path and not node.children:
+				del self._node_at(path[:-1]).children[path[-1]]
+			else:
+				node.is_end = False
+				node.value = None
+
+		def rehacer() -> None:
+			self._insert_order.append(letter)
+			parent = self._node_at(path[:-1]) if path else None
+			if parent is not None and path[-1] not in parent.children:
+				parent.children[path[-1]] = TrieNode()
+			node = self._node_at(path)
+			node.is_end = True
+			node.value = letter
+
+		self._log.registrar(deshacer, rehacer, f"insertar {letter}")
+
+	def _log_delete(self, letter: str, index: int) -> None:
+		"""El borrado reconstruye desde el orden de inserción; se deshace reponiendo la letra en su lugar"""
+		def deshacer() -> None:
+			self._insert_order.insert(index, letter)
+			self._rebuild_from_order()
+
+		def rehacer() -> None:
+			del self._insert_order[index]
+			self._rebuild_from_order()
+
+		self._log.registrar(deshacer, rehacer, f"eliminar {letter}")
 
 	def _on_reset(self) -> None:
-		self._save_state()  # Guardar estado antes de reiniciar
+		anterior = self._capture_state()
 		self.root = TrieNode()
 		self._path_highlight = []
 		self._delete_highlight = None
 		self._insert_order = []
+		self._checkpoint(anterior, "reiniciar")
 		self.status.configure(text="Trie reiniciado")
 		self._draw()
 
@@ -153,15 +203,13 @@ class TrieView(ttk.Frame):
 		if bits is None:
 			return
 		
-		# Guardar estado antes de insertar
-		self._save_state()
-		
 		# If completely empty, place at root
 		if not self.root.is_end and (self.root.value is None) and not self.root.children:
 			self._path_highlight = [(0, 0, '')]
 			self.root.is_end = True
 			self.root.value = ch.upper()
 			self._insert_order.append(ch.upper())
+			self._log_insert(ch.upper(), "", False)
 			self.status.configure(text=f"Insertado {ch} en raíz")
 			self._prepare_animation(delete=False)
 			return
@@ -177,6 +225,7 @@ class TrieView(ttk.Frame):
 				child.is_end = True
 				child.value = ch.upper()
 				self._insert_order.append(ch.upper())
+				self._log_insert(ch.upper(), bits[:depth + 1], True)
 				self.status.configure(text=f"Insertado {ch} en profundidad {depth + 1}")
 				self._prepare_animation(delete=False)
 				return
@@ -185,6 +234,7 @@ class TrieView(ttk.Frame):
 				child.is_end = True
 				child.value = ch.upper()
 				self._insert_order.append(ch.upper())
+				self._log_insert(ch.upper(), bits[:depth + 1], False)
 				self.status.configure(text=f"Insertado {ch} en profundidad {depth + 1}")
 				self._prepare_animation(delete=False)
 				return
@@ -232,18 +282,12 @@ class TrieView(ttk.Frame):
 		if bits is None:
 			return
 		
-		# Guardar estado antes de eliminar
-		self._save_state()
-		
 		# Check root
 		if self.root.is_end and (self.root.value or "").upper() == ch.upper():
 			self._path_highlight = [(0, 0, '')]
 			self._delete_highlight = self._path_highlight[-1]
 			# update order and rebuild
-			try:
-				self._insert_order.remove(ch.upper())
-			except ValueError:
-				pass
+			self._remove_from_order(ch.upper())
 			self._rebuild_from_order()
 			self.status.configure(text="Eliminado de raíz y reordenado")
 			self._prepare_animation(delete=True)
@@ -259,19 +303,13 @@ class TrieView(ttk.Frame):
 				self.status.configure(text="No encontrado")
 				messagebox.showinfo("Búsqueda", "Valor no encontrado")
 				self._prepare_animation(delete=False)
-				# Restaurar estado ya que no se eliminó nada
-				if self._history:
-					self._history.pop()  # Remover el estado que acabamos de guardar
 				return
 			path_nodes.append((node, b))
 			node = next_node
 			if node.is_end and (node.value or "").upper() == ch.upper():
 				self._delete_highlight = self._path_highlight[-1]
 				# update order and rebuild from original insertion sequence
-				try:
-					self._insert_order.remove(ch.upper())
-				except ValueError:
-					pass
+				self._remove_from_order(ch.upper())
 				self._rebuild_from_order()
 				self.status.configure(text=f"Eliminado en profundidad {depth + 1} y reordenado")
 				self._prepare_animation(delete=True)
@@ -279,9 +317,12 @@ class TrieView(ttk.Frame):
 		self.status.configure(text="No encontrado")
 		messagebox.showinfo("Búsqueda", "Valor no encontrado")
 		self._prepare_animation(delete=False)
-		# Restaurar estado ya que no se eliminó nada
-		if self._history:
-			self._history.pop()  # Remover el estado que acabamos de guardar
+
+	def _remove_from_order(self, letter: str) -> None:
+		if letter in self._insert_order:
+			index = self._insert_order.index(letter)
+			del self._insert_order[index]
+			self._log_delete(letter, index)
 
 	def _insert_value_internal(self, ch: str) -> None:
 		# Insert without UI side-effects, respecting the same placement rules
@@ -413,46 +454,47 @@ class TrieView(ttk.Frame):
 
 	def _on_undo(self, event=None) -> None:
 		"""Deshace la última operación realizada"""
-		if not self._history:
+		descripcion = self._log.deshacer()
+		if descripcion is None:
 			self.status.configure(text="No hay operaciones para deshacer")
 			messagebox.showinfo("Deshacer", "No hay operaciones para deshacer")
 			return
-		
-		# Restaurar el último estado guardado
-		last_state = self._history.pop()
-		self._insert_order = list(last_state)  # Copia de la lista
-		
-		# Reconstruir el trie desde el estado restaurado
-		self._rebuild_from_order()
-		self.status.configure(text=f"Operación deshecha. Estados restantes: {len(self._history)}")
+		self._after_history(f"Deshecho: {descripcion}")
+
+	def _on_redo(self, event=None) -> None:
+		"""Rehace la última operación deshecha"""
+		descripcion = self._log.rehacer()
+		if descripcion is None:
+			self.status.configure(text="No hay operaciones para rehacer")
+			return
+		self._after_history(f"Rehecho: {descripcion}")
+
+	def _after_history(self, texto: str) -> None:
+		self._path_highlight = []
+		self._delete_highlight = None
+		self.status.configure(text=f"{texto}. Deshacer: {len(self._log)}, rehacer: {self._log.pendientes_rehacer}")
 		self._draw()
 
 	def _on_load(self) -> None:
-		# Guardar estado antes de cargar
-		self._save_state()
-		
 		path = filedialog.askopenfilename(title="Cargar trie", filetypes=[("Texto", "*.txt")])
 		if not path:
-			# Restaurar estado ya que no se cargó nada
-			if self._history:
-				self._history.pop()
 			return
 		try:
 			with open(path, "r", encoding="utf-8") as f:
 				content = f.read()
 		except Exception as e:
 			messagebox.showerror("Error", f"No se pudo leer: {e}")
-			# Restaurar estado ya que no se cargó nada
-			if self._history:
-				self._history.pop()
 			return
+		anterior = self._capture_state()
+		# El formato antiguo no trae orden de inserción y conserva el actual: copia propia
+		self._insert_order = list(self._insert_order)
 		d = self._parse(content)
 		if d is None:
 			messagebox.showerror("Error", "Formato inválido")
 			# Restaurar estado ya que no se cargó nada
-			if self._history:
-				self._history.pop()
+			self._restore_state(anterior)
 			return
+		self._checkpoint(anterior, "cargar")
 		# Parámetro de dígitos fijo en 5; ignoramos lo cargado
 		self._path_highlight = []
 		self._delete_highlight = None